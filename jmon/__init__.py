@@ -79,6 +79,16 @@ app.conf.task_queues = (
             'x-dead-letter-exchange': dead_letter_exchange_name,
             'x-dead-letter-routing-key': dead_letter_routing_key
         }
+    ),
+    Queue(
+        'playwright',
+        bindings=[
+            binding(exchange=check_exchange, arguments={'x-match': 'any', 'playwright': 'true'})
+        ],
+        queue_arguments={
+            'x-dead-letter-exchange': dead_letter_exchange_name,
+            'x-dead-letter-routing-key': dead_letter_routing_key
+        }
     )
 )
 
@@ -0,0 +1,26 @@
+"""Add playwright browser to client column
+
+Revision ID: 8c3e5a7d9b21
+Revises: 4f2d8b1c7e3a
+Create Date: 2026-10-18 11:02:31.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c3e5a7d9b21'
+down_revision = '4f2d8b1c7e3a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE clienttype ADD VALUE 'BROWSER_PLAYWRIGHT'")
+
+
+def downgrade() -> None:
+    # Postgres does not support removing values from an enum type
+    pass
@@ -60,7 +60,9 @@ def get_check(check_name, environment_name=None):
         "step_count": check.get_step_count(),
         "supported_clients": [client.value for client in check.get_supported_clients()],
         "attributes": check.attributes,
-        "screenshot_on_error": check.screenshot_on_error
+        "block": check.block,
+        "screenshot_on_error": check.screenshot_on_error,
+        "fresh_connection": check.fresh_connection
     }, 200
 
 @FlaskApp.app.route('/api/v1/checks/<check_name>/environments/<environment_name>', methods=["DELETE"])
@@ -1,4 +1,6 @@
 
+from flask import request
+
 from jmon.step_status import StepStatus
 from . import FlaskApp
 from .utils import get_check_and_environment_by_name
@@ -61,6 +63,26 @@ class BaseGraphNode:
             color = color.format(opacity=opacity)
         return color
 
+    def get_duration_color(self, opacity):
+        """Return CSS color for step duration, from green to red, relative to the slowest step of the run"""
+        duration = self.step_data.get("duration")
+        max_duration = self.root_step.graph_generator.max_duration
+        if duration is None or not max_duration:
+            return f"rgba(192, 192, 192, {opacity})"
+
+        ratio = min(duration / max_duration, 1)
+        red, green, blue = [
+            round(fast + ((slow - fast) * ratio))
+            for fast, slow in zip(GraphGenerator.FAST_COLOR, GraphGenerator.SLOW_COLOR)
+        ]
+        return f"rgba({red}, {green}, {blue}, {opacity})"
+
+    def get_node_color(self, opacity):
+        """Return CSS color for node, based on colour mode of graph"""
+        if self.root_step.graph_generator.color_by == GraphGenerator.COLOR_BY_DURATION:
+            return self.get_duration_color(opacity)
+        return self.get_status_color(opacity)
+
     def get_element_data(self):
         """Return element data"""
 
@@ -77,14 +99,15 @@ class BaseGraphNode:
         return {
             "id": self.id,
             "data": {
-                "label": self.step_data.get("description") if len(self.step_data.get("description")) < 70 else f'{self.step_data.get("description")[0:70]}...'
+                "label": self.step_data.get("description") if len(self.step_data.get("description")) < 70 else f'{self.step_data.get("description")[0:70]}...',
+                "duration": self.step_data.get("duration"),
             },
             "position": {
                 "x": self.x,
                 "y": self.y
             },
             "style": {
-                "backgroundColor": self.get_status_color('0.4'),
+                "backgroundColor": self.get_node_color('0.4'),
             },
             "className": "light",
             "parentNode": self.root_step.column_id,
@@ -241,11 +264,29 @@ class RootGraphData(BaseGraphNode):
 
 class GraphGenerator:
 
-    def __init__(self, step_data):
+    COLOR_BY_STATUS = "status"
+    COLOR_BY_DURATION = "duration"
+    COLOR_BY_OPTIONS = [COLOR_BY_STATUS, COLOR_BY_DURATION]
+
+    # RGB colours of the fastest and slowest steps, when colouring by duration
+    FAST_COLOR = (60, 201, 122)
+    SLOW_COLOR = (243, 92, 79)
+
+    @classmethod
+    def _get_max_duration(cls, step_data):
+        """Return max duration of steps and their child steps"""
+        durations = [step.get("duration") or 0 for step in step_data]
+        durations += [cls._get_max_duration(step.get("children", [])) for step in step_data]
+        return max(durations, default=0)
+
+    def __init__(self, step_data, color_by=COLOR_BY_STATUS):
         """Generate graph nodes"""
         previous_root_step = None
         self.column_width = 300
         self.height = 400
+        self.color_by = color_by
+        # Duration of slowest step, used to colour steps by duration
+        self.max_duration = self._get_max_duration(step_data)
 
         self.root_step_objects = []
         for root_step_itx, root_step_data in enumerate(step_data):
@@ -295,6 +336,12 @@ def get_run_step_graph_data(check_name, environment_name, timestamp):
             "error": "Run does not exist"
         }, 400
 
+    color_by = request.args.get("color_by", GraphGenerator.COLOR_BY_STATUS)
+    if color_by not in GraphGenerator.COLOR_BY_OPTIONS:
+        return {
+            "error": f"color_by must be one of: {', '.join(GraphGenerator.COLOR_BY_OPTIONS)}"
+        }, 400
+
     run = jmon.run.Run(check=check, db_run=db_run)
 
     step_data = RunStepData(
@@ -307,6 +354,6 @@ def get_run_step_graph_data(check_name, environment_name, timestamp):
 
     root_steps = step_data.get("children", [])
 
-    graph_generator = GraphGenerator(root_steps)
+    graph_generator = GraphGenerator(root_steps, color_by=color_by)
 
     return graph_generator.generate_graph_data()
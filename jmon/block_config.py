@@ -0,0 +1,130 @@
+
+from enum import Enum
+import re
+from typing import Dict, List, Optional
+
+from jmon.errors import CheckCreateError
+
+
+class BlockResourceType(Enum):
+    """Type of resources that can be blocked in browser checks"""
+
+    IMAGE = "image"
+    FONT = "font"
+    MEDIA = "media"
+    STYLESHEET = "stylesheet"
+
+
+# File extensions used to match resource types by URL,
+# for browsers that can only block by URL pattern
+RESOURCE_TYPE_EXTENSIONS: Dict[BlockResourceType, List[str]] = {
+    BlockResourceType.IMAGE: ["png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"],
+    BlockResourceType.FONT: ["woff", "woff2", "ttf", "otf", "eot"],
+    BlockResourceType.MEDIA: ["mp4", "webm", "ogg", "ogv", "mp3", "wav", "m4a", "mov"],
+    BlockResourceType.STYLESHEET: ["css"],
+}
+
+# Firefox content policy types (nsIContentPolicy) for each resource type
+RESOURCE_TYPE_FIREFOX_CONTENT_POLICIES: Dict[BlockResourceType, List[str]] = {
+    BlockResourceType.IMAGE: ["TYPE_IMAGE", "TYPE_IMAGESET"],
+    BlockResourceType.FONT: ["TYPE_FONT"],
+    BlockResourceType.MEDIA: ["TYPE_MEDIA"],
+    BlockResourceType.STYLESHEET: ["TYPE_STYLESHEET"],
+}
+
+
+class BlockConfig:
+    """
+    Network resources to block during browser checks.
+
+    Configured in check using:
+    ```
+    block:
+      # URL patterns, using * as a wildcard
+      urls:
+        - "*google-analytics.com*"
+      # Resource types to block
+      resource_types:
+        - image
+        - font
+    ```
+    """
+
+    @classmethod
+    def from_config(cls, config) -> Optional['BlockConfig']:
+        """Create block config from check config, raising CheckCreateError if invalid"""
+        if not config:
+            return None
+
+        if type(config) is not dict:
+            raise CheckCreateError("block must be a map containing urls and/or resource_types")
+
+        unknown_keys = set(config) - {"urls", "resource_types"}
+        if unknown_keys:
+            raise CheckCreateError(f"Unknown block configuration: {', '.join(sorted(unknown_keys))}")
+
+        urls = config.get("urls", [])
+        if type(urls) is not list or not all(type(url) is str and url for url in urls):
+            raise CheckCreateError("block urls must be a list of URL patterns")
+
+        resource_types = config.get("resource_types", [])
+        if type(resource_types) is not list:
+            raise CheckCreateError("block resource_types must be a list")
+        try:
+            resource_types = [BlockResourceType(resource_type) for resource_type in resource_types]
+        except ValueError:
+            raise CheckCreateError(
+                "block resource_types must be one of: " +
+                ", ".join([resource_type.value for resource_type in BlockResourceType])
+            )
+
+        return cls(urls=urls, resource_types=resource_types)
+
+    def __init__(self, urls: List[str], resource_types: List[BlockResourceType]):
+        """Store member variables"""
+        self._urls = urls
+        self._resource_types = resource_types
+
+    @property
+    def urls(self) -> List[str]:
+        """Return URL patterns to block"""
+        return self._urls
+
+    @property
+    def resource_types(self) -> List[BlockResourceType]:
+        """Return resource types to block"""
+        return self._resource_types
+
+    def get_url_patterns(self) -> List[str]:
+        """
+        Return wildcard URL patterns for both URLs and resource types,
+        with resource types matched by file extension
+        """
+        patterns = list(self._urls)
+        for resource_type in self._resource_types:
+            for extension in RESOURCE_TYPE_EXTENSIONS[resource_type]:
+                patterns.append(f"*.{extension}")
+                patterns.append(f"*.{extension}?*")
+        return patterns
+
+    def get_url_regexes(self) -> List[str]:
+        """Return URL patterns converted to regular expressions"""
+        return [
+            "^" + ".*".join([re.escape(part) for part in url.split("*")]) + "$"
+            for url in self._urls
+        ]
+
+    def get_firefox_content_policy_types(self) -> List[str]:
+        """Return names of Firefox content policy types to block"""
+        return [
+            content_policy_type
+            for resource_type in self._resource_types
+            for content_policy_type in RESOURCE_TYPE_FIREFOX_CONTENT_POLICIES[resource_type]
+        ]
+
+    def as_dict(self):
+        """Return config as dictionary"""
+        return {
+            "urls": self._urls,
+            "resource_types": [resource_type.value for resource_type in self._resource_types],
+        }
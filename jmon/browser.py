@@ -0,0 +1,843 @@
+"""
+Browser management.
+
+This module imports the browser stack (selenium, pyvirtualdisplay, psutil)
+and should only be imported by workers that execute browser checks.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+from pyvirtualdisplay import Display
+import selenium
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
+import selenium.common.exceptions
+import urllib3.exceptions
+import psutil
+
+from jmon.block_config import BlockConfig
+from jmon.client_type import ClientType
+from jmon.config import ChromeHeadlessMode, Config
+from jmon.logger import logger
+from jmon.page_load import PageLoadStrategy
+
+
+class VirtualDisplay:
+    """Virtual display shared by non-headless browsers"""
+
+    _DISPLAY = None
+    _LOCK = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        """Create display and cache"""
+        # Lock, as browsers may be created by pool refill threads
+        with cls._LOCK:
+            if cls._DISPLAY is None:
+                logger.info("Starting virtual display")
+                cls._DISPLAY = Display(visible=0, size=(1920, 1080))
+                cls._DISPLAY.start()
+            return cls._DISPLAY
+
+    @classmethod
+    def stop(cls):
+        """Stop display, if it has been started"""
+        with cls._LOCK:
+            if cls._DISPLAY is not None:
+                cls._DISPLAY.stop()
+                cls._DISPLAY = None
+
+
+class BrowserBase:
+    """Base class for Browser management"""
+
+    CLIENT_TYPE = None
+    SELENIUM_CLASS = None
+
+    @property
+    def is_headless(self):
+        """Return whether browser is running in headless mode"""
+        return not self.requires_display()
+
+    @classmethod
+    def requires_display(cls):
+        """Return whether browser requires a display, i.e. is not running headless"""
+        raise NotImplementedError
+
+    @classmethod
+    def get_standby_count(cls):
+        """Return number of warm standby browsers to keep in the pool"""
+        raise NotImplementedError
+
+    @property
+    def selenium_class(self):
+        """Return selenium type"""
+        if self.SELENIUM_CLASS is None:
+            raise NotImplementedError
+        return self.SELENIUM_CLASS
+
+    @property
+    def client_type(self):
+        """Return supported client type"""
+        if self.CLIENT_TYPE is None:
+            raise NotImplementedError
+
+        return self.CLIENT_TYPE
+
+    @property
+    def selenium_instance(self):
+        """Return selenium instance"""
+        return self._selenium_instance
+
+    @property
+    def page_load_strategy(self) -> PageLoadStrategy:
+        """Return webdriver page load strategy of browser session"""
+        return self._page_load_strategy
+
+    def __init__(self, page_load_strategy: PageLoadStrategy = PageLoadStrategy.NORMAL):
+        """Setup browser"""
+        logger.info("Creating new browser")
+        self._created_at = time.monotonic()
+        self._blocking_enabled = False
+        # Page load strategy is a capability of the session, so cannot be changed after creation
+        self._page_load_strategy = page_load_strategy
+
+        # Create selenium instance
+        self._selenium_instance = self.selenium_class(**self.get_selenium_kwargs())
+
+        # Maximise window
+        if self.is_headless:
+            # If running in headless, set the window size directly
+            # as maximise does not work
+            self.selenium_instance.set_window_position(0, 0)
+            self.selenium_instance.set_window_size(1920, 1080)
+        else:
+            # Otherwise, if using a read display, use maximum to
+            # make use of the full display
+            self.selenium_instance.maximize_window()
+
+        # Run post-setup configuration
+        self._post_setup_configuration()
+
+        # Obtain PID of browser
+        self._pid = self.selenium_instance.service.process.pid
+
+    def _post_setup_configuration(self):
+        """Perform post-setup configuration"""
+        raise NotImplementedError
+
+    def get_selenium_kwargs(self):
+        """Return list of kwargs to provide to selenium"""
+        raise NotImplementedError
+
+    def teardown(self):
+        """Teardown browser"""
+        # Attempt to close browser
+        try:
+            self.selenium_instance.close()
+        except (selenium.common.exceptions.InvalidSessionIdException,
+                selenium.common.exceptions.WebDriverException,
+                urllib3.exceptions.MaxRetryError) as exc:
+            logger.error(str(exc))
+
+        try:
+            self.selenium_instance.quit()
+        except urllib3.exceptions.MaxRetryError as exc:
+            # Handle exceptions when unable to connect to selenium chromedriver
+            logger.error(str(exc))
+
+        try:
+            # Kill any selenium PIDs, if they exist
+            psutil.Process(self._pid).terminate()
+        # Catch error if PID doesn't exist due to browser
+        # having close down correctly
+        except psutil.Error:
+            pass
+
+    # Script to clear all storage available to the origin of the current page
+    _CLEAR_ORIGIN_STORAGE_SCRIPT = """
+const done = arguments[arguments.length - 1];
+(async () => {
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+    try {
+        if (window.indexedDB && window.indexedDB.databases) {
+            for (const database of await window.indexedDB.databases()) {
+                window.indexedDB.deleteDatabase(database.name);
+            }
+        }
+    } catch (e) {}
+    try {
+        if (window.caches) {
+            for (const key of await window.caches.keys()) {
+                await window.caches.delete(key);
+            }
+        }
+    } catch (e) {}
+    try {
+        if (navigator.serviceWorker) {
+            for (const registration of await navigator.serviceWorker.getRegistrations()) {
+                await registration.unregister();
+            }
+        }
+    } catch (e) {}
+})().then(() => done(true), () => done(false));
+"""
+
+    # Script to obtain URLs of current page and all resources loaded by it
+    _GET_WINDOW_URLS_SCRIPT = """
+return [window.location.href].concat(
+    window.performance.getEntriesByType('resource').map((entry) => entry.name)
+);
+"""
+
+    @staticmethod
+    def _get_origins(urls: List[str]) -> Set[str]:
+        """Return set of http(s) origins from list of URLs"""
+        origins = set()
+        for url in urls:
+            parsed_url = urlparse(url)
+            if parsed_url.scheme in ["http", "https"] and parsed_url.netloc:
+                origins.add(f"{parsed_url.scheme}://{parsed_url.netloc}")
+        return origins
+
+    def _get_window_urls(self) -> List[str]:
+        """Return URLs visited by current window"""
+        return self.selenium_instance.execute_script(self._GET_WINDOW_URLS_SCRIPT) or []
+
+    def _clean_window(self) -> Set[str]:
+        """Clear storage for origin of current window, returning all origins used by the window"""
+        # Dismiss any open alerts, which would block script execution
+        try:
+            self.selenium_instance.switch_to.alert.dismiss()
+        except selenium.common.exceptions.NoAlertPresentException:
+            pass
+        self.selenium_instance.switch_to.default_content()
+
+        origins = self._get_origins(self._get_window_urls())
+        self.selenium_instance.execute_async_script(self._CLEAR_ORIGIN_STORAGE_SCRIPT)
+        self.selenium_instance.delete_all_cookies()
+        return origins
+
+    def _clear_browser_data(self, origins: Set[str]):
+        """Clear all browser data, using browser-specific APIs"""
+        raise NotImplementedError
+
+    def set_block_config(self, block_config: Optional[BlockConfig]):
+        """Block network requests for the run, or remove any blocking if block config is not provided"""
+        # Avoid calls to the browser when blocking has never been enabled
+        if block_config is None and not self._blocking_enabled:
+            return
+
+        self._apply_block_config(block_config)
+        self._blocking_enabled = block_config is not None
+
+    def _apply_block_config(self, block_config: Optional[BlockConfig]):
+        """Apply network request blocking, using browser-specific APIs"""
+        raise NotImplementedError
+
+    @property
+    def age(self) -> float:
+        """Return time since browser was created (in seconds)"""
+        return time.monotonic() - self._created_at
+
+    def get_rss(self) -> int:
+        """Return total resident memory of webdriver and browser process tree (in bytes)"""
+        try:
+            process = psutil.Process(self._pid)
+            processes = [process] + process.children(recursive=True)
+        except psutil.Error:
+            return 0
+
+        rss = 0
+        for child_process in processes:
+            try:
+                rss += child_process.memory_info().rss
+            except psutil.Error:
+                # Process may have exited
+                pass
+        return rss
+
+    def get_recycle_reason(self) -> Optional[str]:
+        """Return reason that the browser should be recycled, if it has exceeded configured thresholds"""
+        config = Config.get()
+        if config.BROWSER_MAX_AGE_SECONDS and self.age >= config.BROWSER_MAX_AGE_SECONDS:
+            return f"browser age ({self.age:.0f}s) exceeds {config.BROWSER_MAX_AGE_SECONDS}s"
+
+        if config.BROWSER_MAX_RSS_MB:
+            rss_mb = self.get_rss() / (1024 * 1024)
+            logger.debug(f"Browser RSS: {rss_mb:.1f}MB")
+            if rss_mb >= config.BROWSER_MAX_RSS_MB:
+                return f"browser memory ({rss_mb:.0f}MB) exceeds {config.BROWSER_MAX_RSS_MB}MB"
+        return None
+
+    def kill(self):
+        """Forcibly kill webdriver and browser process tree"""
+        try:
+            process = psutil.Process(self._pid)
+            processes = process.children(recursive=True) + [process]
+        except psutil.Error:
+            return
+
+        for child_process in processes:
+            try:
+                child_process.kill()
+            except psutil.Error:
+                pass
+        psutil.wait_procs(processes, timeout=5)
+
+    def clean(self):
+        """
+        Reset browser state between runs.
+
+        Closes any additional windows and clears cookies, local/session storage,
+        IndexedDB, cache storage and service workers for all origins used during the run.
+        """
+        window_handles = self.selenium_instance.window_handles
+        main_window_handle = window_handles[0]
+
+        origins = set()
+        for window_handle in reversed(window_handles):
+            self.selenium_instance.switch_to.window(window_handle)
+            origins.update(self._clean_window())
+
+            if window_handle != main_window_handle:
+                self.selenium_instance.close()
+
+        self.selenium_instance.switch_to.window(main_window_handle)
+        self.selenium_instance.get('about:blank')
+
+        self._clear_browser_data(origins)
+
+    def is_alive(self):
+        """Return whether the browser session is still responsive"""
+        try:
+            self.selenium_instance.current_window_handle
+            return True
+        except (selenium.common.exceptions.WebDriverException,
+                urllib3.exceptions.MaxRetryError):
+            return False
+
+
+class BrowserChrome(BrowserBase):
+
+    CLIENT_TYPE = ClientType.BROWSER_CHROME
+    SELENIUM_CLASS = selenium.webdriver.Chrome
+
+    def get_selenium_kwargs(self):
+        """Return kwargs to pass to selenium"""
+        options = ChromeOptions()
+        options.binary_location = "/opt/chrome-linux/chrome"
+        options.add_argument('--no-sandbox')
+        options.page_load_strategy = self.page_load_strategy.value
+
+        # Disable caching
+        options.add_argument("--incognito")
+        options.add_argument('--disable-application-cache')
+        options.add_argument("--disk-cache-size=0")
+        options.add_argument("--disk-cache-dir=/dev/null")
+
+        # Set headles mode, if enabled
+        if Config.get().CHROME_HEADLESS_MODE is not ChromeHeadlessMode.NONE:
+            headless_argument = (
+                "new"
+                if Config.get().CHROME_HEADLESS_MODE is ChromeHeadlessMode.NEW else
+                "chrome"
+            )
+            options.add_argument(f'--headless={headless_argument}')
+        return {"chrome_options": options}
+
+    @classmethod
+    def requires_display(cls):
+        """Return whether browser requires a display, i.e. is not running headless"""
+        return Config.get().CHROME_HEADLESS_MODE is ChromeHeadlessMode.NONE
+
+    @classmethod
+    def get_standby_count(cls):
+        """Return number of warm standby browsers to keep in the pool"""
+        return Config.get().CHROME_STANDBY_BROWSERS
+
+    def _post_setup_configuration(self):
+        """Perform post-setup configuration"""
+        # Disable network caching
+        self.selenium_instance.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled":True})
+
+    def _get_window_urls(self):
+        """Return URLs visited by current window, including navigation history"""
+        urls = super()._get_window_urls()
+        navigation_history = self.selenium_instance.execute_cdp_cmd("Page.getNavigationHistory", {})
+        urls += [entry["url"] for entry in navigation_history.get("entries", [])]
+        return urls
+
+    def _clear_browser_data(self, origins):
+        """Clear all browser data using CDP"""
+        # Include origins of any remaining targets, such as service workers and out-of-process iframes
+        targets = self.selenium_instance.execute_cdp_cmd("Target.getTargets", {})
+        origins = origins | self._get_origins([target["url"] for target in targets.get("targetInfos", [])])
+
+        for origin in sorted(origins):
+            self.selenium_instance.execute_cdp_cmd(
+                "Storage.clearDataForOrigin",
+                {"origin": origin, "storageTypes": "all"}
+            )
+
+        self.selenium_instance.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        self.selenium_instance.execute_cdp_cmd("Network.clearBrowserCache", {})
+        self.selenium_instance.execute_cdp_cmd("Page.resetNavigationHistory", {})
+
+    def _apply_block_config(self, block_config):
+        """Block URLs using CDP, matching resource types by file extension"""
+        url_patterns = block_config.get_url_patterns() if block_config else []
+        self.selenium_instance.execute_cdp_cmd("Network.enable", {})
+        self.selenium_instance.execute_cdp_cmd("Network.setBlockedURLs", {"urls": url_patterns})
+
+
+class BrowserFirefox(BrowserBase):
+
+    CLIENT_TYPE = ClientType.BROWSER_FIREFOX
+    SELENIUM_CLASS = selenium.webdriver.Firefox
+
+    def get_selenium_kwargs(self):
+        """Return kwargs to pass to selenium"""
+        options = FirefoxOptions()
+        options.headless = Config.get().FIREFOX_HEADLESS
+        options.page_load_strategy = self.page_load_strategy.value
+
+        # Create profile for disabling caching
+        profile = FirefoxProfile()
+        profile.set_preference('browser.cache.disk.enable', False)
+        profile.set_preference('browser.cache.memory.enable', False)
+        profile.set_preference('browser.cache.offline.enable', False)
+        profile.set_preference('network.cookie.cookieBehavior', 2)
+        profile.set_preference("browser.privatebrowsing.autostart", True)
+
+        return {
+            "options": options
+        }
+
+    @classmethod
+    def requires_display(cls):
+        """Return whether browser requires a display, i.e. is not running headless"""
+        return not Config.get().FIREFOX_HEADLESS
+
+    @classmethod
+    def get_standby_count(cls):
+        """Return number of warm standby browsers to keep in the pool"""
+        return Config.get().FIREFOX_STANDBY_BROWSERS
+
+    def _post_setup_configuration(self):
+        """Perform post-setup configuration"""
+        pass
+
+    def _clear_browser_data(self, origins):
+        """Clear all browser data using the privileged clear data service"""
+        try:
+            with self.selenium_instance.context(self.selenium_instance.CONTEXT_CHROME):
+                self.selenium_instance.execute_async_script("""
+const done = arguments[arguments.length - 1];
+Services.clearData.deleteData(Ci.nsIClearDataService.CLEAR_ALL, () => done(true));
+""")
+        except selenium.common.exceptions.WebDriverException as exc:
+            # Chrome context may not be available, in which case
+            # rely on the per-origin clearing performed on each window
+            logger.debug(f"Unable to clear firefox data using chrome context: {exc}")
+
+    # Script to register (or remove) an observer that cancels matching requests,
+    # matching resource types using the content policy type of the request
+    _SET_BLOCKED_REQUESTS_SCRIPT = """
+const [urlRegexes, contentPolicyTypes] = arguments;
+const topic = "http-on-modify-request";
+if (window.jmonBlockObserver) {
+    Services.obs.removeObserver(window.jmonBlockObserver, topic);
+    window.jmonBlockObserver = null;
+}
+if (urlRegexes.length || contentPolicyTypes.length) {
+    const regexes = urlRegexes.map((regex) => new RegExp(regex));
+    const types = new Set(contentPolicyTypes.map((name) => Ci.nsIContentPolicy[name]));
+    window.jmonBlockObserver = {
+        observe(subject) {
+            const channel = subject.QueryInterface(Ci.nsIHttpChannel);
+            if (types.has(channel.loadInfo.externalContentPolicyType) ||
+                    regexes.some((regex) => regex.test(channel.URI.spec))) {
+                channel.cancel(Cr.NS_ERROR_ABORT);
+            }
+        }
+    };
+    Services.obs.addObserver(window.jmonBlockObserver, topic);
+}
+"""
+
+    def _apply_block_config(self, block_config):
+        """Block requests using an observer in the privileged chrome context"""
+        url_regexes = block_config.get_url_regexes() if block_config else []
+        content_policy_types = block_config.get_firefox_content_policy_types() if block_config else []
+        try:
+            with self.selenium_instance.context(self.selenium_instance.CONTEXT_CHROME):
+                self.selenium_instance.execute_script(
+                    self._SET_BLOCKED_REQUESTS_SCRIPT, url_regexes, content_policy_types
+                )
+        except selenium.common.exceptions.WebDriverException as exc:
+            logger.warning(f"Unable to block requests in firefox using chrome context: {exc}")
+
+
+class BrowserPoolMetrics:
+    """Usage metrics for a browser pool, used for sizing standby counts"""
+
+    def __init__(self):
+        """Setup counters"""
+        self.hits = 0
+        self.misses = 0
+        self.spawn_count = 0
+        self.total_spawn_time = 0.0
+        self.last_spawn_time: Optional[float] = None
+
+    @property
+    def average_spawn_time(self) -> Optional[float]:
+        """Return average time taken to spawn a browser (in seconds)"""
+        if not self.spawn_count:
+            return None
+        return self.total_spawn_time / self.spawn_count
+
+    def record_spawn(self, duration):
+        """Record time taken to spawn a browser"""
+        self.spawn_count += 1
+        self.total_spawn_time += duration
+        self.last_spawn_time = duration
+
+    def as_dict(self):
+        """Return metrics as dictionary"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "spawn_count": self.spawn_count,
+            "average_spawn_time": self.average_spawn_time,
+            "last_spawn_time": self.last_spawn_time,
+        }
+
+
+class BrowserPool:
+    """
+    Per-process pool of warm standby browsers.
+
+    Browsers are handed out by client type. When a browser is
+    acquired, the standby browsers for the client type are refilled
+    on a background thread, so that subsequent requests (or switches between
+    client types) do not pay the browser start-up cost on the critical path.
+
+    Pooled browsers use the normal page load strategy. Browsers with other
+    strategies are created on demand and are not returned to the pool.
+    """
+
+    def __init__(self, class_mappings, retained_count=0):
+        """Store member variables"""
+        self._class_mappings = class_mappings
+        # Minimum number of released browsers to retain per client type,
+        # even when no standby browsers are configured
+        self._retained_count = retained_count
+        self._lock = threading.Lock()
+        self._standby: Dict[ClientType, List[BrowserBase]] = {
+            client_type: []
+            for client_type in self._class_mappings
+        }
+        self._metrics: Dict[ClientType, BrowserPoolMetrics] = {
+            client_type: BrowserPoolMetrics()
+            for client_type in self._class_mappings
+        }
+        self._refill_threads: Dict[ClientType, threading.Thread] = {}
+        self._shutting_down = False
+
+    @property
+    def metrics(self):
+        """Return pool metrics, by client type"""
+        return {
+            client_type: metrics.as_dict()
+            for client_type, metrics in self._metrics.items()
+        }
+
+    def get_browser_class_by_client_type(self, client_type):
+        """Return browser class by client type"""
+        browser_class = self._class_mappings.get(client_type)
+        if browser_class is None:
+            raise Exception(f"Could not find browser class for client type: {client_type}")
+        return browser_class
+
+    def get_standby_count(self, client_type):
+        """Return number of configured standby browsers for client type"""
+        return self.get_browser_class_by_client_type(client_type).get_standby_count()
+
+    def get_retained_count(self, client_type):
+        """Return number of released browsers that may be retained for client type"""
+        return max(self.get_standby_count(client_type), self._retained_count)
+
+    def _spawn(self, client_type, page_load_strategy: PageLoadStrategy = PageLoadStrategy.NORMAL):
+        """Create new browser, recording spawn time"""
+        browser_class = self.get_browser_class_by_client_type(client_type)
+        start_time = time.monotonic()
+
+        # Only start a display when a non-headless browser is created
+        if browser_class.requires_display():
+            VirtualDisplay.get()
+
+        browser = browser_class(page_load_strategy=page_load_strategy)
+        duration = time.monotonic() - start_time
+
+        with self._lock:
+            self._metrics[client_type].record_spawn(duration)
+        logger.info(f"Spawned {client_type.value} browser in {duration:.2f}s")
+        return browser
+
+    def _pop_standby(self, client_type):
+        """Obtain healthy standby browser, if one is available"""
+        while True:
+            with self._lock:
+                standby = self._standby[client_type]
+                if not standby:
+                    return None
+                browser = standby.pop(0)
+
+            if not browser.is_alive():
+                logger.info("Standby browser is no longer responsive - tearing down")
+            elif recycle_reason := browser.get_recycle_reason():
+                logger.info(f"Recycling standby browser: {recycle_reason}")
+            else:
+                return browser
+
+            browser.teardown()
+
+    def acquire(self, client_type, page_load_strategy: PageLoadStrategy = PageLoadStrategy.NORMAL):
+        """Obtain browser for client type, using a standby browser where available"""
+        browser = self._pop_standby(client_type) if page_load_strategy is PageLoadStrategy.NORMAL else None
+
+        with self._lock:
+            metrics = self._metrics[client_type]
+            if browser is not None:
+                metrics.hits += 1
+            else:
+                metrics.misses += 1
+
+        if browser is not None:
+            logger.info("Using standby browser from pool")
+        else:
+            logger.info("No standby browser available - creating new browser")
+            browser = self._spawn(client_type, page_load_strategy=page_load_strategy)
+
+        logger.info(f"Browser pool metrics ({client_type.value}): {metrics.as_dict()}")
+
+        # Replace the standby browser that has just been used
+        self.refill(client_type)
+        return browser
+
+    def release(self, browser: BrowserBase):
+        """Return browser to pool, tearing it down if the pool is full"""
+        client_type = browser.client_type
+        with self._lock:
+            has_capacity = (
+                not self._shutting_down and
+                browser.page_load_strategy is PageLoadStrategy.NORMAL and
+                len(self._standby[client_type]) < self.get_retained_count(client_type)
+            )
+
+        if has_capacity and (recycle_reason := browser.get_recycle_reason()):
+            logger.info(f"Recycling browser: {recycle_reason}")
+            has_capacity = False
+
+        if has_capacity:
+            try:
+                browser.clean()
+                with self._lock:
+                    self._standby[client_type].append(browser)
+                logger.info("Returned browser to pool")
+                return
+            except Exception as exc:
+                logger.info(f"Error whilst cleaning browser for pool: {exc}")
+
+        browser.teardown()
+
+    def refill(self, client_type):
+        """Start background refill of standby browsers for client type"""
+        if self.get_standby_count(client_type) <= 0:
+            return
+
+        with self._lock:
+            if self._shutting_down:
+                return
+            existing_thread = self._refill_threads.get(client_type)
+            if existing_thread is not None and existing_thread.is_alive():
+                return
+
+            thread = threading.Thread(
+                target=self._refill,
+                args=(client_type, ),
+                name=f"browser-pool-refill-{client_type.value}",
+                daemon=True
+            )
+            self._refill_threads[client_type] = thread
+        thread.start()
+
+    def refill_all(self):
+        """Start background refill for all client types with standby browsers configured"""
+        for client_type in self._class_mappings:
+            self.refill(client_type)
+
+    def _refill(self, client_type):
+        """Create standby browsers until the configured count is reached"""
+        while True:
+            with self._lock:
+                if (self._shutting_down or
+                        len(self._standby[client_type]) >= self.get_standby_count(client_type)):
+                    return
+
+            try:
+                browser = self._spawn(client_type)
+            except Exception as exc:
+                logger.error(f"Failed to create standby browser: {exc}")
+                return
+
+            with self._lock:
+                if not self._shutting_down:
+                    self._standby[client_type].append(browser)
+                    continue
+
+            # Pool has been torn down whilst the browser was being created
+            browser.teardown()
+            return
+
+    def teardown(self):
+        """Teardown all standby browsers"""
+        with self._lock:
+            self._shutting_down = True
+            refill_threads = list(self._refill_threads.values())
+
+        for thread in refill_threads:
+            thread.join()
+
+        with self._lock:
+            standby_browsers = [
+                browser
+                for client_browsers in self._standby.values()
+                for browser in client_browsers
+            ]
+            for client_browsers in self._standby.values():
+                client_browsers.clear()
+            self._refill_threads = {}
+            self._shutting_down = False
+
+        for browser in standby_browsers:
+            browser.teardown()
+
+
+class BrowserFactory:
+
+    _INSTANCE = None
+
+    @classmethod
+    def get(cls):
+        """Return instance of browser factory"""
+        if cls._INSTANCE is None:
+            cls._INSTANCE = cls()
+        return cls._INSTANCE
+
+    @property
+    def cached_browser_client_type(self):
+        """Return client type of cached browser, if present"""
+        if self._browser is not None:
+            return self._browser.client_type
+        return None
+
+    @property
+    def pool(self) -> BrowserPool:
+        """Return browser pool"""
+        return self._pool
+
+    def __init__(self):
+        """Store member variable"""
+        self._browser: BrowserBase = None
+        self._class_mappings = {
+            browser_class.CLIENT_TYPE: browser_class
+            for browser_class in BrowserBase.__subclasses__()
+        }
+        self._pool = BrowserPool(class_mappings=self._class_mappings)
+
+    def get_browser(self, client_type, block_config: Optional[BlockConfig]=None,
+                    page_load_strategy: PageLoadStrategy=PageLoadStrategy.NORMAL):
+        """Obtain and cache browser, applying request blocking for the run"""
+        browser = self._get_browser(client_type, page_load_strategy)
+        try:
+            # Always apply, to remove blocking from any previous run
+            browser.set_block_config(block_config)
+        except Exception:
+            self.teardown_browser()
+            raise
+        return browser
+
+    def _get_browser(self, client_type, page_load_strategy: PageLoadStrategy):
+        """Obtain and cache browser"""
+        # If a browser is already present
+        if self._browser is not None:
+            # If it matches the type, ensure it is working and return
+            if client_type is self._browser.client_type and page_load_strategy is self._browser.page_load_strategy:
+                try:
+                    self._browser.clean()
+
+                    logger.info("Using cached browser")
+                    # Return the cached browser
+                    return self._browser
+                except Exception as exc:
+                    logger.info(f"Error whilst cleaning cached browser: {exc}")
+                    # Delete cached browser
+                    self.teardown_browser()
+
+            else:
+                # Otherwise, if the cached browser type does not match
+                # the required browser, return it to the pool
+                logger.info("Browser type does not match cached browser - returning to pool")
+                self.release_browser()
+
+        # If a cache browser has not been returned, obtain one from the pool
+        self._browser = self._pool.acquire(client_type, page_load_strategy=page_load_strategy)
+
+        return self._browser
+
+    def get_browser_class_by_client_type(self, client_type):
+        """Return browser class by client type"""
+        return self._pool.get_browser_class_by_client_type(client_type)
+
+    def release_browser(self):
+        """Return cached browser to pool"""
+        if self._browser:
+            self._pool.release(self._browser)
+            self._browser = None
+
+    def teardown_browser(self):
+        """Tear down cached browser"""
+        if self._browser:
+            self._browser.teardown()
+            self._browser = None
+
+    def recycle_browser_if_required(self):
+        """Tear down cached browser if it has exceeded memory or age thresholds"""
+        if self._browser and (recycle_reason := self._browser.get_recycle_reason()):
+            logger.info(f"Recycling browser: {recycle_reason}")
+            client_type = self._browser.client_type
+            self.teardown_browser()
+            # Replace standby browser, if configured
+            self._pool.refill(client_type)
+
+    def kill_browser(self):
+        """
+        Forcibly kill cached browser.
+
+        This may be called from another thread, so the browser is not
+        removed - it is expected that the run will subsequently tear it down.
+        """
+        if self._browser:
+            self._browser.kill()
+
+    def teardown(self):
+        """Tear down cached browser and all browsers in pool"""
+        self.teardown_browser()
+        self._pool.teardown()
@@ -0,0 +1,462 @@
+"""
+Long-lived browser host.
+
+The browser host owns the virtual display (if required) and a pool of browsers,
+outside of the Celery worker child processes.
+Worker children lease a browser from the host over a unix socket,
+which is authenticated using a shared secret, and attach to the existing webdriver session, meaning that browsers
+survive worker child recycling (max-tasks-per-child, memory limits or crashes).
+
+Run using:
+
+    python -m jmon.browser_host
+"""
+
+import logging
+import os
+import secrets
+import signal
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from typing import Dict, Optional
+
+import selenium.webdriver
+
+from jmon.block_config import BlockConfig
+from jmon.client_type import ClientType
+from jmon.config import Config
+from jmon.errors import BrowserHostError
+from jmon.logger import logger
+from jmon.page_load import PageLoadStrategy
+import jmon.browser
+
+
+def get_auth_key_path(address: str) -> str:
+    """Return path of file containing generated auth key of browser host"""
+    return f"{address}.key"
+
+
+def create_auth_key(address: str) -> bytes:
+    """
+    Return auth key for browser host, from config if set.
+
+    Otherwise, a secret is generated and written to a file,
+    only readable by the current user, for workers to read.
+    """
+    if auth_key := Config.get().BROWSER_HOST_AUTH_KEY:
+        return auth_key.encode("utf-8")
+
+    auth_key = secrets.token_hex(32).encode("utf-8")
+    key_path = get_auth_key_path(address)
+    if os.path.exists(key_path):
+        os.unlink(key_path)
+    key_fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(key_fd, "wb") as key_file:
+        key_file.write(auth_key)
+    return auth_key
+
+
+def read_auth_key(address: str) -> bytes:
+    """Return auth key for connecting to browser host, from config if set, otherwise from the file written by the host"""
+    if auth_key := Config.get().BROWSER_HOST_AUTH_KEY:
+        return auth_key.encode("utf-8")
+
+    try:
+        with open(get_auth_key_path(address), "rb") as key_file:
+            return key_file.read()
+    except OSError as exc:
+        raise BrowserHostError(f"Unable to read browser host auth key: {exc}")
+
+
+class AttachedWebDriver(selenium.webdriver.Remote):
+    """
+    Selenium webdriver that attaches to an existing session,
+    rather than creating a new session.
+    """
+
+    def __init__(self, command_executor, session_id, capabilities):
+        """Store session details and attach to remote"""
+        self._attach_session_id = session_id
+        self._attach_capabilities = capabilities
+        super().__init__(command_executor=command_executor)
+
+    def start_session(self, capabilities, browser_profile=None):
+        """Use leased session, rather than creating a new session"""
+        self.session_id = self._attach_session_id
+        self.caps = self._attach_capabilities
+
+    def quit(self):
+        """Do not end the session - the browser is owned by the browser host"""
+        pass
+
+
+class RemoteBrowser:
+    """Browser leased from browser host"""
+
+    def __init__(self, client_type, selenium_instance, page_load_strategy: PageLoadStrategy=PageLoadStrategy.NORMAL):
+        """Store member variables"""
+        self._client_type = client_type
+        self._selenium_instance = selenium_instance
+        self._page_load_strategy = page_load_strategy
+
+    @property
+    def client_type(self):
+        """Return client type of browser"""
+        return self._client_type
+
+    @property
+    def page_load_strategy(self) -> PageLoadStrategy:
+        """Return webdriver page load strategy of browser session"""
+        return self._page_load_strategy
+
+    @property
+    def selenium_instance(self):
+        """Return selenium instance"""
+        return self._selenium_instance
+
+
+class BrowserHost:
+    """Serve browsers to worker processes"""
+
+    def __init__(self, address):
+        """Setup browser pool"""
+        self._address = address
+        self._class_mappings = {
+            browser_class.CLIENT_TYPE: browser_class
+            for browser_class in jmon.browser.BrowserBase.__subclasses__()
+        }
+        self._pool = jmon.browser.BrowserPool(
+            class_mappings=self._class_mappings,
+            retained_count=Config.get().BROWSER_HOST_RETAINED_BROWSERS
+        )
+        self._listener: Optional[Listener] = None
+        self._lock = threading.Lock()
+        # Browsers currently leased to workers, keyed by session ID
+        self._leases: Dict[str, jmon.browser.BrowserBase] = {}
+        self._running = False
+
+    def _lease(self, browser):
+        """Record lease of browser and return session details"""
+        with self._lock:
+            self._leases[browser.selenium_instance.session_id] = browser
+
+        return {
+            "session_id": browser.selenium_instance.session_id,
+            "executor_url": browser.selenium_instance.command_executor._url,
+            "capabilities": browser.selenium_instance.caps,
+        }
+
+    def _end_lease(self, session_id):
+        """Remove lease, returning the browser"""
+        with self._lock:
+            browser = self._leases.pop(session_id, None)
+        if browser is None:
+            raise BrowserHostError(f"Unknown browser session: {session_id}")
+        return browser
+
+    def _handle_request(self, request):
+        """Handle request from worker"""
+        action = request.get("action")
+
+        if action == "acquire":
+            browser = self._pool.acquire(
+                ClientType(request["client_type"]),
+                page_load_strategy=PageLoadStrategy(request.get("page_load_strategy", PageLoadStrategy.NORMAL.value))
+            )
+            try:
+                browser.set_block_config(BlockConfig.from_config(request.get("block")))
+            except Exception as exc:
+                browser.teardown()
+                self._pool.refill(browser.client_type)
+                raise BrowserHostError(f"Error whilst applying request blocking: {exc}")
+            return self._lease(browser)
+
+        elif action == "clean":
+            with self._lock:
+                browser = self._leases.get(request["session_id"])
+            if browser is None:
+                raise BrowserHostError(f"Unknown browser session: {request['session_id']}")
+            if recycle_reason := browser.get_recycle_reason():
+                # Browser has exceeded thresholds, so remove it from the host
+                self._end_lease(request["session_id"])
+                browser.teardown()
+                self._pool.refill(browser.client_type)
+                raise BrowserHostError(f"Browser has been recycled: {recycle_reason}")
+            try:
+                browser.clean()
+                browser.set_block_config(BlockConfig.from_config(request.get("block")))
+            except Exception as exc:
+                # Browser is unusable, so remove it from the host
+                self._end_lease(request["session_id"])
+                browser.teardown()
+                raise BrowserHostError(f"Error whilst cleaning browser: {exc}")
+            return {}
+
+        elif action == "release":
+            self._pool.release(self._end_lease(request["session_id"]))
+            return {}
+
+        elif action == "teardown":
+            browser = self._end_lease(request["session_id"])
+            browser.teardown()
+            # Replace the torn down browser in the background
+            self._pool.refill(browser.client_type)
+            return {}
+
+        raise BrowserHostError(f"Unknown action: {action}")
+
+    def _handle_connection(self, connection):
+        """Handle requests from a worker connection"""
+        # Browsers leased over the connection, which are returned
+        # to the pool if the worker disconnects without releasing them
+        connection_sessions = set()
+        try:
+            while True:
+                try:
+                    request = connection.recv()
+                except (EOFError, OSError):
+                    break
+
+                try:
+                    response = self._handle_request(request)
+                except Exception as exc:
+                    logger.error(f"Error handling browser host request: {exc}")
+                    response = {"error": str(exc)}
+
+                if "error" not in response:
+                    if request.get("action") == "acquire":
+                        connection_sessions.add(response["session_id"])
+                    elif request.get("action") in ["release", "teardown"]:
+                        connection_sessions.discard(request["session_id"])
+
+                try:
+                    connection.send(response)
+                except (EOFError, OSError):
+                    break
+        finally:
+            connection.close()
+
+            for session_id in connection_sessions:
+                try:
+                    browser = self._end_lease(session_id)
+                except BrowserHostError:
+                    continue
+                logger.info("Worker disconnected without releasing browser - returning to pool")
+                self._pool.release(browser)
+
+    def _create_listener(self) -> Listener:
+        """Create listener on socket, which is only accessible by the current user and requires the auth key"""
+        auth_key = create_auth_key(self._address)
+        previous_umask = os.umask(0o177)
+        try:
+            return Listener(address=self._address, family="AF_UNIX", authkey=auth_key)
+        finally:
+            os.umask(previous_umask)
+
+    def serve_forever(self):
+        """Accept connections from workers"""
+        # Remove stale socket from previous host
+        if os.path.exists(self._address):
+            os.unlink(self._address)
+
+        self._listener = self._create_listener()
+        self._running = True
+        logger.info(f"Browser host listening on {self._address}")
+
+        # Warm standby browsers. The display is created on demand by the pool
+        self._pool.refill_all()
+
+        try:
+            while self._running:
+                try:
+                    connection = self._listener.accept()
+                except AuthenticationError as exc:
+                    logger.error(f"Rejected unauthenticated browser host connection: {exc}")
+                    continue
+                except OSError:
+                    # Listener has been closed
+                    break
+
+                threading.Thread(
+                    target=self._handle_connection,
+                    args=(connection, ),
+                    name="browser-host-connection",
+                    daemon=True
+                ).start()
+        finally:
+            self.teardown()
+
+    def stop(self, *args):
+        """Stop accepting connections"""
+        self._running = False
+        if self._listener is not None:
+            self._listener.close()
+
+    def teardown(self):
+        """Teardown all browsers and display"""
+        with self._lock:
+            leased_browsers = list(self._leases.values())
+            self._leases = {}
+
+        for browser in leased_browsers:
+            browser.teardown()
+        self._pool.teardown()
+        jmon.browser.VirtualDisplay.stop()
+
+
+class BrowserHostClient:
+    """
+    Obtain browsers from the browser host.
+
+    Provides the same interface as BrowserFactory for use by the runner.
+    """
+
+    _INSTANCE = None
+
+    @classmethod
+    def get(cls):
+        """Return instance of browser host client"""
+        if cls._INSTANCE is None:
+            cls._INSTANCE = cls(address=Config.get().BROWSER_HOST_SOCKET)
+        return cls._INSTANCE
+
+    def __init__(self, address):
+        """Store member variables"""
+        self._address = address
+        self._connection = None
+        self._browser: Optional[RemoteBrowser] = None
+
+    @property
+    def cached_browser_client_type(self):
+        """Return client type of cached browser, if present"""
+        if self._browser is not None:
+            return self._browser.client_type
+        return None
+
+    def _connect(self):
+        """Create authenticated connection to browser host"""
+        try:
+            return Client(address=self._address, family="AF_UNIX", authkey=read_auth_key(self._address))
+        except (OSError, AuthenticationError) as exc:
+            raise BrowserHostError(f"Unable to connect to browser host: {exc}")
+
+    def _request(self, action, **kwargs):
+        """Send request to browser host and return response"""
+        if self._connection is None:
+            self._connection = self._connect()
+
+        try:
+            self._connection.send(dict(action=action, **kwargs))
+            response = self._connection.recv()
+        except (EOFError, OSError) as exc:
+            self._close()
+            raise BrowserHostError(f"Lost connection to browser host: {exc}")
+
+        if "error" in response:
+            raise BrowserHostError(response["error"])
+        return response
+
+    def _close(self):
+        """Close connection to browser host"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._browser = None
+
+    def get_browser(self, client_type, block_config: Optional[BlockConfig]=None,
+                    page_load_strategy: PageLoadStrategy=PageLoadStrategy.NORMAL):
+        """Obtain browser from browser host, with request blocking applied by the host"""
+        block = block_config.as_dict() if block_config else None
+        if self._browser is not None:
+            if client_type is self._browser.client_type and page_load_strategy is self._browser.page_load_strategy:
+                try:
+                    self._request("clean", session_id=self._browser.selenium_instance.session_id, block=block)
+
+                    logger.info("Using cached browser from browser host")
+                    return self._browser
+                except BrowserHostError as exc:
+                    logger.info(f"Error whilst cleaning cached browser: {exc}")
+                    self._close()
+            else:
+                logger.info("Browser type does not match cached browser - returning to browser host")
+                self.release_browser()
+
+        response = self._request(
+            "acquire", client_type=client_type.value, block=block, page_load_strategy=page_load_strategy.value
+        )
+        self._browser = RemoteBrowser(
+            client_type=client_type,
+            selenium_instance=AttachedWebDriver(
+                command_executor=response["executor_url"],
+                session_id=response["session_id"],
+                capabilities=response["capabilities"],
+            ),
+            page_load_strategy=page_load_strategy
+        )
+        return self._browser
+
+    def release_browser(self):
+        """Return cached browser to browser host"""
+        if self._browser:
+            try:
+                self._request("release", session_id=self._browser.selenium_instance.session_id)
+            except BrowserHostError as exc:
+                logger.error(f"Failed to release browser to browser host: {exc}")
+            self._close()
+
+    def teardown_browser(self):
+        """Request browser host to tear down cached browser"""
+        if self._browser:
+            try:
+                self._request("teardown", session_id=self._browser.selenium_instance.session_id)
+            except BrowserHostError as exc:
+                logger.error(f"Failed to teardown browser in browser host: {exc}")
+            self._close()
+
+    def recycle_browser_if_required(self):
+        """Browsers are recycled by the browser host, when they are cleaned for the next run"""
+        pass
+
+    def kill_browser(self):
+        """
+        Request browser host to tear down cached browser.
+
+        This may be called from another thread whilst the run is using the browser,
+        so a separate connection to the browser host is used.
+        """
+        browser = self._browser
+        if browser is None:
+            return
+
+        try:
+            connection = self._connect()
+            try:
+                connection.send({"action": "teardown", "session_id": browser.selenium_instance.session_id})
+                connection.recv()
+            finally:
+                connection.close()
+        except (BrowserHostError, EOFError, OSError) as exc:
+            logger.error(f"Failed to teardown browser in browser host: {exc}")
+
+    def teardown(self):
+        """Return browser to the browser host, so that it outlives the worker process"""
+        self.release_browser()
+
+
+def main():
+    """Run browser host"""
+    logging.basicConfig(level=logging.INFO)
+
+    address = Config.get().BROWSER_HOST_SOCKET
+    if not address:
+        raise BrowserHostError("BROWSER_HOST_SOCKET must be configured to run the browser host")
+
+    host = BrowserHost(address=address)
+    signal.signal(signal.SIGTERM, host.stop)
+    signal.signal(signal.SIGINT, host.stop)
+    host.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,14 @@ class ClientType(Enum):
     BROWSER_FIREFOX = "BROWSER_FIREFOX"
     BROWSER_CHROME = "BROWSER_CHROME"
     REQUESTS = "REQUESTS"
+    BROWSER_PLAYWRIGHT = "BROWSER_PLAYWRIGHT"
 
     @classmethod
     def get_all(cls):
-        """Return all names of client types, in order"""
+        """
+        Return all names of client types, in order.
+
+        Playwright is not included, as it must be explicitly
+        selected by checks, using the client attribute.
+        """
         return [cls.REQUESTS, cls.BROWSER_FIREFOX, cls.BROWSER_CHROME]
@@ -78,6 +78,105 @@ class Config:
         """Min run timeout"""
         return int(os.environ.get('MIN_CHECK_TIMEOUT', '1'))
 
+    @property
+    def RUN_DEADLINE_GRACE_PERIOD(self) -> int:
+        """
+        Grace period (seconds) after the check timeout, before a run is forcibly aborted.
+
+        Runs that exceed the check timeout plus grace period (e.g. due to a hung browser or HTTP request)
+        have any browser killed and are recorded as a timeout, returning the worker to the pool.
+        """
+        return int(os.environ.get('RUN_DEADLINE_GRACE_PERIOD', '30'))
+
+    @property
+    def FIND_ELEMENT_TIMEOUT(self) -> float:
+        """
+        Maximum time (seconds) that find steps wait for an element to be present.
+
+        The wait is also bounded by the remaining time of the run.
+        """
+        return float(os.environ.get('FIND_ELEMENT_TIMEOUT', '5'))
+
+    @property
+    def FIND_ELEMENT_POLL_INTERVAL(self) -> float:
+        """Interval (seconds) between attempts to find an element"""
+        return float(os.environ.get('FIND_ELEMENT_POLL_INTERVAL', '0.1'))
+
+    @property
+    def ASSERTION_TIMEOUT(self) -> float:
+        """
+        Maximum time (seconds) that text, title and URL checks in browsers wait for the expected value.
+
+        The wait is also bounded by the remaining time of the run.
+        """
+        return float(os.environ.get('ASSERTION_TIMEOUT', '2.5'))
+
+    @property
+    def BATCH_READ_ONLY_STEPS(self) -> bool:
+        """
+        Whether find steps containing only nested finds and text, title or URL checks
+        are evaluated in a single browser script, before falling back to executing
+        each step individually.
+        """
+        return os.environ.get('BATCH_READ_ONLY_STEPS', 'True').lower() == 'true'
+
+    @property
+    def BROWSER_PREFLIGHT(self) -> bool:
+        """
+        Whether browser checks probe the URL of the first goto step using an HTTP request,
+        before acquiring a browser.
+
+        If the target cannot be connected to, or does not respond within BROWSER_PREFLIGHT_TIMEOUT,
+        the run is marked as failed without performing any browser steps.
+        """
+        return os.environ.get('BROWSER_PREFLIGHT', 'False').lower() == 'true'
+
+    @property
+    def BROWSER_PREFLIGHT_TIMEOUT(self) -> float:
+        """Timeout (seconds) for connecting to and receiving the first byte from the target during preflight"""
+        return float(os.environ.get('BROWSER_PREFLIGHT_TIMEOUT', '5'))
+
+    @property
+    def REQUESTS_KEEP_ALIVE_TIMEOUT(self) -> float:
+        """
+        Time (seconds) that idle HTTP connections of requests checks are kept open,
+        to be re-used by subsequent runs to the same host.
+        """
+        return float(os.environ.get('REQUESTS_KEEP_ALIVE_TIMEOUT', '30'))
+
+    @property
+    def REQUESTS_MAX_BODY_SIZE(self) -> int:
+        """
+        Default maximum size (bytes) of response body read by checks,
+        for goto steps that stream the response.
+        """
+        return int(os.environ.get('REQUESTS_MAX_BODY_SIZE', '10485760'))
+
+    @property
+    def LOG_BODY_EXCERPT_SIZE(self) -> int:
+        """Maximum number of characters of a response body that are logged by failing checks"""
+        return int(os.environ.get('LOG_BODY_EXCERPT_SIZE', '1000'))
+
+    @property
+    def REQUESTS_POOL_MAX_HOSTS(self) -> int:
+        """Maximum number of hosts that HTTP connections of requests checks are kept open for, per worker"""
+        return int(os.environ.get('REQUESTS_POOL_MAX_HOSTS', '50'))
+
+    @property
+    def REQUESTS_POOL_MAX_CONNECTIONS_PER_HOST(self) -> int:
+        """Maximum number of idle HTTP connections kept open per host, per worker"""
+        return int(os.environ.get('REQUESTS_POOL_MAX_CONNECTIONS_PER_HOST', '10'))
+
+    @property
+    def DNS_QUERY_MAX_CONCURRENCY(self) -> int:
+        """Maximum number of concurrent name server queries performed by DNS steps using concurrent mode, per worker"""
+        return int(os.environ.get('DNS_QUERY_MAX_CONCURRENCY', '10'))
+
+    @property
+    def PARALLEL_STEP_MAX_CONCURRENCY(self) -> int:
+        """Maximum number of branches of parallel steps executed concurrently, per worker"""
+        return int(os.environ.get('PARALLEL_STEP_MAX_CONCURRENCY', '10'))
+
     @property
     def MAX_CHECK_QUEUE_TIME(self) -> int:
         """Check queue timeout"""
@@ -189,11 +288,10 @@ class Config:
         """
         Whether to cache browser between runs.
 
-        This is experimental and might be unstable.
-
-        Use on non-production environment
+        Cached browsers are reset between runs, closing additional windows
+        and clearing cookies, storage, IndexedDB, cache storage and service workers.
         """
-        return os.environ.get("CACHE_BROWSER", "False") == "True"
+        return os.environ.get("CACHE_BROWSER", "True") == "True"
 
     @property
     def PREFER_CACHED_BROWSER(self) -> bool:
@@ -222,6 +320,97 @@ class Config:
         """Whether to run firefox in headless mode"""
         return os.environ.get("FIREFOX_HEADLESS", "True") == "True"
 
+    @property
+    def CHROME_STANDBY_BROWSERS(self) -> int:
+        """
+        Number of warm standby Chrome browsers to keep in each worker's browser pool.
+
+        Standby browsers are created in the background, so that runs (or switches
+        between browser types) do not wait for a browser to start.
+        Browser pool hit/miss and spawn time metrics are logged by the agent to help sizing.
+        """
+        return int(os.environ.get("CHROME_STANDBY_BROWSERS", "0"))
+
+    @property
+    def FIREFOX_STANDBY_BROWSERS(self) -> int:
+        """
+        Number of warm standby Firefox browsers to keep in each worker's browser pool.
+
+        See CHROME_STANDBY_BROWSERS.
+        """
+        return int(os.environ.get("FIREFOX_STANDBY_BROWSERS", "0"))
+
+    @property
+    def BROWSER_HOST_SOCKET(self) -> Optional[str]:
+        """
+        Path to unix socket of the browser host.
+
+        When set, agents obtain browsers from the long-lived browser host (`python -m jmon.browser_host`),
+        rather than starting browsers inside each worker process,
+        so that browsers survive worker process recycling.
+        The browser host must run on the same machine/container as the agent.
+        """
+        return os.environ.get("BROWSER_HOST_SOCKET")
+
+    @property
+    def BROWSER_HOST_AUTH_KEY(self) -> Optional[str]:
+        """
+        Secret used to authenticate connections between agents and the browser host.
+
+        When not set, the browser host generates a secret on start-up and writes it
+        to a file alongside the socket (BROWSER_HOST_SOCKET with a `.key` suffix),
+        which is only readable by the user running the browser host.
+        """
+        return os.environ.get("BROWSER_HOST_AUTH_KEY")
+
+    @property
+    def BROWSER_HOST_RETAINED_BROWSERS(self) -> int:
+        """
+        Number of browsers, per browser type, that the browser host retains
+        when they are released by workers.
+
+        Standby browsers (CHROME_STANDBY_BROWSERS/FIREFOX_STANDBY_BROWSERS) are always retained.
+        """
+        return int(os.environ.get("BROWSER_HOST_RETAINED_BROWSERS", "1"))
+
+    @property
+    def BROWSER_MAX_RSS_MB(self) -> int:
+        """
+        Maximum resident memory (MB) of a browser process tree (webdriver and browser processes),
+        after which the browser is recycled.
+
+        Set to 0 to disable.
+        """
+        return int(os.environ.get("BROWSER_MAX_RSS_MB", "1024"))
+
+    @property
+    def BROWSER_MAX_AGE_SECONDS(self) -> int:
+        """
+        Maximum age (seconds) of a browser, after which the browser is recycled.
+
+        Set to 0 to disable.
+        """
+        return int(os.environ.get("BROWSER_MAX_AGE_SECONDS", "3600"))
+
+    @property
+    def WORKER_MAX_MEMORY_MB(self) -> int:
+        """
+        Maximum resident memory (MB) of a worker process.
+        Once exceeded, the worker process is replaced after completing its current task.
+
+        Set to 0 to disable.
+        """
+        return int(os.environ.get("WORKER_MAX_MEMORY_MB", "512"))
+
+    @property
+    def WORKER_MAX_TASKS_PER_CHILD(self) -> int:
+        """
+        Maximum number of tasks executed by a worker process, before it is replaced.
+
+        Defaults to 0 (unlimited), as worker processes are recycled based on memory usage (WORKER_MAX_MEMORY_MB).
+        """
+        return int(os.environ.get("WORKER_MAX_TASKS_PER_CHILD", "0"))
+
     @property
     def AWS_ENDPOINT(self) -> Optional[str]:
         """HTTPS url for AWS ENDPOINT for accessing S3. Set to minio API URL, if in use."""
@@ -4,6 +4,8 @@ except ImportError:
     from threading import get_ident as _ident_func
 
 # from threading import get_ident as _ident_func
+import threading
+
 import sqlalchemy
 import sqlalchemy.orm
 
@@ -33,8 +35,10 @@ class Database:
     """Handle database connection and settng up database schema"""
 
     _ENGINE = None
+    _ENGINE_LOCK = threading.Lock()
     _SESSION_MAKER = None
     _SESSIONS = {}
+    _SESSIONS_LOCK = threading.Lock()
     blob_encoding_format = 'utf-8'
 
     GENERAL_COLUMN_SIZE = 128
@@ -48,8 +52,9 @@ class Database:
     @classmethod
     def get_engine(cls):
         """Get singleton instance of engine."""
-        if cls._ENGINE is None:
-            cls._ENGINE = sqlalchemy.create_engine(jmon.config.Config.get().DATABASE_URL)
+        with cls._ENGINE_LOCK:
+            if cls._ENGINE is None:
+                cls._ENGINE = sqlalchemy.create_engine(jmon.config.Config.get().DATABASE_URL)
         return cls._ENGINE
 
     @classmethod
@@ -67,16 +72,22 @@ class Database:
     def get_session(cls):
         """Return session for the current thread"""
         thread_id = _ident_func()
-        if thread_id not in cls._SESSIONS:
-            cls._SESSIONS[thread_id] = sqlalchemy.orm.scoped_session(
-                Database.get_session_maker()
-            )
-        return cls._SESSIONS[thread_id]
+        with cls._SESSIONS_LOCK:
+            if thread_id not in cls._SESSIONS:
+                cls._SESSIONS[thread_id] = sqlalchemy.orm.scoped_session(
+                    Database.get_session_maker()
+                )
+            return cls._SESSIONS[thread_id]
 
     @classmethod
     def clear_session(cls):
         """Clear session for thread"""
-        cls.get_session().remove()
+        # Remove session from the cache, so that sessions for
+        # completed threads/greenlets do not accumulate
+        with cls._SESSIONS_LOCK:
+            session = cls._SESSIONS.pop(_ident_func(), None)
+        if session is not None:
+            session.remove()
 
     @classmethod
     def encode_value(cls, value):
@@ -0,0 +1,43 @@
+
+import time
+from typing import Optional
+
+
+class Deadline:
+    """
+    Point in time by which a run (or step) must complete.
+
+    Based on a monotonic clock, so is unaffected by changes to the system time.
+    Timeouts of network calls and waits are clamped to the remaining time,
+    so that they cannot overrun the deadline.
+    """
+
+    def __init__(self, timeout: float, parent: Optional['Deadline'] = None):
+        """Start deadline, which cannot expire after the parent deadline"""
+        self._expires_at = time.monotonic() + timeout
+        if parent is not None:
+            self._expires_at = min(self._expires_at, parent._expires_at)
+
+    @property
+    def expires_at(self) -> float:
+        """Return monotonic time at which the deadline expires"""
+        return self._expires_at
+
+    def remaining(self) -> float:
+        """Return remaining time (seconds) before the deadline expires"""
+        return max(self._expires_at - time.monotonic(), 0)
+
+    def has_expired(self) -> bool:
+        """Return whether the deadline has expired"""
+        return time.monotonic() >= self._expires_at
+
+    def clamp(self, timeout: Optional[float] = None) -> float:
+        """Return timeout limited to the remaining time, or the remaining time if no timeout is provided"""
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+    def child(self, timeout: float) -> 'Deadline':
+        """Create deadline with a budget of timeout seconds, limited to this deadline"""
+        return Deadline(timeout, parent=self)
@@ -0,0 +1,107 @@
+
+import concurrent.futures
+import functools
+import threading
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+import dns.resolver
+
+from jmon.config import Config
+
+
+@functools.lru_cache(maxsize=64)
+def get_resolver(name_servers: Optional[Tuple[str, ...]], port: int, timeout: float) -> 'dns.resolver.Resolver':
+    """
+    Return resolver for configuration, re-using resolvers between runs.
+
+    Resolvers are not modified once created, so can be shared between threads.
+    """
+    resolver = dns.resolver.Resolver()
+    if name_servers:
+        resolver.nameservers = list(name_servers)
+    resolver.port = port
+    resolver.timeout = timeout
+    return resolver
+
+
+class NameServerResult(NamedTuple):
+    """Result of querying a single name server"""
+
+    name_server: str
+    # Time taken for name server to respond (seconds)
+    latency: float
+    answer: Optional['dns.resolver.Answer']
+    error: Optional[str]
+
+    def as_dict(self):
+        """Return result, with records of answer as text"""
+        return {
+            "name_server": self.name_server,
+            "latency": round(self.latency, 6),
+            "answer": None if self.answer is None else [record.to_text() for record in self.answer.rrset],
+            "error": self.error,
+        }
+
+
+_EXECUTOR: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return executor for concurrent queries, created on first use"""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                max_workers=Config.get().DNS_QUERY_MAX_CONCURRENCY,
+                thread_name_prefix="dns-query"
+            )
+        return _EXECUTOR
+
+
+def _query_name_server(name_server: str, port: int, timeout: float, query_kwargs: dict) -> NameServerResult:
+    """Query single name server, returning result"""
+    resolver = get_resolver((name_server,), port, timeout)
+    start_time = time.perf_counter()
+    try:
+        answer = resolver.resolve(**query_kwargs)
+        return NameServerResult(name_server=name_server, latency=time.perf_counter() - start_time, answer=answer, error=None)
+    except Exception as exc:
+        return NameServerResult(
+            name_server=name_server, latency=time.perf_counter() - start_time,
+            answer=None, error=str(exc).split("\n")[0]
+        )
+
+
+def query_name_servers(name_servers: List[str], port: int, timeout: float, quorum: int,
+                       query_kwargs: dict) -> Tuple[List[NameServerResult], bool]:
+    """
+    Query all name servers concurrently, until the outcome is known.
+
+    Returns results, in order of completion, and whether at least quorum
+    name servers returned an answer.
+    Results are returned as soon as the quorum is reached, or can no longer be reached,
+    so may not contain a result for every name server.
+    """
+    futures = [
+        _get_executor().submit(_query_name_server, name_server, port, timeout, query_kwargs)
+        for name_server in name_servers
+    ]
+    results = []
+    answer_count = 0
+    try:
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result.answer is not None:
+                answer_count += 1
+
+            if answer_count >= quorum or (len(results) - answer_count) > (len(name_servers) - quorum):
+                break
+    finally:
+        # Queries that have not yet started are not required
+        for future in futures:
+            future.cancel()
+
+    return results, answer_count >= quorum
@@ -33,3 +33,9 @@ class UnableToPushMetricVictoriaMetricsError(JmonError):
     """Unable to push metric to victoriametrics"""
 
     pass
+
+
+class BrowserHostError(JmonError):
+    """Error communicating with browser host"""
+
+    pass
@@ -0,0 +1,239 @@
+
+import contextlib
+import dataclasses
+import socket
+import threading
+import time
+from typing import Iterator, Optional
+
+import requests
+import requests.adapters
+import urllib3
+import urllib3.connection
+import urllib3.exceptions
+import urllib3.util.connection
+
+from jmon.config import Config
+
+
+@dataclasses.dataclass
+class RequestTiming:
+    """Breakdown of time (seconds) taken to perform a request, including any redirects"""
+
+    dns: float = 0
+    connect: float = 0
+    tls: float = 0
+    ttfb: float = 0
+    # Not measured for streamed responses, as the body is read by subsequent steps
+    download: Optional[float] = 0
+
+    def finalise(self, response: requests.Response, total: float, stream: bool = False):
+        """Calculate TTFB and download time from response and total duration of request"""
+        # Elapsed time of responses spans from sending the request to parsing the headers,
+        # which includes establishing any new connections
+        headers_received = sum(
+            [redirect_response.elapsed.total_seconds() for redirect_response in response.history] +
+            [response.elapsed.total_seconds()]
+        )
+        self.ttfb = max(headers_received - self.dns - self.connect - self.tls, 0)
+        self.download = None if stream else max(total - headers_received, 0)
+
+    def as_dict(self):
+        """Return timing, in seconds"""
+        return {
+            field.name: None if (value := getattr(self, field.name)) is None else round(value, 6)
+            for field in dataclasses.fields(self)
+        }
+
+    def __str__(self):
+        """Return timing in milliseconds"""
+        return " ".join([
+            f"{name}=unmeasured" if value is None else f"{name}={value * 1000:.0f}ms"
+            for name, value in self.as_dict().items()
+        ])
+
+
+_LOCAL = threading.local()
+
+
+@contextlib.contextmanager
+def record_request_timing() -> Iterator[RequestTiming]:
+    """Record timing of connections created by the current thread"""
+    timing = RequestTiming()
+    _LOCAL.timing = timing
+    try:
+        yield timing
+    finally:
+        _LOCAL.timing = None
+
+
+def _get_current_timing() -> Optional[RequestTiming]:
+    """Return timing being recorded by current thread"""
+    return getattr(_LOCAL, "timing", None)
+
+
+class TimedHTTPConnection(urllib3.connection.HTTPConnection):
+    """HTTP connection, recording DNS resolution and connection time"""
+
+    def _new_conn(self):
+        """Resolve host and create connection to the first reachable address"""
+        if (timing := _get_current_timing()) is None:
+            return super()._new_conn()
+
+        start_time = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(
+                self._dns_host, self.port, urllib3.util.connection.allowed_gai_family(), socket.SOCK_STREAM
+            )
+        except socket.gaierror as exc:
+            raise urllib3.exceptions.NewConnectionError(self, f"Failed to establish a new connection: {exc}")
+        resolved_time = time.perf_counter()
+        timing.dns += resolved_time - start_time
+
+        dns_host = self._dns_host
+        try:
+            for itx, address in enumerate(addresses):
+                self._dns_host = address[4][0]
+                try:
+                    conn = super()._new_conn()
+                    break
+                except urllib3.exceptions.ConnectTimeoutError:
+                    # Attempt remaining addresses, raising error for the last address.
+                    # This includes NewConnectionError, which is a subclass of ConnectTimeoutError
+                    if itx == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = dns_host
+
+        timing.connect += time.perf_counter() - resolved_time
+        return conn
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, urllib3.connection.HTTPSConnection):
+    """HTTPS connection, recording DNS resolution, connection and TLS handshake time"""
+
+    def connect(self):
+        """Connect and perform TLS handshake"""
+        if (timing := _get_current_timing()) is None:
+            return super().connect()
+
+        start_time = time.perf_counter()
+        previous_connection_time = timing.dns + timing.connect
+        super().connect()
+        timing.tls += (time.perf_counter() - start_time) - (timing.dns + timing.connect - previous_connection_time)
+
+
+class TimedHTTPConnectionPool(urllib3.HTTPConnectionPool):
+    """HTTP connection pool, storing the last time the pool was used"""
+
+    ConnectionCls = TimedHTTPConnection
+
+    def _get_conn(self, timeout=None):
+        """Get connection from pool"""
+        self.last_used = time.monotonic()
+        return super()._get_conn(timeout=timeout)
+
+
+class TimedHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    """HTTPS connection pool, storing the last time the pool was used"""
+
+    ConnectionCls = TimedHTTPSConnection
+
+    def _get_conn(self, timeout=None):
+        """Get connection from pool"""
+        self.last_used = time.monotonic()
+        return super()._get_conn(timeout=timeout)
+
+
+class TimedHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTP adapter using timed connections, with a connection pool per host"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Create pool manager, using timed connection pools"""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+    def close_idle_pools(self, keep_alive: float):
+        """Close connection pools of hosts that have not been used within the keep-alive time"""
+        pools = self.poolmanager.pools
+        now = time.monotonic()
+        for pool_key in pools.keys():
+            pool = pools.get(pool_key)
+            if pool is not None and now - getattr(pool, "last_used", now) > keep_alive:
+                # Removing the pool from the pool manager closes its connections
+                pools.pop(pool_key, None)
+
+
+def clone_session(session: requests.Session) -> requests.Session:
+    """
+    Create session using the connections of session, with a copy of its cookies and headers.
+
+    Sessions are not thread-safe, so steps executed concurrently use a clone of the session of the run.
+    Clones must not be closed, as this closes the connections of the session.
+    """
+    clone = requests.Session()
+    clone.headers = session.headers.copy()
+    clone.cookies = session.cookies.copy()
+    for prefix, adapter in session.adapters.items():
+        clone.mount(prefix, adapter)
+    return clone
+
+
+class HttpConnectionPool:
+    """
+    Pool of HTTP connections, shared by all runs performed by the worker process.
+
+    Each run is provided with a new session (so that cookies are not shared
+    between runs), which re-uses connections to hosts from previous runs.
+    """
+
+    _INSTANCE = None
+    _LOCK = threading.Lock()
+
+    @classmethod
+    def get(cls) -> 'HttpConnectionPool':
+        """Return instance of connection pool"""
+        with cls._LOCK:
+            if cls._INSTANCE is None:
+                cls._INSTANCE = cls()
+            return cls._INSTANCE
+
+    def __init__(self):
+        """Create shared adapter"""
+        self._adapter = self._create_adapter()
+
+    @staticmethod
+    def _create_adapter() -> TimedHTTPAdapter:
+        """Create HTTP adapter"""
+        return TimedHTTPAdapter(
+            pool_connections=Config.get().REQUESTS_POOL_MAX_HOSTS,
+            pool_maxsize=Config.get().REQUESTS_POOL_MAX_CONNECTIONS_PER_HOST
+        )
+
+    @contextlib.contextmanager
+    def session(self, fresh_connection: bool = False) -> Iterator[requests.Session]:
+        """
+        Provide session for run.
+
+        If fresh_connection is set, the session uses new connections,
+        which are closed once the session is no longer required.
+        """
+        if fresh_connection:
+            adapter = self._create_adapter()
+        else:
+            adapter = self._adapter
+            adapter.close_idle_pools(keep_alive=Config.get().REQUESTS_KEEP_ALIVE_TIMEOUT)
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        try:
+            yield session
+        finally:
+            # Closing the session closes all connections of its adapters,
+            # so is only performed for sessions that do not use the shared adapter
+            if fresh_connection:
+                session.close()
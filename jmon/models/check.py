@@ -5,23 +5,30 @@ from sqlalchemy.sql import func
 
 from redbeat import RedBeatSchedulerEntry
 import yaml
+import hashlib
 import json
 import celery
 import celery.schedules
 
+from jmon.block_config import BlockConfig
 from jmon.client_type import ClientType
 from jmon import app
 import jmon.database
 import jmon.config
 from jmon.errors import CheckCreateError, StepValidationError
 import jmon.models
-import jmon.steps.root_step
-import jmon.run
+from jmon.page_load import PageLoadStrategy
+from jmon.step_plan import StepPlan, StepPlanCache
 from jmon.logger import logger
 
 
 class Check(jmon.database.Base):
 
+    # Version of metadata derived from steps, which must be incremented
+    # when changes to steps alter the derived metadata (e.g. supported clients),
+    # causing stored metadata of existing checks to be ignored
+    METADATA_VERSION = 1
+
     @classmethod
     def get_all(cls):
         """Get all checks"""
@@ -90,6 +97,11 @@ class Check(jmon.database.Base):
 
         instance.screenshot_on_error = content.get("screenshot_on_error")
 
+        fresh_connection = content.get("fresh_connection")
+        if fresh_connection is not None and type(fresh_connection) is not bool:
+            raise CheckCreateError("fresh_connection must be a boolean")
+        instance.fresh_connection = fresh_connection
+
         # If a client type has been provided, convert to enum,
         # hanlding invalid values
         if client_type := content.get("client"):
@@ -105,11 +117,15 @@ class Check(jmon.database.Base):
         # Create root step and perform check to ensure
         # steps are valid
         try:
-            root_step = jmon.steps.root_step.RootStep(run=None, config=instance.steps, parent=None)
+            root_step = instance.get_step_plan().create_step(run=None, parent=None)
             root_step.validate_steps()
         except StepValidationError as exc:
             raise CheckCreateError(str(exc))
 
+        # Store metadata derived from steps, to avoid re-evaluating
+        # steps when scheduling the check
+        instance.update_metadata()
+
         # Add custom attributes
         content_attributes = content.get("attributes", {})
         if type(content_attributes) is not dict:
@@ -118,6 +134,11 @@ class Check(jmon.database.Base):
         if len(instance._attributes) >= jmon.database.Database.MEDIUM_BLOB_SIZE:
             raise CheckCreateError("attributes definition is too large")
 
+        # Add network resource blocking, validating configuration
+        content_block = content.get("block")
+        BlockConfig.from_config(content_block)
+        instance.block = content_block
+
         session.add(instance)
         session.commit()
 
@@ -135,6 +156,7 @@ class Check(jmon.database.Base):
     id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True, autoincrement=True)
     name = sqlalchemy.Column(jmon.database.Database.GeneralString, nullable=False)
     screenshot_on_error = sqlalchemy.Column(sqlalchemy.Boolean)
+    fresh_connection = sqlalchemy.Column(sqlalchemy.Boolean)
     interval = sqlalchemy.Column(sqlalchemy.Integer)
     timeout = sqlalchemy.Column(sqlalchemy.Integer)
     client = sqlalchemy.Column(sqlalchemy.Enum(ClientType), default=None)
@@ -145,12 +167,24 @@ class Check(jmon.database.Base):
         name="steps_b"
     )
     _enabled = sqlalchemy.Column(sqlalchemy.Boolean, default=True, name="enabled")
+
+    # Metadata derived from steps and client, stored when check is created/updated
+    definition_hash = sqlalchemy.Column(sqlalchemy.String(length=64), nullable=True)
+    step_count = sqlalchemy.Column(sqlalchemy.Integer, nullable=True)
+    _supported_clients = sqlalchemy.Column(jmon.database.Database.LargeString, nullable=True, name="supported_clients")
+    _task_headers = sqlalchemy.Column(jmon.database.Database.LargeString, nullable=True, name="task_headers")
     _attributes = sqlalchemy.Column(
         sqlalchemy.LargeBinary(
             length=jmon.database.Database.MEDIUM_BLOB_SIZE
         ),
         name="attributes_b"
     )
+    _block = sqlalchemy.Column(
+        sqlalchemy.LargeBinary(
+            length=jmon.database.Database.MEDIUM_BLOB_SIZE
+        ),
+        name="block_b"
+    )
 
     environment_id = sqlalchemy.Column(
         sqlalchemy.ForeignKey("environment.id", name="fk_check_environment_id_environment_id"),
@@ -184,6 +218,22 @@ class Check(jmon.database.Base):
         """Set attributes column value"""
         self._attributes = (json.dumps(value) if value else "{}").encode('utf-8')
 
+    @property
+    def block(self):
+        """Return network resource blocking configuration"""
+        if self._block:
+            return json.loads(self._block.decode('utf-8'))
+        return None
+
+    @block.setter
+    def block(self, value):
+        """Set block column value"""
+        self._block = json.dumps(value).encode('utf-8') if value else None
+
+    def get_block_config(self):
+        """Return block config for browser checks"""
+        return BlockConfig.from_config(self.block)
+
     @property
     def should_screenshot_on_error(self):
         """Whether a screenshot should be taken on error"""
@@ -194,6 +244,11 @@ class Check(jmon.database.Base):
         # Return default config for whether to screenshot on failure
         return jmon.config.Config.get().SCREENSHOT_ON_FAILURE_DEFAULT
 
+    @property
+    def should_use_fresh_connection(self):
+        """Whether requests checks should use new connections, rather than re-using connections of previous runs"""
+        return self.fresh_connection is True
+
     @property
     def enabled(self):
         """Return whether check is enabled, default empty column to True"""
@@ -204,18 +259,35 @@ class Check(jmon.database.Base):
         """Set enabled flag"""
         self._enabled = value
 
+    def get_step_plan(self) -> StepPlan:
+        """Return compiled plan of steps, which is shared by all runs of the check"""
+        return StepPlanCache.get_root_plan(self._steps)
+
+    def get_definition_hash(self):
+        """Return hash of check definition, from which metadata is derived"""
+        hash_ = hashlib.sha256()
+        hash_.update(f"{self.METADATA_VERSION}:{self.client.value if self.client else ''}:".encode('utf-8'))
+        hash_.update(self._steps)
+        return hash_.hexdigest()
+
+    @property
+    def has_valid_metadata(self):
+        """Whether stored metadata matches the current check definition"""
+        return self.definition_hash is not None and self.definition_hash == self.get_definition_hash()
+
+    def update_metadata(self):
+        """Update metadata derived from steps and client"""
+        supported_clients = self._get_supported_clients_from_steps()
+        self.step_count = self.get_step_plan().step_count
+        self._supported_clients = json.dumps([client.value for client in supported_clients])
+        self._task_headers = json.dumps(self._get_task_headers_for_clients(supported_clients))
+        self.definition_hash = self.get_definition_hash()
+
     def get_step_count(self):
         """Get number of steps"""
-        def get_all_steps(parent):
-            children = parent.get_child_steps()
-            steps = children
-            for child in children:
-                steps += get_all_steps(child)
-            return steps
-
-        root_step = jmon.steps.root_step.RootStep(run=jmon.run.Run(check=self), config=self.steps, parent=None)
-        steps = get_all_steps(root_step)
-        return len(steps)
+        if self.has_valid_metadata:
+            return self.step_count
+        return self.get_step_plan().step_count
 
     def delete(self):
         """Delete check"""
@@ -348,25 +420,42 @@ class Check(jmon.database.Base):
         # Return default check timeout
         return config.DEFAULT_CHECK_TIMEOUT
 
-    def get_supported_clients(self):
-        """Get supported clients"""
+    def _get_supported_clients_from_steps(self):
+        """Determine supported clients from steps"""
         supported_clients = ClientType.get_all()
         if self.client:
             supported_clients = [self.client]
 
-        root_step = jmon.steps.root_step.RootStep(run=jmon.run.Run(check=self), config=self.steps, parent=None)
+        return self.get_step_plan().get_supported_clients(supported_clients)
 
-        supported_clients = root_step.get_supported_clients(supported_clients)
-        return supported_clients
+    def get_page_load_strategy(self):
+        """Get page load strategy for browser sessions, being the most relaxed strategy used by steps"""
+        return PageLoadStrategy.get_session_strategy(self.get_step_plan().page_load_strategies)
+
+    def get_supported_clients(self):
+        """Get supported clients"""
+        if self.has_valid_metadata:
+            return [ClientType(client) for client in json.loads(self._supported_clients)]
+        return self._get_supported_clients_from_steps()
 
     @property
     def task_headers(self):
         """Get queue for task"""
-        supported_clients = self.get_supported_clients()
+        if self.has_valid_metadata:
+            headers = json.loads(self._task_headers)
+        else:
+            headers = self._get_task_headers_for_clients(self._get_supported_clients_from_steps())
 
-        if not supported_clients:
+        if not headers:
             logger.warn(f"Check does not have any compatible client types: {self.name}")
             return None
+        return headers
+
+    @staticmethod
+    def _get_task_headers_for_clients(supported_clients):
+        """Return task headers for supported clients"""
+        if not supported_clients:
+            return None
 
         headers = {}
 
@@ -376,6 +465,8 @@ class Check(jmon.database.Base):
             headers["chrome"] = "true"
         if ClientType.BROWSER_FIREFOX in supported_clients:
             headers["firefox"] = "true"
+        if ClientType.BROWSER_PLAYWRIGHT in supported_clients:
+            headers["playwright"] = "true"
         return headers
 
     @property
@@ -0,0 +1,148 @@
+
+from enum import Enum
+from typing import Iterable, List, Optional
+
+from jmon.utils import poll_until
+
+
+class PageLoadStrategy(Enum):
+    """
+    Strategy for determining when a page has loaded.
+
+    Browsers are created using the "normal" webdriver page load strategy,
+    in which webdriver waits for navigation caused by goto steps and actions.
+    Checks that use a more relaxed strategy are run in browsers created
+    with that strategy, in which steps wait for page loads themselves.
+    """
+
+    # Wait for load event, including all sub-resources
+    NORMAL = "normal"
+    # Wait for DOM to be parsed
+    EAGER = "eager"
+    # Do not wait - readiness is determined by subsequent find/wait steps
+    NONE = "none"
+
+    @property
+    def ready_states(self) -> List[str]:
+        """Return document ready states that satisfy the strategy"""
+        if self is PageLoadStrategy.NORMAL:
+            return ["complete"]
+        elif self is PageLoadStrategy.EAGER:
+            return ["interactive", "complete"]
+        return []
+
+    @property
+    def playwright_wait_until(self) -> str:
+        """Return playwright navigation event that satisfies the strategy"""
+        if self is PageLoadStrategy.NORMAL:
+            return "load"
+        elif self is PageLoadStrategy.EAGER:
+            return "domcontentloaded"
+        return "commit"
+
+    @classmethod
+    def get_session_strategy(cls, strategies: Iterable['PageLoadStrategy']) -> 'PageLoadStrategy':
+        """Return strategy for browser session, being the most relaxed of the strategies"""
+        for strategy in [cls.NONE, cls.EAGER]:
+            if strategy in strategies:
+                return strategy
+        return cls.NORMAL
+
+
+# Mark current document, so that it can be distinguished from the document
+# being navigated to, as navigation does not occur immediately.
+# The document is also flagged once navigation away from it has started.
+_MARK_DOCUMENT_SCRIPT = """
+document.jmonPreviousDocument = true;
+document.jmonNavigating = false;
+if (window.jmonNavigationListener !== true) {
+    window.addEventListener('beforeunload', () => { document.jmonNavigating = true; });
+    window.jmonNavigationListener = true;
+}
+"""
+
+# Return whether document has been replaced, the ready state of the document,
+# the URL of the document and whether navigation away from the document has started
+_GET_DOCUMENT_STATE_SCRIPT = """
+return [
+    document.jmonPreviousDocument !== true,
+    document.readyState,
+    window.location.href,
+    document.jmonNavigating === true
+];
+"""
+
+POLL_INTERVAL = 0.05
+
+
+def mark_document(selenium_instance):
+    """Mark current document prior to navigation"""
+    import selenium.common.exceptions
+
+    try:
+        selenium_instance.execute_script(_MARK_DOCUMENT_SCRIPT)
+    except selenium.common.exceptions.WebDriverException:
+        # Document may already be unloading
+        pass
+
+
+def _poll_document_state(selenium_instance, strategy: PageLoadStrategy, timeout: float, is_loaded) -> bool:
+    """Poll state of document until is_loaded returns True, returning whether it was loaded before the timeout"""
+    import selenium.common.exceptions
+
+    if strategy is PageLoadStrategy.NONE:
+        return True
+
+    def check_document():
+        """Return True if page has loaded, otherwise None"""
+        try:
+            if is_loaded(*selenium_instance.execute_script(_GET_DOCUMENT_STATE_SCRIPT)):
+                return True
+        except selenium.common.exceptions.UnexpectedAlertPresentException:
+            # Alerts raised by the page prevent scripts from being executed,
+            # so treat the page as loaded, leaving subsequent steps to handle the alert
+            return True
+        except selenium.common.exceptions.WebDriverException:
+            # Script execution can fail whilst the document is being replaced
+            pass
+        return None
+
+    return poll_until(check_document, timeout=timeout, interval=POLL_INTERVAL) is not None
+
+
+def wait_for_page_load(selenium_instance, strategy: PageLoadStrategy, timeout: float, url: Optional[str] = None) -> bool:
+    """
+    Wait for page to be loaded after navigation, according to page load strategy.
+
+    The document must have been marked using mark_document prior to navigation.
+    Navigation that does not replace the document (e.g. to an anchor of the current page)
+    is considered loaded once the URL matches.
+
+    Returns whether the page was loaded before the timeout.
+    """
+    def is_loaded(is_new_document, ready_state, current_url, is_navigating):
+        is_current_document = is_new_document or (url is not None and current_url == url and not is_navigating)
+        return is_current_document and ready_state in strategy.ready_states
+
+    return _poll_document_state(selenium_instance, strategy, timeout, is_loaded)
+
+
+def wait_for_navigation(selenium_instance, strategy: PageLoadStrategy, timeout: float) -> bool:
+    """
+    Wait for any navigation caused by an action to load, according to page load strategy.
+
+    The document must have been marked using mark_document prior to the action.
+    If navigation away from the document has started, the new document
+    must reach the ready state of the strategy.
+    Changes to the URL that do not replace the document (e.g. using the history API)
+    do not require the document to be loaded again.
+
+    Returns whether the page was loaded before the timeout.
+    """
+    def is_loaded(is_new_document, ready_state, _, is_navigating):
+        if is_new_document:
+            return ready_state in strategy.ready_states
+        # Wait for document to be replaced, if navigation has started
+        return not is_navigating
+
+    return _poll_document_state(selenium_instance, strategy, timeout, is_loaded)
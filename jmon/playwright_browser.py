@@ -0,0 +1,97 @@
+
+import re
+import threading
+from typing import Optional
+
+from jmon.block_config import BlockConfig
+from jmon.logger import logger
+
+
+class PlaywrightBrowser:
+    """
+    Playwright browser, shared by all runs performed by the current thread.
+
+    Each run is performed in a new browser context, which provides isolated
+    cookies, storage and cache, without the cost of starting or cleaning
+    a browser per run.
+
+    The playwright sync API is bound to the thread that started it,
+    so a browser is created per worker thread.
+    """
+
+    _LOCAL = threading.local()
+
+    @classmethod
+    def get(cls) -> 'PlaywrightBrowser':
+        """Return browser for current thread, starting a new browser if required"""
+        instance = getattr(cls._LOCAL, "instance", None)
+        if instance is not None and not instance.is_alive():
+            logger.info("Playwright browser is no longer connected - starting new browser")
+            cls.teardown_current()
+            instance = None
+
+        if instance is None:
+            instance = cls()
+            cls._LOCAL.instance = instance
+        return instance
+
+    @classmethod
+    def teardown_current(cls):
+        """Teardown browser of current thread, if one exists"""
+        instance = getattr(cls._LOCAL, "instance", None)
+        if instance is not None:
+            cls._LOCAL.instance = None
+            instance.teardown()
+
+    def __init__(self):
+        """Start playwright and launch browser"""
+        # Import playwright inline, as it is only required by playwright workers
+        from playwright.sync_api import sync_playwright
+
+        logger.info("Starting playwright browser")
+        self._playwright = sync_playwright().start()
+        try:
+            self._browser = self._playwright.chromium.launch(headless=True)
+        except:
+            self._playwright.stop()
+            raise
+
+    def is_alive(self) -> bool:
+        """Return whether browser is still connected"""
+        return self._browser.is_connected()
+
+    def new_context(self, block_config: Optional[BlockConfig] = None):
+        """Create new browser context for run"""
+        context = self._browser.new_context(viewport={"width": 1920, "height": 1080})
+        if block_config:
+            self._apply_block_config(context=context, block_config=block_config)
+        return context
+
+    @staticmethod
+    def _apply_block_config(context, block_config: BlockConfig):
+        """Abort requests matching block config"""
+        # Playwright resource types match the names of the block resource types
+        resource_types = set([resource_type.value for resource_type in block_config.resource_types])
+        url_regexes = [re.compile(url_regex) for url_regex in block_config.get_url_regexes()]
+
+        def handle_route(route):
+            request = route.request
+            if (request.resource_type in resource_types or
+                    any(url_regex.match(request.url) for url_regex in url_regexes)):
+                route.abort("blockedbyclient")
+            else:
+                route.continue_()
+
+        context.route("**/*", handle_route)
+
+    def teardown(self):
+        """Close browser and stop playwright"""
+        logger.info("Tearing down playwright browser")
+        try:
+            self._browser.close()
+        except Exception as exc:
+            logger.error(f"Failed to close playwright browser: {exc}")
+        try:
+            self._playwright.stop()
+        except Exception as exc:
+            logger.error(f"Failed to stop playwright: {exc}")
@@ -1,3 +1,4 @@
+import threading
 
 from jmon.logger import logger
 
@@ -85,6 +86,7 @@ class CallablePlugin:
 class BasePluginLoader:
 
     _INSTANCE = None
+    _INSTANCE_LOCK = threading.Lock()
 
     def __init__(self):
         """Setup loader"""
@@ -99,8 +101,10 @@ class BasePluginLoader:
     @classmethod
     def get_instance(cls):
         """Get singleton instance of notification loader"""
-        if cls._INSTANCE is None:
-            cls._INSTANCE = cls()
+        # Lock, as runs may be executed concurrently by threaded workers
+        with cls._INSTANCE_LOCK:
+            if cls._INSTANCE is None:
+                cls._INSTANCE = cls()
         return cls._INSTANCE
 
     def get_plugins(self):
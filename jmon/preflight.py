@@ -0,0 +1,45 @@
+
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+
+from jmon.steps.goto_step import GotoStep
+
+
+def get_preflight_url(root_step) -> Optional[str]:
+    """
+    Return URL to probe before performing a browser check.
+
+    Only a goto as the first step of the check is probed, as URLs of
+    later steps may depend on the outcome of earlier steps (e.g. variables
+    provided by plugins).
+    Only http(s) URLs are probed, as other URLs (e.g. 'about:blank') are handled by the browser.
+    """
+    child_steps = root_step.get_child_steps()
+    if child_steps and isinstance(child_steps[0], GotoStep):
+        url = child_steps[0].url
+        if type(url) is str and urlparse(url).scheme.lower() in ["http", "https"]:
+            return url
+    return None
+
+
+def perform_preflight(url: str, timeout: float) -> Optional[str]:
+    """
+    Probe URL, returning an error message if the target could not be reached.
+
+    Only the response headers are read, so the probe completes
+    once the first byte of the response is received.
+    Any HTTP response (including error status codes), SSL errors and other request
+    errors (e.g. invalid URLs) are treated as reachable, leaving the browser check to determine the outcome.
+    """
+    try:
+        response = requests.get(url, timeout=timeout, stream=True, allow_redirects=False)
+        response.close()
+    except requests.exceptions.SSLError:
+        pass
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+        return str(exc).split("\n")[0]
+    except requests.exceptions.RequestException:
+        pass
+    return None
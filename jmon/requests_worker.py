@@ -0,0 +1,56 @@
+"""
+Lightweight celery worker, for workers that only consume requests (HTTP/DNS) checks
+and maintenance tasks.
+
+The browser stack (selenium, pyvirtualdisplay etc.) is not imported by this worker.
+Workers that perform browser checks should use jmon.worker.
+"""
+
+import celery.signals
+import sentry_sdk
+from sentry_sdk.integrations.celery import CeleryIntegration
+
+from jmon import app
+import jmon.tasks.perform_check
+import jmon.tasks.update_check_schedules
+import jmon.tasks.clean_orphaned_checks
+import jmon.tasks.remove_expired_runs
+import jmon.tasks.update_artifact_lifecycle_rules
+import jmon.tasks.check_queue_timeouts
+import jmon.config
+
+
+# Register tasks with celery
+app.task(bind=True)(jmon.tasks.perform_check.perform_check)
+app.task(jmon.tasks.update_check_schedules.update_check_schedules)
+app.task(jmon.tasks.clean_orphaned_checks.clean_orphaned_checks)
+app.task(jmon.tasks.remove_expired_runs.remove_expired_runs)
+app.task(jmon.tasks.update_artifact_lifecycle_rules.update_artifact_lifecycle_rules)
+app.task(jmon.tasks.check_queue_timeouts.check_queue_timeouts)
+
+# Set pre-fetch multiplier to 1 so that workers only pull the message
+# they are currently working on
+app.conf.worker_prefetch_multiplier = 1
+
+# Recycle worker processes once their memory usage exceeds the limit,
+# to avoid memory leaks, rather than after a fixed number of tasks.
+# The source of these leaks is not entirely known
+if worker_max_memory_mb := jmon.config.Config.get().WORKER_MAX_MEMORY_MB:
+    # Celery expects value in KiB
+    app.conf.worker_max_memory_per_child = worker_max_memory_mb * 1024
+app.conf.worker_max_tasks_per_child = jmon.config.Config.get().WORKER_MAX_TASKS_PER_CHILD or None
+
+@celery.signals.celeryd_init.connect
+def init_sentry(**kwargs):
+    """Initialise sentry"""
+    if jmon.config.Config.get().SENTRY_DSN:
+        sentry_sdk.init(
+            dsn=jmon.config.Config.get().SENTRY_DSN,
+            enable_tracing=True,
+            integrations=[
+                CeleryIntegration(
+                    monitor_beat_tasks=True
+                )
+            ],
+            environment=jmon.config.Config.get().SENTRY_ENVIRONMENT,
+        )
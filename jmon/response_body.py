@@ -0,0 +1,120 @@
+
+from typing import Iterator, List, Optional
+
+import requests
+
+from jmon.config import Config
+
+
+class ResponseBodyTooLargeError(Exception):
+    """Response body exceeds the maximum body size"""
+
+    def __init__(self, max_size: int):
+        """Store max size"""
+        super().__init__(f"Response body exceeds maximum body size of {max_size} bytes")
+        self.max_size = max_size
+
+
+class ResponseBody:
+    """
+    Body of response, read incrementally.
+
+    For streamed responses, the body is only read from the connection as it is
+    required by checks, and reading stops once max_size bytes have been read.
+    Chunks that have been read are retained, so that the body can be
+    used by multiple checks.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, response: 'requests.Response', max_size: Optional[int] = None):
+        """Store member variables"""
+        self.response = response
+        self._max_size = max_size
+        self._chunks: List[bytes] = []
+        self._size = 0
+        self._iterator = None
+        self._complete = False
+        self.exceeded_max_size = False
+
+    @property
+    def encoding(self) -> str:
+        """Return encoding of body"""
+        return self.response.encoding or "utf-8"
+
+    def _read_chunk(self) -> bool:
+        """Read next chunk from response, returning False if there are no further chunks"""
+        if self._complete:
+            return False
+
+        if self._iterator is None:
+            self._iterator = self.response.iter_content(chunk_size=self.CHUNK_SIZE)
+
+        try:
+            chunk = next(self._iterator)
+        except StopIteration:
+            self._complete = True
+            return False
+
+        if self._max_size is not None and self._size + len(chunk) > self._max_size:
+            # Retain body up to the max size and stop reading from the connection
+            chunk = chunk[:self._max_size - self._size]
+            self.exceeded_max_size = True
+            self._complete = True
+            self.response.close()
+
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        return True
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Iterate over chunks of body, reading from the response as required"""
+        index = 0
+        while index < len(self._chunks) or self._read_chunk():
+            yield self._chunks[index]
+            index += 1
+
+    def contains(self, value: str) -> bool:
+        """
+        Return whether body contains value, reading only as much of the body as is required.
+
+        If the max size is exceeded, only the body up to the max size is searched.
+        """
+        needle = value.encode(self.encoding)
+        # Retain end of previous chunk, to match values spanning chunks
+        overlap = b""
+        for chunk in self.iter_chunks():
+            window = overlap + chunk
+            if needle in window:
+                return True
+            overlap = window[-(len(needle) - 1):] if len(needle) > 1 else b""
+        return False
+
+    def read(self) -> bytes:
+        """Return entire body, raising ResponseBodyTooLargeError if it exceeds the max size"""
+        body = b"".join(self.iter_chunks())
+        if self.exceeded_max_size:
+            raise ResponseBodyTooLargeError(max_size=self._max_size)
+        return body
+
+    def text(self) -> str:
+        """Return entire body as text, raising ResponseBodyTooLargeError if it exceeds the max size"""
+        return self.read().decode(self.encoding, errors="replace")
+
+    def excerpt(self) -> str:
+        """Return start of body, for logging"""
+        limit = Config.get().LOG_BODY_EXCERPT_SIZE
+        excerpt = b""
+        for chunk in self.iter_chunks():
+            excerpt += chunk[:limit + 1 - len(excerpt)]
+            if len(excerpt) > limit:
+                break
+        return truncate_for_log(excerpt.decode(self.encoding, errors="replace"))
+
+
+def truncate_for_log(value: str) -> str:
+    """Truncate value to the log excerpt size"""
+    limit = Config.get().LOG_BODY_EXCERPT_SIZE
+    if len(value) > limit:
+        return f"{value[:limit]}... (truncated)"
+    return value
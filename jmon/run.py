@@ -6,6 +6,7 @@ import logging
 import os
 from typing import Optional
 
+from jmon.deadline import Deadline
 from jmon.logger import logger
 from jmon.artifact_storage import ArtifactStorage
 from jmon.run_step_data import RunStepData
@@ -14,7 +15,6 @@ import jmon.result_database
 import jmon.models.run
 import jmon.run_logger
 from jmon.step_status import StepStatus
-import jmon.steps.root_step
 import jmon.timeseries_database
 import jmon.config
 
@@ -29,10 +29,14 @@ class Run:
         self._artifact_paths = []
 
         self._logger = jmon.run_logger.RunLogger(run=self, enable_log=True)
-        self._root_step = jmon.steps.root_step.RootStep(run=self, config=self.check.steps, parent=None, run_logger=self._logger)
+        self._root_step = self.check.get_step_plan().create_step(run=self, parent=None, run_logger=self._logger)
         self._start_time: Optional[datetime.datetime] = None
         self._end_time: Optional[datetime.datetime] = None
+        # Deadline of run, started with the timer
+        self._deadline: Optional[Deadline] = None
         self._variables = {}
+        # Incremented whenever a variable is set, so that rendered templates can be re-used
+        self._variables_version = 0
 
     @property
     def run_model(self):
@@ -51,9 +55,15 @@ class Run:
         """Return runtime variables"""
         return self._variables
 
+    @property
+    def variables_version(self) -> int:
+        """Return version of runtime variables, which changes whenever a variable is set"""
+        return self._variables_version
+
     def set_variable(self, key, value):
         """Set runtime variable"""
         self._variables[key] = value
+        self._variables_version += 1
 
     @property
     def logger(self):
@@ -130,6 +140,8 @@ class Run:
             )
             run_result_metric = jmon.timeseries_database.RunResultMetricWriter()
             run_result_metric.write(result_database=victoria_metrics, run=self)
+            step_duration_metric = jmon.timeseries_database.StepDurationMetricWriter()
+            step_duration_metric.write(result_database=victoria_metrics, run=self)
 
             # Send notifications using plugins
             self.send_notifications(run_status)
@@ -190,12 +202,11 @@ class Run:
         return f"{self._check.name}/{self._check.environment.name}/{self.get_run_key()}"
 
     def start_timer(self):
-        """Set start time of run"""
+        """Set start time of run and start deadline of run, based on the check timeout"""
         self._start_time = datetime.datetime.now()
+        self._deadline = Deadline(self.check.get_timeout())
 
-    def get_remaining_time(self):
-        """Get remaining time between start time of run and timeout"""
-        return (
-            (self._start_time + datetime.timedelta(seconds=self.check.get_timeout())) -
-            datetime.datetime.now()
-        )
+    @property
+    def deadline(self) -> Optional[Deadline]:
+        """Return deadline of run, if the timer has been started"""
+        return self._deadline
@@ -1,24 +1,32 @@
 
+import contextlib
 from io import StringIO
 import logging
+import threading
+from typing import Iterator, List, Optional, Tuple
 
-import multiprocessing
+try:
+    from greenlet import getcurrent as _ident_func
+except ImportError:
+    from threading import get_ident as _ident_func
 
 from jmon.logger import logger
 
 class RunThreadLogFilter(logging.Filter):
     """
-    This filter only show log entries for specified thread name
+    This filter only show log entries for the thread (or greenlet) that created it.
+
+    This allows runs to be executed concurrently in a single worker
+    process (using celery threads/gevent pools), without leaking logs
+    between runs.
     """
 
     def __init__(self, *args, **kwargs):
         logging.Filter.__init__(self, *args, **kwargs)
-        # Use the billiard multiprocessing library, as this is
-        # supposedly the library used by celery
-        self.thread_id = multiprocessing.current_process().pid
+        self.thread_id = _ident_func()
 
     def filter(self, record):
-        return multiprocessing.current_process().pid == self.thread_id
+        return _ident_func() == self.thread_id
 
 
 class RunLogger:
@@ -44,6 +52,9 @@ class RunLogger:
 
     should_info_debug_log = True
 
+    # Log records buffered by the current thread, if buffering is enabled
+    _buffer = threading.local()
+
     @property
     def _format(self):
         """Return log format"""
@@ -92,20 +103,53 @@ class RunLogger:
         self._log_stream.seek(0)
         return self._log_stream.read()
 
+    @classmethod
+    @contextlib.contextmanager
+    def buffer_logs(cls, records: Optional[List[Tuple[int, dict]]] = None) -> Iterator[List[Tuple[int, dict]]]:
+        """
+        Buffer logs of the current thread, rather than logging them.
+
+        This allows steps to be executed in other threads, whose logs are
+        not captured by the run log, with the logs being replayed
+        by the thread of the run using replay_logs.
+        A list can be provided to buffer records into, so that logs
+        can be replayed before the thread has completed.
+        """
+        if records is None:
+            records = []
+        cls._buffer.records = records
+        try:
+            yield records
+        finally:
+            cls._buffer.records = None
+
+    @staticmethod
+    def replay_logs(records: List[Tuple[int, dict]]):
+        """Log buffered log records in the current thread"""
+        for level, log_args in records:
+            logger.log(level, **log_args)
+
+    def _log(self, level, msg):
+        """Log message, buffering message if buffering is enabled for current thread"""
+        if (records := getattr(self._buffer, "records", None)) is not None:
+            records.append((level, self._get_log_args(msg)))
+        else:
+            logger.log(level, **self._get_log_args(msg))
+
     def debug(self, msg):
         """Debug log"""
         if self.should_info_debug_log:
-            logger.debug(**self._get_log_args(msg))
+            self._log(logging.DEBUG, msg)
 
     def info(self, msg):
         """Info log"""
         if self.should_info_debug_log:
-            logger.info(**self._get_log_args(msg))
+            self._log(logging.INFO, msg)
 
     def warn(self, msg):
         """Warn log"""
-        logger.warn(**self._get_log_args(msg))
+        self._log(logging.WARNING, msg)
 
     def error(self, msg):
         """Error log"""
-        logger.error(**self._get_log_args(msg))
\ No newline at end of file
+        self._log(logging.ERROR, msg)
\ No newline at end of file
@@ -0,0 +1,178 @@
+
+import ctypes
+import signal
+import sys
+import threading
+from typing import Callable, List
+
+from jmon.logger import logger
+
+
+class RunDeadlineExceededError(BaseException):
+    """
+    Raised in the thread executing a run, when the hard deadline of the run is exceeded.
+
+    This inherits from BaseException, so that it is not caught by
+    generic exception handling within steps.
+    """
+
+    pass
+
+
+def _get_gevent():
+    """Return gevent module, if threading has been monkey-patched by gevent (e.g. celery gevent pool)"""
+    gevent_monkey = sys.modules.get("gevent.monkey")
+    if gevent_monkey is None or not gevent_monkey.is_module_patched("threading"):
+        return None
+
+    import gevent
+    return gevent
+
+
+class RunWatchdog:
+    """
+    Enforce hard deadline on a run.
+
+    When the deadline is reached, the abort callbacks are called
+    (e.g. to kill the browser process tree) and RunDeadlineExceededError
+    is raised in the thread executing the run.
+
+    When running in the main thread (e.g. celery prefork workers), SIGALRM is used,
+    which also interrupts blocking system calls (such as socket reads).
+    When threading has been monkey-patched by gevent (e.g. celery gevent pool),
+    a timer greenlet raises the exception in the greenlet executing the run.
+    Otherwise, a timer thread raises the exception asynchronously in the run thread,
+    which takes effect once the thread returns to executing python code.
+    """
+
+    def __init__(self, timeout: float):
+        """Store member variables"""
+        self._timeout = timeout
+        self._abort_callbacks: List[Callable] = []
+        self._lock = threading.Lock()
+        self._expired = False
+        self._cancelled = False
+        self._exception_injected = False
+        self._thread_id = None
+        self._timer = None
+        self._use_signal = False
+        self._previous_signal_handler = None
+        self._gevent = None
+        self._greenlet = None
+
+    @property
+    def expired(self):
+        """Return whether the deadline has been exceeded"""
+        return self._expired
+
+    def add_abort_callback(self, callback: Callable):
+        """Add callback to be called when the deadline is exceeded"""
+        self._abort_callbacks.append(callback)
+
+    def _abort(self):
+        """Call abort callbacks"""
+        logger.error(f"Run has exceeded hard deadline ({self._timeout}s) - aborting")
+        for callback in list(self._abort_callbacks):
+            try:
+                callback()
+            except Exception as exc:
+                logger.error(f"Error whilst aborting run: {exc}")
+
+    def _create_exception(self) -> RunDeadlineExceededError:
+        """Return exception to raise in the run"""
+        return RunDeadlineExceededError(f"Run exceeded hard deadline of {self._timeout}s")
+
+    def _handle_signal(self, signum, frame):
+        """Handle alarm signal in main thread"""
+        # Restore previous handler, in case the exception interrupts cancelling the watchdog
+        signal.signal(signal.SIGALRM, self._previous_signal_handler)
+        self._expired = True
+        self._abort()
+        raise self._create_exception()
+
+    def _handle_timer(self):
+        """Handle deadline from timer thread"""
+        with self._lock:
+            if self._cancelled:
+                return
+            self._expired = True
+
+        self._abort()
+
+        with self._lock:
+            if not self._cancelled:
+                modified_count = ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                    ctypes.c_ulong(self._thread_id),
+                    ctypes.py_object(RunDeadlineExceededError)
+                )
+                if modified_count == 1:
+                    self._exception_injected = True
+                else:
+                    if modified_count > 1:
+                        # Revert exception, as it should only be raised in the run thread
+                        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(self._thread_id), None)
+                    logger.error(
+                        f"Unable to interrupt run thread after hard deadline: exception set in {modified_count} threads"
+                    )
+
+    def _handle_greenlet_timer(self):
+        """Handle deadline from timer greenlet"""
+        with self._lock:
+            if self._cancelled:
+                return
+            self._expired = True
+
+        self._abort()
+
+        with self._lock:
+            if not self._cancelled:
+                self._gevent.kill(self._greenlet, self._create_exception())
+
+    def start(self):
+        """Start watchdog for the current thread"""
+        self._gevent = _get_gevent()
+        if self._gevent is not None:
+            self._greenlet = self._gevent.getcurrent()
+            self._timer = self._gevent.spawn_later(self._timeout, self._handle_greenlet_timer)
+            return
+
+        self._thread_id = threading.get_ident()
+        self._use_signal = threading.current_thread() is threading.main_thread()
+
+        if self._use_signal:
+            self._previous_signal_handler = signal.signal(signal.SIGALRM, self._handle_signal)
+            signal.setitimer(signal.ITIMER_REAL, self._timeout)
+        else:
+            self._timer = threading.Timer(self._timeout, self._handle_timer)
+            self._timer.name = "run-watchdog"
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self):
+        """Stop watchdog"""
+        if self._gevent is not None:
+            with self._lock:
+                self._cancelled = True
+            self._timer.kill(block=False)
+        elif self._use_signal:
+            try:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+            finally:
+                signal.signal(signal.SIGALRM, self._previous_signal_handler)
+        else:
+            with self._lock:
+                self._cancelled = True
+                if self._exception_injected:
+                    # Clear exception, if it has not yet been raised in the run thread
+                    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(self._thread_id), None)
+            self._timer.cancel()
+
+    def __enter__(self):
+        """Start watchdog"""
+        self.start()
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        """Stop watchdog"""
+        self.cancel()
+        return False
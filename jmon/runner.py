@@ -1,284 +1,65 @@
-
-
-from pyvirtualdisplay import Display
-import selenium
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
-import selenium.common.exceptions
-import urllib3.exceptions
-import psutil
-
 from jmon.client_type import ClientType
-from jmon.step_state import RequestsStepState, SeleniumStepState
+from jmon.step_state import PlaywrightStepState, RequestsStepState, SeleniumStepState
 from jmon.step_status import StepStatus
 from jmon.steps.actions.screenshot_action import ScreenshotAction
-from jmon.config import ChromeHeadlessMode, Config
+from jmon.config import Config
 from jmon.logger import logger
-
-
-class BrowserBase:
-    """Base class for Browser management"""
-
-    CLIENT_TYPE = None
-    SELENIUM_CLASS = None
-
-    @property
-    def is_headless(self):
-        """Return whether browser is running in headless mode"""
-        raise NotImplementedError
-
-    @property
-    def selenium_class(self):
-        """Return selenium type"""
-        if self.SELENIUM_CLASS is None:
-            raise NotImplementedError
-        return self.SELENIUM_CLASS
-
-    @property
-    def client_type(self):
-        """Return supported client type"""
-        if self.CLIENT_TYPE is None:
-            raise NotImplementedError
-
-        return self.CLIENT_TYPE
-
-    @property
-    def selenium_instance(self):
-        """Return selenium instance"""
-        return self._selenium_instance
-
-    def __init__(self):
-        """Setup browser"""
-        logger.info("Creating new browser")
-
-        # Create selenium instance
-        self._selenium_instance = self.selenium_class(**self.get_selenium_kwargs())
-
-        # Maximise and setup implicit wait
-        if self.is_headless:
-            # If running in headless, set the window size directly
-            # as maximise does not work
-            self.selenium_instance.set_window_position(0, 0)
-            self.selenium_instance.set_window_size(1920, 1080)
-        else:
-            # Otherwise, if using a read display, use maximum to
-            # make use of the full display
-            self.selenium_instance.maximize_window()
-        self.selenium_instance.implicitly_wait(1)
-
-        # Run post-setup configuration
-        self._post_setup_configuration()
-
-        # Obtain PID of browser
-        self._pid = self.selenium_instance.service.process.pid
-
-    def _post_setup_configuration(self):
-        """Perform post-setup configuration"""
-        raise NotImplementedError
-
-    def get_selenium_kwargs(self):
-        """Return list of kwargs to provide to selenium"""
-        raise NotImplementedError
-
-    def teardown(self):
-        """Teardown browser"""
-        # Attempt to close browser
-        try:
-            self.selenium_instance.close()
-        except (selenium.common.exceptions.InvalidSessionIdException,
-                selenium.common.exceptions.WebDriverException,
-                urllib3.exceptions.MaxRetryError) as exc:
-            logger.error(str(exc))
-
-        try:
-            self.selenium_instance.quit()
-        except urllib3.exceptions.MaxRetryError as exc:
-            # Handle exceptions when unable to connect to selenium chromedriver
-            logger.error(str(exc))
-
-        try:
-            # Kill any selenium PIDs, if they exist
-            psutil.Process(self._pid).terminate()
-        # Catch error if PID doesn't exist due to browser
-        # having close down correctly
-        except psutil.Error:
-            pass
-
-    def clean(self):
-        """Clean browser between runs"""
-        # Attempt to load blank page and delete cookies
-        self.selenium_instance.get('about:blank')
-        self.selenium_instance.delete_all_cookies()
-
-
-class BrowserChrome(BrowserBase):
-
-    CLIENT_TYPE = ClientType.BROWSER_CHROME
-    SELENIUM_CLASS = selenium.webdriver.Chrome
-
-    def get_selenium_kwargs(self):
-        """Return kwargs to pass to selenium"""
-        options = ChromeOptions()
-        options.binary_location = "/opt/chrome-linux/chrome"
-        options.add_argument('--no-sandbox')
-
-        # Disable caching
-        options.add_argument("--incognito")
-        options.add_argument('--disable-application-cache')
-        options.add_argument("--disk-cache-size=0")
-        options.add_argument("--disk-cache-dir=/dev/null")
-
-        # Set headles mode, if enabled
-        if Config.get().CHROME_HEADLESS_MODE is not ChromeHeadlessMode.NONE:
-            headless_argument = (
-                "new"
-                if Config.get().CHROME_HEADLESS_MODE is ChromeHeadlessMode.NEW else
-                "chrome"
-            )
-            options.add_argument(f'--headless={headless_argument}')
-        return {"chrome_options": options}
-
-    @property
-    def is_headless(self):
-        """Return whether browser is running in headless mode"""
-        return Config.get().CHROME_HEADLESS_MODE is not ChromeHeadlessMode.NONE
-
-    def _post_setup_configuration(self):
-        """Perform post-setup configuration"""
-        # Disable network caching
-        self.selenium_instance.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled":True})
-
-
-class BrowserFirefox(BrowserBase):
-
-    CLIENT_TYPE = ClientType.BROWSER_FIREFOX
-    SELENIUM_CLASS = selenium.webdriver.Firefox
-
-    def get_selenium_kwargs(self):
-        """Return kwargs to pass to selenium"""
-        options = FirefoxOptions()
-        options.headless = Config.get().FIREFOX_HEADLESS
-
-        # Create profile for disabling caching
-        profile = FirefoxProfile()
-        profile.set_preference('browser.cache.disk.enable', False)
-        profile.set_preference('browser.cache.memory.enable', False)
-        profile.set_preference('browser.cache.offline.enable', False)
-        profile.set_preference('network.cookie.cookieBehavior', 2)
-        profile.set_preference("browser.privatebrowsing.autostart", True)
-
-        return {
-            "options": options
-        }
-
-    @property
-    def is_headless(self):
-        """Return whether browser is running in headless mode"""
-        return bool(Config.get().FIREFOX_HEADLESS)
-
-    def _post_setup_configuration(self):
-        """Perform post-setup configuration"""
-        pass
-
-
-class BrowserFactory:
-
-    _INSTANCE = None
-
-    @classmethod
-    def get(cls):
-        """Return instance of browser factory"""
-        if cls._INSTANCE is None:
-            cls._INSTANCE = cls()
-        return cls._INSTANCE
-
-    @property
-    def cached_browser_client_type(self):
-        """Return client type of cached browser, if present"""
-        if self._browser is not None:
-            return self._browser.client_type
-        return None
-
-    def __init__(self):
-        """Store member variable"""
-        self._browser: BrowserBase = None
-        self._class_mappings = {
-            browser_class.CLIENT_TYPE: browser_class
-            for browser_class in BrowserBase.__subclasses__()
-        }
-
-    def get_browser(self, client_type):
-        """Obtain and cache browser"""
-        # If a browser is already present
-        if self._browser is not None:
-            # If it matches the type, ensure it is working and return
-            if client_type is self._browser.client_type:
-                try:
-                    self._browser.clean()
-
-                    logger.info("Using cached browser")
-                    # Return the cached browser
-                    return self._browser
-                except Exception as exc:
-                    logger.info("Error whilst cleaning cached browser: {exc}")
-                    # Delete cached browser
-                    self.teardown_browser()
-
-            else:
-                # Otherwise, if the cached browser type does not match
-                # the required browser, tear it down
-                logger.info("Browser type does not match cached browser - tearing down")
-                self.teardown_browser()
-
-        # If a cache browser has not been returned, create a new one
-        self._browser = self.get_browser_class_by_client_type(client_type)()
-
-        return self._browser
-
-    def get_browser_class_by_client_type(self, client_type):
-        """Return browser class by client type"""
-        browser_class = self._class_mappings.get(client_type)
-        if browser_class is None:
-            raise Exception(f"Could not find browser class for client type: {client_type}")
-        return browser_class
-
-    def teardown_browser(self):
-        """Tear down cached browser"""
-        if self._browser:
-            self._browser.teardown()
-            self._browser = None
+from jmon.run_watchdog import RunDeadlineExceededError, RunWatchdog
 
 
 class Runner:
     """Execute run"""
 
-    _DISPLAY = None
-
     @classmethod
-    def get_display(cls):
-        """Create display and cache"""
-        if cls._DISPLAY is None:
-            cls._DISPLAY = Display(visible=0, size=(1920, 1080))
-            cls._DISPLAY.start()
-        return cls._DISPLAY
+    def get_browser_factory(cls):
+        """Return browser factory, using the browser host if configured"""
+        # Import browser modules inline, to avoid loading the
+        # browser stack in workers that only perform requests checks
+        if Config.get().BROWSER_HOST_SOCKET:
+            from jmon.browser_host import BrowserHostClient
+            return BrowserHostClient.get()
+
+        from jmon.browser import BrowserFactory
+        return BrowserFactory.get()
 
     @classmethod
     def on_worker_startup(cls):
         """Handle worker startup"""
-        cls.get_display()
+        # Browsers are managed by the browser host, if in use
+        if Config.get().BROWSER_HOST_SOCKET:
+            return
+
+        # Start warming standby browsers.
+        # The display is created on demand, when a non-headless browser is created
+        cls.get_browser_factory().pool.refill_all()
 
     @classmethod
     def on_worker_shutdown(cls):
         """Hanle worker shutdown"""
-        # Teardown any cached browsers
-        BrowserFactory.get().teardown_browser()
+        # Teardown any cached and standby browsers,
+        # or return browser to the browser host
+        cls.get_browser_factory().teardown()
+
+        if not Config.get().BROWSER_HOST_SOCKET:
+            from jmon.browser import VirtualDisplay
+            VirtualDisplay.stop()
 
-        if cls._DISPLAY is not None:
-            cls.get_display().stop()
-            cls._DISPLAY = None
+        from jmon.playwright_browser import PlaywrightBrowser
+        PlaywrightBrowser.teardown_current()
 
     def perform_check(self, run):
+        """Perform checks, enforcing hard deadline of the run"""
+        # Allow a grace period for browser start-up and step-level
+        # timeouts, before forcibly aborting the run
+        watchdog = RunWatchdog(timeout=run.check.get_timeout() + Config.get().RUN_DEADLINE_GRACE_PERIOD)
+        try:
+            with watchdog:
+                return self._perform_check(run=run, watchdog=watchdog)
+        except RunDeadlineExceededError:
+            run.logger.error("Run has been aborted as it exceeded the check timeout")
+            return StepStatus.TIMEOUT
+
+    def _perform_check(self, run, watchdog):
         """Setup selenium and perform checks"""
         supported_clients = run.check.get_supported_clients()
 
@@ -292,16 +73,37 @@ class Runner:
         # be overriden by execution method
         status = StepStatus.FAILED
 
+        if ClientType.REQUESTS not in supported_clients and not self._perform_preflight(run=run):
+            return status
+
         if ClientType.REQUESTS in supported_clients:
-            # Execute using requests
-            run.start_timer()
-            status = run.root_step.execute(
-                execution_method='execute_requests',
-                state=RequestsStepState(None, None)
-            )
+            from jmon.http_session import HttpConnectionPool
+
+            # Execute using requests, re-using connections from previous runs
+            with HttpConnectionPool.get().session(fresh_connection=run.check.should_use_fresh_connection) as session:
+                run.start_timer()
+                state = RequestsStepState(None, None, session=session)
+                try:
+                    status = run.root_step.execute(
+                        execution_method='execute_requests',
+                        state=state
+                    )
+                finally:
+                    # Release connection of streamed responses that were not fully read
+                    if state.response is not None:
+                        state.response.close()
+        elif ClientType.BROWSER_PLAYWRIGHT in supported_clients:
+            status = self._perform_playwright_check(run=run)
+
         elif ClientType.BROWSER_FIREFOX in supported_clients or ClientType.BROWSER_CHROME in supported_clients:
+            # Import browser dependencies inline, as they are only required for browser checks
+            import selenium.common.exceptions
+            import urllib3.exceptions
 
-            browser_factory = BrowserFactory.get()
+            browser_factory = self.get_browser_factory()
+            # Kill browser if the run exceeds the hard deadline,
+            # aborting any blocking webdriver calls
+            watchdog.add_abort_callback(browser_factory.kill_browser)
 
             # Check cached browser
             if ((cached_browser_client_type := browser_factory.cached_browser_client_type)
@@ -312,14 +114,17 @@ class Runner:
                 run.logger.info(f"Switching run to cached browser: {cached_browser_client_type.value}")
                 client_type = cached_browser_client_type
 
-            # Ensure display is created
-            self.get_display()
-
             try:
-                browser = browser_factory.get_browser(client_type)
+                page_load_strategy = run.check.get_page_load_strategy()
+                browser = browser_factory.get_browser(
+                    client_type, block_config=run.check.get_block_config(), page_load_strategy=page_load_strategy
+                )
                 selenium_instance = browser.selenium_instance
 
-                root_state = SeleniumStepState(selenium_instance=selenium_instance, element=selenium_instance)
+                root_state = SeleniumStepState(
+                    selenium_instance=selenium_instance, element=selenium_instance,
+                    session_page_load_strategy=page_load_strategy
+                )
 
                 # Start timeout timer once selenium has been initialised
                 run.start_timer()
@@ -346,6 +151,9 @@ class Runner:
                 if not Config.get().CACHE_BROWSER:
                     logger.info("Tearing down browser - caching not enabled")
                     browser_factory.teardown_browser()
+                else:
+                    # Recycle cached browser if it has exceeded memory/age thresholds
+                    browser_factory.recycle_browser_if_required()
 
             except (selenium.common.exceptions.InvalidSessionIdException,
                     urllib3.exceptions.MaxRetryError,
@@ -367,3 +175,75 @@ class Runner:
             raise Exception(f"Unknown client: {client_type}")
 
         return status
+
+    def _perform_preflight(self, run):
+        """Probe target of browser check, returning False if it could not be reached"""
+        # Import inline, as preflight is only performed for browser checks
+        from jmon.preflight import get_preflight_url, perform_preflight
+
+        if not Config.get().BROWSER_PREFLIGHT:
+            return True
+
+        if (url := get_preflight_url(run.root_step)) is None:
+            return True
+
+        # Start timer, so that the duration of failed runs is recorded.
+        # This is reset once the browser has been initialised.
+        run.start_timer()
+
+        run.logger.info(f"Performing preflight request: {url}")
+        if (error := perform_preflight(url, timeout=Config.get().BROWSER_PREFLIGHT_TIMEOUT)) is not None:
+            run.logger.error(f"Preflight request failed, skipping browser steps: {error}")
+            return False
+        return True
+
+    def _perform_playwright_check(self, run):
+        """Perform check using playwright, in a new browser context"""
+        # Import playwright dependencies inline, as they are only required for playwright checks
+        from jmon.playwright_browser import PlaywrightBrowser
+
+        browser = PlaywrightBrowser.get()
+        try:
+            context = browser.new_context(block_config=run.check.get_block_config())
+        except:
+            logger.info("Exception raised creating browser context - tearing down playwright browser")
+            PlaywrightBrowser.teardown_current()
+            raise
+
+        try:
+            root_state = PlaywrightStepState(page=context.new_page())
+
+            # Start timeout timer once the browser context has been created
+            run.start_timer()
+
+            status = run.root_step.execute(
+                execution_method='execute_playwright',
+                state=root_state
+            )
+
+            if status is StepStatus.FAILED and run.check.should_screenshot_on_error:
+                # Perform failure screenshot, if configured
+                error_screenshot = ScreenshotAction(
+                    run=run,
+                    config="failure",
+                    parent=run.root_step,
+                    run_logger=None
+                )
+                error_screenshot.execute(
+                    execution_method='execute_playwright',
+                    state=root_state
+                )
+            return status
+
+        except:
+            # Browser may have crashed, so start a new browser for the next run
+            logger.info("Exception raised - tearing down playwright browser")
+            PlaywrightBrowser.teardown_current()
+            raise
+
+        finally:
+            # Closing the context discards all state of the run
+            try:
+                context.close()
+            except Exception as exc:
+                logger.warning(f"Failed to close playwright browser context: {exc}")
@@ -0,0 +1,76 @@
+
+from typing import Optional
+
+from jmon.wait_engine import NORMALISE_TEXT_SCRIPT
+
+
+# Evaluate plan of read-only steps (nested finds and checks) against the page,
+# returning a tree of results matching the plan.
+# Text is compared using the same rule as the text check, when not batched
+_EVALUATE_PLAN_SCRIPT = NORMALISE_TEXT_SCRIPT + """
+const [root, plan] = arguments;
+const findElement = (context, by, value) => {
+    const scope = context || document;
+    switch (by) {
+        case "id": return scope.querySelector("[id=\\"" + CSS.escape(value) + "\\"]");
+        case "class name": return scope.querySelector("." + CSS.escape(value));
+        case "tag name": return scope.getElementsByTagName(value)[0] || null;
+        case "xpath": return document.evaluate(
+            value, scope, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    throw new Error("Unsupported find type: " + by);
+};
+const evaluateChildren = (node, element) => {
+    const children = [];
+    for (const child of node.children) {
+        const result = evaluate(child, element);
+        children.push(result);
+        if (!result.ok) return {ok: false, actual: null, children: children};
+    }
+    return {ok: true, actual: null, children: children};
+};
+const evaluate = (node, element) => {
+    switch (node.type) {
+        case "find": {
+            const found = findElement(element, node.by, node.value);
+            if (!found) return {ok: false, actual: null, children: []};
+            return evaluateChildren(node, found);
+        }
+        case "check": return evaluateChildren(node, element);
+        case "text": {
+            if (!element) return {ok: false, actual: null, children: []};
+            const text = normaliseText(element.innerText);
+            return {ok: text === node.expected, actual: text, children: []};
+        }
+        case "title": return {ok: document.title === node.expected, actual: document.title, children: []};
+        case "url": return {ok: window.location.href === node.expected, actual: window.location.href, children: []};
+    }
+    throw new Error("Unsupported step type: " + node.type);
+};
+return evaluate(plan, root);
+"""
+
+
+def evaluate_plan(selenium_instance, element, plan: dict) -> Optional[dict]:
+    """
+    Evaluate plan of read-only steps in a single script.
+
+    Returns the tree of results if all steps succeeded, otherwise None,
+    in which case the steps should be executed individually.
+    """
+    import selenium.common.exceptions
+
+    try:
+        result = selenium_instance.execute_script(
+            _EVALUATE_PLAN_SCRIPT,
+            # Search the document when the current element is the page
+            None if element is selenium_instance else element,
+            plan
+        )
+    except selenium.common.exceptions.WebDriverException:
+        return None
+
+    if result and result.get("ok"):
+        return result
+    return None
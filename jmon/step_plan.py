@@ -0,0 +1,118 @@
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, FrozenSet, List, NamedTuple, Optional, Tuple, Type
+
+from jmon.client_type import ClientType
+
+
+class StepPlan(NamedTuple):
+    """
+    Compiled step definition, containing the class and config of a step and its child steps.
+
+    Plans are immutable and shared between runs, with step instances for
+    each run being created from the plan, without re-parsing the step config.
+    The config of plans must not be modified by steps.
+    """
+
+    step_class: Type['jmon.steps.base_step.BaseStep']
+    config: Any
+    children: Tuple['StepPlan', ...]
+    # Clients supported by the step and all of its child steps
+    supported_clients: FrozenSet[ClientType]
+    # Number of child steps, including all descendants
+    step_count: int
+    # Time budget of step, if provided
+    timeout: Optional[float] = None
+    # Page load strategies configured by the step and all of its child steps
+    page_load_strategies: FrozenSet['jmon.page_load.PageLoadStrategy'] = frozenset()
+    # Compiled templates of step, in the order they are created by the step
+    templates: Tuple['jmon.template.CompiledTemplate', ...] = ()
+
+    @classmethod
+    def compile(cls, step_class: Type['jmon.steps.base_step.BaseStep'], config: Any,
+                timeout: Optional[float] = None) -> 'StepPlan':
+        """Compile plan for step and its child steps"""
+        prototype = step_class(run=None, config=config, parent=None)
+
+        children = tuple(
+            cls.compile(child_step_class, child_config, child_timeout)
+            for child_step_class, child_config, child_timeout in prototype.get_child_step_configs()
+        )
+
+        supported_clients = frozenset(prototype.supported_clients)
+        page_load_strategies = frozenset([prototype.page_load_strategy] if prototype.page_load_strategy else [])
+        for child in children:
+            supported_clients = supported_clients.intersection(child.supported_clients)
+            page_load_strategies = page_load_strategies.union(child.page_load_strategies)
+
+        return cls(
+            step_class=step_class,
+            config=config,
+            children=children,
+            supported_clients=supported_clients,
+            step_count=sum([child.step_count + 1 for child in children]),
+            timeout=timeout,
+            page_load_strategies=page_load_strategies,
+            # Compile templates once, for re-use by the steps of each run
+            templates=tuple(template.compile() for template in prototype._templates),
+        )
+
+    def create_step(self, run, parent: Optional['jmon.steps.base_step.BaseStep'], run_logger=None) -> 'jmon.steps.base_step.BaseStep':
+        """Create step instance for run, with child steps created from the plan"""
+        step = self.step_class(run=run, config=self.config, parent=parent, run_logger=run_logger)
+        step._plan = self
+        step._step_timeout = self.timeout
+        if len(step._templates) == len(self.templates):
+            for template, compiled_template in zip(step._templates, self.templates):
+                template.use_compiled(compiled_template)
+        return step
+
+    def get_supported_clients(self, supported_clients: List[ClientType]) -> List[ClientType]:
+        """Return filtered list of clients, supported by all steps"""
+        return [
+            client
+            for client in supported_clients
+            if client in self.supported_clients
+        ]
+
+
+class StepPlanCache:
+    """
+    Cache of compiled plans of check steps, shared by the process.
+
+    Plans are keyed by a hash of the serialised steps of the check,
+    so changes to the steps of a check result in a new plan.
+    """
+
+    MAX_SIZE = 512
+
+    _LOCK = threading.Lock()
+    _PLANS: 'OrderedDict[bytes, StepPlan]' = OrderedDict()
+
+    @classmethod
+    def get_root_plan(cls, steps: bytes) -> StepPlan:
+        """Return plan for root step of serialised steps"""
+        # Import inline to avoid circular import, as steps reference checks
+        import jmon.steps.root_step
+
+        key = hashlib.sha256(steps).digest()
+        with cls._LOCK:
+            if (plan := cls._PLANS.get(key)) is not None:
+                cls._PLANS.move_to_end(key)
+                return plan
+
+        plan = StepPlan.compile(jmon.steps.root_step.RootStep, json.loads(steps.decode('utf-8')))
+        with cls._LOCK:
+            cls._PLANS[key] = plan
+            if len(cls._PLANS) > cls.MAX_SIZE:
+                cls._PLANS.popitem(last=False)
+        return plan
+
+    @classmethod
+    def clear(cls):
+        """Remove all cached plans"""
+        with cls._LOCK:
+            cls._PLANS.clear()
@@ -1,10 +1,15 @@
 
 import abc
+import json
 from typing import Optional
 
 import requests
+import requests.exceptions
 import dns.resolver
 
+from jmon.page_load import PageLoadStrategy
+from jmon.response_body import ResponseBody
+
 
 class StepState(abc.ABC):
 
@@ -26,38 +31,153 @@ class StepState(abc.ABC):
 
 class SeleniumStepState(StepState):
 
-    def __init__(self, selenium_instance, element):
+    def __init__(self, selenium_instance, element, page_load_strategy=PageLoadStrategy.NORMAL,
+                 session_page_load_strategy=PageLoadStrategy.NORMAL):
         self.element = element
         self.selenium_instance = selenium_instance
+        # Page load strategy of the last goto, used when waiting for navigation
+        self.page_load_strategy = page_load_strategy
+        # Webdriver page load strategy of the browser session
+        self.session_page_load_strategy = session_page_load_strategy
+
+    def should_wait_for_page_load(self, strategy: PageLoadStrategy) -> bool:
+        """
+        Whether steps must wait for pages to load according to strategy, after navigation caused by gotos and actions.
+
+        Webdriver waits for page loads in sessions using the normal strategy,
+        and strategies of none do not require any waiting.
+        """
+        return self.session_page_load_strategy is not PageLoadStrategy.NORMAL and strategy is not PageLoadStrategy.NONE
 
     def clone_to_child(self):
         """Clone current state to state for child step"""
         return SeleniumStepState(
             selenium_instance=self.selenium_instance,
-            element=self.element
+            element=self.element,
+            page_load_strategy=self.page_load_strategy,
+            session_page_load_strategy=self.session_page_load_strategy
         )
 
-    def integrate_from_child(self, child):
+    def integrate_from_child(self, child: 'SeleniumStepState'):
         """Integrate child state back into current state"""
-        pass
+        self.page_load_strategy = child.page_load_strategy
 
 
 class RequestsStepState(StepState):
 
-    def __init__(self, response: Optional['requests.Response'], dns_response: Optional['dns.resolver.Answer']):
+    def __init__(self, response: Optional['requests.Response'], dns_response: Optional['dns.resolver.Answer'],
+                 session: Optional['requests.Session'] = None):
         """Store state member variables"""
         self.response = response
         self.dns_response = dns_response
+        # Session of run, retaining cookies and connections between requests
+        self.session = session
+        # Body of response, read incrementally by checks
+        self._response_body: Optional[ResponseBody] = None
+        # Parsed JSON body of response, as tuple of response, value and decode error
+        self._response_json = None
+        # Whether the response is closed when it is replaced, which is not
+        # the case for branches that share the response with other branches
+        self._owns_response = True
+
+    def set_response(self, response: 'requests.Response', max_body_size: Optional[int] = None):
+        """Set response, limiting the size of body that is read by checks"""
+        # Release connection of previous response, which may not have been fully read
+        if self._owns_response and self.response is not None and self.response is not response:
+            self.response.close()
+
+        self.response = response
+        self._owns_response = True
+        self._response_body = ResponseBody(response, max_size=max_body_size)
+
+    def get_response_body(self) -> ResponseBody:
+        """Return body of response"""
+        if self._response_body is None or self._response_body.response is not self.response:
+            self._response_body = ResponseBody(self.response)
+        return self._response_body
+
+    def get_response_json(self):
+        """
+        Return JSON body of response, parsing the body once per response.
+
+        Raises requests.exceptions.JSONDecodeError if the body is not valid JSON
+        and ResponseBodyTooLargeError if the body exceeds the max body size.
+        """
+        if self._response_json is None or self._response_json[0] is not self.response:
+            try:
+                self._response_json = (self.response, json.loads(self.get_response_body().read()), None)
+            except json.JSONDecodeError as exc:
+                self._response_json = (
+                    self.response, None,
+                    requests.exceptions.JSONDecodeError(exc.msg, exc.doc, exc.pos)
+                )
+            except Exception as exc:
+                self._response_json = (self.response, None, exc)
+
+        _, value, error = self._response_json
+        if error is not None:
+            raise error
+        return value
 
     def clone_to_child(self):
         """Clone current state to state for child step"""
-        return RequestsStepState(
+        child = RequestsStepState(
             response=self.response,
-            dns_response=self.dns_response
+            dns_response=self.dns_response,
+            session=self.session
         )
+        child._response_body = self._response_body
+        child._response_json = self._response_json
+        child._owns_response = self._owns_response
+        return child
+
+    def clone_to_branch(self):
+        """
+        Clone current state to state for branch executed concurrently.
+
+        The branch does not own the current response and uses its own session,
+        sharing the connections and a copy of the cookies of the current session.
+        """
+        # Import inline, as the connection pool is only used by requests checks
+        from jmon.http_session import clone_session
+
+        branch = self.clone_to_child()
+        branch._owns_response = False
+        if self.session is not None:
+            branch.session = clone_session(self.session)
+        return branch
+
+    @property
+    def owns_response(self) -> bool:
+        """Whether the response is owned by the state, so should be closed once it is no longer used"""
+        return self._owns_response
 
     def integrate_from_child(self, child: 'RequestsStepState'):
         """Integrate child state back into current state"""
         # Copy response back to parent object
         self.response = child.response
+        self._owns_response = child._owns_response
         self.dns_response = child.dns_response
+        # Retain body and parsed body, so that they can be used by sibling steps
+        self._response_body = child._response_body
+        self._response_json = child._response_json
+
+
+class PlaywrightStepState(StepState):
+
+    def __init__(self, page, element=None):
+        """Store state member variables"""
+        self.page = page
+        # Locator of current element, or None when the page is the current element
+        self.element = element
+
+    def clone_to_child(self):
+        """Clone current state to state for child step"""
+        return PlaywrightStepState(
+            page=self.page,
+            element=self.element
+        )
+
+    def integrate_from_child(self, child: 'PlaywrightStepState'):
+        """Integrate child state back into current state"""
+        pass
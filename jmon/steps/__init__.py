@@ -6,4 +6,6 @@ from jmon.steps.find_step import FindStep
 from jmon.steps.dns_step import DNSStep
 from jmon.steps.action_step import ActionStep
 from jmon.steps.check_step import CheckStep
-from jmon.steps.call_plugin_step import CallPluginStep
\ No newline at end of file
+from jmon.steps.call_plugin_step import CallPluginStep
+from jmon.steps.branch_step import BranchStep
+from jmon.steps.parallel_step import ParallelStep
@@ -1,8 +1,8 @@
 
 from jmon.client_type import ClientType
 from jmon.errors import StepValidationError
-from jmon.step_state import SeleniumStepState
-from jmon.steps.base_step import BaseStep
+from jmon.step_state import PlaywrightStepState, SeleniumStepState
+from jmon.steps.base_step import BaseStep, ChildStepConfig
 import jmon.steps.actions
 from jmon.logger import logger
 
@@ -43,7 +43,8 @@ class ActionStep(BaseStep):
         """Return list of supported clients"""
         return [
             ClientType.BROWSER_FIREFOX,
-            ClientType.BROWSER_CHROME
+            ClientType.BROWSER_CHROME,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     def _validate_step(self):
@@ -61,9 +62,9 @@ class ActionStep(BaseStep):
         """Friendly description of step"""
         return "Running action steps"
 
-    def get_child_steps(self):
+    def get_child_step_configs(self):
         """
-        Get child steps
+        Return class and config of each child step
 
         Handle actions similar to:
         actions:
@@ -71,31 +72,29 @@ class ActionStep(BaseStep):
          - press: enter
          - click
         """
-        if self._child_steps is None:
-            self._child_steps = []
-
-            supported_actions = self.get_supported_child_steps()
-
-            for action_config in self._config:
-                if type(action_config) is dict:
-                    for action_name in action_config:
-                        if action_name in supported_actions:
-                            self._child_steps.append(
-                                supported_actions[action_name](
-                                    run=self._run,
-                                    config=action_config[action_name],
-                                    parent=self,
-                                    run_logger=self._logger
-                                )
-                            )
-                elif type(action_config) is str:
-                    if action_config in supported_actions:
-                        self._child_steps.append(
-                            supported_actions[action_config](run=self._run, config=None, parent=self)
-                        )
-        return self._child_steps
+        child_step_configs = []
+
+        supported_actions = self.get_supported_child_steps()
+
+        for action_config in self._config:
+            if type(action_config) is dict:
+                for action_name in action_config:
+                    if action_name in supported_actions:
+                        child_step_configs.append(ChildStepConfig(
+                            supported_actions[action_name], action_config[action_name],
+                            action_config.get(self.STEP_TIMEOUT_KEY)
+                        ))
+            elif type(action_config) is str:
+                if action_config in supported_actions:
+                    child_step_configs.append(ChildStepConfig(supported_actions[action_config], None))
+        return child_step_configs
 
     def execute_selenium(self, state: SeleniumStepState):
         """Do nothihng"""
         # Do nothing, let sub-actions perform actions
         pass
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Do nothing"""
+        # Do nothing, let sub-actions perform actions
+        pass
@@ -1,14 +1,14 @@
 
 
-import selenium.common.exceptions
-
 from jmon.client_type import ClientType
+from jmon.config import Config
 from jmon.errors import StepValidationError
-from jmon.step_state import SeleniumStepState
+from jmon.step_state import PlaywrightStepState, SeleniumStepState
 from jmon.steps.actions.base_action import BaseAction
 from jmon.logger import logger
+from jmon.page_load import mark_document, wait_for_navigation
 from jmon.step_status import StepStatus
-from jmon.utils import RetryStatus, retry
+from jmon.utils import TIMEOUT_RETRY_STATUSES, retry
 
 
 class ClickAction(BaseAction):
@@ -32,7 +32,8 @@ class ClickAction(BaseAction):
         """Return list of supported clients"""
         return [
             ClientType.BROWSER_FIREFOX,
-            ClientType.BROWSER_CHROME
+            ClientType.BROWSER_CHROME,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     def _validate_step(self):
@@ -53,6 +54,8 @@ class ClickAction(BaseAction):
     @retry(count=5, interval=0.5)
     def _click_element(self, element):
         """Click mouse"""
+        import selenium.common.exceptions
+
         try:
             element.click()
             return True
@@ -63,9 +66,38 @@ class ClickAction(BaseAction):
 
     def execute_selenium(self, state: SeleniumStepState):
         """Click mouse"""
-        res = self._click_element(state.element, only_if=lambda: not self.has_timeout_been_reached())
-        if res is RetryStatus.ONLY_IF_CONDITION_FAILURE:
+        if state.should_wait_for_page_load(state.page_load_strategy):
+            # Mark document to detect navigation caused by the click
+            mark_document(state.selenium_instance)
+
+        res = self._click_element(state.element, only_if=lambda: not self.has_timeout_been_reached(), deadline=self.deadline, on_retry=self.record_retry)
+        if res in TIMEOUT_RETRY_STATUSES:
             self.set_status(StepStatus.TIMEOUT)
 
         if not res:
             self.set_status(StepStatus.FAILED)
+            return
+
+        # Wait for any navigation caused by the click, if not waited for by webdriver
+        if state.should_wait_for_page_load(state.page_load_strategy) and not wait_for_navigation(
+                state.selenium_instance, strategy=state.page_load_strategy,
+                timeout=self.get_remaining_time()):
+            self.set_status(StepStatus.TIMEOUT)
+            self._logger.error("Timed out waiting for page to load")
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Click mouse, waiting for element to be clickable"""
+        from playwright.sync_api import Error as PlaywrightError
+
+        if state.element is None:
+            self.set_status(StepStatus.FAILED)
+            self._logger.error("Click must be performed on an element")
+            return
+
+        try:
+            # Playwright waits for any navigation caused by the click to start
+            state.element.click(timeout=self.get_playwright_timeout(Config.get().FIND_ELEMENT_TIMEOUT))
+        except PlaywrightError as exc:
+            self._logger.error("Could not click on Element:")
+            self._logger.debug(str(exc).split("\n")[0])
+            self.set_status(StepStatus.TIMEOUT if self.has_timeout_been_reached() else StepStatus.FAILED)
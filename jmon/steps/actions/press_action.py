@@ -1,12 +1,12 @@
 
-from selenium.webdriver.common.keys import Keys
 from jmon.client_type import ClientType
 from jmon.errors import StepValidationError
-from jmon.step_state import SeleniumStepState
+from jmon.step_state import PlaywrightStepState, SeleniumStepState
 from jmon.step_status import StepStatus
 
 from jmon.steps.actions.base_action import BaseAction
 from jmon.logger import logger
+from jmon.page_load import mark_document, wait_for_navigation
 
 
 class PressAction(BaseAction):
@@ -33,7 +33,8 @@ class PressAction(BaseAction):
         """Return list of supported clients"""
         return [
             ClientType.BROWSER_FIREFOX,
-            ClientType.BROWSER_CHROME
+            ClientType.BROWSER_CHROME,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     @property
@@ -54,9 +55,35 @@ class PressAction(BaseAction):
 
     def execute_selenium(self, state: SeleniumStepState):
         """Press keyboard key"""
+        from selenium.webdriver.common.keys import Keys
+
         if self._config.lower() == "enter":
+            if state.should_wait_for_page_load(state.page_load_strategy):
+                # Mark document to detect navigation caused by submitting a form
+                mark_document(state.selenium_instance)
+
             state.element.send_keys(Keys.ENTER)
 
+            # Wait for any navigation caused by submitting a form, if not waited for by webdriver
+            if state.should_wait_for_page_load(state.page_load_strategy) and not wait_for_navigation(
+                    state.selenium_instance, strategy=state.page_load_strategy,
+                    timeout=self.get_remaining_time()):
+                self.set_status(StepStatus.TIMEOUT)
+                self._logger.error("Timed out waiting for page to load")
+
+        else:
+            self.set_status(StepStatus.FAILED)
+            self._logger.error(f'Unknown press action: {self._config}')
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Press keyboard key"""
+        if self._config.lower() == "enter":
+            if state.element is None:
+                # Press key in the focused element of the page
+                state.page.keyboard.press("Enter")
+            else:
+                state.element.press("Enter", timeout=self.get_playwright_timeout(self.get_remaining_time()))
+
         else:
             self.set_status(StepStatus.FAILED)
             self._logger.error(f'Unknown press action: {self._config}')
@@ -7,7 +7,7 @@ from jmon.step_state import SeleniumStepState
 from jmon.steps.actions.base_action import BaseAction
 from jmon.logger import logger
 from jmon.step_status import StepStatus
-from jmon.utils import RetryStatus, retry
+from jmon.utils import TIMEOUT_RETRY_STATUSES, retry
 
 
 @dataclasses.dataclass
@@ -72,6 +72,7 @@ class ReportPerformanceAction(BaseAction):
     """
 
     CONFIG_KEY = "report-performance"
+    PROVIDED_VARIABLES = frozenset(["performance"])
 
     @property
     def supported_clients(self):
@@ -104,8 +105,8 @@ class ReportPerformanceAction(BaseAction):
 
     def execute_selenium(self, state: SeleniumStepState):
         """Perform"""
-        res = self._report_performance(state.selenium_instance, only_if=lambda: not self.has_timeout_been_reached())
-        if res is RetryStatus.ONLY_IF_CONDITION_FAILURE:
+        res = self._report_performance(state.selenium_instance, only_if=lambda: not self.has_timeout_been_reached(), deadline=self.deadline, on_retry=self.record_retry)
+        if res in TIMEOUT_RETRY_STATUSES:
             self.set_status(StepStatus.TIMEOUT)
 
         if not res:
@@ -1,10 +1,9 @@
 
 import os
 import re
-from selenium.webdriver.common.keys import Keys
 from jmon.client_type import ClientType
 from jmon.errors import StepValidationError
-from jmon.step_state import SeleniumStepState
+from jmon.step_state import PlaywrightStepState, SeleniumStepState
 
 from jmon.steps.actions.base_action import BaseAction
 from jmon.logger import logger
@@ -38,7 +37,8 @@ class ScreenshotAction(BaseAction):
         """Return list of supported clients"""
         return [
             ClientType.BROWSER_FIREFOX,
-            ClientType.BROWSER_CHROME
+            ClientType.BROWSER_CHROME,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     @property
@@ -77,3 +77,11 @@ class ScreenshotAction(BaseAction):
         state.selenium_instance.save_screenshot(screenshot_path)
 
         self._run.register_artifact(screenshot_path)
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Capture screenshot of page"""
+        screenshot_path = os.path.join(self.TEMP_DIRECTORY, self.screenshot_file_name)
+
+        state.page.screenshot(path=screenshot_path)
+
+        self._run.register_artifact(screenshot_path)
@@ -1,13 +1,12 @@
 
-import selenium.common.exceptions
-
 from jmon.client_type import ClientType
+from jmon.config import Config
 from jmon.errors import StepValidationError
-from jmon.step_state import SeleniumStepState
+from jmon.step_state import PlaywrightStepState, SeleniumStepState
 from jmon.step_status import StepStatus
 from jmon.steps.actions.base_action import BaseAction
 from jmon.logger import logger
-from jmon.utils import RetryStatus, retry
+from jmon.utils import TIMEOUT_RETRY_STATUSES, retry
 
 
 class TypeAction(BaseAction):
@@ -36,12 +35,18 @@ class TypeAction(BaseAction):
 
     CONFIG_KEY = "type"
 
+    def __init__(self, run, config, parent, run_logger=None):
+        """Compile template"""
+        super().__init__(run, config, parent, run_logger)
+        self._type_template = self.compile_template(self._config)
+
     @property
     def supported_clients(self):
         """Return list of supported clients"""
         return [
             ClientType.BROWSER_FIREFOX,
-            ClientType.BROWSER_CHROME
+            ClientType.BROWSER_CHROME,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     @property
@@ -57,7 +62,7 @@ class TypeAction(BaseAction):
     @property
     def type_value(self):
         """Return text to type"""
-        return self.inject_variables_into_string(self._config)
+        return self.render_template(self._type_template)
 
     def _validate_step(self):
         """Check step is valid"""
@@ -66,6 +71,8 @@ class TypeAction(BaseAction):
 
     @retry(count=5, interval=0.5)
     def _type(self, element, text):
+        import selenium.common.exceptions
+
         try:
             element.send_keys(text)
             return True
@@ -74,9 +81,27 @@ class TypeAction(BaseAction):
 
     def execute_selenium(self, state: SeleniumStepState):
         """Type text"""
-        res = self._type(state.element, self.type_value, only_if=lambda: not self.has_timeout_been_reached())
-        if res is RetryStatus.ONLY_IF_CONDITION_FAILURE:
+        res = self._type(state.element, self.type_value, only_if=lambda: not self.has_timeout_been_reached(), deadline=self.deadline, on_retry=self.record_retry)
+        if res in TIMEOUT_RETRY_STATUSES:
             self.set_status(StepStatus.TIMEOUT)
         elif res is None:
             self.set_status(StepStatus.FAILED)
             self._logger.error("Unable to type into element")
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Type text"""
+        from playwright.sync_api import Error as PlaywrightError
+
+        try:
+            if state.element is None:
+                # Type into the focused element of the page
+                state.page.keyboard.type(self.type_value)
+            else:
+                state.element.press_sequentially(
+                    self.type_value,
+                    timeout=self.get_playwright_timeout(Config.get().FIND_ELEMENT_TIMEOUT)
+                )
+        except PlaywrightError as exc:
+            self.set_status(StepStatus.TIMEOUT if self.has_timeout_been_reached() else StepStatus.FAILED)
+            self._logger.error("Unable to type into element")
+            self._logger.debug(str(exc).split("\n")[0])
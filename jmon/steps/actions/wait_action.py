@@ -1,17 +1,13 @@
 
 from enum import Enum
 
-import selenium.common.exceptions
-import selenium.webdriver.support.expected_conditions as EC
-import selenium.webdriver.support.wait
-
 from jmon.client_type import ClientType
 from jmon.errors import StepValidationError
-from jmon.step_state import SeleniumStepState
+from jmon.step_state import PlaywrightStepState, SeleniumStepState
 from jmon.step_status import StepStatus
 from jmon.steps.actions.base_action import BaseAction
 from jmon.logger import logger
-from jmon.utils import RetryStatus, retry
+from jmon.wait_engine import WaitCondition, wait_for_condition
 
 
 class WaitActionType(Enum):
@@ -56,7 +52,8 @@ class WaitAction(BaseAction):
         """Return list of supported clients"""
         return [
             ClientType.BROWSER_FIREFOX,
-            ClientType.BROWSER_CHROME
+            ClientType.BROWSER_CHROME,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     @property
@@ -115,29 +112,45 @@ or
         # Validate timeout
         self.get_timeout()
 
-    @retry(count=1, interval=0)
-    def _wait(self, instance, element):
-        """Perform wait"""
-        until_method = None
-        wait_type = self.get_wait_type()
-        if wait_type is WaitActionType.VISIBLE:
-            until_method = EC.visibility_of
-        elif wait_type is WaitActionType.CLICKABLE:
-            until_method = EC.element_to_be_clickable
-        else:
-            raise Exception("Could not determine wait method for WatiActionType")
-
-        try:
-            selenium.webdriver.support.wait.WebDriverWait(instance, self.get_timeout()).until(until_method(element))
-            return True
-        except selenium.common.exceptions.TimeoutException:
-            return None
-
     def execute_selenium(self, state: SeleniumStepState):
-        """Perform wait"""
-        res = self._wait(state.selenium_instance, state.element, only_if=lambda: not self.has_timeout_been_reached())
-        if res is RetryStatus.ONLY_IF_CONDITION_FAILURE:
+        """Perform wait, resolving as soon as the element reaches the wait state"""
+        if self.has_timeout_been_reached():
             self.set_status(StepStatus.TIMEOUT)
-        elif res is None:
+            return
+
+        result = wait_for_condition(
+            state.selenium_instance, WaitCondition(self.get_wait_type().value),
+            timeout=self.limit_timeout_to_run(self.get_timeout()),
+            element=state.element
+        )
+        if not result.satisfied:
+            if self.has_timeout_been_reached():
+                self.set_status(StepStatus.TIMEOUT)
+            else:
+                self.set_status(StepStatus.FAILED)
+                self._logger.error("Timeout ocurred before wait completed")
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Perform wait, resolving as soon as the element reaches the wait state"""
+        from playwright.sync_api import Error as PlaywrightError, expect
+
+        if self.has_timeout_been_reached():
+            self.set_status(StepStatus.TIMEOUT)
+            return
+
+        if state.element is None:
             self.set_status(StepStatus.FAILED)
-            self._logger.error("Timeout ocurred before wait completed")
+            self._logger.error("Wait must be performed on an element")
+            return
+
+        timeout = self.get_playwright_timeout(self.get_timeout())
+        try:
+            expect(state.element).to_be_visible(timeout=timeout)
+            if self.get_wait_type() is WaitActionType.CLICKABLE:
+                expect(state.element).to_be_enabled(timeout=timeout)
+        except (AssertionError, PlaywrightError):
+            if self.has_timeout_been_reached():
+                self.set_status(StepStatus.TIMEOUT)
+            else:
+                self.set_status(StepStatus.FAILED)
+                self._logger.error("Timeout ocurred before wait completed")
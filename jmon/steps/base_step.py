@@ -1,15 +1,34 @@
 
-from typing import Optional, Union
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Type, Union
 import logging
+import threading
+import time
 
+from jmon.deadline import Deadline
+from jmon.errors import StepValidationError
 from jmon.logger import logger
 from jmon.step_logger import StepLogger
 from jmon.step_state import StepState
 from jmon.step_status import StepStatus
+from jmon.template import CompiledTemplate
+
+
+class ChildStepConfig(NamedTuple):
+    """Class and config of child step"""
+
+    step_class: Type['BaseStep']
+    config: Any
+    # Time budget (seconds) of step, if provided alongside the step
+    timeout: Optional[float] = None
 
 
 class BaseStep:
 
+    # Lock for updating status of steps, which may be abandoned by another thread
+    _STATUS_LOCK = threading.Lock()
+    # Minimum timeout (seconds) of requests calls, used once the deadline has been reached
+    MIN_REQUESTS_TIMEOUT = 0.001
+
     # Key in steps YAML that the class is matched against
     CONFIG_KEY = None
     # Whether this step (on it's own) produces a
@@ -21,13 +40,39 @@ class BaseStep:
     """Allow some step types to debug/info logging"""
     SHOULD_INFO_DEBUG_LOG = True
 
+    # Names of run variables that the step may set, for use by subsequent steps.
+    # None if the step may set any variable (e.g. by calling plugins)
+    PROVIDED_VARIABLES: Optional[FrozenSet[str]] = frozenset()
+
+    # Key alongside a step in a list of steps, providing a time budget for the step, e.g.
+    # - goto: https://example.com
+    #   timeout: 10
+    STEP_TIMEOUT_KEY = "timeout"
+
+    # Supported child steps of each step class, keyed by config key
+    _SUPPORTED_CHILD_STEPS_CACHE: Dict[Type['BaseStep'], Dict[str, Type['BaseStep']]] = {}
+
     def __init__(self, run, config, parent: Optional['BaseStep'], run_logger: Optional[Union['StepLogger', 'logging.Logger']]=None):
         """Store member variables"""
         self._config = config
         self._run = run
         self._parent = parent
         self._child_steps = None
+        # Compiled plan that the step was created from, if any
+        self._plan: Optional['jmon.step_plan.StepPlan'] = None
+        # Time budget of step, set by parent step, and deadline
+        # of step, which is started when the step is executed
+        self._step_timeout: Optional[float] = None
+        self._deadline: Optional[Deadline] = None
+        # Monotonic start/end time of execution of step and number of retries performed
+        self._start_time: Optional[float] = None
+        self._end_time: Optional[float] = None
+        self._retry_count = 0
         self._status = StepStatus.NOT_RUN
+        # Whether step has been abandoned, ignoring any later status updates
+        self._abandoned = False
+        # Templates compiled from step config
+        self._templates = []
 
         self._logger = (
             StepLogger(step=self, should_info_debug_log=self.SHOULD_INFO_DEBUG_LOG)
@@ -35,7 +80,8 @@ class BaseStep:
             logger
         )
 
-        logger.debug(f"Creating step: {self.__class__.__name__}: {config}")
+        # Format lazily, as the config of root steps contains all steps of the check
+        logger.debug("Creating step: %s: %s", self.__class__.__name__, config)
 
     @property
     def full_id(self):
@@ -61,6 +107,11 @@ class BaseStep:
         """Return list of supported clients"""
         raise NotImplementedError
 
+    @property
+    def page_load_strategy(self) -> Optional['jmon.page_load.PageLoadStrategy']:
+        """Return page load strategy configured by step, if any"""
+        return None
+
     @property
     def status(self):
         """Return current status"""
@@ -73,50 +124,58 @@ class BaseStep:
             "description": self.description,
             "log": "",
             "status": self.status.value,
+            "start_offset": self.start_offset,
+            "duration": self.duration,
+            "retry_count": self._retry_count,
             "children": [
                 child.as_dict()
                 for child in self.get_child_steps()
             ]
         }
 
+    def get_child_step_configs(self) -> List[ChildStepConfig]:
+        """Return class and config of each child step"""
+        child_step_configs = []
+
+        if not self._config or type(self._config) not in [list, dict]:
+            return child_step_configs
+
+        supported_child_steps = self.get_supported_child_steps()
+
+        # Handle lists of steps
+        if type(self._config) is list:
+            for step_config in self._config:
+                for supported_step_name, supported_step_class in supported_child_steps.items():
+                    if supported_step_name in step_config:
+                        child_step_configs.append(ChildStepConfig(
+                            supported_step_class, step_config[supported_step_name],
+                            step_config.get(self.STEP_TIMEOUT_KEY)
+                        ))
+
+        # Handle check dictionaries
+        elif type(self._config) is dict:
+            for step_name in self._config:
+                if step_name in supported_child_steps:
+                    child_step_configs.append(ChildStepConfig(supported_child_steps[step_name], self._config[step_name]))
+
+        return child_step_configs
+
     def get_child_steps(self):
         """Get child steps"""
         # Return cached child steps
         if self._child_steps is None:
-
-            self._child_steps = []
-
-            if not self._config or type(self._config) not in [list, dict]:
-                return self._child_steps
-
-            supported_child_steps = self.get_supported_child_steps()
-
-            # Handle lists of steps
-            if type(self._config) is list:
-                for step_config in self._config:
-                    for supported_step_name, supported_step_class in supported_child_steps.items():
-                        if supported_step_name in step_config:
-                            self._child_steps.append(
-                                supported_step_class(
-                                    run=self._run,
-                                    config=step_config[supported_step_name],
-                                    parent=self,
-                                    run_logger=self._logger
-                                )
-                            )
-
-            # Handle check dictionaries
-            elif type(self._config) is dict:
-                for step_name in self._config:
-                    if step_name in supported_child_steps:
-                        self._child_steps.append(
-                            supported_child_steps[step_name](
-                                run=self._run,
-                                config=self._config[step_name],
-                                parent=self,
-                                run_logger=self._logger
-                            )
-                        )
+            if self._plan is not None:
+                # Create child steps from compiled plan
+                self._child_steps = [
+                    child_plan.create_step(run=self._run, parent=self, run_logger=self._logger)
+                    for child_plan in self._plan.children
+                ]
+            else:
+                self._child_steps = []
+                for step_class, config, timeout in self.get_child_step_configs():
+                    child_step = step_class(run=self._run, config=config, parent=self, run_logger=self._logger)
+                    child_step._step_timeout = timeout
+                    self._child_steps.append(child_step)
 
         return self._child_steps
 
@@ -153,12 +212,16 @@ class BaseStep:
         raise NotImplementedError
 
     def get_supported_child_steps(self):
-        """Get dictionary of supported child steps"""
-        return {
-            child_step.CONFIG_KEY: child_step
-            for child_step in self.supported_child_steps
-            if child_step.CONFIG_KEY
-        }
+        """Get dictionary of supported child steps, which is cached per step class"""
+        supported_child_steps = self._SUPPORTED_CHILD_STEPS_CACHE.get(type(self))
+        if supported_child_steps is None:
+            supported_child_steps = {
+                child_step.CONFIG_KEY: child_step
+                for child_step in self.supported_child_steps
+                if child_step.CONFIG_KEY
+            }
+            self._SUPPORTED_CHILD_STEPS_CACHE[type(self)] = supported_child_steps
+        return supported_child_steps
 
     def execute_selenium(self, state):
         """Execute step using selenium"""
@@ -168,52 +231,223 @@ class BaseStep:
         """Execute step using requests"""
         raise NotImplementedError
 
+    def execute_playwright(self, state):
+        """Execute step using playwright"""
+        raise NotImplementedError
+
+    @property
+    def _is_abandoned(self) -> bool:
+        """Whether step, or any of its parents, has been abandoned"""
+        step = self
+        while step is not None:
+            if step._abandoned:
+                return True
+            step = step._parent
+        return False
+
+    def _update_status(self, status) -> bool:
+        """Update status, returning whether it was updated, as abandoned steps are not updated"""
+        with BaseStep._STATUS_LOCK:
+            if self._is_abandoned:
+                return False
+            self._status = status
+            return True
+
     def set_status(self, status):
         """Set status"""
+        if not self._update_status(status):
+            return
+
         if status is StepStatus.FAILED:
             self._logger.error("Step failed")
         elif status is StepStatus.SUCCESS:
             self._logger.info(f"Step completed")
         elif status is StepStatus.TIMEOUT:
             self._logger.error("Step has failed due to run timeout reached")
-        self._status = status
+
+    def abandon(self):
+        """
+        Mark step as timed out, whilst it may still be executing in another thread.
+
+        Running child steps are also marked as timed out. The status and end time
+        of the step and its child steps are not updated by the execution after this point,
+        and child steps that have not started are not executed.
+        """
+        end_time = time.monotonic()
+        steps = [self]
+        with BaseStep._STATUS_LOCK:
+            while steps:
+                step = steps.pop()
+                step._abandoned = True
+                if step is self or step._status is StepStatus.RUNNING:
+                    step._status = StepStatus.TIMEOUT
+                    if step._start_time is not None:
+                        step._end_time = end_time
+                # Only use child steps that have been created, as they may be being created by the execution
+                steps.extend(step._child_steps or [])
+        self._logger.error("Step has failed due to run timeout reached")
 
     def _validate_step(self):
         """Check step is valid"""
         raise NotImplementedError
 
-    def validate_steps(self):
-        """Validate step has a valid configuration"""
+    def get_batch_plan(self) -> Optional[dict]:
+        """
+        Return plan for evaluating the step and its child steps in a single browser script.
+
+        Only read-only steps support this, returning None otherwise.
+        """
+        return None
+
+    def record_batch_result(self, result: dict, start_time: float, end_time: float):
+        """
+        Record successful execution of step and child steps, evaluated using a batch plan.
+
+        As steps are evaluated together, each step is recorded with the
+        start/end (monotonic) time of the batch evaluation.
+        """
+        self._start_time = start_time
+        self._end_time = end_time
+        self._status = StepStatus.RUNNING
+        self._logger.info(f"Starting {self.id}")
+        self._logger.info(self.description)
+
+        if not self.CHILD_STEPS_FORM_STEP:
+            self.set_status(StepStatus.SUCCESS)
+
+        for child_step, child_result in zip(self.get_child_steps(), result["children"]):
+            child_step.record_batch_result(child_result, start_time=start_time, end_time=end_time)
+
+        if self.CHILD_STEPS_FORM_STEP:
+            self.set_status(StepStatus.SUCCESS)
+
+    def validate_steps(self, available_variables: Optional[FrozenSet[str]] = frozenset()) -> Optional[FrozenSet[str]]:
+        """
+        Validate step has a valid configuration.
+
+        available_variables are the names of run variables that can be set by preceding steps,
+        or None if any variable may have been set.
+        Returns the variables available to subsequent steps.
+        """
         self._validate_step()
+        self._validate_step_timeout()
+        self._validate_templates(available_variables=available_variables)
+
+        if available_variables is not None:
+            available_variables = (
+                None if self.PROVIDED_VARIABLES is None else
+                available_variables.union(self.PROVIDED_VARIABLES)
+            )
         for child_step in self.get_child_steps():
-            child_step.validate_steps()
+            available_variables = child_step.validate_steps(available_variables=available_variables)
+        return available_variables
+
+    def _validate_templates(self, available_variables: Optional[FrozenSet[str]]):
+        """Ensure templates are valid and only reference variables set by preceding steps"""
+        for template in self._templates:
+            if template.error:
+                raise StepValidationError(f"Invalid variable placeholder in '{template.source}': {template.error}")
+            if available_variables is not None and (missing_variables := template.variables - available_variables):
+                raise StepValidationError(
+                    f"Variables used in '{template.source}' are not set by a preceding step: "
+                    f"{', '.join(sorted(missing_variables))}"
+                )
+
+    def _validate_step_timeout(self):
+        """Ensure time budget of step is valid"""
+        if self._step_timeout is not None and (type(self._step_timeout) not in [int, float] or self._step_timeout <= 0):
+            raise StepValidationError(
+                f"Step '{self.STEP_TIMEOUT_KEY}' must be a positive number of seconds: {self._step_timeout}"
+            )
+
+    @property
+    def deadline(self) -> Optional[Deadline]:
+        """Return deadline of step, inherited from parent steps or the run, if the step has no time budget"""
+        if self._deadline is not None:
+            return self._deadline
+        if self._parent is not None and (parent_deadline := self._parent.deadline) is not None:
+            return parent_deadline
+        return self._run.deadline if self._run is not None else None
+
+    def get_remaining_time(self) -> float:
+        """Return remaining time (seconds) of step"""
+        return self.deadline.remaining()
 
     def has_timeout_been_reached(self):
         """Return whether timeout has been reached"""
-        return self._run.get_remaining_time().total_seconds() <= 0
-
-    def inject_variables_into_string(self, source):
-        """Inject run variables into source string/list"""
-        if type(source) is str:
-            try:
-                source = source.format(**self._run.variables)
-            except KeyError:
-                self._logger.warn(f"Could not inject variables on string: {source} due to missing variable")
-        elif type(source) is list:
-            source = [
-                self.inject_variables_into_string(source_itx)
-                for source_itx in source
-            ]
-        return source
+        return self.deadline.has_expired()
+
+    def limit_timeout_to_run(self, timeout: Optional[float]) -> float:
+        """Return timeout, limited to the remaining time of the step, or the remaining time if timeout is None"""
+        return self.deadline.clamp(timeout)
+
+    def get_requests_timeout(self, timeout: Optional[float]) -> float:
+        """Return timeout (seconds) for requests calls, limited to the remaining time of the run"""
+        # A timeout of 0 is rejected by requests
+        return max(self.limit_timeout_to_run(timeout), self.MIN_REQUESTS_TIMEOUT)
+
+    def get_playwright_timeout(self, timeout: float) -> float:
+        """Return timeout in milliseconds for playwright calls, limited to the remaining time of the run"""
+        # A timeout of 0 disables the timeout in playwright
+        return max(self.limit_timeout_to_run(timeout) * 1000, 1)
+
+    def compile_template(self, source: Any) -> CompiledTemplate:
+        """Compile template from step config, which is validated with the step"""
+        template = CompiledTemplate(source)
+        self._templates.append(template)
+        return template
+
+    def render_template(self, template: CompiledTemplate) -> Any:
+        """Inject run variables into template"""
+        try:
+            return template.render(self._run.variables, version=self._run.variables_version)
+        except KeyError:
+            self._logger.warn(f"Could not inject variables on string: {template.source} due to missing variable")
+            return template.source
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Return time taken (seconds) to execute step, including child steps, if the step has been executed"""
+        if self._start_time is None or self._end_time is None:
+            return None
+        return round(self._end_time - self._start_time, 6)
+
+    @property
+    def start_offset(self) -> Optional[float]:
+        """Return time (seconds) between the start of the run and the start of the step, if the step has been executed"""
+        root_step = self
+        while root_step._parent is not None:
+            root_step = root_step._parent
+        if self._start_time is None or root_step._start_time is None:
+            return None
+        return round(self._start_time - root_step._start_time, 6)
+
+    def record_retry(self):
+        """Record retry of step"""
+        self._retry_count += 1
 
     def execute(self, execution_method, state: StepState):
+        """Execute the current step and then execute each of the child steps, recording the time taken"""
+        self._start_time = time.monotonic()
+        try:
+            return self._execute_step(execution_method=execution_method, state=state)
+        finally:
+            if not self._is_abandoned:
+                self._end_time = time.monotonic()
+
+    def _execute_step(self, execution_method, state: StepState):
         """Execute the current step and then execute each of the child steps"""
+        # Start time budget of step, limited to the deadline of the parent/run
+        if self._step_timeout is not None:
+            self._deadline = self.deadline.child(self._step_timeout)
+
         # Check for timeout in check
         if self.has_timeout_been_reached():
             self.set_status(StepStatus.TIMEOUT)
             return self.status
 
-        self._status = StepStatus.RUNNING
+        if not self._update_status(StepStatus.RUNNING):
+            return self.status
 
         self._logger.info(f"Starting {self.id}")
         self._logger.info(self.description)
@@ -230,6 +464,18 @@ class BaseStep:
         if not self.CHILD_STEPS_FORM_STEP:
             self.set_status(StepStatus.SUCCESS)
 
+        child_status = self._execute_child_steps(execution_method=execution_method, state=state)
+
+        if self.CHILD_STEPS_FORM_STEP:
+            # Set current step to failed if child step has failed.
+            self.set_status(child_status)
+
+        # Return own status if child status is success or there it none,
+        # otherwise, return child status as the outcome status
+        return (self.status if (child_status is None or child_status is StepStatus.SUCCESS) else child_status)
+
+    def _execute_child_steps(self, execution_method, state: StepState) -> Optional[StepStatus]:
+        """Execute each of the child steps in order, returning status of last child step, if any"""
         child_status = None
 
         for step in self.get_child_steps():
@@ -245,10 +491,4 @@ class BaseStep:
             if child_status is not StepStatus.SUCCESS:
                 break
 
-        if self.CHILD_STEPS_FORM_STEP:
-            # Set current step to failed if child step has failed.
-            self.set_status(child_status)
-
-        # Return own status if child status is success or there it none,
-        # otherwise, return child status as the outcome status
-        return (self.status if (child_status is None or child_status is StepStatus.SUCCESS) else child_status)
+        return child_status
@@ -0,0 +1,68 @@
+
+from jmon.client_type import ClientType
+from jmon.errors import StepValidationError
+from jmon.step_state import RequestsStepState
+from jmon.steps.base_step import BaseStep
+from jmon.steps.check_step import CheckStep
+from jmon.steps.dns_step import DNSStep
+from jmon.steps.goto_step import GotoStep
+
+
+class BranchStep(BaseStep):
+    """
+    Directive for grouping steps within a parallel directive.
+
+    The steps of a branch are performed in order, whilst branches
+    of the parallel directive are performed concurrently, e.g.
+    ```
+     - parallel:
+       - branch:
+         - goto: https://example.com/api/users
+         - check:
+             response: 200
+       - branch:
+         - dns: example.com
+         - check:
+             records:
+               contains: 127.0.0.1
+    ```
+    """
+
+    CONFIG_KEY = "branch"
+    CHILD_STEPS_FORM_STEP = True
+
+    @property
+    def supported_clients(self):
+        """Return list of supported clients"""
+        return [
+            ClientType.REQUESTS
+        ]
+
+    @property
+    def supported_child_steps(self):
+        """Return list of child support step classes"""
+        return [
+            GotoStep,
+            DNSStep,
+            CheckStep,
+        ]
+
+    def _validate_step(self):
+        """Check step is valid"""
+        if type(self._config) is not list or len(self.get_child_steps()) == 0:
+            raise StepValidationError("Branch must contain a list of at least one step")
+
+    @property
+    def id(self):
+        """ID string for step"""
+        return f"Branch"
+
+    @property
+    def description(self):
+        """Friendly description of step"""
+        return "Running branch steps"
+
+    def execute_requests(self, state: RequestsStepState):
+        """Do nothing"""
+        # Do nothing, let child steps perform requests
+        pass
@@ -1,6 +1,5 @@
 
 import requests
-import selenium.common.exceptions
 from jmon.client_type import ClientType
 from jmon.errors import StepValidationError
 from jmon.plugins import CallbackPluginLoader
@@ -32,6 +31,8 @@ class CallPluginStep(BaseStep):
     """
 
     CONFIG_KEY = "call_plugin"
+    # Plugins may set any variable
+    PROVIDED_VARIABLES = None
 
     @property
     def supported_clients(self):
@@ -1,8 +1,8 @@
 
 from jmon.client_type import ClientType
 from jmon.errors import StepValidationError
-from jmon.step_state import RequestsStepState, SeleniumStepState
-from jmon.steps.base_step import BaseStep
+from jmon.step_state import PlaywrightStepState, RequestsStepState, SeleniumStepState
+from jmon.steps.base_step import BaseStep, ChildStepConfig
 import jmon.steps.checks
 from jmon.logger import logger
 
@@ -40,7 +40,8 @@ class CheckStep(BaseStep):
         return [
             ClientType.BROWSER_FIREFOX,
             ClientType.BROWSER_CHROME,
-            ClientType.REQUESTS
+            ClientType.REQUESTS,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     @property
@@ -63,9 +64,9 @@ class CheckStep(BaseStep):
         if len(self.get_child_steps()) == 0:
             raise StepValidationError("At least one attribute must be provided for a check step")
 
-    def get_child_steps(self):
+    def get_child_step_configs(self):
         """
-        Get child steps
+        Return class and config of each child step
 
         Support checks such as:
         - check:
@@ -73,22 +74,19 @@ class CheckStep(BaseStep):
             response_code: 200
             url: https://www.example.com
         """
-        if self._child_steps is None:
-            self._child_steps = []
-
-            supported_actions = self.get_supported_child_steps()
-
-            for action_name in self._config:
-                if action_name in supported_actions:
-                    self._child_steps.append(
-                        supported_actions[action_name](
-                            run=self._run,
-                            config=self._config[action_name],
-                            parent=self,
-                            run_logger=self._logger
-                        )
-                    )
-        return self._child_steps
+        supported_actions = self.get_supported_child_steps()
+        return [
+            ChildStepConfig(supported_actions[action_name], self._config[action_name])
+            for action_name in self._config
+            if action_name in supported_actions
+        ]
+
+    def get_batch_plan(self):
+        """Return batch plan, if all checks support it"""
+        child_plans = [child_step.get_batch_plan() for child_step in self.get_child_steps()]
+        if not child_plans or None in child_plans:
+            return None
+        return {"type": "check", "children": child_plans}
 
     def execute_requests(self, state: RequestsStepState):
         """Execute step"""
@@ -99,3 +97,8 @@ class CheckStep(BaseStep):
         """Execute step"""
         # Do nothing, let sub-checks perform checks
         pass
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Execute step"""
+        # Do nothing, let sub-checks perform checks
+        pass
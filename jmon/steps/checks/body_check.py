@@ -6,6 +6,7 @@ from jsonpath import JSONPath
 
 from jmon.client_type import ClientType
 from jmon.errors import StepValidationError
+from jmon.response_body import ResponseBody, ResponseBodyTooLargeError
 from jmon.step_state import RequestsStepState, SeleniumStepState
 from jmon.step_status import StepStatus
 from jmon.steps.checks.base_check import BaseCheck
@@ -39,6 +40,9 @@ class BodyCheck(BaseCheck):
           equals: 'Some text'
     ```
 
+    For streamed responses, `contains` only reads the body until the value is found,
+    whereas `equals` requires the entire body, so fails if the body exceeds the max body size.
+
     Variables provided by callable plugins can be used in the type value, e.g.
     ```
     - check:
@@ -49,6 +53,14 @@ class BodyCheck(BaseCheck):
 
     CONFIG_KEY = "body"
 
+    def __init__(self, run, config, parent, run_logger=None):
+        """Compile template of match value"""
+        super().__init__(run, config, parent, run_logger)
+        self._match_template = None
+        if type(self._config) is dict:
+            _, match_value = self._extract_selector_match_type()
+            self._match_template = self.compile_template(match_value)
+
     @property
     def supported_clients(self):
         """Return list of supported clients"""
@@ -96,21 +108,24 @@ class BodyCheck(BaseCheck):
                 "body check must contain a comparator. Either 'contains' or 'equals'"
             )
 
-    def _result_matches(self, body: str):
+    def _result_matches(self, body: ResponseBody):
         """Determine if result is valid"""
-        match_type, match_value = self._extract_selector_match_type()
+        match_type, _ = self._extract_selector_match_type()
 
-        parser_message = f"\nFull body: {body}"
+        match_value = self.render_template(self._match_template)
 
-        # If compare value is a string, inject variables
-        # @TODO How can we handle injecting variables to lists/dicts
-        match_value = self.inject_variables_into_string(match_value)
+        try:
+            if match_type is BodyCheckMatchType.EQUALS and match_value != body.text():
+                message = f"Body does not match expected '{match_value}'"
+            elif match_type is BodyCheckMatchType.CONTAINS and not body.contains(str(match_value)):
+                message = f"Could not find '{match_value}' in body"
+            else:
+                return True, None
+        except ResponseBodyTooLargeError as exc:
+            message = str(exc)
 
-        if match_type is BodyCheckMatchType.EQUALS and match_value != body:
-            return False, f"Body does not match expected '{match_value}'{parser_message}"
-        if match_type is BodyCheckMatchType.CONTAINS and match_value not in body:
-            return False, f"Could not find '{match_value}' in body{parser_message}"
-        return True, None
+        # Only read the body excerpt on failure
+        return False, f"{message}\nFull body: {body.excerpt()}"
 
     # @retry(count=5, interval=0.5)
     # def _check_selenium(self, state: SeleniumStepState):
@@ -134,7 +149,7 @@ class BodyCheck(BaseCheck):
         if self._check_valid_requests_response(state.response):
             return
 
-        result, message = self._result_matches(state.response.content)
+        result, message = self._result_matches(state.get_response_body())
         if not result:
             self.set_status(StepStatus.FAILED)
             self._logger.error(f"body match failed: {message}")
@@ -67,6 +67,14 @@ class DnsRecordsCheck(BaseCheck):
 
     CONFIG_KEY = "records"
 
+    def __init__(self, run, config, parent, run_logger=None):
+        """Compile template of match value"""
+        super().__init__(run, config, parent, run_logger)
+        self._match_template = None
+        if type(self._config) is dict:
+            _, match_value = self._extract_selector_match_type()
+            self._match_template = self.compile_template(match_value)
+
     @property
     def supported_clients(self):
         """Return list of supported clients"""
@@ -143,9 +151,9 @@ class DnsRecordsCheck(BaseCheck):
         ]
 
         # If compare value is a string, inject variables
-        match_value = self.inject_variables_into_string(match_value)
+        match_value = self.render_template(self._match_template)
 
-        if match_type is DnsRecordsCheckMatchType.EQUALS and match_value.sort() != actual_value.sort():
+        if match_type is DnsRecordsCheckMatchType.EQUALS and sorted(match_value) != sorted(actual_value):
             return False, f"Value '{', '.join(actual_value)}' does not match expected '{','.join(match_value)}'"
         if match_type is DnsRecordsCheckMatchType.CONTAINS:
             not_found = [
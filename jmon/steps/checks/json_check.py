@@ -6,6 +6,7 @@ from jsonpath import JSONPath
 
 from jmon.client_type import ClientType
 from jmon.errors import StepValidationError
+from jmon.response_body import ResponseBodyTooLargeError, truncate_for_log
 from jmon.step_state import RequestsStepState
 from jmon.step_status import StepStatus
 from jmon.steps.checks.base_check import BaseCheck
@@ -54,6 +55,25 @@ class JsonCheck(BaseCheck):
 
     CONFIG_KEY = "json"
 
+    def __init__(self, run, config, parent, run_logger=None):
+        """Compile selector"""
+        super().__init__(run, config, parent, run_logger)
+        self._parsed_selector = None
+        self._selector_error = None
+        if type(self._config) is dict and (selector := self._config.get("selector", None)):
+            try:
+                self._parsed_selector = JSONPath(selector)
+            except Exception as exc:
+                # Handled by validation
+                self._selector_error = exc
+
+        self._match_template = None
+        if type(self._config) is dict:
+            match_value = self._config.get(JsonCheckMatchType.EQUALS.value, UNSET)
+            if match_value is UNSET:
+                match_value = self._config.get(JsonCheckMatchType.CONTAINS.value, None)
+            self._match_template = self.compile_template(match_value)
+
     @property
     def supported_clients(self):
         """Return list of supported clients"""
@@ -79,13 +99,9 @@ class JsonCheck(BaseCheck):
 
     def _extract_selector_match_type(self):
         """Return extractor and match type"""
-
-        parsed_selector = None
-        if selector := self._config.get("selector", None):
-            try:
-                parsed_selector = JSONPath(selector)
-            except:
-                raise StepValidationError(f"Invalid JSON selector selector: {selector}")
+        if self._selector_error is not None:
+            raise StepValidationError(f"Invalid JSON selector selector: {self._config.get('selector')}")
+        parsed_selector = self._parsed_selector
 
         equals_match = self._config.get(JsonCheckMatchType.EQUALS.value, UNSET)
         if equals_match != UNSET:
@@ -114,33 +130,36 @@ class JsonCheck(BaseCheck):
 
     def _result_matches(self, state: RequestsStepState):
         """Determine if result is valid"""
-        parser, match_type, match_value = self._extract_selector_match_type()
+        parser, match_type, _ = self._extract_selector_match_type()
 
         try:
-            actual_value = state.response.json()
+            response_value = state.get_response_json()
+        except ResponseBodyTooLargeError as exc:
+            return False, str(exc)
         except requests.exceptions.JSONDecodeError:
-            return False, f"Could not decode json from response body.\nFull response: {state.response.content}"
+            return False, f"Could not decode json from response body.\nFull response: {state.get_response_body().excerpt()}"
 
+        actual_value = response_value
         parser_message = ""
         if parser:
-            actual_value = parser.parse(actual_value)
+            actual_value = parser.parse(response_value)
             parser_message = f", from JSON selector '{self._config.get('selector')}'"
 
             # Handle jsonpath return an array with single element when matching a single value
             if type(actual_value) is list and len(actual_value) == 1:
                 actual_value = actual_value[0]
 
-        parser_message += f"\nFull Response: {state.response.json()}"
-
-        # If compare value is a string, inject variables
-        # @TODO How can we handle injecting variables to lists/dicts
-        match_value = self.inject_variables_into_string(match_value)
+        match_value = self.render_template(self._match_template)
 
         if match_type is JsonCheckMatchType.EQUALS and match_value != actual_value:
-            return False, f"Value '{actual_value}' does not match expected '{match_value}'{parser_message}"
-        if match_type is JsonCheckMatchType.CONTAINS and match_value not in actual_value:
-            return False, f"Could not find '{match_value}' in actual value '{actual_value}'{parser_message}"
-        return True, None
+            message = f"Value '{truncate_for_log(str(actual_value))}' does not match expected '{match_value}'"
+        elif match_type is JsonCheckMatchType.CONTAINS and match_value not in actual_value:
+            message = f"Could not find '{match_value}' in actual value '{truncate_for_log(str(actual_value))}'"
+        else:
+            return True, None
+
+        # Only format the full response on failure, as it can be large
+        return False, f"{message}{parser_message}\nFull Response: {truncate_for_log(str(response_value))}"
 
     def execute_requests(self, state: RequestsStepState):
         """Check response code"""
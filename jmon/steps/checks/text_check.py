@@ -1,12 +1,14 @@
 
 
 from jmon.client_type import ClientType
+from jmon.config import Config
 from jmon.errors import StepValidationError
-from jmon.step_state import SeleniumStepState
+from jmon.step_state import PlaywrightStepState, SeleniumStepState
 from jmon.step_status import StepStatus
 from jmon.steps.checks.base_check import BaseCheck
 from jmon.logger import logger
-from jmon.utils import RetryStatus, retry
+from jmon.utils import poll_until
+from jmon.wait_engine import WaitCondition, normalise_text, wait_for_condition
 
 
 class TextCheck(BaseCheck):
@@ -38,12 +40,18 @@ class TextCheck(BaseCheck):
 
     CONFIG_KEY = "text"
 
+    def __init__(self, run, config, parent, run_logger=None):
+        """Compile template"""
+        super().__init__(run, config, parent, run_logger)
+        self._text_template = self.compile_template(self._config)
+
     @property
     def supported_clients(self):
         """Return list of supported clients"""
         return [
             ClientType.BROWSER_FIREFOX,
-            ClientType.BROWSER_CHROME
+            ClientType.BROWSER_CHROME,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     @property
@@ -59,26 +67,47 @@ class TextCheck(BaseCheck):
     @property
     def check_text(self):
         """Return text to check"""
-        return self.inject_variables_into_string(self._config)
+        return self.render_template(self._text_template)
 
     def _validate_step(self):
         """Check step is valid"""
         if type(self._config) is not str or not self._config:
             raise StepValidationError("Expected text must be a valid string")
 
-    @retry(count=5, interval=0.5)
-    def _check_text(self, element, expected_title):
-        """Check text"""
-        actual_text = element.text
-        if actual_text != expected_title:
-            self._logger.error(f'Element text does not match excepted text. Expected "{expected_title}" and got: "{actual_text}"')
-            return None
-        return True
+    def get_batch_plan(self):
+        """Return batch plan for check"""
+        return {"type": "text", "expected": self.check_text, "children": []}
 
     def execute_selenium(self, state: SeleniumStepState):
-        """Check element text"""
-        res = self._check_text(state.element, self.check_text, only_if=lambda: not self.has_timeout_been_reached())
-        if res is RetryStatus.ONLY_IF_CONDITION_FAILURE:
-            self.set_status(StepStatus.TIMEOUT)
-        if res is None:
-            self.set_status(StepStatus.FAILED)
+        """Check element text, waiting for it to match"""
+        expected_text = self.check_text
+        result = wait_for_condition(
+            state.selenium_instance, WaitCondition.TEXT,
+            timeout=self.limit_timeout_to_run(Config.get().ASSERTION_TIMEOUT),
+            element=state.element, expected=expected_text
+        )
+        if not result.satisfied:
+            self._logger.error(f'Element text does not match excepted text. Expected "{expected_text}" and got: "{result.actual}"')
+            self.set_status(StepStatus.TIMEOUT if self.has_timeout_been_reached() else StepStatus.FAILED)
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Check element text, polling until it matches or the timeout is reached"""
+        from playwright.sync_api import Error as PlaywrightError
+
+        expected_text = self.check_text
+        locator = state.page.locator("body") if state.element is None else state.element
+        deadline = self.deadline.child(Config.get().ASSERTION_TIMEOUT)
+        actual_text = None
+
+        def check_text():
+            """Compare normalised inner text of element, returning None if it does not match"""
+            nonlocal actual_text
+            try:
+                actual_text = normalise_text(locator.inner_text(timeout=max(deadline.remaining() * 1000, 1)))
+            except PlaywrightError:
+                return None
+            return True if actual_text == expected_text else None
+
+        if poll_until(check_text, timeout=deadline.remaining(), interval=Config.get().FIND_ELEMENT_POLL_INTERVAL) is None:
+            self._logger.error(f'Element text does not match excepted text. Expected "{expected_text}" and got: "{actual_text}"')
+            self.set_status(StepStatus.TIMEOUT if self.has_timeout_been_reached() else StepStatus.FAILED)
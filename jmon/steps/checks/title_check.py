@@ -1,12 +1,13 @@
 
 
 from jmon.client_type import ClientType
+from jmon.config import Config
 from jmon.errors import StepValidationError
-from jmon.step_state import SeleniumStepState
+from jmon.step_state import PlaywrightStepState, SeleniumStepState
 from jmon.step_status import StepStatus
 from jmon.steps.checks.base_check import BaseCheck
 from jmon.logger import logger
-from jmon.utils import RetryStatus, retry
+from jmon.wait_engine import WaitCondition, wait_for_condition
 
 
 class TitleCheck(BaseCheck):
@@ -29,12 +30,18 @@ class TitleCheck(BaseCheck):
 
     CONFIG_KEY = "title"
 
+    def __init__(self, run, config, parent, run_logger=None):
+        """Compile template"""
+        super().__init__(run, config, parent, run_logger)
+        self._title_template = self.compile_template(self._config)
+
     @property
     def supported_clients(self):
         """Return list of supported clients"""
         return [
             ClientType.BROWSER_FIREFOX,
-            ClientType.BROWSER_CHROME
+            ClientType.BROWSER_CHROME,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     @property
@@ -50,26 +57,39 @@ class TitleCheck(BaseCheck):
     @property
     def check_title(self):
         """Return title value to check"""
-        return self.inject_variables_into_string(self._config)
+        return self.render_template(self._title_template)
 
     def _validate_step(self):
         """Check step is valid"""
         if type(self._config) is not str or not self._config:
             raise StepValidationError("Expected title must be a valid string")
 
-    @retry(count=5, interval=0.5)
-    def _check_title(self, selenium_instance, expected_title):
-        """Check title"""
-        actual_title = selenium_instance.title
-        if actual_title != expected_title:
-            self._logger.error(f'Title does not match excepted title. Expected "{expected_title}" and got: "{actual_title}"')
-            return None
-        return True
+    def get_batch_plan(self):
+        """Return batch plan for check"""
+        return {"type": "title", "expected": self.check_title, "children": []}
 
     def execute_selenium(self, state: SeleniumStepState):
-        """Check page title"""
-        res = self._check_title(state.selenium_instance, self.check_title, only_if=lambda: not self.has_timeout_been_reached())
-        if res is RetryStatus.ONLY_IF_CONDITION_FAILURE:
-            self.set_status(StepStatus.TIMEOUT)
-        elif res is None:
-            self.set_status(StepStatus.FAILED)
+        """Check page title, waiting for it to match"""
+        expected_title = self.check_title
+        result = wait_for_condition(
+            state.selenium_instance, WaitCondition.TITLE,
+            timeout=self.limit_timeout_to_run(Config.get().ASSERTION_TIMEOUT),
+            expected=expected_title
+        )
+        if not result.satisfied:
+            self._logger.error(f'Title does not match excepted title. Expected "{expected_title}" and got: "{result.actual}"')
+            self.set_status(StepStatus.TIMEOUT if self.has_timeout_been_reached() else StepStatus.FAILED)
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Check page title, waiting for it to match"""
+        from playwright.sync_api import expect
+
+        expected_title = self.check_title
+        try:
+            expect(state.page).to_have_title(
+                expected_title,
+                timeout=self.get_playwright_timeout(Config.get().ASSERTION_TIMEOUT)
+            )
+        except AssertionError:
+            self._logger.error(f'Title does not match excepted title. Expected "{expected_title}" and got: "{state.page.title()}"')
+            self.set_status(StepStatus.TIMEOUT if self.has_timeout_been_reached() else StepStatus.FAILED)
@@ -1,12 +1,13 @@
 
 import requests
 from jmon.client_type import ClientType
+from jmon.config import Config
 from jmon.errors import StepValidationError
-from jmon.step_state import RequestsStepState, SeleniumStepState
+from jmon.step_state import PlaywrightStepState, RequestsStepState, SeleniumStepState
 from jmon.step_status import StepStatus
 from jmon.steps.checks.base_check import BaseCheck
 from jmon.logger import logger
-from jmon.utils import RetryStatus, retry
+from jmon.wait_engine import WaitCondition, wait_for_condition
 
 
 class UrlCheck(BaseCheck):
@@ -29,13 +30,19 @@ class UrlCheck(BaseCheck):
 
     CONFIG_KEY = "url"
 
+    def __init__(self, run, config, parent, run_logger=None):
+        """Compile template"""
+        super().__init__(run, config, parent, run_logger)
+        self._url_template = self.compile_template(self._config)
+
     @property
     def supported_clients(self):
         """Return list of supported clients"""
         return [
             ClientType.REQUESTS,
             ClientType.BROWSER_FIREFOX,
-            ClientType.BROWSER_CHROME
+            ClientType.BROWSER_CHROME,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     @property
@@ -51,22 +58,13 @@ class UrlCheck(BaseCheck):
     @property
     def check_url(self):
         """Return URL to check"""
-        return self.inject_variables_into_string(self._config)
+        return self.render_template(self._url_template)
 
     def _validate_step(self):
         """Check step is valid"""
         if type(self._config) is not str or not self._config:
             raise StepValidationError("Expected URL must be a valid string")
 
-    @retry(count=5, interval=0.5)
-    def _check_url(self, selenium_instance, url):
-        """Check URL"""
-        actual_url = selenium_instance.current_url
-        if actual_url != url:
-            self._logger.error(f'URL does not match excepted url. Expected "{url}" and got: {actual_url}')
-            return None
-        return True
-
     def execute_requests(self, state: RequestsStepState):
         """Check URL"""
         if self._check_valid_requests_response(state.response):
@@ -75,10 +73,32 @@ class UrlCheck(BaseCheck):
             self._logger.error(f'URL does not match excepted url. Expected "{self.check_url}" and got: {state.response.url}')
             self.set_status(StepStatus.FAILED)
 
+    def get_batch_plan(self):
+        """Return batch plan for check"""
+        return {"type": "url", "expected": self.check_url, "children": []}
+
     def execute_selenium(self, state: SeleniumStepState):
-        """Check page URL"""
-        res = self._check_url(state.selenium_instance, self.check_url, only_if=lambda: not self.has_timeout_been_reached())
-        if res is RetryStatus.ONLY_IF_CONDITION_FAILURE:
-            self.set_status(StepStatus.TIMEOUT)
-        elif res is None:
-            self.set_status(StepStatus.FAILED)
+        """Check page URL, waiting for it to match"""
+        expected_url = self.check_url
+        result = wait_for_condition(
+            state.selenium_instance, WaitCondition.URL,
+            timeout=self.limit_timeout_to_run(Config.get().ASSERTION_TIMEOUT),
+            expected=expected_url
+        )
+        if not result.satisfied:
+            self._logger.error(f'URL does not match excepted url. Expected "{expected_url}" and got: {result.actual}')
+            self.set_status(StepStatus.TIMEOUT if self.has_timeout_been_reached() else StepStatus.FAILED)
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Check page URL, waiting for it to match"""
+        from playwright.sync_api import expect
+
+        expected_url = self.check_url
+        try:
+            expect(state.page).to_have_url(
+                expected_url,
+                timeout=self.get_playwright_timeout(Config.get().ASSERTION_TIMEOUT)
+            )
+        except AssertionError:
+            self._logger.error(f'URL does not match excepted url. Expected "{expected_url}" and got: {state.page.url}')
+            self.set_status(StepStatus.TIMEOUT if self.has_timeout_been_reached() else StepStatus.FAILED)
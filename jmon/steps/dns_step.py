@@ -6,6 +6,7 @@ import dns.rdatatype
 import dns.resolver
 
 from jmon.client_type import ClientType
+from jmon.dns_resolver import get_resolver, query_name_servers
 from jmon.errors import StepValidationError
 from jmon.step_state import RequestsStepState, SeleniumStepState
 from jmon.step_status import StepStatus
@@ -40,6 +41,21 @@ class DNSStep(BaseStep):
         timeout: 5
 
     ```
+
+    All name servers can be queried concurrently, recording the latency and answer
+    of each name server. The step succeeds once `quorum` name servers (default 1) have
+    returned an answer, and fails as soon as the quorum can no longer be reached.
+    `quorum` can also be set to `all` and can only be used with `concurrent: true`.
+    Subsequent checks are performed against the first answer received.
+    ```
+    - dns:
+        domain: www.bbc.co.uk
+        name_servers:
+         - 8.8.8.8
+         - 1.1.1.1
+        concurrent: true
+        quorum: all
+    ```
     """
 
     CONFIG_KEY = "dns"
@@ -50,6 +66,8 @@ class DNSStep(BaseStep):
         "type": "a",
         "protocol": "udp",
         "port": 53,
+        "concurrent": False,
+        "quorum": 1,
     }
 
     @property
@@ -70,6 +88,10 @@ class DNSStep(BaseStep):
         self._port = self.DEFAULTS["port"]
         self._protocol = self.DEFAULTS["protocol"]
         self._timeout = self.DEFAULTS["timeout"]
+        self._concurrent = self.DEFAULTS["concurrent"]
+        self._quorum = self.DEFAULTS["quorum"]
+        # Results of each name server, when querying concurrently
+        self.name_server_results = []
 
         if type(self._config) is str:
             self._domain = self._config
@@ -82,6 +104,8 @@ class DNSStep(BaseStep):
             self._port = self._config.get("port", self.DEFAULTS["port"])
             self._lifetime = self._config.get("lifetime", self.DEFAULTS["lifetime"])
             self._timeout = self._config.get("timeout", self.DEFAULTS["timeout"])
+            self._concurrent = self._config.get("concurrent", self.DEFAULTS["concurrent"])
+            self._quorum = self._config.get("quorum", self.DEFAULTS["quorum"])
 
         # Handle user passing a single server, rather than a list
         if type(self._servers) is str:
@@ -102,6 +126,18 @@ class DNSStep(BaseStep):
         except (dns.rdatatype.UnknownRdatatype, ValueError):
             raise StepValidationError("DNS query type must be a valid DNS query type, e.g. A, CNAME")
 
+        if type(self._concurrent) is not bool:
+            raise StepValidationError("DNS concurrent must be true or false")
+
+        if type(self._config) is dict and "quorum" in self._config and self._concurrent is not True:
+            raise StepValidationError("DNS quorum can only be used when concurrent is true")
+
+        if self._quorum != "all":
+            if type(self._quorum) is not int or self._quorum < 1:
+                raise StepValidationError("DNS quorum must be a number greater than 0, or 'all'")
+            if self._servers and self._quorum > len(self._servers):
+                raise StepValidationError("DNS quorum cannot be greater than the number of name servers")
+
 
     @property
     def supported_child_steps(self):
@@ -118,24 +154,63 @@ class DNSStep(BaseStep):
         """Friendly description of step"""
         return f"Perform DNS query: {self._config}"
 
+    def as_dict(self):
+        """Return information about step, including results of each name server queried concurrently"""
+        step_data = super().as_dict()
+        step_data["name_server_results"] = [result.as_dict() for result in self.name_server_results]
+        return step_data
+
+    @property
+    def _name_servers_key(self):
+        """Return name servers as hashable value, for obtaining cached resolver"""
+        return tuple(self._servers) if self._servers else None
+
     def execute_requests(self, state: RequestsStepState):
         """Execute step for requests"""
-        resolver = dns.resolver.Resolver()
-        if self._servers:
-            resolver.nameservers = self._servers
-        resolver.port = self._port
-        resolver.timeout = self._timeout
         kwargs = {
             "qname": self._domain,
             "rdtype": dns.rdatatype.from_text(self._type),
             "tcp": self._protocol.lower() == "tcp",
             "raise_on_no_answer": True,
-            "lifetime": self._lifetime,
+            # Limit total time of query to the remaining time
+            "lifetime": self.limit_timeout_to_run(self._lifetime),
+            # Match behaviour of the deprecated query method
+            "search": True,
         }
 
-        # Get requests call method, based on provided method
+        if self._concurrent:
+            self._execute_concurrently(state=state, query_kwargs=kwargs)
+            return
+
+        resolver = get_resolver(self._name_servers_key, self._port, self._timeout)
         try:
-            state.dns_response = resolver.query(**kwargs)
+            state.dns_response = resolver.resolve(**kwargs)
         except Exception as exc:
             self.set_status(StepStatus.FAILED)
             self._logger.error(str(exc).split("\n")[0])
+
+    def _execute_concurrently(self, state: RequestsStepState, query_kwargs: dict):
+        """Query all name servers concurrently"""
+        # Use name servers of the system resolver, if none have been provided
+        name_servers = self._servers or get_resolver(None, self._port, self._timeout).nameservers
+        quorum = len(name_servers) if self._quorum == "all" else self._quorum
+
+        results, quorum_reached = query_name_servers(
+            name_servers=name_servers, port=self._port, timeout=self._timeout,
+            quorum=quorum, query_kwargs=query_kwargs
+        )
+        self.name_server_results = results
+
+        for result in results:
+            if result.answer is not None:
+                answer_text = ", ".join([record.to_text() for record in result.answer.rrset])
+                self._logger.info(f"Name server {result.name_server} responded in {result.latency * 1000:.0f}ms: {answer_text}")
+            else:
+                self._logger.info(f"Name server {result.name_server} failed after {result.latency * 1000:.0f}ms: {result.error}")
+
+        state.dns_response = next((result.answer for result in results if result.answer is not None), None)
+
+        if not quorum_reached:
+            self.set_status(StepStatus.FAILED)
+            answer_count = len([result for result in results if result.answer is not None])
+            self._logger.error(f"Only {answer_count} of {quorum} required name servers returned an answer")
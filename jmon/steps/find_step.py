@@ -1,16 +1,37 @@
 
-import selenium.common.exceptions
-from selenium.webdriver.common.by import By
+import time
+
 from jmon.client_type import ClientType
+from jmon.config import Config
 from jmon.errors import StepValidationError
-from jmon.step_state import SeleniumStepState
+from jmon.step_state import PlaywrightStepState, SeleniumStepState
 from jmon.step_status import StepStatus
 
 from jmon.steps.action_step import ActionStep
 from jmon.steps.base_step import BaseStep
 from jmon.logger import logger
+from jmon.step_batch import evaluate_plan
 from jmon.steps.check_step import CheckStep
-from jmon.utils import RetryStatus, retry
+from jmon.utils import poll_until
+
+
+def _css_escape(value):
+    """Escape CSS identifier, matching CSS.escape used by the batched selenium script"""
+    escaped = ""
+    for index, char in enumerate(value):
+        code_point = ord(char)
+        if code_point == 0:
+            escaped += "\ufffd"
+        elif (0x1 <= code_point <= 0x1f or code_point == 0x7f or
+                ("0" <= char <= "9" and (index == 0 or (index == 1 and value[0] == "-")))):
+            escaped += f"\\{code_point:x} "
+        elif value == "-":
+            escaped += "\\-"
+        elif code_point >= 0x80 or char in "-_" or (char.isascii() and char.isalnum()):
+            escaped += char
+        else:
+            escaped += f"\\{char}"
+    return escaped
 
 
 class FindStep(BaseStep):
@@ -26,6 +47,8 @@ class FindStep(BaseStep):
 
     If an element cannot be found using the given parameters, the step will fail. No `check` action is required for validating this.
 
+    Elements that are not yet present are waited for, up to `FIND_ELEMENT_TIMEOUT` seconds (limited by the remaining check timeout).
+
     This can be placed in the root of the check, e.g.
     ```
      - goto: https://example.com
@@ -58,6 +81,13 @@ class FindStep(BaseStep):
     """
 
     CONFIG_KEY = "find"
+
+    # Webdriver locator strategies, matching selenium's By
+    BY_ID = "id"
+    BY_XPATH = "xpath"
+    BY_CLASS_NAME = "class name"
+    BY_TAG_NAME = "tag name"
+
     _SUPPORTED_ATTRIBUTES = [
         "id",
         "class",
@@ -66,12 +96,24 @@ class FindStep(BaseStep):
         "tag"
     ]
 
+    def __init__(self, run, config, parent, run_logger=None):
+        """Compile templates of find attributes"""
+        super().__init__(run, config, parent, run_logger)
+        self._find_templates = {}
+        if type(self._config) is list and all(type(config_itx) is dict for config_itx in self._config):
+            self._find_templates = {
+                key_: self.compile_template(value_)
+                for key_, value_ in self._get_find_config().items()
+                if value_
+            }
+
     @property
     def supported_clients(self):
         """Return list of supported clients"""
         return [
             ClientType.BROWSER_FIREFOX,
-            ClientType.BROWSER_CHROME
+            ClientType.BROWSER_CHROME,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     @property
@@ -141,69 +183,153 @@ Actual config: {config}
             raise StepValidationError("Find only supports one of: id, class, tag. Or placeholder or text with optional tag")
 
     def _get_find_type(self):
-        """Get find type based on config"""
-        config = self._get_find_config()
+        """
+        Get find type based on config.
+
+        Find types are webdriver locator strategies, which are the values
+        of selenium's By, so are determined without importing selenium.
+        """
+        config = self._find_templates
 
         by_type = None
         description = None
         value = None
 
         if id := config.get('id'):
-            by_type = By.ID
-            value = self.inject_variables_into_string(id)
+            by_type = self.BY_ID
+            value = self.render_template(id)
             description = f"by ID: {value}"
         elif (text := config.get('text')) or (placeholder := config.get('placeholder')):
             if text:
                 xpath_key = 'text'
-                xpath_value = self.inject_variables_into_string(text)
+                xpath_value = self.render_template(text)
                 xpath_template = f".//{{tag}}[contains(text(), '{xpath_value}')]"
 
             elif placeholder:
                 xpath_key = 'placeholder'
-                xpath_value = self.inject_variables_into_string(placeholder)
+                xpath_value = self.render_template(placeholder)
                 xpath_template = f".//{{tag}}[@placeholder='{xpath_value}']"
 
             tag = config.get('tag')
             description = f"by {xpath_key}: {xpath_value}"
             if tag:
-                tag = self.inject_variables_into_string(tag)
+                tag = self.render_template(tag)
                 description += f" and tag: {tag}"
             else:
                 tag = '*'
 
             # Search by XPATH
-            by_type = By.XPATH
+            by_type = self.BY_XPATH
             value = xpath_template.format(tag=tag)
 
         elif class_name := config.get('class'):
-            by_type = By.CLASS_NAME
-            value = self.inject_variables_into_string(class_name)
+            by_type = self.BY_CLASS_NAME
+            value = self.render_template(class_name)
             description = f"by class: {value}"
 
         elif tag := config.get('tag'):
-            by_type = By.TAG_NAME
-            value = self.inject_variables_into_string(tag)
+            by_type = self.BY_TAG_NAME
+            value = self.render_template(tag)
             description = f"by tag: {value}"
 
         return by_type, description, value
 
-    @retry(count=5, interval=0.5)
-    def _find_element(self, element, by_type, value):
-        """Find element"""
-        try:
-            return element.find_element(by_type, value)
-        except (selenium.common.exceptions.NoSuchElementException, selenium.common.exceptions.ElementNotInteractableException) as exc:
-            self._logger.error("Could not find element")
-            self._logger.debug(str(exc).split("\n")[0])
+    def _get_playwright_selector(self):
+        """Return playwright selector, based on find type"""
+        by_type, _, value = self._get_find_type()
+        if by_type == self.BY_ID:
+            escaped_value = value.replace("\\", "\\\\").replace('"', '\\"')
+            return f'css=[id="{escaped_value}"]'
+        elif by_type == self.BY_CLASS_NAME:
+            return f"css=.{_css_escape(value)}"
+        elif by_type == self.BY_TAG_NAME:
+            return f"css={value}"
+        return f"xpath={value}"
+
+    def get_batch_plan(self):
+        """Return batch plan, if all child steps are read-only"""
+        child_plans = [child_step.get_batch_plan() for child_step in self.get_child_steps()]
+        if None in child_plans:
             return None
 
+        by_type, _, value = self._get_find_type()
+        return {"type": "find", "by": by_type, "value": value, "children": child_plans}
+
+    def _execute_step(self, execution_method, state):
+        """
+        Execute step.
+
+        If the find and all of its child steps are read-only, they are first
+        evaluated in a single browser script. If any step does not succeed, the steps
+        are executed individually, which waits for elements and expected values.
+        """
+        if (execution_method == "execute_selenium" and Config.get().BATCH_READ_ONLY_STEPS and
+                self.get_child_steps() and not self.has_timeout_been_reached() and
+                # Only evaluate from the top of a read-only sub-tree
+                not (isinstance(self._parent, FindStep) and self._parent.get_batch_plan() is not None) and
+                (plan := self.get_batch_plan()) is not None):
+
+            if (result := evaluate_plan(state.selenium_instance, state.element, plan)) is not None:
+                # Execution of find is timed by execute, so is only updated for child steps
+                self.record_batch_result(result, start_time=self._start_time, end_time=time.monotonic())
+                return self.status
+            logger.debug("Batch evaluation of find did not succeed - executing steps individually")
+
+        return super()._execute_step(execution_method, state)
+
     def execute_selenium(self, state: SeleniumStepState):
-        """Find element on page"""
-        by_type, _, value, = self._get_find_type()
-        element = self._find_element(state.element, by_type, value, only_if=lambda: not self.has_timeout_been_reached())
-        if element is RetryStatus.ONLY_IF_CONDITION_FAILURE:
-            self.set_status(StepStatus.TIMEOUT)
-
-        if not element:
-            self.set_status(StepStatus.FAILED)
+        """Find element on page, polling until it is present or the timeout is reached"""
+        import selenium.common.exceptions
+
+        by_type, description, value, = self._get_find_type()
+        last_error = None
+
+        def find_element():
+            """Find element, returning None if it is not present"""
+            nonlocal last_error
+            try:
+                return state.element.find_element(by_type, value)
+            except (selenium.common.exceptions.NoSuchElementException, selenium.common.exceptions.ElementNotInteractableException) as exc:
+                last_error = str(exc).split("\n")[0]
+                return None
+
+        element = poll_until(
+            find_element,
+            timeout=self.limit_timeout_to_run(Config.get().FIND_ELEMENT_TIMEOUT),
+            interval=Config.get().FIND_ELEMENT_POLL_INTERVAL
+        )
+
+        if element is None:
+            self._logger.error(f"Could not find element {description}")
+            if last_error:
+                self._logger.debug(last_error)
+
+            if self.has_timeout_been_reached():
+                self.set_status(StepStatus.TIMEOUT)
+            else:
+                self.set_status(StepStatus.FAILED)
         state.element = element
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Find element on page, waiting until it is present or the timeout is reached"""
+        from playwright.sync_api import Error as PlaywrightError
+
+        _, description, _ = self._get_find_type()
+        parent = state.page if state.element is None else state.element
+        locator = parent.locator(self._get_playwright_selector()).first
+
+        try:
+            locator.wait_for(
+                state="attached",
+                timeout=self.get_playwright_timeout(Config.get().FIND_ELEMENT_TIMEOUT)
+            )
+        except PlaywrightError as exc:
+            self._logger.error(f"Could not find element {description}")
+            self._logger.debug(str(exc).split("\n")[0])
+
+            if self.has_timeout_been_reached():
+                self.set_status(StepStatus.TIMEOUT)
+            else:
+                self.set_status(StepStatus.FAILED)
+            locator = None
+        state.element = locator
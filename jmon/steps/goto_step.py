@@ -1,13 +1,18 @@
 
 import json
+import time
+from typing import Optional
+
 import requests
-import selenium.common.exceptions
 from jmon.client_type import ClientType
+from jmon.config import Config
 from jmon.errors import StepValidationError
-from jmon.step_state import RequestsStepState, SeleniumStepState
+from jmon.page_load import PageLoadStrategy, mark_document, wait_for_page_load
+from jmon.step_state import PlaywrightStepState, RequestsStepState, SeleniumStepState
 
 from jmon.step_status import StepStatus
 from jmon.steps.base_step import BaseStep
+from jmon.http_session import RequestTiming, record_request_timing
 from jmon.logger import logger
 from jmon.utils import UNSET
 
@@ -55,14 +60,49 @@ class GotoStep(BaseStep):
         timeout: 5
     ```
     Variables can also be used inside the header values, URL and body
+
+    For large responses, the response body can be streamed, so that checks
+    only read as much of the body as they require.
+    The size of body read by checks is limited, defaulting to the REQUESTS_MAX_BODY_SIZE configuration:
+    ```
+    - goto:
+        url: https://example.com/large-export
+        stream: true
+        # Maximum size of body (in bytes)
+        max-body-size: 1048576
+    ```
+
+    For browser based tests, the page load strategy can be set, determining
+    when the page is considered loaded:
+     * `normal` (default) - wait for the page and all resources to load
+     * `eager` - wait for the page to be parsed, without waiting for images, stylesheets etc.
+     * `none` - do not wait, relying on subsequent `find` steps to wait for elements
+    ```
+    - goto:
+        url: https://example.com
+        page-load-strategy: eager
+    ```
+    The strategy also applies to navigation caused by subsequent click and press actions.
+    Checks that use `eager` or `none` run in a browser created with the most
+    relaxed strategy used by the check, rather than a pooled browser.
     """
 
     CONFIG_KEY = "goto"
 
+    # Config keys that are only supported by requests
+    REQUESTS_CONFIG_KEYS = ["method", "headers", "body", "json", "ignore-ssl", "timeout", "stream", "max-body-size"]
+
     @property
     def supported_clients(self):
         """Return list of supported clients"""
-        if type(self._config) is dict:
+        if type(self._config) is dict and "page-load-strategy" in self._config:
+            # Page load strategy is only supported by browsers
+            return [
+                ClientType.BROWSER_FIREFOX,
+                ClientType.BROWSER_CHROME,
+                ClientType.BROWSER_PLAYWRIGHT
+            ]
+        elif type(self._config) is dict:
             # For checks that provide additional configs (method, body, headers),
             # only support requests
             return [
@@ -73,9 +113,23 @@ class GotoStep(BaseStep):
         return [
             ClientType.BROWSER_FIREFOX,
             ClientType.BROWSER_CHROME,
-            ClientType.REQUESTS
+            ClientType.REQUESTS,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
+    @property
+    def page_load_strategy(self) -> Optional[PageLoadStrategy]:
+        """Return page load strategy configured by step, if any"""
+        if type(self._config) is dict and "page-load-strategy" in self._config:
+            return self._page_load_strategy
+        return None
+
+    def as_dict(self):
+        """Return information about step, including timing breakdown of request"""
+        step_data = super().as_dict()
+        step_data["timing"] = None if self.timing is None else self.timing.as_dict()
+        return step_data
+
     def __init__(self, run, config, parent, run_logger=None):
         """Calculate config"""
         super().__init__(run, config, parent, run_logger)
@@ -85,6 +139,11 @@ class GotoStep(BaseStep):
         self._ignore_ssl = False
         self._headers = {}
         self._timeout = UNSET
+        self._stream = False
+        self._max_body_size = None
+        self._page_load_strategy = PageLoadStrategy.NORMAL
+        # Timing breakdown of request, for requests client
+        self.timing: Optional[RequestTiming] = None
         if type(self._config) is dict:
             self._method = self._config.get("method", "get").lower()
             self._body = self._config.get("body", UNSET)
@@ -92,6 +151,21 @@ class GotoStep(BaseStep):
             self._headers = self._config.get("headers", {})
             self._ignore_ssl = self._config.get("ignore-ssl", False)
             self._timeout = self._config.get("timeout", UNSET)
+            self._stream = self._config.get("stream", False)
+            self._max_body_size = self._config.get("max-body-size", None)
+            if page_load_strategy := self._config.get("page-load-strategy"):
+                try:
+                    self._page_load_strategy = PageLoadStrategy(page_load_strategy)
+                except ValueError:
+                    # Handled by validation
+                    pass
+
+        self._url_template = self.compile_template(
+            self._config.get("url") if type(self._config) is dict else self._config
+        )
+        self._headers_template = self.compile_template(self._headers)
+        self._body_template = None if self._body is UNSET else self.compile_template(self._body)
+        self._json_template = None if self._json is UNSET else self.compile_template(self._json)
 
     def _validate_step(self):
         """Check step is valid"""
@@ -114,6 +188,16 @@ class GotoStep(BaseStep):
                 except ValueError:
                     raise StepValidationError("Goto value for 'timeout' must a number")
 
+            if type(self._config.get("stream", False)) is not bool:
+                raise StepValidationError("Goto value for 'stream' must be a boolean")
+
+            if "max-body-size" in self._config:
+                max_body_size = self._config["max-body-size"]
+                if type(max_body_size) is not int or max_body_size < 1:
+                    raise StepValidationError("Goto value for 'max-body-size' must be a positive integer")
+                if not self._config.get("stream", False):
+                    raise StepValidationError("Goto 'max-body-size' can only be used with 'stream'")
+
             # Ensure headers, if present, is a dict and contains only key values of strings
             if type(self._config.get("headers", {})) is not dict:
                 raise StepValidationError("Goto headers must be an object with key-value headers")
@@ -123,9 +207,18 @@ class GotoStep(BaseStep):
                 if type(value) is not str or not value:
                     raise StepValidationError(f"Goto value for '{header}' must be a string")
 
+            if "page-load-strategy" in self._config:
+                valid_strategies = [strategy.value for strategy in PageLoadStrategy]
+                if self._config["page-load-strategy"] not in valid_strategies:
+                    raise StepValidationError(f"Goto page-load-strategy must be one of: {', '.join(valid_strategies)}")
+                if request_keys := [key for key in self.REQUESTS_CONFIG_KEYS if key in self._config]:
+                    raise StepValidationError(
+                        f"Goto page-load-strategy cannot be combined with request attributes: {', '.join(request_keys)}"
+                    )
+
             # Check remaining keys
             config_keys = [k for k in self._config.keys()]
-            for valid_key in ["url", "method", "headers", "body", "json", "ignore-ssl", "timeout"]:
+            for valid_key in ["url", "page-load-strategy"] + self.REQUESTS_CONFIG_KEYS:
                 if valid_key in config_keys:
                     config_keys.remove(valid_key)
             if config_keys:
@@ -151,63 +244,100 @@ class GotoStep(BaseStep):
     @property
     def url(self):
         """Return URL"""
-        url = self._config
-        if type(self._config) is dict:
-            url = self._config.get("url")
-        return self.inject_variables_into_string(url)
+        return self.render_template(self._url_template)
 
-    def execute_requests(self, state: RequestsStepState):
-        """Execute step for requests"""
+    def get_request_kwargs(self) -> dict:
+        """Return arguments for request, injecting variables into the URL, headers and body"""
         request_kwargs = {
             "url": self.url,
-            "headers": {
-                key_: self.inject_variables_into_string(value_)
-                for key_, value_ in self._headers.items()
-            }
+            "headers": self.render_template(self._headers_template),
         }
 
-        # Attempt to inject variables into body
-        if self._json is not UNSET:
-            def inject_variables_in_structure(structure):
-                """Inject variables"""
-                # If item is a string, replace value directly and return
-                if type(structure) is str:
-                    structure = self.inject_variables_into_string(structure)
-                elif type(structure) is dict:
-                    # Iterate through keys of a dict and replace each value
-                    for key_, value_ in structure.items():
-                        structure[key_] = inject_variables_in_structure(value_)
-                elif type(structure) is list:
-                    # Iterate through elements of lists and replace them with injected versions
-                    for itx, val in enumerate(structure):
-                        structure[itx] = inject_variables_in_structure(val)
-
-                return structure
-            self._json = inject_variables_in_structure(self._json)
-            request_kwargs["json"] = self._json
-
-        if self._body is not UNSET:
-            self._body = self.inject_variables_into_string(self._body)
-            request_kwargs["data"] = self._body
+        if self._json_template is not None:
+            request_kwargs["json"] = self.render_template(self._json_template)
+
+        if self._body_template is not None:
+            request_kwargs["data"] = self.render_template(self._body_template)
 
         if self._ignore_ssl:
             request_kwargs["verify"] = False
 
-        if self._timeout is not UNSET:
-            request_kwargs["timeout"] = self._timeout
+        # Limit timeout to the remaining time, as requests does not time out by default
+        request_kwargs["timeout"] = self.get_requests_timeout(None if self._timeout is UNSET else float(self._timeout))
+
+        if self._stream:
+            request_kwargs["stream"] = True
+
+        return request_kwargs
+
+    def execute_requests(self, state: RequestsStepState):
+        """Execute step for requests"""
+        request_kwargs = self.get_request_kwargs()
+
+        max_body_size = None
+        if self._stream:
+            max_body_size = self._max_body_size or Config.get().REQUESTS_MAX_BODY_SIZE
 
-        # Get requests call method, based on provided method
+        # Get requests call method, based on provided method,
+        # using the session of the run, if available
         try:
-            state.response = getattr(requests, self._method)(**request_kwargs)
+            with record_request_timing() as timing:
+                start_time = time.perf_counter()
+                response = getattr(state.session or requests, self._method)(**request_kwargs)
+                timing.finalise(response=response, total=time.perf_counter() - start_time, stream=self._stream)
+            state.set_response(response, max_body_size=max_body_size)
         except Exception as exc:
-            self.set_status(StepStatus.FAILED)
+            # Timeouts caused by reaching the deadline of the run/step are a timeout of the step
+            if isinstance(exc, requests.exceptions.Timeout) and self.has_timeout_been_reached():
+                self.set_status(StepStatus.TIMEOUT)
+            else:
+                self.set_status(StepStatus.FAILED)
             self._logger.error(str(exc).split("\n")[0])
+            return
+
+        self.timing = timing
+        self._logger.debug(f"Request timing: {timing}")
 
     def execute_selenium(self, state: SeleniumStepState):
         """Goto URL"""
+        import selenium.common.exceptions
+
+        url = self.url
+        # Webdriver only waits for page loads in sessions using the normal strategy
+        should_wait = state.should_wait_for_page_load(self._page_load_strategy)
         try:
-            state.selenium_instance.get(self.url)
+            if should_wait:
+                # Browsers return from navigation immediately, so mark the current
+                # document to wait for the new document to load
+                mark_document(state.selenium_instance)
+            state.selenium_instance.get(url)
             state.element = state.selenium_instance
         except selenium.common.exceptions.WebDriverException as exc:
             self.set_status(StepStatus.FAILED)
             self._logger.error(str(exc).split("\n")[0])
+            return
+
+        state.page_load_strategy = self._page_load_strategy
+        if should_wait and not wait_for_page_load(
+                state.selenium_instance, strategy=self._page_load_strategy,
+                timeout=self.get_remaining_time(), url=url):
+            self.set_status(StepStatus.TIMEOUT)
+            self._logger.error("Timed out waiting for page to load")
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Goto URL"""
+        from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+        state.element = None
+        try:
+            state.page.goto(
+                self.url,
+                wait_until=self._page_load_strategy.playwright_wait_until,
+                timeout=self.get_playwright_timeout(self.get_remaining_time())
+            )
+        except PlaywrightTimeoutError:
+            self.set_status(StepStatus.TIMEOUT)
+            self._logger.error("Timed out waiting for page to load")
+        except PlaywrightError as exc:
+            self.set_status(StepStatus.FAILED)
+            self._logger.error(str(exc).split("\n")[0])
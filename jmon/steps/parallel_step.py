@@ -0,0 +1,150 @@
+
+import concurrent.futures
+import threading
+from typing import List, Optional, Tuple
+
+from jmon.client_type import ClientType
+from jmon.config import Config
+from jmon.errors import StepValidationError
+from jmon.run_logger import RunLogger
+from jmon.step_state import RequestsStepState
+from jmon.step_status import StepStatus
+from jmon.steps.base_step import BaseStep
+from jmon.steps.branch_step import BranchStep
+from jmon.steps.dns_step import DNSStep
+from jmon.steps.goto_step import GotoStep
+
+
+_EXECUTOR: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return executor for branches of parallel steps, created on first use"""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                max_workers=Config.get().PARALLEL_STEP_MAX_CONCURRENCY,
+                thread_name_prefix="parallel-step"
+            )
+        return _EXECUTOR
+
+
+class ParallelStep(BaseStep):
+    """
+    Directive for performing independent steps concurrently.
+
+    Each child step is a branch, which is performed concurrently with the other
+    branches, using a copy of the current response. Use a branch directive to
+    perform several steps in order within a branch, e.g.
+    ```
+     - parallel:
+       - goto: https://example.com/api/health
+       - branch:
+         - goto: https://example.com/api/users
+         - check:
+             response: 200
+       - branch:
+         - goto: https://example.com/api/groups
+         - check:
+             json:
+               selector: '$.status'
+               equals: ok
+    ```
+
+    The step fails if any branch fails. Logs and statuses of branches are
+    recorded in the order of the branches, regardless of the order in which they complete.
+    Responses and cookies of branches are not available to steps after the parallel directive.
+    """
+
+    CONFIG_KEY = "parallel"
+    CHILD_STEPS_FORM_STEP = True
+
+    @property
+    def supported_clients(self):
+        """Return list of supported clients"""
+        return [
+            ClientType.REQUESTS
+        ]
+
+    @property
+    def supported_child_steps(self):
+        """Return list of child support step classes"""
+        return [
+            GotoStep,
+            DNSStep,
+            BranchStep,
+        ]
+
+    def _validate_step(self):
+        """Check step is valid"""
+        if type(self._config) is not list or len(self.get_child_steps()) == 0:
+            raise StepValidationError("Parallel must contain a list of at least one step")
+
+    @property
+    def id(self):
+        """ID string for step"""
+        return f"Parallel"
+
+    @property
+    def description(self):
+        """Friendly description of step"""
+        return f"Running {len(self.get_child_steps())} branches concurrently"
+
+    def execute_requests(self, state: RequestsStepState):
+        """Do nothing"""
+        # Do nothing, let branches perform requests
+        pass
+
+    @staticmethod
+    def _execute_branch(branch: BaseStep, execution_method, state: RequestsStepState,
+                        log_records: List[Tuple[int, dict]]) -> Tuple[Optional[StepStatus], Optional[Exception]]:
+        """Execute branch, buffering logs into log_records, returning status and any exception raised"""
+        with RunLogger.buffer_logs(records=log_records):
+            try:
+                return branch.execute(execution_method=execution_method, state=state), None
+            except Exception as exc:
+                return None, exc
+            finally:
+                # Release connection of response made by the branch, as it is not used after the branch
+                if state.response is not None and state.owns_response:
+                    state.response.close()
+
+    def _execute_child_steps(self, execution_method, state: RequestsStepState) -> Optional[StepStatus]:
+        """Execute each branch concurrently, returning status of first unsuccessful branch, if any"""
+        branches = self.get_child_steps()
+        branch_log_records = [[] for _ in branches]
+        futures = [
+            _get_executor().submit(self._execute_branch, branch, execution_method, state.clone_to_branch(), log_records)
+            for branch, log_records in zip(branches, branch_log_records)
+        ]
+        done, _ = concurrent.futures.wait(futures, timeout=self.get_remaining_time())
+
+        child_status = StepStatus.SUCCESS
+        error = None
+        # Log results in order of branches
+        for branch, future, log_records in zip(branches, futures, branch_log_records):
+            if future in done:
+                branch_status, exc = future.result()
+                RunLogger.replay_logs(log_records)
+                error = error or exc
+            else:
+                # Branches that have not started are not required
+                future.cancel()
+                # Branches that have started continue in the background,
+                # so prevent them from updating their status or starting further
+                # steps after the timeout, logging what they have performed so far
+                branch.abandon()
+                RunLogger.replay_logs(list(log_records))
+                branch_status = StepStatus.TIMEOUT
+                self._logger.error(f"{branch.id} did not complete before the timeout")
+
+            if child_status is StepStatus.SUCCESS and branch_status is not StepStatus.SUCCESS:
+                child_status = branch_status
+
+        # Raise errors from branches, as they would be raised by steps executed in order
+        if error is not None:
+            raise error
+
+        return child_status
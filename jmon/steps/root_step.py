@@ -2,7 +2,7 @@
 
 from jmon.client_type import ClientType
 from jmon.logger import logger
-from jmon.step_state import RequestsStepState, SeleniumStepState
+from jmon.step_state import PlaywrightStepState, RequestsStepState, SeleniumStepState
 from jmon.steps.base_step import BaseStep
 from jmon.steps.dns_step import DNSStep
 from jmon.steps.goto_step import GotoStep
@@ -10,6 +10,7 @@ from jmon.steps.find_step import FindStep
 from jmon.steps.check_step import CheckStep
 from jmon.steps.action_step import ActionStep
 from jmon.steps.call_plugin_step import CallPluginStep
+from jmon.steps.parallel_step import ParallelStep
 
 
 class RootStep(BaseStep):
@@ -22,7 +23,8 @@ class RootStep(BaseStep):
         return [
             ClientType.BROWSER_FIREFOX,
             ClientType.BROWSER_CHROME,
-            ClientType.REQUESTS
+            ClientType.REQUESTS,
+            ClientType.BROWSER_PLAYWRIGHT
         ]
 
     @property
@@ -35,6 +37,7 @@ class RootStep(BaseStep):
             ActionStep,
             CallPluginStep,
             DNSStep,
+            ParallelStep,
         ]
 
     @property
@@ -58,3 +61,7 @@ class RootStep(BaseStep):
     def execute_selenium(self, state: SeleniumStepState):
         """Root module does nothing"""
         self._logger.debug(f"Starting root with config: {self._config}")
+
+    def execute_playwright(self, state: PlaywrightStepState):
+        """Root module does nothing"""
+        self._logger.debug(f"Starting root with config: {self._config}")
@@ -1,4 +1,6 @@
 
+import resource
+
 from celery.result import AsyncResult
 from celery.exceptions import Ignore
 
@@ -67,6 +69,10 @@ def perform_check(self, check_name, environment_name, trigger_type=RunTriggerTyp
         finally:
             run.end(run_status=status)
 
+            # Log peak memory of worker process. Celery replaces the worker
+            # process once it exceeds WORKER_MAX_MEMORY_MB
+            logger.debug(f"Worker peak memory usage: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f}MB")
+
     finally:
         jmon.database.Database.clear_session()
 
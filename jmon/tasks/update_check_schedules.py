@@ -11,9 +11,19 @@ from jmon.logger import logger
 
 def update_check_schedules():
     """Add task schedules for each check in database."""
+    session = jmon.database.Database.get_session()
     checks = jmon.models.Check.get_all()
     for check in checks:
         logger.debug(f"Processing check: {check.name}, environment: {check.environment.name}")
+
+        # Store metadata for checks created before metadata was
+        # stored, or whose metadata is out of date
+        if not check.has_valid_metadata:
+            logger.info(f"Updating metadata for {check.name}, {check.environment.name}")
+            check.update_metadata()
+            session.add(check)
+            session.commit()
+
         if check.enabled:
             if check.upsert_schedule():
                 logger.info(f"Added/updated schedule for {check.name}, {check.environment.name}")
@@ -0,0 +1,193 @@
+
+import functools
+import string
+from typing import Any, FrozenSet, NamedTuple, Optional, Tuple
+
+
+_FORMATTER = string.Formatter()
+
+
+class _Plan(NamedTuple):
+    """
+    Plan for rendering a value.
+
+    For strings, parts contains the parsed string.
+    For lists and dictionaries, children contains the plan for each
+    item/value that references variables, keyed by index/key.
+    """
+
+    parts: Optional[Tuple[tuple, ...]]
+    children: Optional[Tuple[Tuple[Any, '_Plan'], ...]]
+
+
+class _CompileResult(NamedTuple):
+    """Result of compiling a value"""
+
+    # None if the value does not reference any variables
+    plan: Optional[_Plan]
+    variables: FrozenSet[str]
+    error: Optional[str]
+
+
+_STATIC_RESULT = _CompileResult(plan=None, variables=frozenset(), error=None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_string(source: str) -> _CompileResult:
+    """Parse string, returning plan, referenced variable names and any error"""
+    if "{" not in source and "}" not in source:
+        return _STATIC_RESULT
+
+    try:
+        parts = tuple(_FORMATTER.parse(source))
+        # Include nested fields of format specs, e.g. '{value:{width}}'
+        fields = parts + tuple(
+            nested_part
+            for _, field_name, format_spec, _ in parts
+            if field_name is not None and format_spec
+            for nested_part in _FORMATTER.parse(format_spec)
+        )
+    except ValueError as exc:
+        return _CompileResult(plan=None, variables=frozenset(), error=str(exc))
+
+    variables = set()
+    for _, field_name, _, _ in fields:
+        if field_name is None:
+            continue
+        root = field_name.split(".")[0].split("[")[0]
+        if not root or root.isdigit():
+            return _CompileResult(
+                plan=None, variables=frozenset(),
+                error="positional placeholders are not supported, a variable name must be provided"
+            )
+        if not root.isidentifier():
+            # Treat as literal text, which is not a placeholder
+            return _STATIC_RESULT
+        variables.add(root)
+
+    if not variables:
+        return _STATIC_RESULT
+    return _CompileResult(plan=_Plan(parts=parts, children=None), variables=frozenset(variables), error=None)
+
+
+def _compile(source: Any) -> _CompileResult:
+    """Compile value, returning plan, referenced variable names and any error"""
+    if type(source) is str:
+        return _compile_string(source)
+
+    if type(source) is list:
+        items = enumerate(source)
+    elif type(source) is dict:
+        items = source.items()
+    else:
+        return _STATIC_RESULT
+
+    # Only retain plans of items that reference variables
+    children = []
+    variables = frozenset()
+    error = None
+    for key_, value_ in items:
+        result = _compile(value_)
+        error = error or result.error
+        if result.plan is not None:
+            children.append((key_, result.plan))
+            variables = variables.union(result.variables)
+
+    if not children:
+        return _CompileResult(plan=None, variables=frozenset(), error=error)
+    return _CompileResult(plan=_Plan(parts=None, children=tuple(children)), variables=variables, error=error)
+
+
+def _render(source: Any, plan: _Plan, variables: dict) -> Any:
+    """Render value using plan"""
+    if plan.parts is not None:
+        result = []
+        for literal, field_name, format_spec, conversion in plan.parts:
+            result.append(literal)
+            if field_name is None:
+                continue
+            value, _ = _FORMATTER.get_field(field_name, (), variables)
+            value = _FORMATTER.convert_field(value, conversion)
+            if format_spec and "{" in format_spec:
+                format_spec = _FORMATTER.vformat(format_spec, (), variables)
+            result.append(_FORMATTER.format_field(value, format_spec))
+        return "".join(result)
+
+    # Copy list/dictionary, replacing items that reference variables
+    rendered = list(source) if type(source) is list else dict(source)
+    for key_, child_plan in plan.children:
+        rendered[key_] = _render(source[key_], child_plan, variables)
+    return rendered
+
+
+class CompiledTemplate:
+    """
+    Value containing run variable placeholders, parsed once so that it can be rendered repeatedly.
+
+    Strings use str.format syntax, e.g. 'https://example.com/?id={an_output_variable}'.
+    Lists and dictionaries are compiled recursively, rendering each of their string values.
+
+    Placeholders that do not reference a variable name (e.g. braces
+    within a JSON string) are not treated as placeholders.
+    """
+
+    def __init__(self, source: Any):
+        """Store source, which is compiled on first use"""
+        self.source = source
+        self._result: Optional[_CompileResult] = None
+        # Last rendered value, as tuple of render key and value
+        self._rendered = None
+
+    def _get_result(self) -> _CompileResult:
+        """Return result of compiling source"""
+        if self._result is None:
+            self._result = _compile(self.source)
+        return self._result
+
+    def compile(self) -> 'CompiledTemplate':
+        """Compile source, if not already compiled, returning the template"""
+        self._get_result()
+        return self
+
+    def use_compiled(self, template: 'CompiledTemplate'):
+        """
+        Use compiled result of template with the same source, rather than compiling the source.
+
+        Steps of each run re-use the templates compiled by the step plan,
+        whilst keeping their own rendered values.
+        """
+        self._result = template._get_result()
+
+    @property
+    def variables(self) -> FrozenSet[str]:
+        """Names of variables referenced by template"""
+        return self._get_result().variables
+
+    @property
+    def error(self) -> Optional[str]:
+        """Error encountered whilst parsing a string, if invalid"""
+        return self._get_result().error
+
+    @property
+    def is_static(self) -> bool:
+        """Whether the template does not reference any variables"""
+        return self._get_result().plan is None
+
+    def render(self, variables: dict, version: Optional[int] = None) -> Any:
+        """
+        Render template using variables, raising KeyError if a referenced variable is not set.
+
+        If a version of the variables is provided, the rendered value
+        is re-used until the variables change.
+        """
+        plan = self._get_result().plan
+        if plan is None:
+            return self.source
+
+        key = (id(variables), version)
+        if version is not None and self._rendered is not None and self._rendered[0] == key:
+            return self._rendered[1]
+
+        value = _render(self.source, plan, variables)
+        self._rendered = (key, value)
+        return value
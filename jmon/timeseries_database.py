@@ -1,7 +1,7 @@
 
 import abc
 import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
 
 import requests
 
@@ -15,6 +15,15 @@ import jmon.run
 
 
 
+class TimeSeriesDataPoint(NamedTuple):
+    """Data point of metric, for writing to time series database"""
+
+    metric_name: str
+    properties: Dict[str, str]
+    fields: Dict[str, float]
+    timestamp: datetime.datetime
+
+
 class TimeSeriesDatabase(abc.ABC):
 
     def __init__(self, url):
@@ -26,6 +35,11 @@ class TimeSeriesDatabase(abc.ABC):
         """Write metric to database"""
         ...
 
+    def write_metrics(self, data_points: List[TimeSeriesDataPoint]):
+        """Write multiple metrics to database"""
+        for data_point in data_points:
+            self.write_metric(**data_point._asdict())
+
     @abc.abstractmethod
     def read_metric(self, query: str, from_date: datetime.datetime, to_date: datetime.datetime):
         """Read metric from database"""
@@ -35,13 +49,19 @@ class TimeSeriesDatabase(abc.ABC):
 class VictoriaMetricsDatabase(TimeSeriesDatabase):
     """Implementation of TimeSeriesDatabase for victoriametrics"""
 
-    def write_metric(self, metric_name: str, properties: Dict[str, str], fields: Dict[str, str], timestamp: datetime.datetime) -> bool:
-        """Write metric to victoriametrics"""
+    @staticmethod
+    def _escape_tag(value) -> str:
+        """Escape tag key/value for influx line protocol"""
+        return str(value).replace("\\", "\\\\").replace(",", "\\,").replace("=", "\\=").replace(" ", "\\ ")
+
+    @classmethod
+    def _get_line(cls, metric_name: str, properties: Dict[str, str], fields: Dict[str, str], timestamp: datetime.datetime) -> str:
+        """Return metric in influx line protocol"""
         tags = [
             metric_name
         ]
         tags += [
-            f"{key}={value}" for key, value in properties.items()
+            f"{cls._escape_tag(key)}={cls._escape_tag(value)}" for key, value in properties.items()
         ]
         fields_string = ','.join([
             f"{key}={value}" for key, value in fields.items()
@@ -50,7 +70,21 @@ class VictoriaMetricsDatabase(TimeSeriesDatabase):
         # Convert from seconds to microseconds and pad with 0s to nanoseconds
         timestamp_string = str(int(timestamp.timestamp() * 1000000)) + "000"
 
-        data = f"{','.join(tags)} {fields_string} {timestamp_string}"
+        return f"{','.join(tags)} {fields_string} {timestamp_string}"
+
+    def write_metric(self, metric_name: str, properties: Dict[str, str], fields: Dict[str, str], timestamp: datetime.datetime) -> bool:
+        """Write metric to victoriametrics"""
+        return self._write_lines([self._get_line(metric_name, properties, fields, timestamp)])
+
+    def write_metrics(self, data_points: List[TimeSeriesDataPoint]) -> bool:
+        """Write multiple metrics to victoriametrics in a single request"""
+        if not data_points:
+            return True
+        return self._write_lines([self._get_line(**data_point._asdict()) for data_point in data_points])
+
+    def _write_lines(self, lines: List[str]) -> bool:
+        """Write lines of influx line protocol to victoriametrics"""
+        data = "\n".join(lines)
         res = requests.post(self._url + "/write", data=data)
 
         if res.status_code != 204:
@@ -201,3 +235,40 @@ class RunResultMetricWriter(TimeSeriesMetricWriter):
             "success": 1 if run.success else 0,
             "execution_time": run.execution_time
         }
+
+
+class StepDurationMetricWriter(TimeSeriesMetric):
+    """Metric for duration of each step of run"""
+
+    TIME_SERIES_METRIC_NAME = "jmon_step"
+
+    def _get_step_data_points(self, run: 'jmon.run.Run', step: 'jmon.steps.base_step.BaseStep',
+                              step_path: str) -> List[TimeSeriesDataPoint]:
+        """Return data points for step and its child steps"""
+        data_points = []
+        if (duration := step.duration) is not None:
+            data_points.append(TimeSeriesDataPoint(
+                metric_name=self.TIME_SERIES_METRIC_NAME,
+                properties={
+                    "check": run.check.name,
+                    "environment": run.check.environment.name,
+                    # Path of step, matching IDs of nodes of the step graph
+                    "step": step_path,
+                    "step_name": step.id,
+                },
+                fields={
+                    "duration": duration,
+                },
+                timestamp=run.run_model.timestamp
+            ))
+
+        for child_itx, child_step in enumerate(step.get_child_steps()):
+            data_points += self._get_step_data_points(run=run, step=child_step, step_path=f"{step_path}.{child_itx + 1}")
+        return data_points
+
+    def write(self, result_database: 'TimeSeriesDatabase', run: 'jmon.run.Run'):
+        """Write durations of steps to result database"""
+        data_points = []
+        for step_itx, step in enumerate(run.root_step.get_child_steps()):
+            data_points += self._get_step_data_points(run=run, step=step, step_path=f"s{step_itx + 1}")
+        result_database.write_metrics(data_points)
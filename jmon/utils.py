@@ -1,8 +1,10 @@
 
 
 from enum import Enum
-from time import sleep
+from time import monotonic, sleep
+from typing import Callable, Optional, TypeVar
 
+from jmon.deadline import Deadline
 from jmon.logger import logger
 
 
@@ -11,14 +13,24 @@ from jmon.logger import logger
 UNSET = object()
 
 
+T = TypeVar("T")
+
+
 class RetryStatus(Enum):
     """Retry return status enum"""
     ONLY_IF_CONDITION_FAILURE = "ONLY_IF_CONDITION_FAILURE"
+    # Attempt failed and the deadline has been reached, so no further attempts are made
+    DEADLINE_EXCEEDED = "DEADLINE_EXCEEDED"
+
+
+# Statuses returned when attempts are stopped due to a timeout
+TIMEOUT_RETRY_STATUSES = (RetryStatus.ONLY_IF_CONDITION_FAILURE, RetryStatus.DEADLINE_EXCEEDED)
 
 
 def retry(count, interval):
     def wrapper(func):
-        def execute_attempt(*args, only_if=None, **kwargs):
+        def execute_attempt(*args, only_if=None, deadline: Optional[Deadline]=None,
+                            on_retry: Optional[Callable[[], None]]=None, **kwargs):
             res = None
             for itx in range(count):
                 # Use callback only_if method to
@@ -30,11 +42,38 @@ def retry(count, interval):
                 res = func(*args, **kwargs)
                 if res is not None:
                     return res
-                else:
-                    sleep(interval)
-                    logger.error(f"Retrying step ({itx + 1}/{count})")
-            else:
-                return res
+
+                # Only retry if there are remaining attempts and time
+                if itx == count - 1:
+                    break
+                if deadline is not None and deadline.remaining() <= 0:
+                    return RetryStatus.DEADLINE_EXCEEDED
+
+                # Do not sleep beyond the deadline
+                sleep(interval if deadline is None else deadline.clamp(interval))
+                logger.error(f"Retrying step ({itx + 1}/{count})")
+                if on_retry is not None:
+                    on_retry()
+            return res
 
         return execute_attempt
     return wrapper
+
+
+def poll_until(func: Callable[[], Optional[T]], timeout: float, interval: float) -> Optional[T]:
+    """
+    Call function until it returns a value other than None, or the timeout is reached.
+
+    The function is always called at least once, and is called a final
+    time at the timeout. Returns None if the timeout is reached.
+    """
+    end_time = monotonic() + timeout
+    while True:
+        res = func()
+        if res is not None:
+            return res
+
+        remaining = end_time - monotonic()
+        if remaining <= 0:
+            return None
+        sleep(min(interval, remaining))
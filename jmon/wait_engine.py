@@ -0,0 +1,164 @@
+
+from enum import Enum
+import re
+import time
+from typing import Any, NamedTuple, Optional
+
+
+class WaitCondition(Enum):
+    """Condition that can be waited for in the browser"""
+
+    VISIBLE = "visible"
+    CLICKABLE = "clickable"
+    TEXT = "text"
+    TITLE = "title"
+    URL = "url"
+
+    @property
+    def requires_element(self) -> bool:
+        """Return whether the condition is evaluated against an element"""
+        return self in [WaitCondition.VISIBLE, WaitCondition.CLICKABLE, WaitCondition.TEXT]
+
+
+class WaitResult(NamedTuple):
+    """Result of wait"""
+
+    satisfied: bool
+    # Last observed value (text, title or URL), if applicable
+    actual: Optional[Any]
+
+
+# Normalise rendered text of element, matching normalise_text, so that text
+# is compared using the same rule in the page and using webdriver
+NORMALISE_TEXT_SCRIPT = """
+const normaliseText = (text) => (text || "").replace(/\\u00a0/g, " ").replace(/[ \\t]*\\n[ \\t]*/g, "\\n").trim();
+"""
+
+
+def normalise_text(text: Optional[str]) -> str:
+    """
+    Normalise rendered text of element.
+
+    Non-breaking spaces are replaced with spaces and whitespace surrounding
+    lines is removed, so that the inner text of elements matches the text
+    returned by webdriver. Whitespace within lines is retained.
+    """
+    return re.sub(r"[ \t]*\n[ \t]*", "\n", (text or "").replace("\u00a0", " ")).strip()
+
+
+# Evaluate condition in page, resolving as soon as it is satisfied.
+# Changes are detected using a MutationObserver, with an animation frame loop
+# to detect changes that do not mutate the DOM (e.g. style or history changes).
+_WAIT_SCRIPT = NORMALISE_TEXT_SCRIPT + """
+const [element, condition, expected, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const isVisible = (el) => {
+    if (!el.isConnected) return false;
+    const style = window.getComputedStyle(el);
+    if (style.display === "none" || style.visibility === "hidden" || parseFloat(style.opacity) === 0) return false;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+};
+const evaluate = () => {
+    switch (condition) {
+        case "visible": return [isVisible(element), null];
+        case "clickable": return [isVisible(element) && !element.disabled, null];
+        case "text": {
+            const text = normaliseText(element.innerText);
+            return [text === expected, text];
+        }
+        case "title": return [document.title === expected, document.title];
+        case "url": return [window.location.href === expected, window.location.href];
+    }
+    throw new Error("Unknown wait condition: " + condition);
+};
+
+let finished = false;
+let observer = null;
+let timer = null;
+const finish = (satisfied, actual) => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done({satisfied: satisfied, actual: actual});
+};
+const check = () => {
+    if (finished) return;
+    const [satisfied, actual] = evaluate();
+    if (satisfied) finish(true, actual);
+};
+
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    const frame = () => {
+        if (finished) return;
+        check();
+        window.requestAnimationFrame(frame);
+    };
+    window.requestAnimationFrame(frame);
+    timer = setTimeout(() => finish(...evaluate()), timeoutMs);
+}
+"""
+
+# Maximum duration of a single wait script, which must be less than
+# the webdriver script timeout (default 30s)
+MAX_SCRIPT_DURATION = 20
+
+# Interval between attempts when the wait script is interrupted
+# (e.g. whilst the page is navigating)
+RETRY_INTERVAL = 0.05
+
+
+def _evaluate_natively(selenium_instance, condition: WaitCondition, element, expected) -> WaitResult:
+    """Evaluate condition using webdriver commands"""
+    if condition is WaitCondition.VISIBLE:
+        return WaitResult(satisfied=element.is_displayed(), actual=None)
+    elif condition is WaitCondition.CLICKABLE:
+        return WaitResult(satisfied=element.is_displayed() and element.is_enabled(), actual=None)
+    elif condition is WaitCondition.TEXT:
+        actual = normalise_text(element.text)
+    elif condition is WaitCondition.TITLE:
+        actual = selenium_instance.title
+    else:
+        actual = selenium_instance.current_url
+    return WaitResult(satisfied=actual == expected, actual=actual)
+
+
+def wait_for_condition(selenium_instance, condition: WaitCondition, timeout: float,
+                       element=None, expected=None) -> WaitResult:
+    """
+    Wait for condition to be satisfied in the browser, for up to timeout seconds.
+
+    The condition is evaluated in the page, meaning that a satisfied condition
+    is generally returned in a single webdriver command.
+    If the condition has not been satisfied in the page before the timeout, it is
+    evaluated a final time using webdriver commands, which are authoritative.
+    """
+    import selenium.common.exceptions
+
+    end_time = time.monotonic() + timeout
+    while (remaining := end_time - time.monotonic()) > 0:
+        try:
+            result = selenium_instance.execute_async_script(
+                _WAIT_SCRIPT,
+                element if condition.requires_element else None,
+                condition.value,
+                expected,
+                int(min(remaining, MAX_SCRIPT_DURATION) * 1000)
+            )
+            if result and result.get("satisfied"):
+                return WaitResult(satisfied=True, actual=result.get("actual"))
+        except selenium.common.exceptions.StaleElementReferenceException:
+            # Element is no longer attached, so will not satisfy the condition
+            break
+        except selenium.common.exceptions.WebDriverException:
+            # Script can be interrupted by navigation, so retry against the new document
+            time.sleep(min(RETRY_INTERVAL, max(end_time - time.monotonic(), 0)))
+
+    try:
+        return _evaluate_natively(selenium_instance, condition, element, expected)
+    except selenium.common.exceptions.StaleElementReferenceException:
+        return WaitResult(satisfied=False, actual=None)
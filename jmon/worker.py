@@ -1,49 +1,11 @@
 
 import celery.signals
-import sentry_sdk
-from sentry_sdk.integrations.celery import CeleryIntegration
 
-from jmon import app
-import jmon.tasks.perform_check
-import jmon.tasks.update_check_schedules
-import jmon.tasks.clean_orphaned_checks
-import jmon.tasks.remove_expired_runs
-import jmon.tasks.update_artifact_lifecycle_rules
-import jmon.tasks.check_queue_timeouts
+# Register tasks and worker configuration shared with requests-only workers
+from jmon.requests_worker import app
 import jmon.runner
-import jmon.config
-
-
-# Register tasks with celery
-app.task(bind=True)(jmon.tasks.perform_check.perform_check)
-app.task(jmon.tasks.update_check_schedules.update_check_schedules)
-app.task(jmon.tasks.clean_orphaned_checks.clean_orphaned_checks)
-app.task(jmon.tasks.remove_expired_runs.remove_expired_runs)
-app.task(jmon.tasks.update_artifact_lifecycle_rules.update_artifact_lifecycle_rules)
-app.task(jmon.tasks.check_queue_timeouts.check_queue_timeouts)
-
-# Set pre-fetch multiplier to 1 so that workers only pull the message
-# they are currently working on
-app.conf.worker_prefetch_multiplier = 1
-
-# Set maximum tasks per worker to avoid memory leaks.
-# The source of these leaks is not entirely known
-app.conf.worker_max_tasks_per_child = 100
-
-@celery.signals.celeryd_init.connect
-def init_sentry(**kwargs):
-    """Initialise sentry"""
-    if jmon.config.Config.get().SENTRY_DSN:
-        sentry_sdk.init(
-            dsn=jmon.config.Config.get().SENTRY_DSN,
-            enable_tracing=True,
-            integrations=[
-                CeleryIntegration(
-                    monitor_beat_tasks=True
-                )
-            ],
-            environment=jmon.config.Config.get().SENTRY_ENVIRONMENT,
-        )
+# Preload browser stack in the parent process, so that it is shared between prefork children
+import jmon.browser
 
 
 @celery.signals.worker_process_init.connect
@@ -0,0 +1,138 @@
+"""
+Benchmark time taken by find steps to locate an element in a browser.
+
+A local page inserts the target element after a configurable delay.
+For each run, the time between the element being inserted by the page and the
+find step returning is measured (time-to-found), as well as the time taken
+for a find step to fail for an element that is never present (time-to-fail).
+
+Requires a browser to be available, as per the worker.
+
+Usage:
+    python scripts/benchmarks/find_element.py [--client BROWSER_CHROME] [--runs 20] [--delay 0.3]
+"""
+
+import argparse
+import http.server
+import statistics
+import sys
+import threading
+import time
+
+sys.path.append('.')
+
+from jmon.browser import BrowserFactory, VirtualDisplay
+from jmon.client_type import ClientType
+from jmon.config import Config
+from jmon.models.check import Check
+from jmon.run import Run
+from jmon.step_state import SeleniumStepState
+from jmon.step_status import StepStatus
+from jmon.steps.find_step import FindStep
+from jmon.steps.goto_step import GotoStep
+
+
+class DelayedElementRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Return page that inserts element after the delay provided in the query string"""
+
+    def do_GET(self):
+        delay_ms = int(self.path.split("delay=")[-1])
+        content = f"""
+<html>
+<head><title>Find benchmark</title></head>
+<body>
+<script>
+setTimeout(() => {{
+    const element = document.createElement("div");
+    element.id = "delayed";
+    document.body.appendChild(element);
+    window.insertedAt = Date.now();
+}}, {delay_ms});
+</script>
+</body>
+</html>
+""".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def execute_find(run, state, element_id):
+    """Execute find step, returning status, start time and end time (wall clock, in seconds)"""
+    step = FindStep(run=run, config=[{"id": element_id}], parent=run.root_step)
+    start_time = time.time()
+    step.execute(execution_method="execute_selenium", state=state.clone_to_child())
+    return step._status, start_time, time.time()
+
+
+def summarise(name, durations):
+    """Print summary of durations"""
+    durations = sorted(durations)
+    print(
+        f"{name:>15}: mean={statistics.mean(durations) * 1000:.0f}ms "
+        f"p50={durations[len(durations) // 2] * 1000:.0f}ms "
+        f"max={durations[-1] * 1000:.0f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--client", default=ClientType.BROWSER_CHROME.value, help="Browser client type")
+    parser.add_argument("--runs", type=int, default=20, help="Number of runs")
+    parser.add_argument("--delay", type=float, default=0.3, help="Delay before element is inserted (seconds)")
+    args = parser.parse_args()
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), DelayedElementRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/?delay={int(args.delay * 1000)}"
+
+    print(
+        f"Find timeout: {Config.get().FIND_ELEMENT_TIMEOUT}s, "
+        f"poll interval: {Config.get().FIND_ELEMENT_POLL_INTERVAL}s"
+    )
+
+    browser_factory = BrowserFactory.get()
+    try:
+        browser = browser_factory.get_browser(ClientType(args.client))
+        check = Check(name="benchmark-find", client=None, timeout=60)
+        check.steps = []
+
+        found_durations = []
+        fail_durations = []
+        for _ in range(args.runs):
+            run = Run(check)
+            run.start_timer()
+            state = SeleniumStepState(selenium_instance=browser.selenium_instance, element=browser.selenium_instance)
+
+            GotoStep(run=run, config=url, parent=run.root_step).execute(
+                execution_method="execute_selenium", state=state
+            )
+            status, _, end_time = execute_find(run, state, "delayed")
+            if status is not StepStatus.SUCCESS:
+                print(f"Failed to find element: {status}")
+            else:
+                # Measure from when the element was inserted by the page
+                inserted_at = browser.selenium_instance.execute_script("return window.insertedAt;") / 1000
+                found_durations.append(end_time - inserted_at)
+
+            status, start_time, end_time = execute_find(run, state, "missing")
+            if status is not StepStatus.FAILED:
+                print(f"Unexpected status for missing element: {status}")
+            fail_durations.append(end_time - start_time)
+            run.logger.cleanup()
+
+        summarise("time-to-found", found_durations)
+        summarise("time-to-fail", fail_durations)
+    finally:
+        browser_factory.teardown()
+        VirtualDisplay.stop()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
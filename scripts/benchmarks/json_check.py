@@ -0,0 +1,134 @@
+"""
+Benchmark time taken by JSON checks against large responses.
+
+A JSON response of the given size is generated and a check step containing
+ten JSON checks (each using a selector) is executed against it.
+The time is compared against parsing the response and compiling the
+selector for every check.
+
+Usage:
+    python scripts/benchmarks/json_check.py [--size-mb 5] [--runs 5]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from jsonpath import JSONPath
+import requests
+
+sys.path.append('.')
+
+from jmon.models.check import Check
+from jmon.run import Run
+from jmon.step_state import RequestsStepState
+from jmon.step_status import StepStatus
+from jmon.steps.check_step import CheckStep
+
+
+SELECTORS = [
+    ("$.meta.id", "benchmark"),
+    ("$.meta.count", None),
+    ("$.items[0].name", "item-0"),
+    ("$.items[1].tags[0]", "tag-0"),
+    ("$.items[10].value", 10),
+    ("$.items[100].name", "item-100"),
+    ("$.items[1000].enabled", True),
+    ("$.items[2000].value", 2000),
+    ("$.meta.source", "generated"),
+    ("$.items[5].tags[2]", "tag-2"),
+]
+
+
+def generate_response(size_mb: float) -> requests.Response:
+    """Generate response containing JSON body of approximately the given size"""
+    items = []
+    body_size = 0
+    while body_size < size_mb * 1024 * 1024:
+        item = {
+            "name": f"item-{len(items)}",
+            "value": len(items),
+            "enabled": True,
+            "tags": [f"tag-{itx}" for itx in range(5)],
+            "description": "x" * 200,
+        }
+        items.append(item)
+        body_size += len(json.dumps(item))
+
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps({
+        "meta": {"id": "benchmark", "count": len(items), "source": "generated"},
+        "items": items,
+    }).encode("utf-8")
+    response._content_consumed = True
+    return response
+
+
+def get_checks_config(response: requests.Response) -> list:
+    """Return JSON check config for each selector, with expected values matching the response"""
+    body = response.json()
+    checks = []
+    for selector, expected in SELECTORS:
+        if expected is None:
+            expected = JSONPath(selector).parse(body)[0]
+        checks.append({"json": {"selector": selector, "equals": expected}})
+    return checks
+
+
+def run_check_step(check: Check, response: requests.Response, checks_config: list) -> float:
+    """Execute check step containing each JSON check, returning duration"""
+    run = Run(check)
+    run.start_timer()
+    try:
+        # Execute each JSON check as a sibling of the same parent state
+        state = RequestsStepState(response=response, dns_response=None)
+        start_time = time.perf_counter()
+        for check_config in checks_config:
+            step = CheckStep(run=run, config=check_config, parent=run.root_step)
+            child_state = state.clone_to_child()
+            status = step.execute(execution_method="execute_requests", state=child_state)
+            state.integrate_from_child(child_state)
+            if status is not StepStatus.SUCCESS:
+                raise Exception(f"JSON check failed: {check_config}")
+        return time.perf_counter() - start_time
+    finally:
+        run.logger.cleanup()
+
+
+def run_baseline(response: requests.Response, checks_config: list) -> float:
+    """Parse response and compile selector for each check, returning duration"""
+    start_time = time.perf_counter()
+    for check_config in checks_config:
+        value = JSONPath(check_config["json"]["selector"]).parse(response.json())
+        if value[0] != check_config["json"]["equals"]:
+            raise Exception(f"Baseline check failed: {check_config}")
+    return time.perf_counter() - start_time
+
+
+def summarise(name, durations):
+    """Print summary of durations"""
+    print(f"{name:>22}: mean={statistics.mean(durations) * 1000:.0f}ms min={min(durations) * 1000:.0f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=5, help="Size of JSON response (MB)")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs")
+    args = parser.parse_args()
+
+    response = generate_response(args.size_mb)
+    checks_config = get_checks_config(response)
+    print(f"Response size: {len(response.content) / 1024 / 1024:.1f}MB, checks: {len(checks_config)}")
+
+    check = Check(name="benchmark-json", client=None, timeout=60)
+    check.steps = []
+
+    summarise("parse per check", [run_baseline(response, checks_config) for _ in range(args.runs)])
+    summarise("shared parsed response", [run_check_step(check, response, checks_config) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark throughput of requests checks executed concurrently within a single process,
+as performed by a requests worker using the celery threads pool.
+
+Runs are executed against a local stub HTTP server, which adds a fixed
+latency to each response to emulate network wait.
+Each run's log is verified to only contain entries for that run.
+
+Usage:
+    python scripts/benchmarks/requests_concurrency.py [--runs 200] [--concurrency 1 10 50] [--latency 0.05]
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import http.server
+import logging
+import sys
+import threading
+import time
+
+sys.path.append('.')
+
+from jmon.logger import logger
+from jmon.models.check import Check
+from jmon.run import Run
+from jmon.runner import Runner
+from jmon.step_status import StepStatus
+
+
+class StubRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Return static page after configured latency"""
+
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        content = b"<html><head><title>Stub</title></head><body>OK</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(http.server.ThreadingHTTPServer):
+    """Stub HTTP server, accepting a large number of concurrent connections"""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def perform_run(base_url, run_id):
+    """Execute requests check, returning status and whether the log is isolated to the run"""
+    check = Check(name=f"benchmark-{run_id}", client=None, timeout=30)
+    check.steps = [
+        {"goto": f"{base_url}/?run={run_id}"},
+        {"check": {"code": 200}},
+    ]
+    run = Run(check)
+    try:
+        status = Runner().perform_check(run=run)
+    finally:
+        run.logger.cleanup()
+
+    log = run.logger.read_log_stream()
+    isolated = f"run={run_id}" in log and log.count("run=") == log.count(f"run={run_id}")
+    return status, isolated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=200, help="Number of runs per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50], help="Concurrency levels")
+    parser.add_argument("--latency", type=float, default=0.05, help="Stub server response latency (seconds)")
+    args = parser.parse_args()
+
+    # Emit info logs, as performed by workers, so that run logs are captured
+    logger.setLevel(logging.INFO)
+
+    StubRequestHandler.latency = args.latency
+    server = StubServer(("127.0.0.1", 0), StubRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{'Concurrency':>11} {'Runs':>6} {'Duration (s)':>13} {'Runs/s':>9} {'Failed':>7} {'Leaked logs':>12}")
+    for concurrency in args.concurrency:
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(lambda run_id: perform_run(base_url, run_id), range(args.runs)))
+        duration = time.perf_counter() - start_time
+
+        failed = len([status for status, _ in results if status is not StepStatus.SUCCESS])
+        leaked = len([isolated for _, isolated in results if not isolated])
+        print(f"{concurrency:>11} {args.runs:>6} {duration:>13.2f} {args.runs / duration:>9.1f} {failed:>7} {leaked:>12}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark time taken to create and validate the steps of a large check.
+
+A check is generated with the given number of steps, and the steps are built and
+validated, as they are when the check is created. For each run of the check, the
+supported clients are determined (as they are when scheduling the run) and the steps
+of the run are created. Building the step tree from the step config each time is
+compared against using the cached step plan.
+
+Usage:
+    python scripts/benchmarks/step_plan.py [--steps 500] [--check-runs 10] [--runs 5]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+sys.path.append('.')
+
+from jmon.client_type import ClientType
+from jmon.step_plan import StepPlanCache
+import jmon.steps.root_step
+
+
+CLIENTS = [ClientType.BROWSER_FIREFOX, ClientType.BROWSER_CHROME, ClientType.REQUESTS]
+
+
+def generate_steps(step_count: int) -> list:
+    """Generate steps config containing approximately the given number of steps"""
+    steps = []
+    itx = 0
+    # Each group contains 5 steps
+    while itx * 5 < step_count:
+        steps.append({"goto": f"https://example.com/{itx}"})
+        steps.append({"find": [{"id": f"item-{itx}"}, {"actions": ["click"]}]})
+        steps.append({"check": {"title": f"Item {itx}"}})
+        itx += 1
+    return steps
+
+
+def count_steps(step) -> int:
+    """Count child steps of step"""
+    return sum([count_steps(child) + 1 for child in step.get_child_steps()])
+
+
+def run_uncached(steps: list, check_runs: int) -> float:
+    """Build steps from config for validation and each run, returning duration"""
+    start_time = time.perf_counter()
+    jmon.steps.root_step.RootStep(run=None, config=steps, parent=None).validate_steps()
+    for _ in range(check_runs):
+        jmon.steps.root_step.RootStep(run=None, config=steps, parent=None).get_supported_clients(CLIENTS)
+        count_steps(jmon.steps.root_step.RootStep(run=None, config=steps, parent=None))
+    return time.perf_counter() - start_time
+
+
+def run_cached(steps: list, check_runs: int) -> float:
+    """Build steps from step plan for validation and each run, returning duration"""
+    StepPlanCache.clear()
+    serialised_steps = json.dumps(steps).encode('utf-8')
+
+    start_time = time.perf_counter()
+    StepPlanCache.get_root_plan(serialised_steps).create_step(run=None, parent=None).validate_steps()
+    for _ in range(check_runs):
+        StepPlanCache.get_root_plan(serialised_steps).get_supported_clients(CLIENTS)
+        count_steps(StepPlanCache.get_root_plan(serialised_steps).create_step(run=None, parent=None))
+    return time.perf_counter() - start_time
+
+
+def summarise(name, durations):
+    """Print summary of durations"""
+    print(f"{name:>22}: mean={statistics.mean(durations) * 1000:.1f}ms min={min(durations) * 1000:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=500, help="Number of steps in check")
+    parser.add_argument("--check-runs", type=int, default=10, help="Number of runs of the check")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs")
+    args = parser.parse_args()
+
+    steps = generate_steps(args.steps)
+    step_count = StepPlanCache.get_root_plan(json.dumps(steps).encode('utf-8')).step_count
+
+    print(f"Steps: {step_count}, check runs: {args.check_runs}")
+    summarise("build from config", [run_uncached(steps, args.check_runs) for _ in range(args.runs)])
+    summarise("cached step plan", [run_cached(steps, args.check_runs) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark time taken to inject variables into goto steps with large templated JSON bodies.
+
+Templates are compiled once for a goto config with a JSON body containing the given
+number of templated items, as they are by the step plan of a check. For each run, templates
+are created re-using the compiled templates, as they are when the steps of a run are created,
+and the URL, headers and body are rendered several times (e.g. for the description, logging and retries).
+The time is compared against formatting each string of the config on every access.
+
+Usage:
+    python scripts/benchmarks/templates.py [--items 5000] [--accesses 5] [--runs 5]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+sys.path.append('.')
+
+from jmon.template import CompiledTemplate
+
+
+def generate_config(item_count: int) -> dict:
+    """Generate goto config, with JSON body containing templated items"""
+    return {
+        "url": "https://example.com/api/{tenant}/search",
+        "method": "post",
+        "headers": {"Authorization": "Bearer {token}", "Content-Type": "application/json"},
+        "json": {
+            "tenant": "{tenant}",
+            "items": [
+                {
+                    "id": itx,
+                    "name": f"item-{itx}-{{tenant}}",
+                    "tags": ["static", "{token}", f"tag-{itx}"],
+                    "description": "x" * 100,
+                }
+                for itx in range(item_count)
+            ],
+        },
+    }
+
+
+def inject_variables_baseline(structure, variables: dict):
+    """Inject variables by formatting each string of the structure"""
+    if type(structure) is str:
+        try:
+            return structure.format(**variables)
+        except KeyError:
+            return structure
+    elif type(structure) is dict:
+        return {key_: inject_variables_baseline(value_, variables) for key_, value_ in structure.items()}
+    elif type(structure) is list:
+        return [inject_variables_baseline(value_, variables) for value_ in structure]
+    return structure
+
+
+def run_baseline(config: dict, variables: dict, accesses: int) -> float:
+    """Format URL, headers and JSON body on every access, returning duration"""
+    start_time = time.perf_counter()
+    for _ in range(accesses):
+        inject_variables_baseline(config["url"], variables)
+        inject_variables_baseline(config["headers"], variables)
+        inject_variables_baseline(config["json"], variables)
+    return time.perf_counter() - start_time
+
+
+def compile_templates(config: dict) -> list:
+    """Compile templates of URL, headers and JSON body, as done by step plan"""
+    return [CompiledTemplate(config[key_]).compile() for key_ in ["url", "headers", "json"]]
+
+
+def run_compiled(compiled_templates: list, variables: dict, accesses: int) -> float:
+    """Create templates from compiled templates and render URL, headers and JSON body on every access, returning duration"""
+    start_time = time.perf_counter()
+    templates = []
+    for compiled_template in compiled_templates:
+        template = CompiledTemplate(compiled_template.source)
+        template.use_compiled(compiled_template)
+        templates.append(template)
+    for _ in range(accesses):
+        for template in templates:
+            template.render(variables, version=1)
+    return time.perf_counter() - start_time
+
+
+def summarise(name, durations):
+    """Print summary of durations"""
+    print(f"{name:>22}: mean={statistics.mean(durations) * 1000:.1f}ms min={min(durations) * 1000:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=5000, help="Number of items in JSON body")
+    parser.add_argument("--accesses", type=int, default=5, help="Number of accesses of request arguments per run")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs")
+    args = parser.parse_args()
+
+    config = generate_config(args.items)
+    variables = {"tenant": "benchmark", "token": "secret-token"}
+
+    print(f"JSON items: {args.items}, accesses per run: {args.accesses}")
+    summarise("format per access", [run_baseline(config, variables, args.accesses) for _ in range(args.runs)])
+    compiled_templates = compile_templates(config)
+    summarise("compiled templates", [run_compiled(compiled_templates, variables, args.accesses) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
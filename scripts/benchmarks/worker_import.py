@@ -0,0 +1,74 @@
+"""
+Benchmark import time and memory usage of worker entry points.
+
+Compares the full worker (jmon.worker), which loads the browser stack,
+with the requests-only worker (jmon.requests_worker).
+
+Usage:
+    python scripts/benchmarks/worker_import.py [--iterations 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+sys.path.append('.')
+
+
+WORKER_MODULES = ["jmon.requests_worker", "jmon.worker"]
+
+# Script executed in a fresh interpreter for each measurement
+MEASURE_SCRIPT = """
+import json
+import resource
+import sys
+import time
+
+start_time = time.perf_counter()
+import {module}
+import_time = time.perf_counter() - start_time
+
+with open("/proc/self/status") as status_fh:
+    rss_kb = int([line for line in status_fh if line.startswith("VmRSS:")][0].split()[1])
+
+print(json.dumps({{
+    "import_time": import_time,
+    "rss_mb": rss_kb / 1024,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "module_count": len(sys.modules),
+}}))
+"""
+
+
+def measure(module):
+    """Import module in a new interpreter and return measurements"""
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5, help="Number of imports to measure per worker")
+    args = parser.parse_args()
+
+    print(f"{'Worker':<22} {'Import time (ms)':>18} {'RSS (MB)':>10} {'Max RSS (MB)':>14} {'Modules':>9}")
+    for module in WORKER_MODULES:
+        results = [measure(module) for _ in range(args.iterations)]
+        print(
+            f"{module:<22} "
+            f"{statistics.median([r['import_time'] for r in results]) * 1000:>18.1f} "
+            f"{statistics.median([r['rss_mb'] for r in results]):>10.1f} "
+            f"{statistics.median([r['max_rss_mb'] for r in results]):>14.1f} "
+            f"{results[0]['module_count']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ from selenium.webdriver.common.by import By
 from pyvirtualdisplay import display
 
 from jmon.client_type import ClientType
-from jmon.runner import BrowserFactory
+from jmon.browser import BrowserFactory
 import jmon.models.check
 
 
@@ -0,0 +1,159 @@
+
+import http.server
+import threading
+
+from pyvirtualdisplay import display
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+
+from jmon.client_type import ClientType
+from jmon.browser import BrowserFactory
+from test.e2e import EndToEndBaseTest
+
+
+SEED_PAGE = """
+<html>
+<head><title>loading</title></head>
+<body>
+<script>
+(async () => {
+    document.cookie = "jmon_test=1; max-age=3600";
+    window.localStorage.setItem("jmon_test", "1");
+    window.sessionStorage.setItem("jmon_test", "1");
+    await new Promise((resolve, reject) => {
+        const request = window.indexedDB.open("jmon-test", 1);
+        request.onupgradeneeded = () => request.result.createObjectStore("store");
+        request.onsuccess = () => { request.result.close(); resolve(); };
+        request.onerror = reject;
+    });
+    const cache = await window.caches.open("jmon-test");
+    await cache.put("/cached", new Response("cached"));
+    await navigator.serviceWorker.register("/sw.js");
+    await navigator.serviceWorker.ready;
+    document.title = "seeded";
+})();
+</script>
+</body>
+</html>
+"""
+
+EMPTY_PAGE = "<html><head><title>empty</title></head><body></body></html>"
+
+SERVICE_WORKER = "self.addEventListener('fetch', () => {});"
+
+# Obtain state of all storage types for the current origin
+INSPECT_STORAGE_SCRIPT = """
+const done = arguments[arguments.length - 1];
+(async () => {
+    const indexedDbStores = await new Promise((resolve) => {
+        const request = window.indexedDB.open("jmon-test");
+        request.onsuccess = () => {
+            const stores = request.result.objectStoreNames.length;
+            request.result.close();
+            resolve(stores);
+        };
+        request.onerror = () => resolve(-1);
+    });
+    done({
+        cookies: document.cookie,
+        local_storage: window.localStorage.length,
+        session_storage: window.sessionStorage.length,
+        indexed_db: indexedDbStores,
+        cache_storage: await window.caches.keys(),
+        service_workers: (await navigator.serviceWorker.getRegistrations()).length,
+    });
+})();
+"""
+
+
+class StorageRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serve pages for seeding and inspecting browser storage"""
+
+    def do_GET(self):
+        """Return page for path"""
+        content_type = "text/html"
+        if self.path == "/sw.js":
+            content = SERVICE_WORKER
+            content_type = "application/javascript"
+        elif self.path == "/empty":
+            content = EMPTY_PAGE
+        else:
+            content = SEED_PAGE
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.end_headers()
+        self.wfile.write(content.encode("utf-8"))
+
+    def log_message(self, format, *args):
+        """Disable request logging"""
+        pass
+
+
+class TestBrowserClean(EndToEndBaseTest):
+    """Test cleaning of cached browsers between runs"""
+
+    @classmethod
+    def setup_class(cls):
+        """Create display and start web server"""
+        EndToEndBaseTest.setup_class()
+        cls._display = display.Display(visible=False)
+        cls._display.start()
+
+        cls._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StorageRequestHandler)
+        cls._server_thread = threading.Thread(target=cls._server.serve_forever, daemon=True)
+        cls._server_thread.start()
+        # Use localhost, as it is treated as a secure context, allowing service workers
+        cls._base_url = f"http://localhost:{cls._server.server_address[1]}"
+
+    @classmethod
+    def teardown_class(cls):
+        """Stop web server and display"""
+        cls._server.shutdown()
+        cls._display.stop()
+
+    def teardown_method(self, method):
+        """Teardown browsers"""
+        BrowserFactory.get().teardown()
+        return super().teardown_method(method)
+
+    def _seed_window(self, selenium_instance):
+        """Load seeding page and wait for all storage to be populated"""
+        selenium_instance.get(f"{self._base_url}/")
+        WebDriverWait(selenium_instance, 10).until(lambda driver: driver.title == "seeded")
+
+    @pytest.mark.parametrize("client_type", [ClientType.BROWSER_FIREFOX, ClientType.BROWSER_CHROME])
+    def test_clean_clears_all_storage(self, client_type):
+        """Seed all storage types and ensure they are empty after cleaning browser"""
+        browser = BrowserFactory.get().get_browser(client_type)
+        selenium_instance = browser.selenium_instance
+
+        self._seed_window(selenium_instance)
+        # Seed an additional window
+        selenium_instance.switch_to.new_window("window")
+        self._seed_window(selenium_instance)
+
+        # Ensure storage has been seeded
+        storage = selenium_instance.execute_async_script(INSPECT_STORAGE_SCRIPT)
+        assert storage["cookies"] == "jmon_test=1"
+        assert storage["local_storage"] == 1
+        assert storage["session_storage"] == 1
+        assert storage["indexed_db"] == 1
+        assert storage["cache_storage"] == ["jmon-test"]
+        assert storage["service_workers"] == 1
+        assert len(selenium_instance.window_handles) == 2
+
+        browser.clean()
+
+        assert len(selenium_instance.window_handles) == 1
+
+        selenium_instance.get(f"{self._base_url}/empty")
+        storage = selenium_instance.execute_async_script(INSPECT_STORAGE_SCRIPT)
+        assert storage == {
+            "cookies": "",
+            "local_storage": 0,
+            "session_storage": 0,
+            "indexed_db": 0,
+            "cache_storage": [],
+            "service_workers": 0,
+        }
@@ -0,0 +1,49 @@
+
+from jmon.api.run_step_graph_data import GraphGenerator
+
+
+def get_step_data(duration, children=None, status="SUCCESS"):
+    """Return step data of step"""
+    return {
+        "name": "GoTo",
+        "description": "Going to URL",
+        "status": status,
+        "duration": duration,
+        "children": children or [],
+    }
+
+
+def get_node_colors(graph_data):
+    """Return background colour of step nodes, keyed by node ID"""
+    return {
+        node["id"]: node["style"]["backgroundColor"]
+        for node in graph_data["nodes"]
+        if node["id"].startswith("s")
+    }
+
+
+def test_color_by_status():
+    """Test nodes are coloured by status by default"""
+    graph_data = GraphGenerator([get_step_data(1), get_step_data(2, status="FAILED")]).generate_graph_data()
+
+    assert get_node_colors(graph_data) == {
+        "s1": "rgba(60, 201, 122, 0.4)",
+        "s2": "rgba(243, 92, 79, 0.4)",
+    }
+
+
+def test_color_by_duration():
+    """Test nodes are coloured by duration, relative to the slowest step"""
+    graph_data = GraphGenerator(
+        [get_step_data(4, children=[get_step_data(0), get_step_data(2)]), get_step_data(None)],
+        color_by=GraphGenerator.COLOR_BY_DURATION
+    ).generate_graph_data()
+
+    assert get_node_colors(graph_data) == {
+        "s1": "rgba(243, 92, 79, 0.4)",
+        "s1.1": "rgba(60, 201, 122, 0.4)",
+        "s1.2": "rgba(152, 146, 100, 0.4)",
+        # Steps that have not been executed
+        "s2": "rgba(192, 192, 192, 0.4)",
+    }
+    assert [node["data"]["duration"] for node in graph_data["nodes"] if node["id"].startswith("s")] == [4, 0, 2, None]
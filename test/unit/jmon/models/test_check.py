@@ -0,0 +1,62 @@
+
+import unittest.mock
+
+import pytest
+
+from jmon.client_type import ClientType
+from jmon.models.check import Check
+from jmon.step_plan import StepPlanCache
+
+
+@pytest.fixture
+def check():
+    """Return check, which is not stored in the database"""
+    check = Check(name="test-check")
+    check.steps = [{"goto": "https://example.com/"}, {"check": {"response": 200}}]
+    check.client = None
+    return check
+
+
+class TestCheckMetadata:
+
+    def test_update_metadata(self, check):
+        """Test metadata derived from steps is stored"""
+        check.update_metadata()
+
+        assert check.step_count == 3
+        assert check.has_valid_metadata is True
+
+        with unittest.mock.patch.object(StepPlanCache, 'get_root_plan') as mock_get_root_plan:
+            assert check.get_step_count() == 3
+            assert check.get_supported_clients() == [ClientType.REQUESTS]
+            assert check.task_headers == {"requests": "true"}
+
+        # Steps are not evaluated when metadata is valid
+        mock_get_root_plan.assert_not_called()
+
+    @pytest.mark.parametrize('modify', [
+        lambda check: setattr(check, 'steps', [{"goto": "https://example.com/"}]),
+        lambda check: setattr(check, 'client', ClientType.BROWSER_FIREFOX),
+        lambda check: setattr(check, 'METADATA_VERSION', Check.METADATA_VERSION + 1),
+    ])
+    def test_metadata_invalidated(self, check, modify):
+        """Test stored metadata is not used once check definition changes"""
+        check.update_metadata()
+        modify(check)
+
+        assert check.has_valid_metadata is False
+        assert check.get_step_count() == check.get_step_plan().step_count
+
+    def test_no_metadata(self, check):
+        """Test metadata is derived from steps for checks without stored metadata"""
+        assert check.has_valid_metadata is False
+        assert check.get_step_count() == 3
+        assert check.get_supported_clients() == [ClientType.REQUESTS]
+
+    def test_no_supported_clients(self, check):
+        """Test task headers for check without any supported clients"""
+        check.client = ClientType.BROWSER_FIREFOX
+        check.update_metadata()
+
+        assert check.get_supported_clients() == []
+        assert check.task_headers is None
@@ -0,0 +1,143 @@
+import unittest.mock
+
+import selenium.common.exceptions
+import pytest
+
+import jmon.page_load
+import jmon.step_state
+import jmon.step_status
+import jmon.steps
+from jmon.page_load import PageLoadStrategy
+from test.unit.jmon.steps.fixtures import mock_run, mock_logger
+
+
+class MockBrowser:
+    """
+    Mock selenium instance, containing a login page with a link to a welcome page.
+
+    When the session does not wait for page loads, the previous document remains
+    present for several polls of the document state after the link is clicked.
+    """
+
+    PAGES = {
+        "https://example.com/login": ["login"],
+        "https://example.com/welcome": ["welcome"],
+    }
+
+    def __init__(self, waits_for_page_load):
+        """Setup browser on login page"""
+        self._waits_for_page_load = waits_for_page_load
+        self.url = "https://example.com/login"
+        # Document states returned whilst navigation is in progress
+        self._pending_states = []
+        self.execute_script = unittest.mock.MagicMock(side_effect=self._execute_script)
+        self.find_element = unittest.mock.MagicMock(side_effect=self._find_element)
+
+    def _navigate(self, url):
+        """Navigate to URL, returning after the navigation has started"""
+        if self._waits_for_page_load:
+            self.url = url
+            return
+
+        self._pending_states = [
+            [False, "complete", self.url, True],
+            [False, "complete", self.url, True],
+            [True, "loading", url, False],
+            [True, "complete", url, False],
+        ]
+        self._pending_url = url
+
+    def _execute_script(self, script, *args):
+        """Return document state, completing navigation once the new document has been returned"""
+        if script == jmon.page_load._GET_DOCUMENT_STATE_SCRIPT:
+            if not self._pending_states:
+                return [False, "complete", self.url, False]
+            state = self._pending_states.pop(0)
+            if state[0]:
+                self.url = self._pending_url
+            return state
+        return None
+
+    def _find_element(self, by_type, value):
+        """Find element of current page"""
+        if value not in self.PAGES[self.url]:
+            raise selenium.common.exceptions.NoSuchElementException(f"Unable to locate element: {value}")
+
+        element = unittest.mock.MagicMock()
+        if value == "login":
+            element.click.side_effect = lambda: self._navigate("https://example.com/welcome")
+        return element
+
+
+class TestClickAction:
+
+    @pytest.mark.parametrize('session_page_load_strategy', [
+        PageLoadStrategy.NORMAL,
+        PageLoadStrategy.EAGER,
+        PageLoadStrategy.NONE,
+    ])
+    def test_click_navigation(self, session_page_load_strategy, mock_run, mock_logger):
+        """Test steps following a click that navigates are performed against the new page"""
+        browser = MockBrowser(waits_for_page_load=session_page_load_strategy is PageLoadStrategy.NORMAL)
+        root_step = jmon.steps.RootStep(run=mock_run, config=[
+            {"find": [{"id": "login"}, {"actions": ["click"]}]},
+            {"find": [{"id": "welcome"}]},
+        ], parent=None, run_logger=mock_logger)
+        state = jmon.step_state.SeleniumStepState(
+            selenium_instance=browser, element=browser,
+            page_load_strategy=PageLoadStrategy.NORMAL,
+            session_page_load_strategy=session_page_load_strategy
+        )
+
+        with unittest.mock.patch('jmon.page_load.POLL_INTERVAL', 0):
+            status = root_step.execute(execution_method="execute_selenium", state=state)
+
+        assert status is jmon.step_status.StepStatus.SUCCESS
+        # Welcome element is found on the first attempt, as the new page has loaded
+        assert [call.args[1] for call in browser.find_element.call_args_list] == ["login", "welcome"]
+
+        if session_page_load_strategy is PageLoadStrategy.NORMAL:
+            # Webdriver waits for navigation, so the document state is not polled
+            browser.execute_script.assert_not_called()
+
+    def test_click_without_navigation(self, mock_run, mock_logger):
+        """Test click that does not navigate does not wait for a new document"""
+        browser = MockBrowser(waits_for_page_load=False)
+        root_step = jmon.steps.RootStep(run=mock_run, config=[
+            {"find": [{"id": "login"}, {"actions": ["click"]}]},
+        ], parent=None, run_logger=mock_logger)
+        state = jmon.step_state.SeleniumStepState(
+            selenium_instance=browser, element=browser,
+            session_page_load_strategy=PageLoadStrategy.EAGER
+        )
+
+        with unittest.mock.patch.object(browser, '_navigate'):
+            status = root_step.execute(execution_method="execute_selenium", state=state)
+
+        assert status is jmon.step_status.StepStatus.SUCCESS
+        # Document is marked and its state is checked once
+        assert [call.args[0] for call in browser.execute_script.call_args_list] == [
+            jmon.page_load._MARK_DOCUMENT_SCRIPT, jmon.page_load._GET_DOCUMENT_STATE_SCRIPT
+        ]
+
+    def test_click_alert(self, mock_run, mock_logger):
+        """Test click causing an alert does not wait for the page to load until the timeout"""
+        browser = MockBrowser(waits_for_page_load=False)
+        root_step = jmon.steps.RootStep(run=mock_run, config=[
+            {"find": [{"id": "login"}, {"actions": ["click"]}]},
+        ], parent=None, run_logger=mock_logger)
+        state = jmon.step_state.SeleniumStepState(
+            selenium_instance=browser, element=browser,
+            session_page_load_strategy=PageLoadStrategy.EAGER
+        )
+
+        def execute_script(script, *args):
+            if script == jmon.page_load._GET_DOCUMENT_STATE_SCRIPT:
+                raise selenium.common.exceptions.UnexpectedAlertPresentException("Alert")
+        browser.execute_script.side_effect = execute_script
+
+        with unittest.mock.patch.object(browser, '_navigate'):
+            status = root_step.execute(execution_method="execute_selenium", state=state)
+
+        assert status is jmon.step_status.StepStatus.SUCCESS
+        assert browser.execute_script.call_count == 2
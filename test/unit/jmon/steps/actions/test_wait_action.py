@@ -11,6 +11,8 @@ import jmon.steps.actions
 import jmon.errors
 import jmon.client_type
 import jmon.run_logger
+from jmon.deadline import Deadline
+import jmon.wait_engine
 from test.unit.jmon.steps.fixtures import mock_run, mock_logger, mock_root_step
 
 
@@ -82,18 +84,15 @@ class TestJsonCheck:
             with pytest.raises(NotImplementedError):
                 step.execute_requests(state=mock_state)
 
-    @pytest.mark.parametrize('config, method, expected_timeout', [
-        ({"type": "visible"}, "visibility_of", 60),
-        ({"type": "clickable"}, "element_to_be_clickable", 60),
-        ({"type": "visible", "timeout": 51}, "visibility_of", 51),
+    @pytest.mark.parametrize('config, expected_condition, expected_timeout', [
+        ({"type": "visible"}, jmon.wait_engine.WaitCondition.VISIBLE, 60),
+        ({"type": "clickable"}, jmon.wait_engine.WaitCondition.CLICKABLE, 60),
+        ({"type": "visible", "timeout": 51}, jmon.wait_engine.WaitCondition.VISIBLE, 51),
     ])
-    def test_execution_selenium(self, config, method, expected_timeout, mock_run, mock_root_step, mock_logger, get_wait_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
+    def test_execution_selenium(self, config, expected_condition, expected_timeout, mock_run, mock_root_step, mock_logger, get_wait_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
         """Test execution selenium"""
-        with unittest.mock.patch(f"selenium.webdriver.support.expected_conditions.{method}", unittest.mock.MagicMock()) as MockUntilMethod, \
-                unittest.mock.patch("selenium.webdriver.support.wait.WebDriverWait", unittest.mock.MagicMock()) as MockDriverWait:
-    
-            until_response = object()
-            MockUntilMethod.return_value = until_response
+        with unittest.mock.patch("jmon.steps.actions.wait_action.wait_for_condition", unittest.mock.MagicMock()) as mock_wait_for_condition:
+            mock_wait_for_condition.return_value = jmon.wait_engine.WaitResult(satisfied=True, actual=None)
 
             step = get_wait_step(config)
             mock_selenium_instance = unittest.mock.MagicMock()
@@ -102,45 +101,35 @@ class TestJsonCheck:
             mock_state.selenium_instance = mock_selenium_instance
             mock_state.element = mock_element
 
-            mock_wait_instance = unittest.mock.MagicMock()
-            mock_wait_instance.until = unittest.mock.MagicMock()
-            MockDriverWait.return_value = mock_wait_instance
-
             step.execute(execution_method="execute_selenium", state=mock_state)
 
-            MockUntilMethod.assert_called_once_with(mock_element)
-            MockDriverWait.assert_called_once_with(mock_selenium_instance, expected_timeout)
-            mock_wait_instance.until.assert_called_once_with(until_response)
+            mock_wait_for_condition.assert_called_once_with(
+                mock_selenium_instance, expected_condition,
+                timeout=expected_timeout, element=mock_element
+            )
 
             assert step._status is jmon.step_status.StepStatus.SUCCESS
 
+    def test_execution_selenium_limited_by_run(self, mock_run, mock_root_step, mock_logger, get_wait_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
+        """Test wait timeout is limited by remaining run time"""
+        mock_run.deadline = Deadline(10)
+        with unittest.mock.patch("jmon.steps.actions.wait_action.wait_for_condition", unittest.mock.MagicMock()) as mock_wait_for_condition:
+            mock_wait_for_condition.return_value = jmon.wait_engine.WaitResult(satisfied=True, actual=None)
+
+            step = get_wait_step({"type": "visible"})
+            step.execute(execution_method="execute_selenium", state=unittest.mock.MagicMock())
+
+            assert mock_wait_for_condition.call_args.kwargs["timeout"] == pytest.approx(10, abs=1)
+
     def test_execution_selenium_timeout(self, mock_run, mock_root_step, mock_logger, get_wait_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
         """Test execution selenium with timeout"""
-        with unittest.mock.patch(f"selenium.webdriver.support.expected_conditions.visibility_of", unittest.mock.MagicMock()) as MockUntilMethod, \
-                unittest.mock.patch("selenium.webdriver.support.wait.WebDriverWait", unittest.mock.MagicMock()) as MockDriverWait:
-    
-            until_response = object()
-            MockUntilMethod.return_value = until_response
+        with unittest.mock.patch("jmon.steps.actions.wait_action.wait_for_condition", unittest.mock.MagicMock()) as mock_wait_for_condition:
+            mock_wait_for_condition.return_value = jmon.wait_engine.WaitResult(satisfied=False, actual=None)
 
             step = get_wait_step({"type": "visible"})
-            mock_selenium_instance = unittest.mock.MagicMock()
-            mock_element = unittest.mock.MagicMock()
             mock_state = unittest.mock.MagicMock()
-            mock_state.selenium_instance = mock_selenium_instance
-            mock_state.element = mock_element
-
-            mock_wait_instance = unittest.mock.MagicMock()
-            mock_until = unittest.mock.MagicMock(side_effect=selenium.common.exceptions.TimeoutException())
-            mock_wait_instance.until = mock_until
-            
-            MockDriverWait.return_value = mock_wait_instance
 
             step.execute(execution_method="execute_selenium", state=mock_state)
 
-            MockUntilMethod.assert_called_once_with(mock_element)
-            MockDriverWait.assert_called_once_with(mock_selenium_instance, 60)
-            mock_wait_instance.until.assert_called_once_with(until_response)
-
-
             assert 'Root -> Wait: Timeout ocurred before wait completed' in mock_logger.read_log_stream()
             assert step._status is jmon.step_status.StepStatus.FAILED
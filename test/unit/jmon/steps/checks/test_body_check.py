@@ -5,13 +5,15 @@ import unittest.mock
 import pytest
 import requests.exceptions
 
+import jmon.response_body
+import jmon.step_state
 import jmon.step_status
 import jmon.steps
 import jmon.steps.checks
 import jmon.errors
 import jmon.client_type
 import jmon.run_logger
-from test.unit.jmon.steps.fixtures import mock_run, mock_logger, mock_root_step
+from test.unit.jmon.steps.fixtures import create_response, mock_run, mock_logger, mock_root_step
 
 
 @pytest.fixture
@@ -83,8 +85,7 @@ class TestBodyCheck:
     def test_execution_requests_mismatch(self, config, body_response, mock_run, mock_root_step, mock_logger, get_body_step: Callable[[Any], 'jmon.steps.checks.BodyCheck']):
         """Test execution requests"""
         step = get_body_step(config)
-        mock_state = unittest.mock.MagicMock()
-        mock_state.response.content = body_response
+        mock_state = jmon.step_state.RequestsStepState(response=create_response(body_response.encode()), dns_response=None)
 
         step.execute(execution_method="execute_requests", state=mock_state)
         assert 'Root -> CheckBody: Step failed' in mock_logger.read_log_stream()
@@ -98,8 +99,7 @@ class TestBodyCheck:
     def test_execution_requests_match(self, config, body_response, mock_run, mock_root_step, mock_logger, get_body_step: Callable[[Any], 'jmon.steps.checks.BodyCheck']):
         """Test execution requests with valid match"""
         step = get_body_step(config)
-        mock_state = unittest.mock.MagicMock()
-        mock_state.response.content = body_response
+        mock_state = jmon.step_state.RequestsStepState(response=create_response(body_response.encode()), dns_response=None)
 
         step.execute(execution_method="execute_requests", state=mock_state)
         assert mock_logger.read_log_stream() == ''
@@ -108,8 +108,7 @@ class TestBodyCheck:
     def test_execution_requests_mismatch_error_log(self, mock_run, mock_root_step, mock_logger, get_body_step: Callable[[Any], 'jmon.steps.checks.BodyCheck']):
         """Test execution requests error log after failure"""
         step = get_body_step({"contains": "does_not_exist"})
-        mock_state = unittest.mock.MagicMock()
-        mock_state.response.content = "Different response"
+        mock_state = jmon.step_state.RequestsStepState(response=create_response(b"Different response"), dns_response=None)
 
         step.execute(execution_method="execute_requests", state=mock_state)
         assert mock_logger.read_log_stream() == '\n'.join([
@@ -131,3 +130,30 @@ class TestBodyCheck:
             'Root -> CheckBody: This step requires a request to have been made\n',
         ])
         assert step._status is jmon.step_status.StepStatus.FAILED
+
+    def test_execution_requests_stream_contains(self, mock_run, mock_root_step, mock_logger, get_body_step: Callable[[Any], 'jmon.steps.checks.BodyCheck']):
+        """Test contains check of streamed response stops reading once value is found"""
+        step = get_body_step({"contains": "needle"})
+        response = create_response(b"needle" + b"x" * 1024 * 1024, stream=True)
+        mock_state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
+        mock_state.set_response(response, max_body_size=2 * 1024 * 1024)
+
+        step.execute(execution_method="execute_requests", state=mock_state)
+        assert mock_logger.read_log_stream() == ''
+        assert step._status is jmon.step_status.StepStatus.SUCCESS
+        # Only first chunk has been read from the response
+        assert response.raw.tell() == jmon.response_body.ResponseBody.CHUNK_SIZE
+
+    def test_execution_requests_stream_equals_too_large(self, mock_run, mock_root_step, mock_logger, get_body_step: Callable[[Any], 'jmon.steps.checks.BodyCheck']):
+        """Test equals check of streamed response that exceeds the max body size"""
+        step = get_body_step({"equals": "Short body"})
+        mock_state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
+        mock_state.set_response(create_response(b"Longer body than max", stream=True), max_body_size=10)
+
+        step.execute(execution_method="execute_requests", state=mock_state)
+        assert mock_logger.read_log_stream() == '\n'.join([
+            'Root -> CheckBody: Step failed',
+            "Root -> CheckBody: body match failed: Response body exceeds maximum body size of 10 bytes",
+            "Full body: Longer bod\n"
+        ])
+        assert step._status is jmon.step_status.StepStatus.FAILED
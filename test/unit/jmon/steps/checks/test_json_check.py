@@ -2,16 +2,19 @@
 from typing import Any, Callable
 import unittest.mock
 
+import json
+
 import pytest
 import requests.exceptions
 
+import jmon.step_state
 import jmon.step_status
 import jmon.steps
 import jmon.steps.checks
 import jmon.errors
 import jmon.client_type
 import jmon.run_logger
-from test.unit.jmon.steps.fixtures import mock_run, mock_logger, mock_root_step
+from test.unit.jmon.steps.fixtures import create_response, mock_run, mock_logger, mock_root_step
 
 
 @pytest.fixture
@@ -81,8 +84,7 @@ class TestJsonCheck:
     def test_execution_requests_mismatch(self, config, json_response, mock_run, mock_root_step, mock_logger, get_json_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
         """Test execution requests"""
         step = get_json_step(config)
-        mock_state = unittest.mock.MagicMock()
-        mock_state.response.json.return_value = json_response
+        mock_state = jmon.step_state.RequestsStepState(response=create_response(json.dumps(json_response).encode()), dns_response=None)
 
         step.execute(execution_method="execute_requests", state=mock_state)
         assert 'Root -> CheckJson: Step failed' in mock_logger.read_log_stream()
@@ -112,8 +114,7 @@ class TestJsonCheck:
     def test_execution_requests_match(self, config, json_response, mock_run, mock_root_step, mock_logger, get_json_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
         """Test execution requests with valid match"""
         step = get_json_step(config)
-        mock_state = unittest.mock.MagicMock()
-        mock_state.response.json.return_value = json_response
+        mock_state = jmon.step_state.RequestsStepState(response=create_response(json.dumps(json_response).encode()), dns_response=None)
 
         step.execute(execution_method="execute_requests", state=mock_state)
         assert mock_logger.read_log_stream() == ''
@@ -122,8 +123,7 @@ class TestJsonCheck:
     def test_execution_requests_mismatch_error_log(self, mock_run, mock_root_step, mock_logger, get_json_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
         """Test execution requests error log after failure"""
         step = get_json_step({"contains": "does_not_exist"})
-        mock_state = unittest.mock.MagicMock()
-        mock_state.response.json.return_value = ["first", "some_value", "other"]
+        mock_state = jmon.step_state.RequestsStepState(response=create_response(b'["first", "some_value", "other"]'), dns_response=None)
 
         step.execute(execution_method="execute_requests", state=mock_state)
         assert mock_logger.read_log_stream() == '\n'.join([
@@ -136,8 +136,7 @@ class TestJsonCheck:
     def test_execution_requests_mismatch_error_log_with_selector(self, mock_run, mock_root_step, mock_logger, get_json_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
         """Test execution requests error log after failure with selector"""
         step = get_json_step({"contains": "does_not_exist", "selector": "$.doesnotexist"})
-        mock_state = unittest.mock.MagicMock()
-        mock_state.response.json.return_value = ["first", "some_value", "other"]
+        mock_state = jmon.step_state.RequestsStepState(response=create_response(b'["first", "some_value", "other"]'), dns_response=None)
 
         step.execute(execution_method="execute_requests", state=mock_state)
         assert mock_logger.read_log_stream() == '\n'.join([
@@ -147,6 +146,23 @@ class TestJsonCheck:
         ])
         assert step._status is jmon.step_status.StepStatus.FAILED
 
+    @pytest.mark.parametrize('config', [
+        {"equals": "does_not_exist"},
+        {"contains": "does_not_exist"},
+    ])
+    def test_execution_requests_mismatch_error_log_truncated(self, config, mock_run, mock_root_step, mock_logger, get_json_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
+        """Test large values are truncated in error log after failure"""
+        step = get_json_step(config)
+        body = json.dumps([f"item-{itx}" for itx in range(20000)]).encode("utf-8")
+        mock_state = jmon.step_state.RequestsStepState(response=create_response(body), dns_response=None)
+
+        step.execute(execution_method="execute_requests", state=mock_state)
+        log = mock_logger.read_log_stream()
+        assert len(body) > 200000
+        assert len(log) < 3000
+        assert log.count("... (truncated)") == 2
+        assert step._status is jmon.step_status.StepStatus.FAILED
+
     def test_execution_requests_no_state(self, mock_run, mock_root_step, mock_logger, get_json_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
         """Test execution requests without response state"""
         step = get_json_step({"equals": "value"})
@@ -163,9 +179,7 @@ class TestJsonCheck:
     def test_execution_requests_invalid_json(self, mock_run, mock_root_step, mock_logger, get_json_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
         """Test execution requests with invalid JSON response"""
         step = get_json_step({"contains": "value"})
-        mock_state = unittest.mock.MagicMock()
-        mock_state.response.json.side_effect = requests.exceptions.JSONDecodeError("Invalid JSON", "test doc", 1)
-        mock_state.response.content = "Example Non-JSON response"
+        mock_state = jmon.step_state.RequestsStepState(response=create_response(b"Example Non-JSON response"), dns_response=None)
 
         step.execute(execution_method="execute_requests", state=mock_state)
         assert mock_logger.read_log_stream() == '\n'.join([
@@ -174,3 +188,65 @@ class TestJsonCheck:
             "Full response: Example Non-JSON response\n"
         ])
         assert step._status is jmon.step_status.StepStatus.FAILED
+
+    def test_response_parsed_once_for_sibling_checks(self, mock_run, mock_root_step, mock_logger):
+        """Test JSON body is parsed once and shared between sibling checks"""
+        check_step = jmon.steps.CheckStep(
+            parent=mock_root_step,
+            config={"json": {"selector": "$.id", "equals": 1}},
+            run=mock_run, run_logger=mock_logger
+        )
+        state = jmon.step_state.RequestsStepState(response=create_response(b'{"id": 1, "name": "test"}'), dns_response=None)
+
+        with unittest.mock.patch('json.loads', wraps=json.loads) as mock_loads:
+            for _ in range(3):
+                child_state = state.clone_to_child()
+                assert check_step.execute(execution_method="execute_requests", state=child_state) is jmon.step_status.StepStatus.SUCCESS
+                state.integrate_from_child(child_state)
+
+        mock_loads.assert_called_once_with(b'{"id": 1, "name": "test"}')
+
+    def test_response_parsed_for_new_response(self):
+        """Test JSON body is parsed again once the response changes"""
+        state = jmon.step_state.RequestsStepState(response=create_response(b'{"page": 1}'), dns_response=None)
+
+        assert state.get_response_json() == {"page": 1}
+        state.response = create_response(b"Invalid JSON")
+        with unittest.mock.patch('json.loads', wraps=json.loads) as mock_loads:
+            for _ in range(2):
+                with pytest.raises(requests.exceptions.JSONDecodeError):
+                    state.get_response_json()
+
+        mock_loads.assert_called_once_with(b"Invalid JSON")
+
+    def test_selector_compiled_once(self, mock_run, mock_root_step, mock_logger, get_json_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
+        """Test selector is compiled on creation of step"""
+        with unittest.mock.patch('jmon.steps.checks.json_check.JSONPath') as mock_json_path:
+            step = get_json_step({"selector": "$.id", "equals": 1})
+            step.validate_steps()
+            _ = step.description
+
+        mock_json_path.assert_called_once_with("$.id")
+
+    def test_execution_requests_stream_too_large(self, mock_run, mock_root_step, mock_logger, get_json_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
+        """Test execution requests with streamed response exceeding the max body size"""
+        step = get_json_step({"equals": "value", "selector": "$.id"})
+        mock_state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
+        mock_state.set_response(create_response(b'{"id": "value", "other": "long value"}', stream=True), max_body_size=16)
+
+        step.execute(execution_method="execute_requests", state=mock_state)
+        assert mock_logger.read_log_stream() == '\n'.join([
+            'Root -> CheckJson: Step failed',
+            "Root -> CheckJson: JSON match failed: Response body exceeds maximum body size of 16 bytes\n",
+        ])
+        assert step._status is jmon.step_status.StepStatus.FAILED
+
+    def test_execution_requests_stream(self, mock_run, mock_root_step, mock_logger, get_json_step: Callable[[Any], 'jmon.steps.checks.JsonCheck']):
+        """Test execution requests with streamed response within the max body size"""
+        step = get_json_step({"equals": "value", "selector": "$.id"})
+        mock_state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
+        mock_state.set_response(create_response(b'{"id": "value"}', stream=True), max_body_size=1024)
+
+        step.execute(execution_method="execute_requests", state=mock_state)
+        assert mock_logger.read_log_stream() == ''
+        assert step._status is jmon.step_status.StepStatus.SUCCESS
@@ -0,0 +1,54 @@
+from typing import Any, Callable
+import unittest.mock
+
+import pytest
+
+import jmon.step_state
+import jmon.step_status
+import jmon.steps.checks
+from test.unit.jmon.steps.fixtures import mock_run, mock_logger, mock_root_step
+
+
+@pytest.fixture
+def get_text_step(mock_run, mock_root_step, mock_logger) -> Callable[[Any], 'jmon.steps.checks.TextCheck']:
+    def inner(config):
+        return jmon.steps.checks.TextCheck(parent=mock_root_step, config=config, run=mock_run, run_logger=mock_logger)
+    return inner
+
+
+class TestTextCheck:
+
+    def test_execute_playwright_normalises_text(self, mock_run, mock_root_step, mock_logger, get_text_step: Callable[[Any], 'jmon.steps.checks.TextCheck']):
+        """Test playwright text check compares inner text using the same normalisation as selenium"""
+        pytest.importorskip("playwright")
+        step = get_text_step("Some  text\nNext line")
+
+        element = unittest.mock.MagicMock()
+        element.inner_text.return_value = " Some  text \n\tNext\u00a0line\n"
+        state = jmon.step_state.PlaywrightStepState(page=unittest.mock.MagicMock(), element=element)
+
+        step.execute(execution_method="execute_playwright", state=state)
+
+        assert mock_logger.read_log_stream() == ''
+        assert step._status is jmon.step_status.StepStatus.SUCCESS
+        element.inner_text.assert_called_once()
+
+    def test_execute_playwright_mismatch(self, monkeypatch, mock_run, mock_root_step, mock_logger, get_text_step: Callable[[Any], 'jmon.steps.checks.TextCheck']):
+        """Test playwright text check polls until the timeout, when whitespace within lines differs"""
+        pytest.importorskip("playwright")
+        monkeypatch.setenv("ASSERTION_TIMEOUT", "0.2")
+        monkeypatch.setenv("FIND_ELEMENT_POLL_INTERVAL", "0.05")
+        step = get_text_step("Some text")
+
+        element = unittest.mock.MagicMock()
+        element.inner_text.return_value = "Some  text"
+        state = jmon.step_state.PlaywrightStepState(page=unittest.mock.MagicMock(), element=element)
+
+        step.execute(execution_method="execute_playwright", state=state)
+
+        assert mock_logger.read_log_stream() == (
+            'Root -> CheckText: Element text does not match excepted text. Expected "Some text" and got: "Some  text"\n'
+            'Root -> CheckText: Step failed\n'
+        )
+        assert step._status is jmon.step_status.StepStatus.FAILED
+        assert element.inner_text.call_count >= 4
@@ -1,9 +1,11 @@
+import io
 import unittest.mock
-import datetime
 
 import pytest
+import requests
 
 import test.unit.jmon.mock_run_logger
+from jmon.deadline import Deadline
 import jmon.steps
 import jmon.run
 
@@ -11,7 +13,7 @@ import jmon.run
 @pytest.fixture
 def mock_run():
     run = unittest.mock.MagicMock(spec=jmon.run.Run)
-    run.get_remaining_time.return_value = datetime.timedelta(minutes=1)
+    run.deadline = Deadline(600)
     yield run
 
 @pytest.fixture
@@ -23,3 +25,16 @@ def mock_logger():
 @pytest.fixture
 def mock_root_step(mock_logger):
     yield jmon.steps.RootStep(run=None, config=None, parent=None, run_logger=mock_logger)
+
+
+def create_response(body: bytes, stream: bool = False, status_code: int = 200) -> requests.Response:
+    """Create response with body, which is read from the raw response if streamed"""
+    response = requests.Response()
+    response.status_code = status_code
+    response.encoding = "utf-8"
+    if stream:
+        response.raw = io.BytesIO(body)
+    else:
+        response._content = body
+        response._content_consumed = True
+    return response
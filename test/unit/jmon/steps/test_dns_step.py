@@ -12,9 +12,18 @@ import jmon.steps.checks
 import jmon.errors
 import jmon.client_type
 import jmon.run_logger
+import jmon.dns_resolver
 from test.unit.jmon.steps.fixtures import mock_run, mock_logger, mock_root_step
 
 
+@pytest.fixture(autouse=True)
+def clear_resolver_cache():
+    """Clear cached resolvers, which are created using the mocked resolver class"""
+    jmon.dns_resolver.get_resolver.cache_clear()
+    yield
+    jmon.dns_resolver.get_resolver.cache_clear()
+
+
 @pytest.fixture
 def get_dns_step(mock_run, mock_root_step, mock_logger) -> Callable[[Any], 'jmon.steps.DNSStep']:
     def inner(config):
@@ -33,6 +42,8 @@ class TestDNSStep:
         {"domain": "www.example.com", "name_servers": "1.1.1.1"},
         {"domain": "www.example.com", "name_servers": ["1.1.1.1"]},
         {"domain": "www.example.com", "type": "cname", "protocol": "tcp", "port": 52, "lifetime": 3, "timeout": 6},
+        {"domain": "www.example.com", "name_servers": ["1.1.1.1", "8.8.8.8"], "concurrent": True, "quorum": "all"},
+        {"domain": "www.example.com", "name_servers": ["1.1.1.1", "8.8.8.8"], "concurrent": True, "quorum": 2},
     ])
     def test_create(self, config, mock_run, mock_root_step, mock_logger, get_dns_step: Callable[[Any], 'jmon.steps.GotoStep']):
         """Test create with valid config"""
@@ -43,7 +54,14 @@ class TestDNSStep:
         ["list"],
         {"without": "domain"},
         {"domain": "adg", "port": "astring"},
-        {"domain": "adg", "type": "invalidtype"}
+        {"domain": "adg", "type": "invalidtype"},
+        {"domain": "adg", "concurrent": "yes"},
+        {"domain": "adg", "concurrent": True, "quorum": 0},
+        {"domain": "adg", "concurrent": True, "quorum": "most"},
+        {"domain": "adg", "concurrent": True, "quorum": 3, "name_servers": ["1.1.1.1", "8.8.8.8"]},
+        # Quorum without concurrent queries
+        {"domain": "adg", "quorum": 1, "name_servers": ["1.1.1.1", "8.8.8.8"]},
+        {"domain": "adg", "concurrent": False, "quorum": "all"},
     ])
     def test_invalid_config(self, config, mock_run, mock_root_step, mock_logger, get_dns_step: Callable[[Any], 'jmon.steps.GotoStep']):
         """Test create with valid config"""
@@ -86,7 +104,7 @@ class TestDNSStep:
             nameservers = None
             port = None
             timeout = None
-            query = unittest.mock.MagicMock(return_value=mock_dns_response)
+            resolve = unittest.mock.MagicMock(return_value=mock_dns_response)
         mock_resolver = MockResolver()
 
         with unittest.mock.patch('dns.resolver.Resolver', unittest.mock.MagicMock(return_value=mock_resolver)):
@@ -94,7 +112,7 @@ class TestDNSStep:
 
         assert step._status is jmon.step_status.StepStatus.SUCCESS
 
-        MockResolver.query.assert_called_once_with(raise_on_no_answer=True, **expected_resolve_args)
+        MockResolver.resolve.assert_called_once_with(raise_on_no_answer=True, search=True, **expected_resolve_args)
         for k, v in expected_resolver_config.items():
             assert getattr(mock_resolver, k) == v
 
@@ -114,7 +132,7 @@ class TestDNSStep:
             nameservers = None
             port = None
             timeout = None
-            query = unittest.mock.MagicMock(side_effect=dns.resolver.NXDOMAIN)
+            resolve = unittest.mock.MagicMock(side_effect=dns.resolver.NXDOMAIN)
         mock_resolver = MockResolver()
 
         with unittest.mock.patch('dns.resolver.Resolver', unittest.mock.MagicMock(return_value=mock_resolver)):
@@ -126,3 +144,83 @@ class TestDNSStep:
             'Root -> DNS: Step failed',
             'Root -> DNS: The DNS query name does not exist.\n'
         ])
+
+    def test_resolver_reused(self, mock_run, mock_root_step, mock_logger, get_dns_step: Callable[[Any], 'jmon.steps.DNSStep']):
+        """Test resolver is created once for each resolver configuration"""
+        class MockState:
+            dns_response = None
+
+        mock_resolver_class = unittest.mock.MagicMock()
+        with unittest.mock.patch('dns.resolver.Resolver', mock_resolver_class):
+            for _ in range(3):
+                get_dns_step({"domain": "www.example.com", "name_servers": ["1.1.1.1"]}).execute(
+                    execution_method='execute_requests', state=MockState()
+                )
+            get_dns_step({"domain": "www.example.com", "name_servers": ["8.8.8.8"]}).execute(
+                execution_method='execute_requests', state=MockState()
+            )
+
+        assert mock_resolver_class.call_count == 2
+        assert mock_resolver_class.return_value.resolve.call_count == 4
+
+    @pytest.mark.parametrize('quorum, expected_status', [
+        (1, jmon.step_status.StepStatus.SUCCESS),
+        (2, jmon.step_status.StepStatus.SUCCESS),
+        ("all", jmon.step_status.StepStatus.FAILED),
+    ])
+    def test_execute_requests_concurrent(self, quorum, expected_status, mock_run, mock_root_step, mock_logger, get_dns_step: Callable[[Any], 'jmon.steps.DNSStep']):
+        """Test querying name servers concurrently, based on quorum"""
+        class MockState:
+            dns_response = None
+
+        mock_state = MockState()
+        answers = {}
+
+        def create_resolver():
+            """Return resolver, answering based on its name server"""
+            resolver = unittest.mock.MagicMock()
+
+            def resolve(**kwargs):
+                if resolver.nameservers == ["10.0.0.3"]:
+                    raise dns.resolver.NoNameservers()
+                answer = unittest.mock.MagicMock()
+                answer.rrset = [unittest.mock.MagicMock(to_text=unittest.mock.MagicMock(return_value="192.0.2.1"))]
+                answers[resolver.nameservers[0]] = answer
+                return answer
+
+            resolver.resolve.side_effect = resolve
+            return resolver
+
+        step = get_dns_step({
+            "domain": "www.example.com", "name_servers": ["10.0.0.1", "10.0.0.2", "10.0.0.3"],
+            "concurrent": True, "quorum": quorum
+        })
+        step.validate_steps()
+
+        with unittest.mock.patch('dns.resolver.Resolver', side_effect=create_resolver):
+            step.execute(execution_method='execute_requests', state=mock_state)
+
+        assert step._status is expected_status
+        assert mock_state.dns_response in answers.values()
+        if expected_status is jmon.step_status.StepStatus.SUCCESS:
+            assert len([result for result in step.name_server_results if result.answer is not None]) >= quorum
+        for result in step.name_server_results:
+            assert (result.answer is None) == (result.name_server == "10.0.0.3")
+
+        # Results of name servers are included in step data
+        step_results = step.as_dict()["name_server_results"]
+        assert len(step_results) == len(step.name_server_results)
+        for result in step_results:
+            assert result["latency"] >= 0
+            if result["name_server"] == "10.0.0.3":
+                assert result["answer"] is None
+                assert result["error"]
+            else:
+                assert result["answer"] == ["192.0.2.1"]
+                assert result["error"] is None
+
+    def test_name_server_results_not_queried_concurrently(self, get_dns_step: Callable[[Any], 'jmon.steps.DNSStep']):
+        """Test step data does not contain name server results when not querying concurrently"""
+        step = get_dns_step("www.example.com")
+
+        assert step.as_dict()["name_server_results"] == []
@@ -1,4 +1,9 @@
 
+import json
+import shutil
+import subprocess
+import sys
+import time
 from typing import Any, Callable
 import unittest.mock
 
@@ -6,12 +11,16 @@ import pytest
 import requests.exceptions
 import selenium.common.exceptions
 
+import jmon.step_batch
+import jmon.step_state
 import jmon.step_status
 import jmon.steps
 import jmon.steps.checks
 import jmon.errors
 import jmon.client_type
 import jmon.run_logger
+import jmon.wait_engine
+from jmon.deadline import Deadline
 from test.unit.jmon.steps.fixtures import mock_run, mock_logger, mock_root_step
 
 
@@ -58,7 +67,7 @@ class TestFindStep:
     def test_supported_clients(self, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
         """Return list of supported clients"""
         find_step = get_find_step([{'id': 'test'}])
-        assert find_step.supported_clients == [jmon.client_type.ClientType.BROWSER_FIREFOX, jmon.client_type.ClientType.BROWSER_CHROME]
+        assert find_step.supported_clients == [jmon.client_type.ClientType.BROWSER_FIREFOX, jmon.client_type.ClientType.BROWSER_CHROME, jmon.client_type.ClientType.BROWSER_PLAYWRIGHT]
 
     def test_supported_clients(self, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
         """Return list of supported clients"""
@@ -171,8 +180,43 @@ class TestFindStep:
         assert mock_state.element is target_selenium_element
         original_element.find_element.assert_called_once_with('xpath', xpath)
 
-    def test_find_without_result(self, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
+    @pytest.mark.parametrize('config, selector', [
+        ([{"id": "test-id"}], 'css=[id="test-id"]'),
+        ([{"id": 'test"id'}], 'css=[id="test\\"id"]'),
+        ([{"class": "test-class"}], "css=.test-class"),
+        ([{"class": "col:md.6"}], "css=.col\\:md\\.6"),
+        ([{"class": "1st"}], "css=.\\31 st"),
+        ([{"class": "-2nd"}], "css=.-\\32 nd"),
+        ([{"class": "a b#c"}], "css=.a\\ b\\#c"),
+        ([{"tag": "input"}], "css=input"),
+        ([{"text": "test-text", "tag": "a"}], "xpath=.//a[contains(text(), 'test-text')]"),
+    ])
+    def test_playwright_selector(self, config, selector, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test conversion of find config to playwright selector, without requiring selenium"""
+        step = get_find_step(config)
+        with unittest.mock.patch.dict(sys.modules, {"selenium": None, "selenium.webdriver": None, "selenium.webdriver.common.by": None}):
+            assert step._get_playwright_selector() == selector
+            assert step.description.startswith("Find element by ")
+
+    def test_execute_playwright(self, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test find using playwright locates element within current element"""
+        pytest.importorskip("playwright")
+        step = get_find_step([{"id": "test-id"}])
+
+        parent_locator = unittest.mock.MagicMock()
+        state = jmon.step_state.PlaywrightStepState(page=unittest.mock.MagicMock(), element=parent_locator)
+
+        step.execute(execution_method="execute_playwright", state=state)
+
+        assert step._status is jmon.step_status.StepStatus.SUCCESS
+        parent_locator.locator.assert_called_once_with('css=[id="test-id"]')
+        assert state.element is parent_locator.locator.return_value.first
+        state.element.wait_for.assert_called_once()
+
+    def test_find_without_result(self, monkeypatch, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
         """Test find without a result"""
+        monkeypatch.setenv("FIND_ELEMENT_TIMEOUT", "0.2")
+        monkeypatch.setenv("FIND_ELEMENT_POLL_INTERVAL", "0.05")
         step = get_find_step([{"id": "test-id"}])
 
         class MockSeleniumElement:
@@ -188,26 +232,23 @@ class TestFindStep:
 
         step.execute(execution_method="execute_selenium", state=mock_state)
         assert mock_logger.read_log_stream() == (
-            'Retrying step (1/5)\nRetrying step (2/5)\nRetrying step (3/5)\n'
-            'Retrying step (4/5)\nRetrying step (5/5)\nRoot -> Find: Step failed\n'
+            'Root -> Find: Could not find element by ID: test-id\nRoot -> Find: Step failed\n'
         )
         assert step._status is jmon.step_status.StepStatus.FAILED
 
         assert mock_state.element is None
-        original_element.find_element.assert_has_calls(calls=[
-            unittest.mock.call("id", "test-id"),
-            unittest.mock.call("id", "test-id"),
-            unittest.mock.call("id", "test-id"),
-            unittest.mock.call("id", "test-id"),
-            unittest.mock.call("id", "test-id"),
-        ])
+        # Ensure element is polled for until the timeout
+        assert original_element.find_element.call_count >= 4
+        original_element.find_element.assert_called_with("id", "test-id")
 
     @pytest.mark.parametrize('exception', [
         selenium.common.exceptions.NoSuchElementException,
         selenium.common.exceptions.ElementNotInteractableException
     ])
-    def test_find_selenium_exception(self, exception, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
+    def test_find_selenium_exception(self, exception, monkeypatch, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
         """Test find without a result"""
+        monkeypatch.setenv("FIND_ELEMENT_TIMEOUT", "0.2")
+        monkeypatch.setenv("FIND_ELEMENT_POLL_INTERVAL", "0.05")
         step = get_find_step([{"id": "test-id"}])
 
         class MockSeleniumElement:
@@ -223,23 +264,60 @@ class TestFindStep:
 
         step.execute(execution_method="execute_selenium", state=mock_state)
         assert mock_logger.read_log_stream() == (
-            'Root -> Find: Could not find element\nRetrying step (1/5)\n'
-            'Root -> Find: Could not find element\nRetrying step (2/5)\n'
-            'Root -> Find: Could not find element\nRetrying step (3/5)\n'
-            'Root -> Find: Could not find element\nRetrying step (4/5)\n'
-            'Root -> Find: Could not find element\nRetrying step (5/5)\n'
+            'Root -> Find: Could not find element by ID: test-id\n'
             'Root -> Find: Step failed\n'
         )
         assert step._status is jmon.step_status.StepStatus.FAILED
 
         assert mock_state.element is None
-        original_element.find_element.assert_has_calls(calls=[
-            unittest.mock.call("id", "test-id"),
-            unittest.mock.call("id", "test-id"),
-            unittest.mock.call("id", "test-id"),
-            unittest.mock.call("id", "test-id"),
-            unittest.mock.call("id", "test-id"),
-        ])
+        assert original_element.find_element.call_count >= 4
+        original_element.find_element.assert_called_with("id", "test-id")
+
+    def test_find_after_polling(self, monkeypatch, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test element is returned once it is present"""
+        monkeypatch.setenv("FIND_ELEMENT_POLL_INTERVAL", "0.01")
+        step = get_find_step([{"id": "test-id"}])
+
+        target_selenium_element = unittest.mock.MagicMock()
+
+        class MockSeleniumElement:
+            find_element = unittest.mock.MagicMock(side_effect=[
+                selenium.common.exceptions.NoSuchElementException,
+                selenium.common.exceptions.NoSuchElementException,
+                target_selenium_element,
+            ])
+
+        class MockState:
+            selenium_instance = None
+            element = MockSeleniumElement()
+
+        mock_state = MockState()
+
+        step.execute(execution_method="execute_selenium", state=mock_state)
+        assert mock_logger.read_log_stream() == ''
+        assert step._status is jmon.step_status.StepStatus.SUCCESS
+        assert mock_state.element is target_selenium_element
+
+    def test_find_limited_by_run_timeout(self, monkeypatch, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test wait for element is limited by remaining run time"""
+        monkeypatch.setenv("FIND_ELEMENT_TIMEOUT", "60")
+        step = get_find_step([{"id": "test-id"}])
+        mock_run.deadline = Deadline(0.1)
+
+        class MockSeleniumElement:
+            find_element = unittest.mock.MagicMock(side_effect=selenium.common.exceptions.NoSuchElementException)
+
+        class MockState:
+            selenium_instance = None
+            element = MockSeleniumElement()
+
+        mock_state = MockState()
+
+        start_time = time.monotonic()
+        step.execute(execution_method="execute_selenium", state=mock_state)
+
+        assert time.monotonic() - start_time < 1
+        assert step._status is jmon.step_status.StepStatus.TIMEOUT
 
     @pytest.mark.parametrize('config, call_args', [
         ([{"id": 'pre-{test_variable}-post'}],
@@ -283,3 +361,115 @@ class TestFindStep:
         # Ensure element has been reset to None
         assert mock_state.element is target_selenium_element
         original_element.find_element.assert_called_once_with(*call_args)
+
+    def test_batch_plan(self, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test batch plan is generated for read-only sub-tree"""
+        step = get_find_step([
+            {"id": "content"},
+            {"find": [{"class": "login"}, {"check": {"text": "Please Login"}}]},
+            {"check": {"title": "Login", "url": "https://example.com/login"}},
+        ])
+
+        assert step.get_batch_plan() == {
+            "type": "find", "by": "id", "value": "content", "children": [
+                {"type": "find", "by": "class name", "value": "login", "children": [
+                    {"type": "check", "children": [{"type": "text", "expected": "Please Login", "children": []}]},
+                ]},
+                {"type": "check", "children": [
+                    {"type": "title", "expected": "Login", "children": []},
+                    {"type": "url", "expected": "https://example.com/login", "children": []},
+                ]},
+            ]
+        }
+
+    def test_batch_plan_with_action(self, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test batch plan is not generated when sub-tree contains actions"""
+        step = get_find_step([
+            {"id": "content"},
+            {"find": [{"class": "login"}, {"actions": ["click"]}]},
+        ])
+
+        assert step.get_batch_plan() is None
+
+    def test_execute_batch(self, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test read-only sub-tree is evaluated in a single script"""
+        step = get_find_step([
+            {"id": "content"},
+            {"find": [{"class": "login"}, {"check": {"text": "Please Login"}}]},
+        ])
+        selenium_instance = unittest.mock.MagicMock()
+        selenium_instance.execute_script.return_value = {"ok": True, "actual": None, "children": [
+            {"ok": True, "actual": None, "children": [
+                {"ok": True, "actual": None, "children": [
+                    {"ok": True, "actual": "Please Login", "children": []},
+                ]},
+            ]},
+        ]}
+        state = jmon.step_state.SeleniumStepState(selenium_instance=selenium_instance, element=selenium_instance)
+
+        assert step.execute(execution_method="execute_selenium", state=state) is jmon.step_status.StepStatus.SUCCESS
+
+        selenium_instance.execute_script.assert_called_once()
+        # Ensure page is used as root of search
+        assert selenium_instance.execute_script.call_args.args[1] is None
+        selenium_instance.find_element.assert_not_called()
+        selenium_instance.execute_async_script.assert_not_called()
+
+        nested_find = step.get_child_steps()[0]
+        check_step = nested_find.get_child_steps()[0]
+        text_check = check_step.get_child_steps()[0]
+        for child_step in [step, nested_find, check_step, text_check]:
+            assert child_step.status is jmon.step_status.StepStatus.SUCCESS
+            # Steps are timed using the batch evaluation
+            assert child_step.duration is not None
+            assert 0 <= child_step.duration <= step.duration
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+    @pytest.mark.parametrize('text, expected', [
+        ("Please Login", "Please Login"),
+        ("  Please Login \n", "Please Login"),
+        ("Please   Login", "Please Login"),
+        ("Please\nLogin", "Please Login"),
+        ("Please \nLogin", "Please\nLogin"),
+    ])
+    def test_batch_text_matches_text_check(self, text, expected):
+        """Test text is compared in batch evaluation using the same rule as the text check"""
+        script = f"const result = (function() {{ {jmon.step_batch._EVALUATE_PLAN_SCRIPT} }}).apply(null, %s);" % json.dumps([
+            {"innerText": text}, {"type": "text", "expected": expected, "children": []}
+        ]) + "console.log(JSON.stringify(result.ok));"
+
+        assert json.loads(subprocess.check_output(["node", "-e", script])) is (jmon.wait_engine.normalise_text(text) == expected)
+
+    def test_execute_batch_fallback(self, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test steps are executed individually when batch evaluation does not succeed"""
+        step = get_find_step([
+            {"id": "content"},
+            {"check": {"text": "Please Login"}},
+        ])
+        selenium_instance = unittest.mock.MagicMock()
+        # Element is not yet present in batch evaluation
+        selenium_instance.execute_script.return_value = {"ok": False, "actual": None, "children": []}
+        selenium_instance.execute_async_script.return_value = {"satisfied": True, "actual": "Please Login"}
+        target_element = unittest.mock.MagicMock()
+        selenium_instance.find_element.return_value = target_element
+        state = jmon.step_state.SeleniumStepState(selenium_instance=selenium_instance, element=selenium_instance)
+
+        assert step.execute(execution_method="execute_selenium", state=state) is jmon.step_status.StepStatus.SUCCESS
+
+        selenium_instance.execute_script.assert_called_once()
+        selenium_instance.find_element.assert_called_once_with("id", "content")
+        assert selenium_instance.execute_async_script.call_args.args[1] is target_element
+
+    def test_execute_batch_disabled(self, monkeypatch, mock_run, mock_root_step, mock_logger, get_find_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test batch evaluation can be disabled"""
+        monkeypatch.setenv("BATCH_READ_ONLY_STEPS", "False")
+        step = get_find_step([
+            {"id": "content"},
+            {"check": {"text": "Please Login"}},
+        ])
+        selenium_instance = unittest.mock.MagicMock()
+        selenium_instance.execute_async_script.return_value = {"satisfied": True, "actual": "Please Login"}
+        state = jmon.step_state.SeleniumStepState(selenium_instance=selenium_instance, element=selenium_instance)
+
+        assert step.execute(execution_method="execute_selenium", state=state) is jmon.step_status.StepStatus.SUCCESS
+        selenium_instance.execute_script.assert_not_called()
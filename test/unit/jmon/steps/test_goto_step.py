@@ -1,4 +1,6 @@
 
+import datetime
+import time
 from typing import Any, Callable
 import unittest.mock
 
@@ -6,12 +8,15 @@ import pytest
 import requests.exceptions
 import selenium.common.exceptions
 
+import jmon.page_load
+import jmon.step_state
 import jmon.step_status
 import jmon.steps
 import jmon.steps.checks
 import jmon.errors
 import jmon.client_type
 import jmon.run_logger
+from jmon.deadline import Deadline
 from test.unit.jmon.steps.fixtures import mock_run, mock_logger, mock_root_step
 
 
@@ -37,6 +42,14 @@ class TestGotoStep:
 
         # With timeout
         {"url": "https://example.com/someurl", "headers": {"some-header": "headervalue"}, "timeout": 5},
+
+        # With streamed response
+        {"url": "https://example.com/someurl", "stream": True},
+        {"url": "https://example.com/someurl", "stream": True, "max-body-size": 1024},
+
+        # With page load strategy
+        {"url": "https://example.com/someurl", "page-load-strategy": "eager"},
+        {"url": "https://example.com/someurl", "page-load-strategy": "none"},
     ])
     def test_create(self, config, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
         """Test create with valid config"""
@@ -58,6 +71,18 @@ class TestGotoStep:
 
         # Invalid timeout value
         {"url": "https://example.com/someurl", "timeout": "test"},
+
+        # Invalid stream values
+        {"url": "https://example.com/someurl", "stream": "yes"},
+        {"url": "https://example.com/someurl", "stream": True, "max-body-size": 0},
+        {"url": "https://example.com/someurl", "stream": True, "max-body-size": "1MB"},
+        # Max body size without stream
+        {"url": "https://example.com/someurl", "max-body-size": 1024},
+
+        # Invalid page load strategy
+        {"url": "https://example.com/someurl", "page-load-strategy": "fast"},
+        # Page load strategy with requests attributes
+        {"url": "https://example.com/someurl", "page-load-strategy": "eager", "method": "post"},
     ])
     def test_invalid_config(self, config, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
         """Test create with invalid config"""
@@ -66,8 +91,9 @@ class TestGotoStep:
             step.validate_steps()
 
     @pytest.mark.parametrize('config, expected_clients', [
-        ('https://some-url', [jmon.client_type.ClientType.BROWSER_FIREFOX, jmon.client_type.ClientType.BROWSER_CHROME, jmon.client_type.ClientType.REQUESTS]),
+        ('https://some-url', [jmon.client_type.ClientType.BROWSER_FIREFOX, jmon.client_type.ClientType.BROWSER_CHROME, jmon.client_type.ClientType.REQUESTS, jmon.client_type.ClientType.BROWSER_PLAYWRIGHT]),
         ({"url": "https://some-url"}, [jmon.client_type.ClientType.REQUESTS]),
+        ({"url": "https://some-url", "page-load-strategy": "eager"}, [jmon.client_type.ClientType.BROWSER_FIREFOX, jmon.client_type.ClientType.BROWSER_CHROME, jmon.client_type.ClientType.BROWSER_PLAYWRIGHT]),
     ])
     def test_supported_clients(self, config, expected_clients, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
         """Test supported clients is correctly set based on config"""
@@ -80,16 +106,9 @@ class TestGotoStep:
         """Test execution selenium"""
         step = get_goto_step("https://some.example.com/url")
 
-        mock_element_state = unittest.mock.MagicMock()
-
-        class MockSeleniumInstance:
-            get = unittest.mock.MagicMock()
-
-        class MockState:
-            selenium_instance = MockSeleniumInstance()
-            element = mock_element_state
-
-        mock_state = MockState()
+        mock_state = jmon.step_state.SeleniumStepState(
+            selenium_instance=unittest.mock.MagicMock(), element=unittest.mock.MagicMock()
+        )
 
         step.execute(execution_method="execute_selenium", state=mock_state)
         assert mock_logger.read_log_stream() == ''
@@ -98,6 +117,204 @@ class TestGotoStep:
         # Ensure element has been reset to None
         assert mock_state.element is mock_state.selenium_instance
         mock_state.selenium_instance.get.assert_called_once_with('https://some.example.com/url')
+        # Webdriver waits for the page to load in sessions using the normal strategy
+        mock_state.selenium_instance.execute_script.assert_not_called()
+
+    def test_requests_json_variable_injection(self, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test variables are injected into JSON body, without modifying config"""
+        config = {
+            "url": "https://some.example.com/{path}",
+            "json": {"query": ["{term}", "static"], "limit": 5},
+            "method": "post",
+        }
+        step = get_goto_step(config)
+        mock_run.variables = {"path": "search", "term": "unittest-value"}
+
+        assert step.get_request_kwargs() == {
+            "url": "https://some.example.com/search",
+            "headers": {},
+            "json": {"query": ["unittest-value", "static"], "limit": 5},
+            # Request timeout is limited to the remaining time of the run
+            "timeout": pytest.approx(600, abs=5),
+        }
+        assert config["json"] == {"query": ["{term}", "static"], "limit": 5}
+
+    @pytest.mark.parametrize('config, should_raise', [
+        # Variable is not set by any step
+        ([{"goto": "https://example.com/{missing}"}], True),
+        ([{"goto": {"url": "https://example.com", "headers": {"Authorization": "Bearer {token}"}}}], True),
+        # Invalid placeholder
+        ([{"goto": "https://example.com/}"}], True),
+        # Variable may be set by plugin
+        ([{"call_plugin": {"example-plugin": {"example_argument": "value"}}}, {"goto": "https://example.com/{token}"}], False),
+        # Variable is set by step
+        ([{"actions": ["report-performance"]}, {"goto": "https://example.com/?load={performance.load}"}], False),
+        ([{"actions": ["report-performance"]}, {"goto": "https://example.com/{missing}"}], True),
+    ])
+    def test_validate_variables(self, config, should_raise, mock_run, mock_logger):
+        """Test validation of variables referenced by step"""
+        root_step = jmon.steps.RootStep(run=mock_run, config=config, parent=None, run_logger=mock_logger)
+        if should_raise:
+            with pytest.raises(jmon.errors.StepValidationError):
+                root_step.validate_steps()
+        else:
+            root_step.validate_steps()
+
+    def test_requests_previous_response_closed(self, mock_run, mock_logger):
+        """Test response of previous goto is closed when it is replaced"""
+        root_step = jmon.steps.RootStep(run=mock_run, config=[
+            {"goto": {"url": "https://some.example.com/1", "stream": True}},
+            {"goto": {"url": "https://some.example.com/2", "stream": True}},
+        ], parent=None, run_logger=mock_logger)
+        responses = [
+            unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100))
+            for _ in range(2)
+        ]
+        state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
+
+        with unittest.mock.patch('requests.get', side_effect=responses):
+            root_step.execute(execution_method="execute_requests", state=state)
+
+        responses[0].close.assert_called_once_with()
+        # Last response is closed by the runner, once the run has completed
+        responses[1].close.assert_not_called()
+        assert state.response is responses[1]
+
+    def test_requests_timing_in_step_data(self, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test timing breakdown of request is included in step data"""
+        step = get_goto_step("https://some.example.com/url")
+        assert step.as_dict()["timing"] is None
+
+        mock_state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
+        mock_request_response = unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100))
+
+        with unittest.mock.patch('requests.get', return_value=mock_request_response):
+            step.execute(execution_method="execute_requests", state=mock_state)
+
+        timing = step.as_dict()["timing"]
+        assert list(timing.keys()) == ["dns", "connect", "tls", "ttfb", "download"]
+        assert timing["ttfb"] == pytest.approx(0.1)
+        assert timing["download"] is not None and timing["download"] >= 0
+
+    def test_requests_stream_success(self, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test execution requests with streamed response, limiting body size"""
+        step = get_goto_step({
+            "url": "https://some.example.com/url",
+            "stream": True,
+            "max-body-size": 1024,
+        })
+
+        mock_state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
+
+        mock_request_response = unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100))
+        mock_requests_get = unittest.mock.MagicMock(return_value=mock_request_response)
+
+        with unittest.mock.patch('requests.get', mock_requests_get):
+            step.execute(execution_method="execute_requests", state=mock_state)
+
+        assert mock_logger.read_log_stream() == ''
+        assert step._status is jmon.step_status.StepStatus.SUCCESS
+
+        assert mock_state.response is mock_request_response
+        assert mock_state.get_response_body()._max_size == 1024
+        # Body is read by subsequent steps, so download time is not measured
+        assert step.as_dict()["timing"]["download"] is None
+        mock_requests_get.assert_called_once_with(
+            url='https://some.example.com/url', headers={}, stream=True, timeout=pytest.approx(600, abs=5)
+        )
+
+    @pytest.mark.parametrize('page_load_strategy, document_states, expected_script_calls', [
+        # Previous document is still present, then new document is loading
+        ("normal", [
+            [False, "complete", "https://previous.example.com", True],
+            [True, "loading", "https://some.example.com/url", False],
+            [True, "interactive", "https://some.example.com/url", False],
+            [True, "complete", "https://some.example.com/url", False],
+        ], 5),
+        ("eager", [
+            [False, "complete", "https://previous.example.com", True],
+            [True, "loading", "https://some.example.com/url", False],
+            [True, "interactive", "https://some.example.com/url", False],
+        ], 4),
+        # Navigation to the current URL does not complete until the document is replaced
+        ("normal", [
+            [False, "complete", "https://some.example.com/url", True],
+            [True, "complete", "https://some.example.com/url", False],
+        ], 3),
+        # No waiting is performed
+        ("none", [], 0),
+    ])
+    def test_selenium_page_load_strategy(self, page_load_strategy, document_states, expected_script_calls,
+                                         mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test waiting for page load, based on page load strategy"""
+        step = get_goto_step({"url": "https://some.example.com/url", "page-load-strategy": page_load_strategy})
+
+        selenium_instance = unittest.mock.MagicMock()
+        selenium_instance.execute_script.side_effect = [None] + document_states
+        state = jmon.step_state.SeleniumStepState(
+            selenium_instance=selenium_instance, element=None,
+            session_page_load_strategy=jmon.page_load.PageLoadStrategy.NONE
+        )
+
+        with unittest.mock.patch('jmon.page_load.POLL_INTERVAL', 0):
+            step.execute(execution_method="execute_selenium", state=state)
+
+        assert step._status is jmon.step_status.StepStatus.SUCCESS
+        assert selenium_instance.execute_script.call_count == expected_script_calls
+        assert state.page_load_strategy is jmon.page_load.PageLoadStrategy(page_load_strategy)
+
+    def test_selenium_page_load_timeout(self, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test step times out when page does not load within the remaining run time"""
+        step = get_goto_step("https://some.example.com/url")
+        mock_run.deadline = Deadline(0.1)
+
+        selenium_instance = unittest.mock.MagicMock()
+        selenium_instance.execute_script.return_value = [True, "loading", "https://some.example.com/url", False]
+        state = jmon.step_state.SeleniumStepState(
+            selenium_instance=selenium_instance, element=None,
+            session_page_load_strategy=jmon.page_load.PageLoadStrategy.EAGER
+        )
+
+        step.execute(execution_method="execute_selenium", state=state)
+
+        assert step._status is jmon.step_status.StepStatus.TIMEOUT
+        assert "Timed out waiting for page to load" in mock_logger.read_log_stream()
+
+    def test_selenium_page_load_alert(self, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test page raising an alert whilst loading is treated as loaded, rather than waiting until the timeout"""
+        step = get_goto_step("https://some.example.com/url")
+
+        selenium_instance = unittest.mock.MagicMock()
+        selenium_instance.execute_script.side_effect = selenium.common.exceptions.UnexpectedAlertPresentException("Alert")
+        state = jmon.step_state.SeleniumStepState(
+            selenium_instance=selenium_instance, element=None,
+            session_page_load_strategy=jmon.page_load.PageLoadStrategy.EAGER
+        )
+
+        step.execute(execution_method="execute_selenium", state=state)
+
+        assert step._status is jmon.step_status.StepStatus.SUCCESS
+        # Document is marked and its state is checked once
+        assert selenium_instance.execute_script.call_count == 2
+
+    @pytest.mark.parametrize('page_load_strategy, wait_until', [
+        ("normal", "load"),
+        ("eager", "domcontentloaded"),
+        ("none", "commit"),
+    ])
+    def test_playwright_page_load_strategy(self, page_load_strategy, wait_until, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test navigation using playwright waits for event matching page load strategy"""
+        pytest.importorskip("playwright")
+        step = get_goto_step({"url": "https://some.example.com/url", "page-load-strategy": page_load_strategy})
+
+        page = unittest.mock.MagicMock()
+        state = jmon.step_state.PlaywrightStepState(page=page, element=unittest.mock.MagicMock())
+
+        step.execute(execution_method="execute_playwright", state=state)
+
+        assert step._status is jmon.step_status.StepStatus.SUCCESS
+        assert state.element is None
+        page.goto.assert_called_once_with("https://some.example.com/url", wait_until=wait_until, timeout=unittest.mock.ANY)
 
     def test_execution_requests_failure_log(self, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
         """Test execution selenium error log after failure"""
@@ -107,6 +324,7 @@ class TestGotoStep:
 
         class MockSeleniumInstance:
             get = unittest.mock.MagicMock(side_effect=selenium.common.exceptions.WebDriverException("Could not access URL"))
+            execute_script = unittest.mock.MagicMock()
 
         class MockState:
             selenium_instance = MockSeleniumInstance()
@@ -125,12 +343,9 @@ class TestGotoStep:
         """Test execution requests"""
         step = get_goto_step("https://some.example.com/url")
 
-        class MockState:
-            response = None
+        mock_state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
 
-        mock_state = MockState()
-
-        mock_request_response = unittest.mock.MagicMock()
+        mock_request_response = unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100))
         mock_requests_get = unittest.mock.MagicMock(return_value=mock_request_response)
 
         with unittest.mock.patch('requests.get', mock_requests_get):
@@ -141,7 +356,9 @@ class TestGotoStep:
 
         # Ensure element has been reset to None
         assert mock_state.response is mock_request_response
-        mock_requests_get.assert_called_once_with(url='https://some.example.com/url', headers={})
+        mock_requests_get.assert_called_once_with(
+            url='https://some.example.com/url', headers={}, timeout=pytest.approx(600, abs=5)
+        )
 
     def test_requests_full_config_body_success(self, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
         """Test execution requests with body"""
@@ -154,12 +371,9 @@ class TestGotoStep:
             "timeout": 6,
         })
 
-        class MockState:
-            response = None
+        mock_state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
 
-        mock_state = MockState()
-
-        mock_request_response = unittest.mock.MagicMock()
+        mock_request_response = unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100))
         mock_requests_post = unittest.mock.MagicMock(return_value=mock_request_response)
 
         with unittest.mock.patch('requests.post', mock_requests_post):
@@ -189,12 +403,9 @@ class TestGotoStep:
             "timeout": 7,
         })
 
-        class MockState:
-            response = None
-
-        mock_state = MockState()
+        mock_state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
 
-        mock_request_response = unittest.mock.MagicMock()
+        mock_request_response = unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100))
         mock_requests_put = unittest.mock.MagicMock(return_value=mock_request_response)
 
         with unittest.mock.patch('requests.put', mock_requests_put):
@@ -217,12 +428,9 @@ class TestGotoStep:
         """Test execution requests error log after failure"""
         step = get_goto_step("https://example.com/url")
 
-        class MockState:
-            response = None
+        mock_state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
 
-        mock_state = MockState()
-
-        mock_request_response = unittest.mock.MagicMock()
+        mock_request_response = unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100))
         mock_requests_get = unittest.mock.MagicMock(side_effect=requests.exceptions.ConnectionError("Could not access URL"))
 
         with unittest.mock.patch('requests.get', mock_requests_get):
@@ -233,3 +441,59 @@ class TestGotoStep:
             "Root -> GoTo: Could not access URL\n"
         ])
         assert step._status is jmon.step_status.StepStatus.FAILED
+
+    @pytest.mark.parametrize('config, step_timeout, expected_timeout', [
+        # Configured timeout is limited to the remaining time of the run
+        ({"url": "https://some.example.com/url", "timeout": 6}, None, 2),
+        ("https://some.example.com/url", None, 2),
+        # Time budget of step
+        ("https://some.example.com/url", 1, 1),
+    ])
+    def test_requests_timeout_limited_by_deadline(self, config, step_timeout, expected_timeout,
+                                                  mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test request timeout is limited to the deadline of the run and step"""
+        mock_run.deadline = Deadline(2)
+        step = get_goto_step(config)
+        step._step_timeout = step_timeout
+
+        mock_requests_get = unittest.mock.MagicMock(
+            return_value=unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100))
+        )
+        with unittest.mock.patch('requests.get', mock_requests_get):
+            step.execute(execution_method="execute_requests", state=jmon.step_state.RequestsStepState(response=None, dns_response=None))
+
+        assert step._status is jmon.step_status.StepStatus.SUCCESS
+        assert mock_requests_get.call_args.kwargs["timeout"] == pytest.approx(expected_timeout, abs=0.5)
+
+    def test_requests_timeout_at_deadline(self, mock_run, mock_root_step, mock_logger, get_goto_step: Callable[[Any], 'jmon.steps.GotoStep']):
+        """Test request timeout is positive once the deadline has been reached, and the step times out"""
+        mock_run.deadline = Deadline(0.05)
+        step = get_goto_step("https://some.example.com/url")
+
+        def request(url, timeout, **kwargs):
+            # Reach deadline whilst preparing request
+            time.sleep(0.1)
+            assert step.get_request_kwargs()["timeout"] > 0
+            raise requests.exceptions.ConnectTimeout("Connection timed out")
+
+        with unittest.mock.patch('requests.get', side_effect=request):
+            step.execute(execution_method="execute_requests", state=jmon.step_state.RequestsStepState(response=None, dns_response=None))
+
+        assert step._status is jmon.step_status.StepStatus.TIMEOUT
+        assert "Connection timed out" in mock_logger.read_log_stream()
+
+    @pytest.mark.parametrize('config, should_raise', [
+        ([{"goto": "https://example.com", "timeout": 5}], False),
+        ([{"goto": "https://example.com", "timeout": 0.5}], False),
+        ([{"goto": "https://example.com", "timeout": 0}], True),
+        ([{"goto": "https://example.com", "timeout": "five"}], True),
+    ])
+    def test_validate_step_timeout(self, config, should_raise, mock_run, mock_logger):
+        """Test validation of time budget of step"""
+        root_step = jmon.steps.RootStep(run=mock_run, config=config, parent=None, run_logger=mock_logger)
+        assert root_step.get_child_steps()[0]._step_timeout == config[0]["timeout"]
+        if should_raise:
+            with pytest.raises(jmon.errors.StepValidationError):
+                root_step.validate_steps()
+        else:
+            root_step.validate_steps()
@@ -0,0 +1,203 @@
+
+import datetime
+import threading
+import time
+from typing import Any, Callable
+import unittest.mock
+
+import pytest
+import requests
+import requests.exceptions
+
+import jmon.client_type
+import jmon.errors
+import jmon.step_state
+import jmon.step_status
+import jmon.steps
+from jmon.deadline import Deadline
+from test.unit.jmon.steps.fixtures import mock_run, mock_logger, mock_root_step
+
+
+@pytest.fixture
+def get_parallel_step(mock_run, mock_root_step, mock_logger) -> Callable[[Any], 'jmon.steps.ParallelStep']:
+    def inner(config):
+        return jmon.steps.ParallelStep(parent=mock_root_step, config=config, run=mock_run, run_logger=mock_logger)
+    return inner
+
+
+def mock_request(delays: dict, errors: dict):
+    """Return mock requests method, delaying and raising errors based on URL"""
+    def request(url, **kwargs):
+        time.sleep(delays.get(url, 0))
+        if url in errors:
+            raise requests.exceptions.ConnectionError(errors[url])
+        return unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100), url=url)
+    return request
+
+
+def execute(step):
+    """Execute step using requests client"""
+    state = jmon.step_state.RequestsStepState(response=None, dns_response=None)
+    return step.execute(execution_method="execute_requests", state=state)
+
+
+class TestParallelStep:
+
+    def test_branches_executed_concurrently(self, get_parallel_step):
+        """Test branches are executed at the same time"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def request(url, **kwargs):
+            # Wait for all requests to be in progress
+            barrier.wait()
+            return unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100))
+
+        step = get_parallel_step([
+            {"goto": "https://example.com/1"},
+            {"goto": "https://example.com/2"},
+            {"branch": [{"goto": "https://example.com/3"}, {"check": {"response": 200}}]},
+        ])
+        with unittest.mock.patch('requests.get', side_effect=request):
+            with unittest.mock.patch('jmon.steps.checks.ResponseCheck.execute_requests'):
+                status = execute(step)
+
+        assert status is jmon.step_status.StepStatus.SUCCESS
+        assert [child.status for child in step.get_child_steps()] == [jmon.step_status.StepStatus.SUCCESS] * 3
+
+    def test_branch_failure(self, get_parallel_step, mock_logger):
+        """Test logs of branches are recorded in order of branches and step fails if a branch fails"""
+        step = get_parallel_step([
+            {"goto": "https://example.com/slow"},
+            {"goto": "https://example.com/fast"},
+            {"goto": "https://example.com/success"},
+        ])
+        request = mock_request(
+            delays={"https://example.com/slow": 0.2},
+            errors={"https://example.com/slow": "Slow failure", "https://example.com/fast": "Fast failure"}
+        )
+        with unittest.mock.patch('requests.get', side_effect=request):
+            status = execute(step)
+
+        assert status is jmon.step_status.StepStatus.FAILED
+        assert step.status is jmon.step_status.StepStatus.FAILED
+        assert [child.status for child in step.get_child_steps()] == [
+            jmon.step_status.StepStatus.FAILED,
+            jmon.step_status.StepStatus.FAILED,
+            jmon.step_status.StepStatus.SUCCESS,
+        ]
+        assert mock_logger.read_log_stream() == '\n'.join([
+            'Root -> Parallel -> GoTo: Step failed',
+            'Root -> Parallel -> GoTo: Slow failure',
+            'Root -> Parallel -> GoTo: Step failed',
+            'Root -> Parallel -> GoTo: Fast failure',
+            'Root -> Parallel: Step failed\n',
+        ])
+
+    def test_parent_response_not_closed(self, get_parallel_step):
+        """Test branches close their own responses, but not the response shared with other branches"""
+        step = get_parallel_step([
+            {"goto": "https://example.com/1"},
+            {"dns": "example.com"},
+        ])
+        parent_response = unittest.mock.MagicMock()
+        branch_response = unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100))
+        state = jmon.step_state.RequestsStepState(response=parent_response, dns_response=None)
+
+        with unittest.mock.patch('requests.get', return_value=branch_response), \
+                unittest.mock.patch('jmon.steps.DNSStep.execute_requests'):
+            status = step.execute(execution_method="execute_requests", state=state)
+
+        assert status is jmon.step_status.StepStatus.SUCCESS
+        branch_response.close.assert_called_once_with()
+        parent_response.close.assert_not_called()
+        assert state.response is parent_response
+
+    def test_deadline(self, get_parallel_step, mock_run, mock_logger):
+        """Test step does not wait for branches beyond the deadline"""
+        mock_run.deadline = Deadline(0.2)
+        step = get_parallel_step([
+            {"branch": [{"goto": "https://example.com/hang"}, {"goto": "https://example.com/after"}]},
+            {"goto": "https://example.com/success"},
+        ])
+        release_request = threading.Event()
+        request = unittest.mock.MagicMock(side_effect=mock_request(delays={}, errors={}))
+
+        def hanging_request(url, **kwargs):
+            if url == "https://example.com/hang":
+                # Log from the branch whilst the request is in progress
+                step.get_child_steps()[0].get_child_steps()[0]._logger.error("Waiting for response")
+                release_request.wait(5)
+            return request(url, **kwargs)
+
+        execute_branch = jmon.steps.ParallelStep._execute_branch
+        branches_finished = threading.Semaphore(0)
+
+        def track_branch(*args, **kwargs):
+            try:
+                return execute_branch(*args, **kwargs)
+            finally:
+                branches_finished.release()
+
+        start_time = time.monotonic()
+        with unittest.mock.patch('requests.get', side_effect=hanging_request), \
+                unittest.mock.patch.object(jmon.steps.ParallelStep, '_execute_branch', side_effect=track_branch):
+            status = execute(step)
+
+            assert time.monotonic() - start_time < 1
+            assert status is jmon.step_status.StepStatus.TIMEOUT
+            log = mock_logger.read_log_stream()
+            assert 'Root -> Parallel: Branch did not complete before the timeout' in log
+            # Logs of timed out branch are recorded
+            assert log.index('Root -> Parallel -> Branch -> GoTo: Waiting for response') < log.index('did not complete')
+            assert [child["status"] for child in step.as_dict()["children"]] == ["TIMEOUT", "SUCCESS"]
+
+            # Complete hanging branch after the timeout
+            release_request.set()
+            for _ in step.get_child_steps():
+                assert branches_finished.acquire(timeout=5)
+
+        # Status and duration of timed out branch are not updated by the late completion
+        children = step.as_dict()["children"]
+        assert [child["status"] for child in children] == ["TIMEOUT", "SUCCESS"]
+        assert [child["status"] for child in children[0]["children"]] == ["TIMEOUT", "NOT_RUN"]
+        assert children[0]["duration"] < 1
+        # Remaining steps of timed out branch are not performed
+        assert "https://example.com/after" not in [call.args[0] for call in request.call_args_list]
+
+    def test_branch_session(self):
+        """Test branches use their own session, sharing connections and a copy of the cookies of the run session"""
+        session = requests.Session()
+        session.cookies.set("session", "test")
+        state = jmon.step_state.RequestsStepState(response=None, dns_response=None, session=session)
+
+        branch_state = state.clone_to_branch()
+        branch_state.session.cookies.set("branch", "test")
+
+        assert branch_state.session is not session
+        assert branch_state.session.cookies.get("session") == "test"
+        assert session.cookies.get("branch") is None
+        assert branch_state.session.adapters["https://"] is session.adapters["https://"]
+
+    @pytest.mark.parametrize('config, should_raise', [
+        ([{"goto": "https://example.com/1"}, {"dns": "example.com"}], False),
+        ([{"branch": [{"goto": "https://example.com/1"}, {"check": {"response": 200}}]}], False),
+        ([], True),
+        ({"goto": "https://example.com/1"}, True),
+        # Branches must contain steps
+        ([{"branch": []}], True),
+    ])
+    def test_validate(self, config, should_raise, get_parallel_step):
+        """Test validation of parallel step"""
+        step = get_parallel_step(config)
+        if should_raise:
+            with pytest.raises(jmon.errors.StepValidationError):
+                step.validate_steps()
+        else:
+            step.validate_steps()
+
+    def test_supported_clients(self, get_parallel_step):
+        """Test parallel steps only support requests client"""
+        step = get_parallel_step([{"goto": "https://example.com/1"}])
+        assert step.get_supported_clients(
+            [jmon.client_type.ClientType.BROWSER_FIREFOX, jmon.client_type.ClientType.REQUESTS]
+        ) == [jmon.client_type.ClientType.REQUESTS]
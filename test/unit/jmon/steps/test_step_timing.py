@@ -0,0 +1,69 @@
+
+import datetime
+import unittest.mock
+
+import jmon.step_state
+import jmon.steps
+from jmon.utils import retry
+from test.unit.jmon.steps.fixtures import mock_run, mock_logger, mock_root_step
+
+
+class TestStepTiming:
+
+    def test_duration_recorded(self, mock_run, mock_logger):
+        """Test duration and start time of executed steps are recorded in step data"""
+        root_step = jmon.steps.RootStep(run=mock_run, config=[
+            {"goto": "https://example.com/1"},
+            {"goto": "https://example.com/2"},
+        ], parent=None, run_logger=mock_logger)
+
+        mock_response = unittest.mock.MagicMock(history=[], elapsed=datetime.timedelta(milliseconds=100))
+        with unittest.mock.patch('requests.get', return_value=mock_response):
+            root_step.execute(
+                execution_method="execute_requests",
+                state=jmon.step_state.RequestsStepState(response=None, dns_response=None)
+            )
+
+        step_data = root_step.as_dict()
+        assert step_data["start_offset"] == 0
+        assert step_data["retry_count"] == 0
+        first_step, second_step = step_data["children"]
+        assert 0 <= first_step["start_offset"] <= second_step["start_offset"]
+        assert 0 <= first_step["duration"] <= step_data["duration"]
+        assert second_step["start_offset"] + second_step["duration"] <= step_data["duration"]
+
+    def test_not_executed(self, mock_run, mock_logger):
+        """Test steps that have not been executed do not have timing"""
+        root_step = jmon.steps.RootStep(run=mock_run, config=[{"goto": "https://example.com"}], parent=None, run_logger=mock_logger)
+
+        step_data = root_step.as_dict()["children"][0]
+        assert step_data["duration"] is None
+        assert step_data["start_offset"] is None
+
+    def test_retry_count(self, mock_run, mock_root_step, mock_logger):
+        """Test retries of step are recorded in step data"""
+        step = jmon.steps.GotoStep(run=mock_run, config="https://example.com", parent=mock_root_step, run_logger=mock_logger)
+        attempts = iter([None, None, True])
+
+        @retry(count=5, interval=0)
+        def attempt():
+            return next(attempts)
+
+        assert attempt(deadline=mock_run.deadline, on_retry=step.record_retry) is True
+        assert step.as_dict()["retry_count"] == 2
+
+    def test_retry_count_all_attempts_failed(self, mock_run, mock_root_step, mock_logger):
+        """Test retries are only recorded for attempts that are performed"""
+        step = jmon.steps.GotoStep(run=mock_run, config="https://example.com", parent=mock_root_step, run_logger=mock_logger)
+
+        @retry(count=3, interval=0)
+        def attempt():
+            return None
+
+        with unittest.mock.patch('jmon.utils.logger') as mock_utils_logger:
+            assert attempt(deadline=mock_run.deadline, on_retry=step.record_retry) is None
+
+        assert step.as_dict()["retry_count"] == 2
+        assert [call.args[0] for call in mock_utils_logger.error.call_args_list] == [
+            "Retrying step (1/3)", "Retrying step (2/3)"
+        ]
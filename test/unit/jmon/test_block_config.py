@@ -0,0 +1,60 @@
+import re
+
+import pytest
+
+from jmon.block_config import BlockConfig, BlockResourceType
+from jmon.errors import CheckCreateError
+
+
+class TestBlockConfig:
+
+    def test_empty_config(self):
+        """Test that empty config disables blocking"""
+        assert BlockConfig.from_config(None) is None
+        assert BlockConfig.from_config({}) is None
+
+    @pytest.mark.parametrize("config", [
+        ["*analytics*"],
+        {"urls": "*analytics*"},
+        {"urls": [""]},
+        {"resource_types": "image"},
+        {"resource_types": ["script"]},
+        {"domains": ["example.com"]},
+    ])
+    def test_invalid_config(self, config):
+        """Test invalid configuration raises error"""
+        with pytest.raises(CheckCreateError):
+            BlockConfig.from_config(config)
+
+    def test_from_config(self):
+        """Test creating block config"""
+        block_config = BlockConfig.from_config({"urls": ["*analytics*"], "resource_types": ["image", "font"]})
+
+        assert block_config.urls == ["*analytics*"]
+        assert block_config.resource_types == [BlockResourceType.IMAGE, BlockResourceType.FONT]
+        assert block_config.as_dict() == {"urls": ["*analytics*"], "resource_types": ["image", "font"]}
+
+    def test_get_url_patterns(self):
+        """Test resource types are converted to file extension URL patterns"""
+        block_config = BlockConfig.from_config({"urls": ["*analytics*"], "resource_types": ["stylesheet"]})
+
+        assert block_config.get_url_patterns() == ["*analytics*", "*.css", "*.css?*"]
+
+    @pytest.mark.parametrize("url, expected_match", [
+        ("https://www.google-analytics.com/analytics.js", True),
+        ("https://example.com/page?ref=google-analytics.com", True),
+        ("https://www.google-analyticsXcom/", False),
+        ("https://example.com/", False),
+    ])
+    def test_get_url_regexes(self, url, expected_match):
+        """Test wildcard URL patterns are converted to regular expressions"""
+        block_config = BlockConfig.from_config({"urls": ["*google-analytics.com*"]})
+
+        [url_regex] = block_config.get_url_regexes()
+        assert bool(re.match(url_regex, url)) is expected_match
+
+    def test_get_firefox_content_policy_types(self):
+        """Test obtaining firefox content policy types"""
+        block_config = BlockConfig.from_config({"resource_types": ["image", "media"]})
+
+        assert block_config.get_firefox_content_policy_types() == ["TYPE_IMAGE", "TYPE_IMAGESET", "TYPE_MEDIA"]
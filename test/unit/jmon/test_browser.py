@@ -0,0 +1,300 @@
+import time
+import unittest.mock
+
+import pytest
+
+from jmon.block_config import BlockConfig
+import jmon.browser
+from jmon.client_type import ClientType
+from jmon.page_load import PageLoadStrategy
+
+
+class MockBrowser:
+
+    CLIENT_TYPE = ClientType.BROWSER_CHROME
+    STANDBY_COUNT = 0
+    REQUIRES_DISPLAY = False
+
+    def __init__(self, page_load_strategy=PageLoadStrategy.NORMAL):
+        self.client_type = self.CLIENT_TYPE
+        self.page_load_strategy = page_load_strategy
+        self.teardown = unittest.mock.MagicMock()
+        self.clean = unittest.mock.MagicMock()
+        self.set_block_config = unittest.mock.MagicMock()
+        self.is_alive = unittest.mock.MagicMock(return_value=True)
+        self.get_recycle_reason = unittest.mock.MagicMock(return_value=None)
+
+    @classmethod
+    def get_standby_count(cls):
+        return cls.STANDBY_COUNT
+
+    @classmethod
+    def requires_display(cls):
+        return cls.REQUIRES_DISPLAY
+
+
+@pytest.fixture
+def mock_browser_class():
+    class MockChromeBrowser(MockBrowser):
+        pass
+    yield MockChromeBrowser
+
+
+@pytest.fixture
+def browser_pool(mock_browser_class):
+    pool = jmon.browser.BrowserPool(class_mappings={ClientType.BROWSER_CHROME: mock_browser_class})
+    yield pool
+    pool.teardown()
+
+
+class TestBrowserPool:
+
+    def _wait_for_refill(self, pool):
+        """Wait for background refill threads to complete"""
+        for thread in list(pool._refill_threads.values()):
+            thread.join()
+
+    def test_acquire_without_standby(self, browser_pool, mock_browser_class):
+        """Test acquiring browser without standby browsers configured"""
+        browser = browser_pool.acquire(ClientType.BROWSER_CHROME)
+
+        assert isinstance(browser, mock_browser_class)
+        assert browser_pool.metrics[ClientType.BROWSER_CHROME]["misses"] == 1
+        assert browser_pool.metrics[ClientType.BROWSER_CHROME]["hits"] == 0
+        assert browser_pool.metrics[ClientType.BROWSER_CHROME]["spawn_count"] == 1
+        # Ensure no refill has been started
+        assert browser_pool._refill_threads == {}
+
+    def test_acquire_with_standby(self, browser_pool, mock_browser_class):
+        """Test acquiring browser uses standby browser and refills pool"""
+        mock_browser_class.STANDBY_COUNT = 1
+
+        browser_pool.refill(ClientType.BROWSER_CHROME)
+        self._wait_for_refill(browser_pool)
+        standby_browser = browser_pool._standby[ClientType.BROWSER_CHROME][0]
+
+        browser = browser_pool.acquire(ClientType.BROWSER_CHROME)
+        assert browser is standby_browser
+        assert browser_pool.metrics[ClientType.BROWSER_CHROME]["hits"] == 1
+        assert browser_pool.metrics[ClientType.BROWSER_CHROME]["misses"] == 0
+
+        # Ensure pool is refilled in the background
+        self._wait_for_refill(browser_pool)
+        assert len(browser_pool._standby[ClientType.BROWSER_CHROME]) == 1
+        assert browser_pool._standby[ClientType.BROWSER_CHROME][0] is not standby_browser
+        assert browser_pool.metrics[ClientType.BROWSER_CHROME]["spawn_count"] == 2
+
+    def test_acquire_unresponsive_standby(self, browser_pool, mock_browser_class):
+        """Test unresponsive standby browser is torn down and replaced"""
+        mock_browser_class.STANDBY_COUNT = 1
+        browser_pool.refill(ClientType.BROWSER_CHROME)
+        self._wait_for_refill(browser_pool)
+
+        standby_browser = browser_pool._standby[ClientType.BROWSER_CHROME][0]
+        standby_browser.is_alive.return_value = False
+
+        browser = browser_pool.acquire(ClientType.BROWSER_CHROME)
+        assert browser is not standby_browser
+        standby_browser.teardown.assert_called_once_with()
+        assert browser_pool.metrics[ClientType.BROWSER_CHROME]["misses"] == 1
+
+    def test_release_to_pool(self, browser_pool, mock_browser_class):
+        """Test releasing browser returns it to pool when there is capacity"""
+        browser = browser_pool.acquire(ClientType.BROWSER_CHROME)
+
+        mock_browser_class.STANDBY_COUNT = 1
+        browser_pool.release(browser)
+
+        browser.clean.assert_called_once_with()
+        browser.teardown.assert_not_called()
+        assert browser_pool._standby[ClientType.BROWSER_CHROME] == [browser]
+
+    def test_release_pool_full(self, browser_pool, mock_browser_class):
+        """Test releasing browser tears it down when the pool is full"""
+        browser = browser_pool.acquire(ClientType.BROWSER_CHROME)
+        browser_pool.release(browser)
+
+        browser.teardown.assert_called_once_with()
+        assert browser_pool._standby[ClientType.BROWSER_CHROME] == []
+
+    def test_relaxed_page_load_strategy(self, browser_pool, mock_browser_class):
+        """Test browsers with a relaxed page load strategy do not use, and are not returned to, the pool"""
+        mock_browser_class.STANDBY_COUNT = 1
+        browser_pool.refill(ClientType.BROWSER_CHROME)
+        self._wait_for_refill(browser_pool)
+        standby_browser = browser_pool._standby[ClientType.BROWSER_CHROME][0]
+
+        browser = browser_pool.acquire(ClientType.BROWSER_CHROME, page_load_strategy=PageLoadStrategy.EAGER)
+
+        assert browser is not standby_browser
+        assert browser.page_load_strategy is PageLoadStrategy.EAGER
+        assert browser_pool._standby[ClientType.BROWSER_CHROME] == [standby_browser]
+
+        browser_pool.release(browser)
+
+        browser.clean.assert_not_called()
+        browser.teardown.assert_called_once_with()
+        assert browser_pool._standby[ClientType.BROWSER_CHROME] == [standby_browser]
+
+    def test_release_recycles_browser(self, browser_pool, mock_browser_class):
+        """Test releasing browser that has exceeded thresholds tears it down"""
+        browser = browser_pool.acquire(ClientType.BROWSER_CHROME)
+        browser.get_recycle_reason.return_value = "browser memory exceeded"
+
+        mock_browser_class.STANDBY_COUNT = 1
+        browser_pool.release(browser)
+
+        browser.clean.assert_not_called()
+        browser.teardown.assert_called_once_with()
+        assert browser_pool._standby[ClientType.BROWSER_CHROME] == []
+
+    def test_acquire_recycles_standby(self, browser_pool, mock_browser_class):
+        """Test standby browsers that have exceeded thresholds are not used"""
+        mock_browser_class.STANDBY_COUNT = 1
+        browser_pool.refill(ClientType.BROWSER_CHROME)
+        self._wait_for_refill(browser_pool)
+        standby_browser = browser_pool._standby[ClientType.BROWSER_CHROME][0]
+        standby_browser.get_recycle_reason.return_value = "browser age exceeded"
+
+        browser = browser_pool.acquire(ClientType.BROWSER_CHROME)
+
+        assert browser is not standby_browser
+        standby_browser.teardown.assert_called_once_with()
+
+    def test_teardown(self, browser_pool, mock_browser_class):
+        """Test teardown of pool tears down standby browsers"""
+        mock_browser_class.STANDBY_COUNT = 2
+        browser_pool.refill(ClientType.BROWSER_CHROME)
+        self._wait_for_refill(browser_pool)
+        standby_browsers = list(browser_pool._standby[ClientType.BROWSER_CHROME])
+        assert len(standby_browsers) == 2
+
+        browser_pool.teardown()
+
+        for browser in standby_browsers:
+            browser.teardown.assert_called_once_with()
+        assert browser_pool._standby[ClientType.BROWSER_CHROME] == []
+
+    @pytest.mark.parametrize("requires_display", [True, False])
+    def test_display_only_created_when_required(self, browser_pool, mock_browser_class, requires_display):
+        """Test display is only started when a non-headless browser is created"""
+        mock_browser_class.REQUIRES_DISPLAY = requires_display
+
+        with unittest.mock.patch.object(jmon.browser.VirtualDisplay, "get") as mock_get_display:
+            browser_pool.acquire(ClientType.BROWSER_CHROME)
+
+        if requires_display:
+            mock_get_display.assert_called_once_with()
+        else:
+            mock_get_display.assert_not_called()
+
+
+class TestBrowserBase:
+
+    def test_get_origins(self):
+        """Test obtaining origins from URLs"""
+        assert jmon.browser.BrowserBase._get_origins([
+            "https://example.com/some/path?query=1",
+            "https://example.com/other",
+            "http://localhost:8080/",
+            "https://cdn.example.com/script.js",
+            "about:blank",
+            "data:text/html,hello",
+        ]) == {"https://example.com", "http://localhost:8080", "https://cdn.example.com"}
+
+    def test_clean(self):
+        """Test cleaning browser closes additional windows and clears all visited origins"""
+        class MockCleanBrowser(jmon.browser.BrowserBase):
+            def __init__(self):
+                self._selenium_instance = unittest.mock.MagicMock()
+                self.clear_browser_data = unittest.mock.MagicMock()
+
+            def _clear_browser_data(self, origins):
+                self.clear_browser_data(origins)
+
+        browser = MockCleanBrowser()
+        selenium_instance = browser.selenium_instance
+        selenium_instance.window_handles = ["main", "popup"]
+        selenium_instance.execute_script.side_effect = [
+            ["https://popup.example.com/"],
+            ["https://example.com/", "https://cdn.example.com/script.js"],
+        ]
+
+        browser.clean()
+
+        assert selenium_instance.switch_to.window.call_args_list == [
+            unittest.mock.call("popup"),
+            unittest.mock.call("main"),
+            unittest.mock.call("main"),
+        ]
+        # Only the additional window should be closed
+        selenium_instance.close.assert_called_once_with()
+        assert selenium_instance.execute_async_script.call_count == 2
+        selenium_instance.get.assert_called_once_with("about:blank")
+        browser.clear_browser_data.assert_called_once_with(
+            {"https://popup.example.com", "https://example.com", "https://cdn.example.com"}
+        )
+
+    @pytest.mark.parametrize("age, rss_mb, expected_recycle", [
+        (10, 100, False),
+        (4000, 100, True),
+        (10, 2000, True),
+    ])
+    def test_get_recycle_reason(self, monkeypatch, age, rss_mb, expected_recycle):
+        """Test browser is recycled when exceeding age or memory thresholds"""
+        monkeypatch.setenv("BROWSER_MAX_AGE_SECONDS", "3600")
+        monkeypatch.setenv("BROWSER_MAX_RSS_MB", "1024")
+
+        browser = jmon.browser.BrowserBase.__new__(jmon.browser.BrowserBase)
+        browser._created_at = time.monotonic() - age
+        browser.get_rss = unittest.mock.MagicMock(return_value=rss_mb * 1024 * 1024)
+
+        assert (browser.get_recycle_reason() is not None) is expected_recycle
+
+    def test_set_block_config(self):
+        """Test blocking is only applied to browser when enabled, or when removing previous blocking"""
+        browser = jmon.browser.BrowserBase.__new__(jmon.browser.BrowserBase)
+        browser._blocking_enabled = False
+        browser._apply_block_config = unittest.mock.MagicMock()
+
+        browser.set_block_config(None)
+        browser._apply_block_config.assert_not_called()
+
+        block_config = BlockConfig.from_config({"resource_types": ["image"]})
+        browser.set_block_config(block_config)
+        browser._apply_block_config.assert_called_once_with(block_config)
+
+        browser.set_block_config(None)
+        browser._apply_block_config.assert_called_with(None)
+        assert browser._apply_block_config.call_count == 2
+
+    def test_chrome_apply_block_config(self):
+        """Test blocked URLs are set in chrome using CDP"""
+        browser = jmon.browser.BrowserChrome.__new__(jmon.browser.BrowserChrome)
+        browser._selenium_instance = unittest.mock.MagicMock()
+        browser._blocking_enabled = False
+
+        browser.set_block_config(BlockConfig.from_config({"urls": ["*analytics*"]}))
+        browser.selenium_instance.execute_cdp_cmd.assert_called_with(
+            "Network.setBlockedURLs", {"urls": ["*analytics*"]}
+        )
+
+        browser.set_block_config(None)
+        browser.selenium_instance.execute_cdp_cmd.assert_called_with("Network.setBlockedURLs", {"urls": []})
+
+
+class TestBrowserFactory:
+
+    def test_get_browser_applies_block_config(self, browser_pool, mock_browser_class):
+        """Test block config is applied to both new and cached browsers"""
+        browser_factory = jmon.browser.BrowserFactory()
+        browser_factory._pool = browser_pool
+        block_config = BlockConfig.from_config({"urls": ["*analytics*"]})
+
+        browser = browser_factory.get_browser(ClientType.BROWSER_CHROME, block_config=block_config)
+        browser.set_block_config.assert_called_once_with(block_config)
+
+        # Ensure blocking from previous run is removed from cached browser
+        assert browser_factory.get_browser(ClientType.BROWSER_CHROME) is browser
+        browser.clean.assert_called_once_with()
+        browser.set_block_config.assert_called_with(None)
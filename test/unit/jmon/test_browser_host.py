@@ -0,0 +1,190 @@
+import multiprocessing
+import multiprocessing.connection
+import os
+import stat
+import threading
+import unittest.mock
+
+import pytest
+
+import jmon.browser_host
+from jmon.client_type import ClientType
+from jmon.errors import BrowserHostError
+from jmon.page_load import PageLoadStrategy
+
+
+class MockBrowser:
+
+    def __init__(self, session_id):
+        self.client_type = ClientType.BROWSER_CHROME
+        self.selenium_instance = unittest.mock.MagicMock()
+        self.selenium_instance.session_id = session_id
+        self.selenium_instance.command_executor._url = "http://localhost:1234"
+        self.selenium_instance.caps = {"browserName": "chrome"}
+        self.teardown = unittest.mock.MagicMock()
+        self.clean = unittest.mock.MagicMock()
+        self.set_block_config = unittest.mock.MagicMock()
+        self.get_recycle_reason = unittest.mock.MagicMock(return_value=None)
+
+
+@pytest.fixture
+def browser_host():
+    host = jmon.browser_host.BrowserHost(address="/tmp/jmon-test-browser-host.sock")
+    host._pool = unittest.mock.MagicMock()
+    host._pool.acquire.side_effect = lambda client_type, page_load_strategy: MockBrowser(session_id="session-1")
+    yield host
+
+
+class TestBrowserHost:
+
+    def test_acquire(self, browser_host):
+        """Test acquiring browser returns session details"""
+        response = browser_host._handle_request({"action": "acquire", "client_type": "BROWSER_CHROME"})
+
+        browser_host._pool.acquire.assert_called_once_with(ClientType.BROWSER_CHROME, page_load_strategy=PageLoadStrategy.NORMAL)
+        assert response == {
+            "session_id": "session-1",
+            "executor_url": "http://localhost:1234",
+            "capabilities": {"browserName": "chrome"},
+        }
+        assert list(browser_host._leases.keys()) == ["session-1"]
+
+    def test_acquire_applies_block_config(self, browser_host):
+        """Test request blocking is applied to acquired and cleaned browsers"""
+        browser_host._handle_request({
+            "action": "acquire", "client_type": "BROWSER_CHROME",
+            "block": {"urls": ["*analytics*"]}
+        })
+        browser = browser_host._leases["session-1"]
+        block_config = browser.set_block_config.call_args.args[0]
+        assert block_config.urls == ["*analytics*"]
+
+        # Ensure blocking is removed when cleaning for a run without block configuration
+        browser_host._handle_request({"action": "clean", "session_id": "session-1", "block": None})
+        browser.set_block_config.assert_called_with(None)
+
+    def test_release(self, browser_host):
+        """Test releasing browser returns it to the pool"""
+        browser_host._handle_request({"action": "acquire", "client_type": "BROWSER_CHROME"})
+        browser = browser_host._leases["session-1"]
+
+        browser_host._handle_request({"action": "release", "session_id": "session-1"})
+
+        browser_host._pool.release.assert_called_once_with(browser)
+        assert browser_host._leases == {}
+
+    def test_teardown(self, browser_host):
+        """Test tearing down browser"""
+        browser_host._handle_request({"action": "acquire", "client_type": "BROWSER_CHROME"})
+        browser = browser_host._leases["session-1"]
+
+        browser_host._handle_request({"action": "teardown", "session_id": "session-1"})
+
+        browser.teardown.assert_called_once_with()
+        browser_host._pool.release.assert_not_called()
+        browser_host._pool.refill.assert_called_once_with(ClientType.BROWSER_CHROME)
+        assert browser_host._leases == {}
+
+    def test_clean_failure(self, browser_host):
+        """Test browser is removed if cleaning fails"""
+        browser_host._handle_request({"action": "acquire", "client_type": "BROWSER_CHROME"})
+        browser = browser_host._leases["session-1"]
+        browser.clean.side_effect = Exception("Browser has crashed")
+
+        with pytest.raises(BrowserHostError):
+            browser_host._handle_request({"action": "clean", "session_id": "session-1"})
+
+        browser.teardown.assert_called_once_with()
+        assert browser_host._leases == {}
+
+    def test_clean_recycles_browser(self, browser_host):
+        """Test browser exceeding thresholds is torn down, rather than cleaned"""
+        browser_host._handle_request({"action": "acquire", "client_type": "BROWSER_CHROME"})
+        browser = browser_host._leases["session-1"]
+        browser.get_recycle_reason.return_value = "browser memory exceeded"
+
+        with pytest.raises(BrowserHostError):
+            browser_host._handle_request({"action": "clean", "session_id": "session-1"})
+
+        browser.clean.assert_not_called()
+        browser.teardown.assert_called_once_with()
+        browser_host._pool.refill.assert_called_once_with(ClientType.BROWSER_CHROME)
+        assert browser_host._leases == {}
+
+    def test_unknown_session(self, browser_host):
+        """Test releasing unknown session"""
+        with pytest.raises(BrowserHostError):
+            browser_host._handle_request({"action": "release", "session_id": "does-not-exist"})
+
+    def test_disconnect_releases_browser(self, browser_host):
+        """Test browser is returned to pool when worker disconnects without releasing"""
+        host_connection, worker_connection = multiprocessing.Pipe()
+        thread = threading.Thread(target=browser_host._handle_connection, args=(host_connection, ))
+        thread.start()
+
+        worker_connection.send({"action": "acquire", "client_type": "BROWSER_CHROME"})
+        assert worker_connection.recv()["session_id"] == "session-1"
+        browser = browser_host._leases["session-1"]
+
+        # Close worker connection, emulating worker process being recycled
+        worker_connection.close()
+        thread.join()
+
+        browser_host._pool.release.assert_called_once_with(browser)
+        assert browser_host._leases == {}
+
+    def test_error_response(self, browser_host):
+        """Test errors are returned to worker"""
+        host_connection, worker_connection = multiprocessing.Pipe()
+        thread = threading.Thread(target=browser_host._handle_connection, args=(host_connection, ))
+        thread.start()
+
+        worker_connection.send({"action": "invalid"})
+        assert worker_connection.recv() == {"error": "Unknown action: invalid"}
+
+        worker_connection.close()
+        thread.join()
+
+    def test_authenticated_socket(self, browser_host, tmp_path):
+        """Test socket is only accessible by the current user and connections require the auth key"""
+        address = str(tmp_path / "browser-host.sock")
+        browser_host._address = address
+        listener = browser_host._create_listener()
+        try:
+            assert stat.S_IMODE(os.stat(address).st_mode) == 0o600
+            assert stat.S_IMODE(os.stat(jmon.browser_host.get_auth_key_path(address)).st_mode) == 0o600
+
+            def accept_connections(count):
+                for _ in range(count):
+                    try:
+                        browser_host._handle_connection(listener.accept())
+                    except multiprocessing.AuthenticationError:
+                        pass
+
+            thread = threading.Thread(target=accept_connections, args=(2, ))
+            thread.start()
+
+            # Connections without the auth key are rejected
+            with pytest.raises(multiprocessing.AuthenticationError):
+                multiprocessing.connection.Client(address=address, family="AF_UNIX", authkey=b"invalid")
+
+            client = jmon.browser_host.BrowserHostClient(address=address)
+            assert client._request("acquire", client_type="BROWSER_CHROME")["session_id"] == "session-1"
+            client._close()
+            thread.join()
+        finally:
+            listener.close()
+
+    def test_configured_auth_key(self, monkeypatch, tmp_path):
+        """Test configured auth key is used, rather than generating a key"""
+        monkeypatch.setenv("BROWSER_HOST_AUTH_KEY", "configured-secret")
+        address = str(tmp_path / "browser-host.sock")
+
+        assert jmon.browser_host.create_auth_key(address) == b"configured-secret"
+        assert jmon.browser_host.read_auth_key(address) == b"configured-secret"
+        assert not os.path.exists(jmon.browser_host.get_auth_key_path(address))
+
+    def test_missing_auth_key(self, tmp_path):
+        """Test error is raised if the browser host has not created an auth key"""
+        with pytest.raises(BrowserHostError):
+            jmon.browser_host.BrowserHostClient(address=str(tmp_path / "browser-host.sock"))._request("release")
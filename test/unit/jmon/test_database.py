@@ -0,0 +1,25 @@
+import threading
+import unittest.mock
+
+import jmon.database
+
+
+def test_sessions_are_per_thread_and_cleared():
+    """Ensure sessions are created per thread and removed from cache when cleared"""
+    sessions = {}
+
+    def use_session(thread_name):
+        sessions[thread_name] = jmon.database.Database.get_session()
+        # Session should be cached for the thread
+        assert jmon.database.Database.get_session() is sessions[thread_name]
+        jmon.database.Database.clear_session()
+
+    with unittest.mock.patch.object(jmon.database.Database, "get_session_maker", return_value=unittest.mock.MagicMock()):
+        threads = [threading.Thread(target=use_session, args=(f"thread-{i}", )) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len({id(session) for session in sessions.values()}) == 5
+    assert jmon.database.Database._SESSIONS == {}
@@ -0,0 +1,64 @@
+
+import time
+import unittest.mock
+
+import pytest
+
+from jmon.deadline import Deadline
+from jmon.utils import RetryStatus, retry
+
+
+class TestDeadline:
+
+    def test_remaining(self):
+        """Test remaining time and expiry of deadline"""
+        deadline = Deadline(10)
+
+        assert deadline.remaining() == pytest.approx(10, abs=1)
+        assert deadline.has_expired() is False
+        assert deadline.clamp(5) == 5
+        assert deadline.clamp(20) == pytest.approx(10, abs=1)
+        assert deadline.clamp() == pytest.approx(10, abs=1)
+
+    def test_expired(self):
+        """Test expired deadline"""
+        deadline = Deadline(0)
+
+        assert deadline.has_expired() is True
+        assert deadline.remaining() == 0
+        assert deadline.clamp(5) == 0
+
+    def test_child(self):
+        """Test child deadlines are limited to parent deadline"""
+        deadline = Deadline(10)
+
+        assert deadline.child(5).remaining() == pytest.approx(5, abs=1)
+        assert deadline.child(20).expires_at == deadline.expires_at
+
+
+def test_retry_sleep_limited_to_deadline():
+    """Test retry does not sleep beyond deadline"""
+    @retry(count=3, interval=10)
+    def always_fails():
+        return None
+
+    with unittest.mock.patch('jmon.utils.sleep') as mock_sleep:
+        always_fails(deadline=Deadline(1))
+
+    # No sleep is performed after the final attempt
+    assert mock_sleep.call_count == 2
+    for call in mock_sleep.call_args_list:
+        assert call.args[0] <= 1
+
+
+def test_retry_stops_at_deadline():
+    """Test retry does not perform further attempts once the deadline has been reached"""
+    always_fails = unittest.mock.MagicMock(return_value=None)
+    on_retry = unittest.mock.MagicMock()
+
+    with unittest.mock.patch('jmon.utils.sleep') as mock_sleep:
+        assert retry(count=3, interval=10)(always_fails)(deadline=Deadline(0), on_retry=on_retry) is RetryStatus.DEADLINE_EXCEEDED
+
+    always_fails.assert_called_once_with()
+    mock_sleep.assert_not_called()
+    on_retry.assert_not_called()
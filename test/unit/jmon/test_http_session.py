@@ -0,0 +1,146 @@
+
+import datetime
+import http.server
+import socket
+import threading
+import unittest.mock
+
+import pytest
+import urllib3.util.connection
+
+from jmon.http_session import HttpConnectionPool, RequestTiming, record_request_timing
+
+
+class KeepAliveRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Return empty response, setting a cookie, keeping connections open"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.send_header("Set-Cookie", "session=test")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def get_with_timing(session, url):
+    """Perform request, returning response and timing"""
+    with record_request_timing() as timing:
+        response = session.get(url)
+    return response, timing
+
+
+class TestHttpConnectionPool:
+
+    def test_connections_reused_between_sessions(self, server_url):
+        """Test connections are re-used by subsequent sessions, without sharing cookies"""
+        pool = HttpConnectionPool()
+
+        with pool.session() as session:
+            response, first_timing = get_with_timing(session, server_url)
+            assert response.status_code == 200
+            assert session.cookies.get("session") == "test"
+
+        with pool.session() as session:
+            assert session.cookies.get("session") is None
+            _, second_timing = get_with_timing(session, server_url)
+
+        assert first_timing.connect > 0
+        assert second_timing.dns == 0
+        assert second_timing.connect == 0
+
+    def test_fresh_connection(self, server_url):
+        """Test sessions using fresh connections do not re-use connections"""
+        pool = HttpConnectionPool()
+
+        with pool.session() as session:
+            get_with_timing(session, server_url)
+
+        with pool.session(fresh_connection=True) as session:
+            _, timing = get_with_timing(session, server_url)
+
+        assert timing.connect > 0
+
+    def test_idle_connections_closed(self, server_url):
+        """Test connections that have exceeded keep-alive time are not re-used"""
+        pool = HttpConnectionPool()
+
+        with pool.session() as session:
+            get_with_timing(session, server_url)
+
+        with unittest.mock.patch('jmon.config.Config.REQUESTS_KEEP_ALIVE_TIMEOUT', new_callable=unittest.mock.PropertyMock, return_value=-1):
+            with pool.session() as session:
+                _, timing = get_with_timing(session, server_url)
+
+        assert timing.connect > 0
+
+
+    def test_address_timeout(self, server_url):
+        """Test remaining addresses of host are attempted when connecting to an address times out"""
+        port = int(server_url.rstrip("/").rsplit(":", 1)[1])
+        getaddrinfo = socket.getaddrinfo
+        create_connection = urllib3.util.connection.create_connection
+
+        def mock_getaddrinfo(host, *args, **kwargs):
+            if host == "multiple-addresses.example.com":
+                return [
+                    (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", port)),
+                    (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port)),
+                ]
+            return getaddrinfo(host, *args, **kwargs)
+
+        def mock_create_connection(address, *args, **kwargs):
+            if address[0] == "192.0.2.1":
+                raise socket.timeout("timed out")
+            return create_connection(address, *args, **kwargs)
+
+        with unittest.mock.patch('socket.getaddrinfo', side_effect=mock_getaddrinfo) as mock_resolve, \
+                unittest.mock.patch('urllib3.util.connection.create_connection', side_effect=mock_create_connection) as mock_connect:
+            with HttpConnectionPool().session() as session:
+                response, timing = get_with_timing(session, f"http://multiple-addresses.example.com:{port}/")
+
+        assert response.status_code == 200
+        assert [call.args[0][0] for call in mock_connect.call_args_list] == ["192.0.2.1", "127.0.0.1"]
+        mock_resolve.assert_any_call(
+            "multiple-addresses.example.com", port, urllib3.util.connection.allowed_gai_family(), socket.SOCK_STREAM
+        )
+        assert timing.connect > 0
+
+class TestRequestTiming:
+
+    def test_finalise(self):
+        """Test TTFB and download time are calculated from response, including redirects"""
+        timing = RequestTiming(dns=0.01, connect=0.02, tls=0.03)
+        redirect_response = unittest.mock.MagicMock(elapsed=datetime.timedelta(seconds=0.1))
+        response = unittest.mock.MagicMock(elapsed=datetime.timedelta(seconds=0.2), history=[redirect_response])
+
+        timing.finalise(response=response, total=0.5)
+
+        assert timing.ttfb == pytest.approx(0.24)
+        assert timing.download == pytest.approx(0.2)
+        assert str(timing) == "dns=10ms connect=20ms tls=30ms ttfb=240ms download=200ms"
+        assert timing.as_dict() == {"dns": 0.01, "connect": 0.02, "tls": 0.03, "ttfb": 0.24, "download": 0.2}
+
+    def test_finalise_stream(self):
+        """Test download time is not measured for streamed responses"""
+        timing = RequestTiming(dns=0.01, connect=0.02, tls=0.03)
+        response = unittest.mock.MagicMock(elapsed=datetime.timedelta(seconds=0.2), history=[])
+
+        timing.finalise(response=response, total=0.5, stream=True)
+
+        assert timing.ttfb == pytest.approx(0.14)
+        assert timing.download is None
+        assert str(timing) == "dns=10ms connect=20ms tls=30ms ttfb=140ms download=unmeasured"
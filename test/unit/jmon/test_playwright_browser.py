@@ -0,0 +1,52 @@
+
+import unittest.mock
+
+import pytest
+
+from jmon.block_config import BlockConfig
+from jmon.playwright_browser import PlaywrightBrowser
+
+
+class TestPlaywrightBrowser:
+
+    @pytest.mark.parametrize('url, resource_type, should_block', [
+        ("https://example.com/", "document", False),
+        ("https://example.com/logo.png", "image", True),
+        ("https://example.com/app.css", "stylesheet", False),
+        ("https://www.google-analytics.com/collect", "xhr", True),
+    ])
+    def test_block_config_route(self, url, resource_type, should_block):
+        """Test requests are aborted based on resource type and URL patterns"""
+        context = unittest.mock.MagicMock()
+        block_config = BlockConfig.from_config({
+            "urls": ["*google-analytics.com*"],
+            "resource_types": ["image"],
+        })
+
+        PlaywrightBrowser._apply_block_config(context=context, block_config=block_config)
+
+        context.route.assert_called_once()
+        pattern, handler = context.route.call_args.args
+        assert pattern == "**/*"
+
+        route = unittest.mock.MagicMock()
+        route.request.url = url
+        route.request.resource_type = resource_type
+        handler(route)
+
+        if should_block:
+            route.abort.assert_called_once_with("blockedbyclient")
+            route.continue_.assert_not_called()
+        else:
+            route.continue_.assert_called_once_with()
+            route.abort.assert_not_called()
+
+    def test_new_context_without_block_config(self):
+        """Test context is created without routing when no block config is provided"""
+        browser = PlaywrightBrowser.__new__(PlaywrightBrowser)
+        browser._browser = unittest.mock.MagicMock()
+
+        context = browser.new_context(block_config=None)
+
+        assert context is browser._browser.new_context.return_value
+        context.route.assert_not_called()
@@ -0,0 +1,67 @@
+
+import unittest.mock
+
+import pytest
+import requests.exceptions
+
+import jmon.steps
+from jmon.preflight import get_preflight_url, perform_preflight
+from test.unit.jmon.steps.fixtures import mock_run, mock_logger
+
+
+class TestGetPreflightUrl:
+
+    @pytest.mark.parametrize('config, expected_url', [
+        ([{"goto": "https://example.com"}, {"check": {"title": "Example"}}], "https://example.com"),
+        ([{"goto": {"url": "https://example.com/login", "page-load-strategy": "eager"}}], "https://example.com/login"),
+        # Goto is not the first step
+        ([{"find": [{"id": "test"}]}, {"goto": "https://example.com"}], None),
+        ([], None),
+        # Non-http URLs are not probed
+        ([{"goto": "about:blank"}], None),
+        ([{"goto": "data:text/html,<p>test</p>"}], None),
+        ([{"goto": "file:///tmp/test.html"}], None),
+        ([{"goto": "HTTP://example.com"}], "HTTP://example.com"),
+    ])
+    def test_get_preflight_url(self, config, expected_url, mock_run, mock_logger):
+        """Test URL of only first goto step is used for preflight"""
+        mock_run.variables = {}
+        root_step = jmon.steps.RootStep(run=mock_run, config=config, parent=None, run_logger=mock_logger)
+
+        assert get_preflight_url(root_step) == expected_url
+
+
+class TestPerformPreflight:
+
+    def test_reachable(self):
+        """Test reachable target returns no error and only reads response headers"""
+        mock_response = unittest.mock.MagicMock(status_code=503)
+        with unittest.mock.patch('requests.get', return_value=mock_response) as mock_get:
+            assert perform_preflight("https://example.com", timeout=2) is None
+
+        mock_get.assert_called_once_with("https://example.com", timeout=2, stream=True, allow_redirects=False)
+        mock_response.close.assert_called_once_with()
+
+    @pytest.mark.parametrize('exception', [
+        requests.exceptions.ConnectionError("Failed to establish a new connection\nDetails"),
+        requests.exceptions.ConnectTimeout("Failed to establish a new connection\nDetails"),
+        requests.exceptions.ReadTimeout("Failed to establish a new connection\nDetails"),
+    ])
+    def test_unreachable(self, exception):
+        """Test connection errors and timeouts are returned as error"""
+        with unittest.mock.patch('requests.get', side_effect=exception):
+            assert perform_preflight("https://example.com", timeout=2) == "Failed to establish a new connection"
+
+    def test_ssl_error(self):
+        """Test SSL errors are left to the browser check to handle"""
+        with unittest.mock.patch('requests.get', side_effect=requests.exceptions.SSLError("certificate verify failed")):
+            assert perform_preflight("https://example.com", timeout=2) is None
+
+    @pytest.mark.parametrize('url', [
+        "https://exa mple.com:port/",
+        "http://",
+        "example.com",
+    ])
+    def test_invalid_url(self, url):
+        """Test invalid URLs are left to the browser check to handle"""
+        assert perform_preflight(url, timeout=2) is None
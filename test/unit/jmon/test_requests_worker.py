@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+
+def _get_imported_modules(module):
+    """Import module in a new interpreter and return the names of all loaded modules"""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; import {module}; print('\\n'.join(sys.modules))"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return set(result.stdout.splitlines())
+
+
+def test_requests_worker_does_not_import_browser_modules():
+    """Ensure requests-only worker does not load the browser stack"""
+    modules = _get_imported_modules("jmon.requests_worker")
+
+    assert "jmon.tasks.perform_check" in modules
+    for browser_module in ["selenium", "pyvirtualdisplay", "psutil", "jmon.browser", "jmon.browser_host"]:
+        assert browser_module not in modules
+
+
+def test_worker_imports_browser_modules():
+    """Ensure browser worker preloads the browser stack"""
+    modules = _get_imported_modules("jmon.worker")
+
+    assert "selenium" in modules
+    assert "jmon.browser" in modules
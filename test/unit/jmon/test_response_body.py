@@ -0,0 +1,81 @@
+
+import unittest.mock
+
+import pytest
+
+from jmon.response_body import ResponseBody, ResponseBodyTooLargeError, truncate_for_log
+from test.unit.jmon.steps.fixtures import create_response
+
+
+class TestResponseBody:
+
+    @pytest.mark.parametrize('value, expected', [
+        ("start", True),
+        # Value spanning boundary of chunks
+        ("abcdefgh", True),
+        ("end", True),
+        ("missing", False),
+    ])
+    def test_contains(self, value, expected):
+        """Test searching body over multiple chunks"""
+        body = ResponseBody(create_response(b"start-abcd" + b"efgh-end", stream=True))
+
+        with unittest.mock.patch.object(ResponseBody, 'CHUNK_SIZE', 10):
+            assert body.contains(value) is expected
+
+    def test_contains_stops_reading(self):
+        """Test searching body stops reading once value is found"""
+        response = create_response(b"x" * 100, stream=True)
+        body = ResponseBody(response)
+
+        with unittest.mock.patch.object(ResponseBody, 'CHUNK_SIZE', 10):
+            assert body.contains("xxx") is True
+            assert response.raw.tell() == 10
+
+            # Subsequent reads use previously read chunks
+            assert body.read() == b"x" * 100
+
+    def test_max_size(self):
+        """Test reading body exceeding max size"""
+        response = create_response(b"x" * 100, stream=True)
+        body = ResponseBody(response, max_size=25)
+
+        with unittest.mock.patch.object(ResponseBody, 'CHUNK_SIZE', 10):
+            with pytest.raises(ResponseBodyTooLargeError):
+                body.read()
+
+            assert body.exceeded_max_size is True
+            # Response is closed once max size is exceeded
+            assert response.raw.closed is True
+            # Only body up to max size is searched
+            assert body.contains("x" * 25) is True
+            assert body.contains("x" * 26) is False
+
+    def test_max_size_not_exceeded(self):
+        """Test reading body matching max size"""
+        body = ResponseBody(create_response(b"x" * 100, stream=True), max_size=100)
+
+        assert body.text() == "x" * 100
+        assert body.exceeded_max_size is False
+
+    def test_non_streamed(self):
+        """Test reading body of response that has already been read"""
+        body = ResponseBody(create_response("Unicode é".encode("utf-8")))
+
+        assert body.text() == "Unicode é"
+        assert body.contains("é") is True
+
+    def test_excerpt(self):
+        """Test excerpt only reads start of body"""
+        response = create_response(b"x" * 10000, stream=True)
+        body = ResponseBody(response)
+
+        with unittest.mock.patch.object(ResponseBody, 'CHUNK_SIZE', 100):
+            assert body.excerpt() == ("x" * 1000) + "... (truncated)"
+            assert response.raw.tell() == 1100
+
+
+def test_truncate_for_log():
+    """Test truncating values for log"""
+    assert truncate_for_log("short value") == "short value"
+    assert truncate_for_log("x" * 1001) == ("x" * 1000) + "... (truncated)"
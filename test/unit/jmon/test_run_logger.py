@@ -0,0 +1,29 @@
+import threading
+
+from test.unit.jmon.mock_run_logger import MockLogger
+
+
+def test_concurrent_run_logs_are_isolated():
+    """Ensure logs from runs executing concurrently in threads do not leak between runs"""
+    run_count = 10
+    barrier = threading.Barrier(run_count)
+    logs = {}
+
+    def perform_run(run_id):
+        run_logger = MockLogger(run=None, enable_log=True)
+        # Ensure all loggers are active at the same time
+        barrier.wait()
+        for i in range(5):
+            run_logger.error(f"run-{run_id} message {i}")
+        barrier.wait()
+        run_logger.cleanup()
+        logs[run_id] = run_logger.read_log_stream()
+
+    threads = [threading.Thread(target=perform_run, args=(run_id, )) for run_id in range(run_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for run_id in range(run_count):
+        assert logs[run_id] == "".join([f"run-{run_id} message {i}\n" for i in range(5)])
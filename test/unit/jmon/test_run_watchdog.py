@@ -0,0 +1,141 @@
+import ctypes
+import signal
+import threading
+import time
+import unittest.mock
+
+import pytest
+
+from jmon.client_type import ClientType
+from jmon.run_watchdog import RunDeadlineExceededError, RunWatchdog
+from jmon.runner import Runner
+from jmon.step_status import StepStatus
+
+
+class TestRunWatchdog:
+
+    def test_deadline_in_main_thread(self):
+        """Test blocking call is interrupted in main thread"""
+        abort_callback = unittest.mock.MagicMock()
+        start_time = time.monotonic()
+
+        with pytest.raises(RunDeadlineExceededError):
+            with RunWatchdog(timeout=0.2) as watchdog:
+                watchdog.add_abort_callback(abort_callback)
+                time.sleep(10)
+
+        assert time.monotonic() - start_time < 5
+        assert watchdog.expired
+        abort_callback.assert_called_once_with()
+
+    def test_deadline_in_thread(self):
+        """Test run executing in non-main thread is aborted"""
+        abort_callback = unittest.mock.MagicMock()
+        result = {}
+
+        def run():
+            try:
+                with RunWatchdog(timeout=0.2) as watchdog:
+                    watchdog.add_abort_callback(abort_callback)
+                    end_time = time.monotonic() + 10
+                    while time.monotonic() < end_time:
+                        time.sleep(0.01)
+                result["raised"] = False
+            except RunDeadlineExceededError:
+                result["raised"] = True
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert result["raised"] is True
+        abort_callback.assert_called_once_with()
+
+    def test_deadline_not_reached(self):
+        """Test watchdog does not interfere with runs within deadline"""
+        abort_callback = unittest.mock.MagicMock()
+
+        with RunWatchdog(timeout=0.2) as watchdog:
+            watchdog.add_abort_callback(abort_callback)
+
+        # Ensure alarm has been cancelled
+        time.sleep(0.4)
+        assert not watchdog.expired
+        abort_callback.assert_not_called()
+
+
+    def test_signal_handler_restored(self):
+        """Test previous alarm handler is restored after the deadline, including if cancelling is interrupted"""
+        def previous_handler(signum, frame):
+            pass
+
+        original_handler = signal.signal(signal.SIGALRM, previous_handler)
+        try:
+            with pytest.raises(RunDeadlineExceededError):
+                with RunWatchdog(timeout=0.2):
+                    time.sleep(10)
+            assert signal.getsignal(signal.SIGALRM) is previous_handler
+
+            # Emulate deadline being reached whilst cancelling
+            watchdog = RunWatchdog(timeout=10)
+            watchdog.start()
+            with unittest.mock.patch('signal.setitimer', side_effect=RunDeadlineExceededError()):
+                with pytest.raises(RunDeadlineExceededError):
+                    watchdog.cancel()
+            assert signal.getsignal(signal.SIGALRM) is previous_handler
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, original_handler)
+
+    def test_thread_exception_not_set(self):
+        """Test error is logged if the exception cannot be raised in the run thread"""
+        watchdog = RunWatchdog(timeout=10)
+        watchdog._thread_id = 0
+
+        with unittest.mock.patch.object(ctypes.pythonapi, 'PyThreadState_SetAsyncExc', return_value=0), \
+                unittest.mock.patch('jmon.run_watchdog.logger') as mock_logger:
+            watchdog._handle_timer()
+
+        assert watchdog.expired
+        assert not watchdog._exception_injected
+        mock_logger.error.assert_called_with(
+            "Unable to interrupt run thread after hard deadline: exception set in 0 threads"
+        )
+
+    def test_deadline_in_greenlet(self):
+        """Test run executing in greenlet is aborted using gevent, when threading is monkey-patched"""
+        mock_gevent = unittest.mock.MagicMock()
+        abort_callback = unittest.mock.MagicMock()
+
+        with unittest.mock.patch('jmon.run_watchdog._get_gevent', return_value=mock_gevent):
+            with RunWatchdog(timeout=0.2) as watchdog:
+                watchdog.add_abort_callback(abort_callback)
+
+                timeout, handle_timer = mock_gevent.spawn_later.call_args.args
+                assert timeout == 0.2
+                handle_timer()
+
+        assert watchdog.expired
+        abort_callback.assert_called_once_with()
+        greenlet, exception = mock_gevent.kill.call_args.args
+        assert greenlet is mock_gevent.getcurrent.return_value
+        assert isinstance(exception, RunDeadlineExceededError)
+        mock_gevent.spawn_later.return_value.kill.assert_called_once_with(block=False)
+
+class TestRunnerDeadline:
+
+    def test_run_exceeding_deadline_times_out(self, monkeypatch):
+        """Test hung run is aborted and marked as timeout"""
+        monkeypatch.setenv("RUN_DEADLINE_GRACE_PERIOD", "1")
+
+        mock_run = unittest.mock.MagicMock()
+        mock_run.check.get_timeout.return_value = 0
+        mock_run.check.get_supported_clients.return_value = [ClientType.REQUESTS]
+        mock_run.root_step.execute.side_effect = lambda **kwargs: time.sleep(10)
+
+        start_time = time.monotonic()
+        status = Runner().perform_check(run=mock_run)
+
+        assert status is StepStatus.TIMEOUT
+        assert time.monotonic() - start_time < 5
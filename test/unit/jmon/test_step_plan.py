@@ -0,0 +1,101 @@
+
+import json
+import unittest.mock
+
+import pytest
+
+from jmon.client_type import ClientType
+from jmon.page_load import PageLoadStrategy
+from jmon.step_plan import StepPlanCache
+import jmon.steps.root_step
+from test.unit.jmon.steps.fixtures import mock_run
+
+
+STEPS = [
+    {"goto": "https://example.com/", "timeout": 5},
+    {"check": {"title": "Example", "url": "https://example.com/"}},
+    {"find": [{"id": "search"}, {"actions": [{"type": "test"}, "click"]}]},
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Remove cached plans before each test"""
+    StepPlanCache.clear()
+    yield
+    StepPlanCache.clear()
+
+
+class TestStepPlanCache:
+
+    def test_cached(self):
+        """Test plan is re-used for the same steps"""
+        plan = StepPlanCache.get_root_plan(json.dumps(STEPS).encode('utf-8'))
+
+        assert StepPlanCache.get_root_plan(json.dumps(STEPS).encode('utf-8')) is plan
+        assert StepPlanCache.get_root_plan(json.dumps(STEPS[:1]).encode('utf-8')) is not plan
+
+    def test_step_count(self):
+        """Test number of steps in plan"""
+        plan = StepPlanCache.get_root_plan(json.dumps(STEPS).encode('utf-8'))
+
+        # goto, check, title, url, find, actions, type, click
+        assert plan.step_count == 8
+
+    @pytest.mark.parametrize('steps, expected_clients', [
+        (STEPS, [ClientType.BROWSER_FIREFOX, ClientType.BROWSER_CHROME]),
+        ([{"goto": "https://example.com/"}, {"check": {"response": 200}}], [ClientType.REQUESTS]),
+    ])
+    def test_supported_clients(self, steps, expected_clients):
+        """Test clients supported by all steps of plan"""
+        plan = StepPlanCache.get_root_plan(json.dumps(steps).encode('utf-8'))
+
+        assert plan.get_supported_clients(
+            [ClientType.BROWSER_FIREFOX, ClientType.BROWSER_CHROME, ClientType.REQUESTS]
+        ) == expected_clients
+
+    @pytest.mark.parametrize('steps, expected_strategies, expected_session_strategy', [
+        (STEPS, set(), PageLoadStrategy.NORMAL),
+        ([
+            {"goto": {"url": "https://example.com/", "page-load-strategy": "normal"}},
+            {"goto": {"url": "https://example.com/other", "page-load-strategy": "eager"}},
+        ], {PageLoadStrategy.NORMAL, PageLoadStrategy.EAGER}, PageLoadStrategy.EAGER),
+        ([
+            {"goto": {"url": "https://example.com/", "page-load-strategy": "none"}},
+            {"goto": {"url": "https://example.com/other", "page-load-strategy": "eager"}},
+        ], {PageLoadStrategy.NONE, PageLoadStrategy.EAGER}, PageLoadStrategy.NONE),
+    ])
+    def test_page_load_strategies(self, steps, expected_strategies, expected_session_strategy):
+        """Test page load strategies configured by steps of plan"""
+        plan = StepPlanCache.get_root_plan(json.dumps(steps).encode('utf-8'))
+
+        assert plan.page_load_strategies == expected_strategies
+        assert PageLoadStrategy.get_session_strategy(plan.page_load_strategies) is expected_session_strategy
+
+    def test_create_step(self, mock_run):
+        """Test steps created from plan match steps created from config"""
+        plan = StepPlanCache.get_root_plan(json.dumps(STEPS).encode('utf-8'))
+
+        def describe(step):
+            return (type(step), step._config, step._step_timeout, step._run, [describe(child) for child in step.get_child_steps()])
+
+        planned_step = plan.create_step(run=mock_run, parent=None)
+        config_step = jmon.steps.root_step.RootStep(run=mock_run, config=STEPS, parent=None)
+
+        assert describe(planned_step) == describe(config_step)
+        # Child steps are associated with the parent created for the run
+        assert planned_step.get_child_steps()[0]._parent is planned_step
+
+    def test_create_step_reuses_templates(self, mock_run):
+        """Test steps created from plan do not re-compile templates"""
+        steps = [{"goto": {"url": "https://example.com/{tenant}", "method": "post", "json": {"items": ["{token}"] * 10}}}]
+        plan = StepPlanCache.get_root_plan(json.dumps(steps).encode('utf-8'))
+        mock_run.variables = {"tenant": "test", "token": "secret"}
+        mock_run.variables_version = 1
+
+        with unittest.mock.patch('jmon.template._compile') as mock_compile:
+            goto_step = plan.create_step(run=mock_run, parent=None).get_child_steps()[0]
+
+            assert goto_step.render_template(goto_step._url_template) == "https://example.com/test"
+            assert goto_step.render_template(goto_step._json_template) == {"items": ["secret"] * 10}
+            mock_compile.assert_not_called()
@@ -0,0 +1,94 @@
+
+import unittest.mock
+
+import pytest
+
+from jmon.template import CompiledTemplate
+
+
+class TestCompiledTemplate:
+
+    @pytest.mark.parametrize('source, expected_variables, expected_static', [
+        ("https://example.com/?id={an_id}&page={page}", {"an_id", "page"}, False),
+        ("{performance.load} {items[0]}", {"performance", "items"}, False),
+        ("{value:{width}}", {"value", "width"}, False),
+        # Escaped braces
+        ("{{not_a_variable}}", set(), True),
+        # Braces that are not placeholders
+        ('{"query": "test"}', set(), True),
+        (["{first}", {"nested": ["{second}", 1]}, None], {"first", "second"}, False),
+        ({"key": "value"}, set(), True),
+        (5, set(), True),
+        (None, set(), True),
+    ])
+    def test_variables(self, source, expected_variables, expected_static):
+        """Test variables referenced by template"""
+        template = CompiledTemplate(source)
+
+        assert template.error is None
+        assert template.variables == expected_variables
+        assert template.is_static is expected_static
+
+    @pytest.mark.parametrize('source', [
+        "Single }",
+        "Unclosed {",
+        "Positional {}",
+        "Positional {0}",
+        ["Nested {"],
+    ])
+    def test_invalid(self, source):
+        """Test parsing invalid templates"""
+        assert CompiledTemplate(source).error
+
+    @pytest.mark.parametrize('source, expected', [
+        ("https://example.com/?id={an_id}", "https://example.com/?id=1234"),
+        ("{{escaped}} {name!r} {an_id:>6}", "{escaped} 'test'   1234"),
+        ('{"query": "test"}', '{"query": "test"}'),
+        (
+            {"query": {"terms": ["{name}", "static"], "id": 5}, "other": "{an_id}"},
+            {"query": {"terms": ["test", "static"], "id": 5}, "other": "1234"}
+        ),
+    ])
+    def test_render(self, source, expected):
+        """Test rendering template"""
+        assert CompiledTemplate(source).render({"an_id": 1234, "name": "test"}) == expected
+
+    def test_render_does_not_modify_source(self):
+        """Test rendering structures creates new structures"""
+        source = {"items": ["{name}"]}
+        CompiledTemplate(source).render({"name": "test"})
+
+        assert source == {"items": ["{name}"]}
+
+    def test_render_missing_variable(self):
+        """Test rendering template with missing variable"""
+        with pytest.raises(KeyError):
+            CompiledTemplate("{name}").render({})
+
+    def test_render_memoized_per_version(self):
+        """Test rendered value is re-used until variables version changes"""
+        template = CompiledTemplate({"items": ["{name}"] * 10})
+        variables = {"name": "first"}
+
+        with unittest.mock.patch('jmon.template._FORMATTER.format_field', wraps=str.__format__) as mock_format_field:
+            assert template.render(variables, version=1) == {"items": ["first"] * 10}
+            assert template.render(variables, version=1) == {"items": ["first"] * 10}
+            assert mock_format_field.call_count == 10
+
+            variables["name"] = "second"
+            assert template.render(variables, version=2) == {"items": ["second"] * 10}
+            assert mock_format_field.call_count == 20
+
+    def test_use_compiled(self):
+        """Test template re-uses compiled result of another template, whilst rendering independently"""
+        source = {"items": ["{name}"]}
+        compiled_template = CompiledTemplate(source).compile()
+
+        template = CompiledTemplate(source)
+        with unittest.mock.patch('jmon.template._compile') as mock_compile:
+            template.use_compiled(compiled_template)
+
+            assert template.variables == frozenset(["name"])
+            assert template.render({"name": "first"}, version=1) == {"items": ["first"]}
+            assert compiled_template.render({"name": "second"}, version=1) == {"items": ["second"]}
+            mock_compile.assert_not_called()
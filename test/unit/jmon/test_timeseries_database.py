@@ -0,0 +1,84 @@
+
+import datetime
+import unittest.mock
+
+import pytest
+
+import jmon.steps
+from jmon.errors import UnableToPushMetricVictoriaMetricsError
+from jmon.timeseries_database import StepDurationMetricWriter, TimeSeriesDataPoint, VictoriaMetricsDatabase
+from test.unit.jmon.steps.fixtures import mock_run, mock_logger
+
+
+TIMESTAMP = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class TestVictoriaMetricsDatabase:
+
+    def test_write_metrics_single_request(self):
+        """Test multiple metrics are written in a single request, escaping tags"""
+        database = VictoriaMetricsDatabase("http://victoriametrics:8428")
+
+        with unittest.mock.patch('requests.post', return_value=unittest.mock.MagicMock(status_code=204)) as mock_post:
+            assert database.write_metrics([
+                TimeSeriesDataPoint(metric_name="jmon_step", properties={"check": "A check,with=tags"}, fields={"duration": 0.5}, timestamp=TIMESTAMP),
+                TimeSeriesDataPoint(metric_name="jmon_step", properties={"check": "second"}, fields={"duration": 1}, timestamp=TIMESTAMP),
+            ]) is True
+
+        mock_post.assert_called_once_with(
+            "http://victoriametrics:8428/write",
+            data=(
+                "jmon_step,check=A\\ check\\,with\\=tags duration=0.5 1672531200000000000\n"
+                "jmon_step,check=second duration=1 1672531200000000000"
+            )
+        )
+
+    def test_write_metrics_empty(self):
+        """Test writing no metrics does not perform request"""
+        with unittest.mock.patch('requests.post') as mock_post:
+            assert VictoriaMetricsDatabase("http://victoriametrics:8428").write_metrics([]) is True
+        mock_post.assert_not_called()
+
+    def test_write_metrics_error(self):
+        """Test error response whilst writing metrics"""
+        with unittest.mock.patch('requests.post', return_value=unittest.mock.MagicMock(status_code=400)):
+            with pytest.raises(UnableToPushMetricVictoriaMetricsError):
+                VictoriaMetricsDatabase("http://victoriametrics:8428").write_metrics([
+                    TimeSeriesDataPoint(metric_name="jmon_step", properties={}, fields={"duration": 1}, timestamp=TIMESTAMP),
+                ])
+
+
+class TestStepDurationMetricWriter:
+
+    def test_write(self, mock_run, mock_logger):
+        """Test durations of executed steps are written, labelled with step path"""
+        mock_run.check.name = "test-check"
+        mock_run.check.environment.name = "default"
+        mock_run.run_model.timestamp = TIMESTAMP
+        mock_run.root_step = jmon.steps.RootStep(run=mock_run, config=[
+            {"goto": "https://example.com/1"},
+            {"parallel": [{"goto": "https://example.com/2"}]},
+        ], parent=None, run_logger=mock_logger)
+
+        child_steps = mock_run.root_step.get_child_steps()
+        child_steps[0]._start_time, child_steps[0]._end_time = 10, 10.5
+        child_steps[1].get_child_steps()[0]._start_time, child_steps[1].get_child_steps()[0]._end_time = 11, 13
+
+        mock_database = unittest.mock.MagicMock()
+        StepDurationMetricWriter().write(result_database=mock_database, run=mock_run)
+
+        # Parallel step was not executed, so is not written
+        mock_database.write_metrics.assert_called_once_with([
+            TimeSeriesDataPoint(
+                metric_name="jmon_step",
+                properties={"check": "test-check", "environment": "default", "step": "s1", "step_name": child_steps[0].id},
+                fields={"duration": 0.5},
+                timestamp=TIMESTAMP
+            ),
+            TimeSeriesDataPoint(
+                metric_name="jmon_step",
+                properties={"check": "test-check", "environment": "default", "step": "s2.1", "step_name": child_steps[1].get_child_steps()[0].id},
+                fields={"duration": 2},
+                timestamp=TIMESTAMP
+            ),
+        ])
@@ -0,0 +1,152 @@
+import json
+import shutil
+import subprocess
+import unittest.mock
+
+import pytest
+import selenium.common.exceptions
+
+from jmon.wait_engine import NORMALISE_TEXT_SCRIPT, WaitCondition, WaitResult, normalise_text, wait_for_condition
+
+
+# Rendered text of elements and expected normalised text
+TEXT_NORMALISATION_CASES = [
+    ("Login", "Login"),
+    ("  Login \n", "Login"),
+    # Whitespace within lines is retained
+    ("Please   Login", "Please   Login"),
+    ("Please \t Login", "Please \t Login"),
+    # Whitespace surrounding lines is removed
+    ("Please \n  Login", "Please\nLogin"),
+    ("Please\n\nLogin", "Please\n\nLogin"),
+    ("Please\u00a0Login", "Please Login"),
+]
+
+
+class TestNormaliseText:
+
+    @pytest.mark.parametrize("text, expected", TEXT_NORMALISATION_CASES)
+    def test_normalise_text(self, text, expected):
+        """Test normalisation of element text"""
+        assert normalise_text(text) == expected
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+    def test_script_matches_normalise_text(self):
+        """Test text is normalised in the page using the same rule"""
+        texts = [text for text, _ in TEXT_NORMALISATION_CASES]
+        output = subprocess.check_output(
+            ["node", "-e", NORMALISE_TEXT_SCRIPT + f"console.log(JSON.stringify({json.dumps(texts)}.map(normaliseText)));"]
+        )
+
+        assert json.loads(output) == [expected for _, expected in TEXT_NORMALISATION_CASES]
+
+
+class TestWaitForCondition:
+
+    def test_satisfied_in_page(self):
+        """Test satisfied condition is returned from a single script execution"""
+        selenium_instance = unittest.mock.MagicMock()
+        element = unittest.mock.MagicMock()
+        selenium_instance.execute_async_script.return_value = {"satisfied": True, "actual": "Login"}
+
+        result = wait_for_condition(
+            selenium_instance, WaitCondition.TEXT, timeout=5, element=element, expected="Login"
+        )
+
+        assert result == WaitResult(satisfied=True, actual="Login")
+        selenium_instance.execute_async_script.assert_called_once()
+        _, passed_element, condition, expected, timeout_ms = selenium_instance.execute_async_script.call_args.args
+        assert passed_element is element
+        assert condition == "text"
+        assert expected == "Login"
+        assert timeout_ms == pytest.approx(5000, abs=50)
+
+    def test_element_not_passed_for_page_conditions(self):
+        """Test element is not passed to script for page conditions"""
+        selenium_instance = unittest.mock.MagicMock()
+        selenium_instance.execute_async_script.return_value = {"satisfied": True, "actual": "Title"}
+
+        wait_for_condition(
+            selenium_instance, WaitCondition.TITLE, timeout=5, element=unittest.mock.MagicMock(), expected="Title"
+        )
+
+        assert selenium_instance.execute_async_script.call_args.args[1] is None
+
+    def test_long_wait_split_across_scripts(self):
+        """Test waits longer than the script timeout are split across multiple script executions"""
+        selenium_instance = unittest.mock.MagicMock()
+        selenium_instance.execute_async_script.side_effect = [
+            {"satisfied": False, "actual": None},
+            {"satisfied": True, "actual": None},
+        ]
+
+        with unittest.mock.patch("jmon.wait_engine.MAX_SCRIPT_DURATION", 0.05):
+            result = wait_for_condition(
+                selenium_instance, WaitCondition.VISIBLE, timeout=60, element=unittest.mock.MagicMock()
+            )
+
+        assert result.satisfied is True
+        assert selenium_instance.execute_async_script.call_count == 2
+        assert selenium_instance.execute_async_script.call_args.args[4] == 50
+
+    def test_retry_after_navigation(self):
+        """Test script is re-executed when interrupted by navigation"""
+        selenium_instance = unittest.mock.MagicMock()
+        selenium_instance.execute_async_script.side_effect = [
+            selenium.common.exceptions.JavascriptException("document unloaded while waiting for result"),
+            {"satisfied": True, "actual": "https://example.com/"},
+        ]
+
+        result = wait_for_condition(
+            selenium_instance, WaitCondition.URL, timeout=5, expected="https://example.com/"
+        )
+
+        assert result == WaitResult(satisfied=True, actual="https://example.com/")
+
+    @pytest.mark.parametrize("condition, expected, native_value, expected_result", [
+        # Native text matches, where page evaluation did not
+        (WaitCondition.TEXT, "Login", "Login", WaitResult(satisfied=True, actual="Login")),
+        (WaitCondition.TITLE, "Home", "Other", WaitResult(satisfied=False, actual="Other")),
+        (WaitCondition.URL, "https://example.com/", "https://example.com/login", WaitResult(satisfied=False, actual="https://example.com/login")),
+    ])
+    def test_native_evaluation_after_timeout(self, condition, expected, native_value, expected_result):
+        """Test condition is evaluated using webdriver once the timeout is reached"""
+        selenium_instance = unittest.mock.MagicMock()
+        element = unittest.mock.MagicMock()
+        selenium_instance.execute_async_script.return_value = {"satisfied": False, "actual": "Log in"}
+        element.text = native_value
+        selenium_instance.title = native_value
+        selenium_instance.current_url = native_value
+
+        result = wait_for_condition(selenium_instance, condition, timeout=0.01, element=element, expected=expected)
+
+        assert result == expected_result
+
+    @pytest.mark.parametrize("native_text, expected, expected_result", [
+        # Whitespace within text is not collapsed
+        ("Please   Login", "Please Login", WaitResult(satisfied=False, actual="Please   Login")),
+        ("Please\nLogin", "Please Login", WaitResult(satisfied=False, actual="Please\nLogin")),
+        ("Please \nLogin ", "Please\nLogin", WaitResult(satisfied=True, actual="Please\nLogin")),
+    ])
+    def test_native_text_normalisation(self, native_text, expected, expected_result):
+        """Test text is compared using webdriver with the same rule as in the page"""
+        selenium_instance = unittest.mock.MagicMock()
+        element = unittest.mock.MagicMock()
+        selenium_instance.execute_async_script.return_value = {"satisfied": False, "actual": normalise_text(native_text)}
+        element.text = native_text
+
+        result = wait_for_condition(selenium_instance, WaitCondition.TEXT, timeout=0.01, element=element, expected=expected)
+
+        assert result == expected_result
+
+    def test_stale_element(self):
+        """Test wait fails for elements that are no longer attached to the page"""
+        selenium_instance = unittest.mock.MagicMock()
+        element = unittest.mock.MagicMock()
+        selenium_instance.execute_async_script.side_effect = selenium.common.exceptions.StaleElementReferenceException()
+        element.is_displayed.side_effect = selenium.common.exceptions.StaleElementReferenceException()
+
+        result = wait_for_condition(selenium_instance, WaitCondition.VISIBLE, timeout=5, element=element)
+
+        assert result == WaitResult(satisfied=False, actual=None)
+        selenium_instance.execute_async_script.assert_called_once()
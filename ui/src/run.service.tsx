@@ -21,8 +21,12 @@ class CheckService {
     return client.get(`/checks/${name}/environments/${environment}/runs/${runTimestamp}/artifacts/artifact.log`);
   }
 
-  getGraphDataById(name, environment, runTimestamp) {
-    return client.get(`/checks/${name}/environments/${environment}/runs/${runTimestamp}/step-graph-data`);
+  getGraphDataById(name, environment, runTimestamp, colorBy = "status") {
+    return client.get(`/checks/${name}/environments/${environment}/runs/${runTimestamp}/step-graph-data`, {
+      params: {
+        color_by: colorBy
+      }
+    });
   }
 
   triggerRun(name, environment) {